@@ -0,0 +1,158 @@
+import datetime
+import decimal
+import io
+import os
+import typing
+
+from ads_manager import exceptions
+
+# Money columns are stored as exact decimals, 6 fractional digits cover every provider currency precision.
+MONEY_TYPE_PRECISION = 18
+MONEY_TYPE_SCALE = 6
+
+PARQUET_COMPRESSION = "snappy"
+
+_NULL_VALUES = (None, "", "None", "null")
+
+
+def get_insights_schema() -> typing.Any:
+    pyarrow = _import_pyarrow()
+
+    money_type = pyarrow.decimal128(MONEY_TYPE_PRECISION, MONEY_TYPE_SCALE)
+    actions_type = pyarrow.list_(
+        pyarrow.struct([pyarrow.field("action_type", pyarrow.string()), pyarrow.field("value", pyarrow.float64())])
+    )
+
+    return pyarrow.schema(
+        [
+            pyarrow.field("account_id", pyarrow.string()),
+            pyarrow.field("account_name", pyarrow.string()),
+            pyarrow.field("resource_type", pyarrow.string()),
+            pyarrow.field("campaign_id", pyarrow.string()),
+            pyarrow.field("campaign_name", pyarrow.string()),
+            pyarrow.field("adset_id", pyarrow.string()),
+            pyarrow.field("adset_name", pyarrow.string()),
+            pyarrow.field("ad_id", pyarrow.string()),
+            pyarrow.field("ad_name", pyarrow.string()),
+            pyarrow.field("spend", money_type),
+            pyarrow.field("impressions", pyarrow.int64()),
+            pyarrow.field("clicks", pyarrow.int64()),
+            pyarrow.field("ctr", pyarrow.float64()),
+            pyarrow.field("cpm", money_type),
+            pyarrow.field("cpc", money_type),
+            pyarrow.field("reach", pyarrow.int64()),
+            pyarrow.field("actions", actions_type),
+            pyarrow.field("conversions", actions_type),
+            pyarrow.field("cost_per_conversion", actions_type),
+            pyarrow.field("conversion_rate", actions_type),
+            pyarrow.field("date_start", pyarrow.date32()),
+            pyarrow.field("date_stop", pyarrow.date32()),
+        ]
+    )
+
+
+def to_insights_table(records: typing.Iterable[typing.Dict]) -> typing.Any:
+    """
+    Converts insights rows (`messages.ResourceInsightsReport` as dicts) into a typed Arrow table. The providers
+    return every metric as a string, they are parsed here once so readers get native column types.
+    """
+    pyarrow = _import_pyarrow()
+
+    rows = [
+        {
+            "account_id": record["account_id"],
+            "account_name": record.get("account_name"),
+            "resource_type": record["resource_type"],
+            "campaign_id": record["campaign_id"],
+            "campaign_name": record["campaign_name"],
+            "adset_id": record.get("adset_id"),
+            "adset_name": record.get("adset_name"),
+            "ad_id": record.get("ad_id"),
+            "ad_name": record.get("ad_name"),
+            "spend": _to_money(value=record["spend"]),
+            "impressions": _to_int(value=record["impressions"]),
+            "clicks": _to_int(value=record["clicks"]),
+            "ctr": _to_float(value=record.get("ctr")),
+            "cpm": _to_money(value=record.get("cpm")),
+            "cpc": _to_money(value=record.get("cpc")),
+            "reach": _to_int(value=record["reach"]),
+            "actions": _to_actions(actions=record.get("actions")),
+            "conversions": _to_actions(actions=record.get("conversions")),
+            "cost_per_conversion": _to_actions(actions=record.get("cost_per_conversion")),
+            "conversion_rate": _to_actions(actions=record.get("conversion_rate")),
+            "date_start": _to_date(value=record["date_start"]),
+            "date_stop": _to_date(value=record["date_stop"]),
+        }
+        for record in records
+    ]
+
+    return pyarrow.Table.from_pylist(rows, schema=get_insights_schema())
+
+
+def get_insights_parquet_bytes(records: typing.Iterable[typing.Dict]) -> bytes:
+    buffer = io.BytesIO()
+    _write_parquet(table=to_insights_table(records=records), where=buffer)
+
+    return buffer.getvalue()
+
+
+def write_insights_parquet(records: typing.Iterable[typing.Dict], file_path: str) -> str:
+    table = to_insights_table(records=records)
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    _write_parquet(table=table, where=file_path)
+
+    return file_path
+
+
+def _write_parquet(table: typing.Any, where: typing.Union[str, typing.BinaryIO]) -> None:
+    from pyarrow import parquet
+
+    parquet.write_table(table, where, compression=PARQUET_COMPRESSION)
+
+
+def _import_pyarrow() -> typing.Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise exceptions.ColumnarFormatException(
+            'Parquet export requires the optional "pyarrow" dependency to be installed'
+        )
+
+    return pyarrow
+
+
+def _to_money(value: typing.Any) -> typing.Optional[decimal.Decimal]:
+    if value in _NULL_VALUES:
+        return None
+
+    return decimal.Decimal(str(value)).quantize(decimal.Decimal(1).scaleb(-MONEY_TYPE_SCALE))
+
+
+def _to_int(value: typing.Any) -> typing.Optional[int]:
+    if value in _NULL_VALUES:
+        return None
+
+    return int(decimal.Decimal(str(value)))
+
+
+def _to_float(value: typing.Any) -> typing.Optional[float]:
+    if value in _NULL_VALUES:
+        return None
+
+    return float(value)
+
+
+def _to_date(value: typing.Any) -> typing.Optional[datetime.date]:
+    if value in _NULL_VALUES:
+        return None
+
+    return datetime.date.fromisoformat(str(value)[:10])
+
+
+def _to_actions(actions: typing.Optional[typing.List[typing.Dict]]) -> typing.Optional[typing.List[typing.Dict]]:
+    if actions is None:
+        return None
+
+    return [
+        {"action_type": action.get("action_type"), "value": _to_float(value=action.get("value"))} for action in actions
+    ]
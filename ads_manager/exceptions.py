@@ -1,3 +1,6 @@
+import typing
+
+
 class ImporterException(Exception):
     pass
 
@@ -8,3 +11,19 @@ class ActionException(Exception):
 
 class AdAssetsException(Exception):
     pass
+
+
+class PartialExportException(ImporterException):
+    def __init__(self, message: str, data: typing.Optional[str], failed_accounts: typing.Dict[str, str]) -> None:
+        ImporterException.__init__(self, message)
+        self.message = message
+        self.data = data
+        self.failed_accounts = failed_accounts
+
+
+class ColumnarFormatException(Exception):
+    pass
+
+
+class JsonCodecException(Exception):
+    pass
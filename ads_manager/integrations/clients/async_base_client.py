@@ -0,0 +1,220 @@
+import abc
+import datetime
+import typing
+
+from ads_manager import enums
+from ads_manager.integrations.clients import messages
+from ads_manager.integrations.gateways import async_connection_pool
+from ads_manager.integrations.gateways.facebook import (
+    async_client as async_facebook_api_client,
+)
+from ads_manager.integrations.gateways.tiktok import (
+    async_client as async_tiktok_api_client,
+)
+
+
+class AsyncBaseClient(object):
+    """
+    asyncio counterpart of `BaseClient`. Every provider call is awaitable; the underlying gateway keeps its
+    own keep-alive connection pool until `aclose` is awaited (or the client is used as an async context manager).
+
+    A deliberately limited subset of `BaseClient`, for driving many accounts or report jobs concurrently. The
+    `iter_*` methods take no `cursor` or `updated_since`, so checkpointed and incremental exports stay on the sync
+    clients. Graph API batches and `?ids=` lookups (`get_ad_creatives`, bulk updates) and TikTok chunked uploads
+    are sync only. Projection, date range splitting, rate limiting, retries and adaptive page sizes are shared.
+    """
+
+    @abc.abstractmethod
+    def __init__(
+        self,
+        user_access_token: str,
+        params: typing.Optional[typing.Dict] = None,
+        connection_pool: typing.Optional[async_connection_pool.AsyncConnectionPool] = None,
+    ) -> None:
+        self._user_access_token = user_access_token
+        self._rest_api_client = None
+        self._params = params
+        self._connection_pool = connection_pool
+
+    async def aclose(self) -> None:
+        if self._rest_api_client:
+            await self._rest_api_client.aclose()
+
+    async def __aenter__(self) -> "AsyncBaseClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    @property
+    @abc.abstractmethod
+    def get_rest_api_client(
+        self,
+    ) -> typing.Union[async_facebook_api_client.AsyncFacebookApiClient, async_tiktok_api_client.AsyncTikTokApiClient]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_account_ids(
+        self,
+    ) -> typing.List[messages.AdAccount]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_account_campaigns_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.CampaignDetails]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_account_adsets_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdSetDetails]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_account_ads_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdDetails]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_account_ad_creatives(self, ad_account_id: str) -> typing.List[messages.AdCreativeDetails]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_ad_creative(self, ad_creative_id: str) -> messages.AdCreativeDetails:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_insights(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.ResourceInsightsReport]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_account_campaigns_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.AsyncIterator[typing.List[messages.CampaignDetails]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_account_adsets_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.AsyncIterator[typing.List[messages.AdSetDetails]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_account_ads_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.AsyncIterator[typing.List[messages.AdDetails]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_insights(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.AsyncIterator[typing.List[messages.ResourceInsightsReport]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def create_campaign(self, ad_account_id: str, campaign_details: typing.Dict) -> str:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def update_campaign(
+        self,
+        ad_account_id,
+        campaign_id: str,
+        campaign_details: typing.Dict,
+    ) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def create_adset(self, ad_account_id: str, adset_details: typing.Dict) -> str:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def update_adset(
+        self,
+        ad_account_id: str,
+        adset_id: str,
+        adset_details: typing.Dict,
+    ) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def create_adcreative(self, ad_account_id: str, adcreative_details: typing.Dict) -> str:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def update_adcreative(self, adcreative_id: str, adcreative_details: typing.Dict) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def create_ad(
+        self,
+        ad_account_id: str,
+        ad_details: typing.Dict,
+    ) -> str:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def create_ads(
+        self,
+        ad_account_id: str,
+        ads_details: typing.Dict,
+    ) -> typing.List[str]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def update_ad(
+        self,
+        ad_id: str,
+        ad_details: typing.Dict,
+    ) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def update_ads(self, ad_account_id: str, adgroup_id: str, ad_details: typing.Dict) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def update_ads_status(self, ad_account_id: str, ads_status_details: typing.Dict) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def create_image(self, ad_account_id: str, image_details: typing.Dict) -> str:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def update_image_name(self, ad_account_id: str, image_id: str, image_name: str) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_images_info(
+        self, ad_account_id: str, image_ids: typing.List[str]
+    ) -> typing.List[messages.ImageDetails]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def create_video(self, ad_account_id: str, video_details: typing.Dict) -> str:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def update_video_name(self, ad_account_id: str, video_id: str, video_name: str) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_videos_info(
+        self, ad_account_id: str, video_ids: typing.List[str]
+    ) -> typing.List[messages.VideoDetails]:
+        raise NotImplementedError
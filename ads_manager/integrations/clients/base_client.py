@@ -4,6 +4,7 @@ import typing
 
 from ads_manager import enums
 from ads_manager.integrations.clients import messages
+from ads_manager.integrations.gateways import pagination
 from ads_manager.integrations.gateways.facebook import client as facebook_api_client
 from ads_manager.integrations.gateways.tiktok import client as tiktok_api_client
 
@@ -29,15 +30,21 @@ class BaseClient(object):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def get_account_campaigns_details(self, ad_account_id: str) -> typing.List[messages.CampaignDetails]:
+    def get_account_campaigns_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.CampaignDetails]:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def get_account_adsets_details(self, ad_account_id: str) -> typing.List[messages.AdSetDetails]:
+    def get_account_adsets_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdSetDetails]:
         raise NotImplementedError
 
     @abc.abstractmethod
-    def get_account_ads_details(self, ad_account_id: str) -> typing.List[messages.AdDetails]:
+    def get_account_ads_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdDetails]:
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -55,9 +62,52 @@ class BaseClient(object):
         resource_type: enums.ResourceType,
         from_datetime: datetime.datetime,
         to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
     ) -> typing.List[messages.ResourceInsightsReport]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def iter_account_campaigns_details(
+        self,
+        ad_account_id: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        updated_since: typing.Optional[datetime.datetime] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.CampaignDetails]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_account_adsets_details(
+        self,
+        ad_account_id: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        updated_since: typing.Optional[datetime.datetime] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.AdSetDetails]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_account_ads_details(
+        self,
+        ad_account_id: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        updated_since: typing.Optional[datetime.datetime] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.AdDetails]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_insights(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.ResourceInsightsReport]]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def create_campaign(self, ad_account_id: str, campaign_details: typing.Dict) -> str:
         raise NotImplementedError
@@ -8,3 +8,7 @@ class ClientProviderError(ClientError):
 
 class ResponseDataNotValidError(ClientError):
     pass
+
+
+class ProjectionNotValidError(ClientError):
+    pass
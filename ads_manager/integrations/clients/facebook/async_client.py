@@ -0,0 +1,570 @@
+import asyncio
+import datetime
+import logging
+import typing
+
+from ads_manager import enums, utils
+from ads_manager.integrations.clients import async_base_client
+from ads_manager.integrations.clients import exceptions as client_exceptions
+from ads_manager.integrations.clients import insights_windows, messages
+from ads_manager.integrations.clients.facebook import (
+    constants as facebook_client_constants,
+)
+from ads_manager.integrations.clients.facebook import (
+    insights_scheduler as facebook_insights_scheduler,
+)
+from ads_manager.integrations.clients.facebook import parser as facebook_client_parser
+from ads_manager.integrations.gateways import async_connection_pool
+from ads_manager.integrations.gateways.facebook import (
+    async_client as async_facebook_api_client,
+)
+from ads_manager.integrations.gateways.facebook import (
+    exceptions as facebook_api_client_exceptions,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFacebookClient(async_base_client.AsyncBaseClient, facebook_client_parser.FacebookResponseParser):
+    def __init__(
+        self,
+        user_access_token: str,
+        params: typing.Optional[typing.Dict] = None,
+        connection_pool: typing.Optional[async_connection_pool.AsyncConnectionPool] = None,
+    ) -> None:
+        super().__init__(user_access_token=user_access_token, params=params, connection_pool=connection_pool)
+
+    def get_rest_api_client(self) -> async_facebook_api_client.AsyncFacebookApiClient:
+        if not self._rest_api_client:
+            self._rest_api_client = async_facebook_api_client.AsyncFacebookApiClient(
+                user_access_token=self._user_access_token, pool=self._connection_pool
+            )
+
+        return self._rest_api_client
+
+    async def get_account_ids(
+        self,
+    ) -> typing.List[messages.AdAccount]:
+        try:
+            response = await self.get_rest_api_client().get_accounts()
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch account ids (platform={}). Error: {}".format(
+                    enums.Platform.FACEBOOK.name, utils.get_exception_message(exception=e)
+                )
+            )
+
+        return self._parse_account_ids(response=response)
+
+    async def get_account_campaigns_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.CampaignDetails]:
+        return [
+            data
+            async for page in self.iter_account_campaigns_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
+        ]
+
+    async def iter_account_campaigns_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.AsyncIterator[typing.List[messages.CampaignDetails]]:
+        try:
+            async for page in self.get_rest_api_client().iter_account_campaigns(
+                ad_account=ad_account_id,
+                fields=self._get_resource_details_fields(
+                    resource_type=enums.ResourceType.CAMPAIGN, projection=projection
+                ),
+            ):
+                yield self._parse_campaigns_details(ad_account_id=ad_account_id, response=page, projection=projection)
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch campaign details (platform={}, ad_account_id={}) through provider. Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+    async def get_account_adsets_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdSetDetails]:
+        return [
+            data
+            async for page in self.iter_account_adsets_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
+        ]
+
+    async def iter_account_adsets_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.AsyncIterator[typing.List[messages.AdSetDetails]]:
+        try:
+            async for page in self.get_rest_api_client().iter_account_adsets(
+                ad_account=ad_account_id,
+                fields=self._get_resource_details_fields(
+                    resource_type=enums.ResourceType.AD_SET, projection=projection
+                ),
+            ):
+                yield self._parse_adsets_details(ad_account_id=ad_account_id, response=page, projection=projection)
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch adset details (platform={}, ad_account_id={}) through provider. Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+    async def get_account_ads_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdDetails]:
+        return [
+            data
+            async for page in self.iter_account_ads_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
+        ]
+
+    async def iter_account_ads_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.AsyncIterator[typing.List[messages.AdDetails]]:
+        try:
+            async for page in self.get_rest_api_client().iter_account_ads(
+                ad_account=ad_account_id,
+                fields=self._get_resource_details_fields(resource_type=enums.ResourceType.AD, projection=projection),
+            ):
+                yield self._parse_ads_details(ad_account_id=ad_account_id, response=page, projection=projection)
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch ad details (platform={}, ad_account_id={}) through provider. Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+    async def get_account_ad_creatives(self, ad_account_id: str) -> typing.List[messages.AdCreativeDetails]:
+        return [data async for page in self.iter_account_ad_creatives(ad_account_id=ad_account_id) for data in page]
+
+    async def iter_account_ad_creatives(
+        self, ad_account_id: str
+    ) -> typing.AsyncIterator[typing.List[messages.AdCreativeDetails]]:
+        try:
+            async for page in self.get_rest_api_client().iter_account_adcreatives(
+                ad_account=ad_account_id,
+                fields=self._get_resource_details_fields(resource_type=enums.ResourceType.AD_CREATIVE),
+            ):
+                yield self._parse_ad_creatives(ad_account_id=ad_account_id, response=page)
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch ad creative details (platform={}, ad_account_id={}) through provider. Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+    async def get_ad_creative(self, ad_creative_id: str) -> messages.AdCreativeDetails:
+        try:
+            response = await self.get_rest_api_client().get_resource_details(
+                resource_id=ad_creative_id,
+                fields=self._get_resource_details_fields(resource_type=enums.ResourceType.AD_CREATIVE),
+            )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch ad creative details (platform={}, ad_creative_id={}) through provider. Error: {}".format(
+                    enums.Platform.FACEBOOK,
+                    ad_creative_id,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return self._parse_ad_creative(ad_creative_id=ad_creative_id, response=response)
+
+    async def get_insights(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.ResourceInsightsReport]:
+        """
+        Ranges longer than `FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS` run as one report per window, all submitted up front
+        and polled together, and the results are merged in date order.
+        """
+        scheduler = facebook_insights_scheduler.AsyncInsightsJobScheduler(client=self)
+        for window_from_datetime, window_to_datetime in insights_windows.split_date_range(
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            max_days=facebook_client_constants.FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS,
+        ):
+            await scheduler.submit(
+                ad_account_id=ad_account_id,
+                resource_type=resource_type,
+                from_datetime=window_from_datetime,
+                to_datetime=window_to_datetime,
+                projection=projection,
+            )
+        insights_jobs = await scheduler.run()
+
+        return insights_windows.merge_insights_reports(
+            reports=[data for insights_job in insights_jobs for data in insights_job.results]
+        )
+
+    async def iter_insights(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.AsyncIterator[typing.List[messages.ResourceInsightsReport]]:
+        """
+        Ranges longer than `FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS` run as one report per window, all submitted up front
+        and polled together, and the results are paged in date order.
+        """
+        scheduler = facebook_insights_scheduler.AsyncInsightsJobScheduler(client=self, fetch_results=False)
+        insights_jobs = [
+            await scheduler.submit(
+                ad_account_id=ad_account_id,
+                resource_type=resource_type,
+                from_datetime=window_from_datetime,
+                to_datetime=window_to_datetime,
+                projection=projection,
+            )
+            for window_from_datetime, window_to_datetime in insights_windows.split_date_range(
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+                max_days=facebook_client_constants.FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS,
+            )
+        ]
+        await scheduler.run()
+
+        for insights_job in insights_jobs:
+            async for page in self.iter_insights_report_results(
+                ad_account_id=ad_account_id,
+                report_id=insights_job.report_id,
+                resource_type=resource_type,
+                from_datetime=insights_job.from_datetime,
+                to_datetime=insights_job.to_datetime,
+                projection=projection,
+            ):
+                yield page
+
+    async def get_accounts_insights(
+        self,
+        ad_account_ids: typing.List[str],
+        resource_types: typing.List[enums.ResourceType],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        fetch_results: bool = True,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[facebook_insights_scheduler.InsightsJob]:
+        """
+        One job per account, resource type and window of at most `FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS` days.
+        """
+        windows = insights_windows.split_date_range(
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            max_days=facebook_client_constants.FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS,
+        )
+        scheduler = facebook_insights_scheduler.AsyncInsightsJobScheduler(client=self, fetch_results=fetch_results)
+        await asyncio.gather(
+            *[
+                scheduler.submit(
+                    ad_account_id=ad_account_id,
+                    resource_type=resource_type,
+                    from_datetime=window_from_datetime,
+                    to_datetime=window_to_datetime,
+                    projection=projection,
+                )
+                for ad_account_id in ad_account_ids
+                for resource_type in resource_types
+                for window_from_datetime, window_to_datetime in windows
+            ]
+        )
+
+        return await scheduler.run()
+
+    async def create_insights_report(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> str:
+        try:
+            report = await self.get_rest_api_client().create_insights_report(
+                ad_account=ad_account_id,
+                level=resource_type.value,
+                fields=self._get_resource_insights_fields(resource_type=resource_type, projection=projection),
+                time_increment=enums.TimeIncrement.DAY.value,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create insights report job (platform={}, ad_account_id={}, resource_type={}, from_datetime={}, to_datetime={}) through provider. Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    resource_type.name,
+                    from_datetime,
+                    to_datetime,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        logger.info("Created report (data={})".format(report))
+
+        report_id = report.get("report_run_id")
+        if not report_id:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Report job id is not received from provider (platform={}, response_data={})".format(
+                    enums.Platform.FACEBOOK.name, report_id
+                )
+            )
+
+        return report_id
+
+    async def get_insights_report_status(self, report_id: str) -> typing.Dict:
+        try:
+            report_status = await self.get_rest_api_client().get_insights_report_status(report_id=report_id)
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to get insights report status (platform={}, report_id={}) through provider. Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    report_id,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return self._parse_insights_report_status(report_id=report_id, report_status=report_status)
+
+    async def get_insights_report_results(
+        self,
+        ad_account_id: str,
+        report_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.ResourceInsightsReport]:
+        return [
+            data
+            async for page in self.iter_insights_report_results(
+                ad_account_id=ad_account_id,
+                report_id=report_id,
+                resource_type=resource_type,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+                projection=projection,
+            )
+            for data in page
+        ]
+
+    async def iter_insights_report_results(
+        self,
+        ad_account_id: str,
+        report_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.AsyncIterator[typing.List[messages.ResourceInsightsReport]]:
+        try:
+            async for page in self.get_rest_api_client().iter_insights_report_results(report_id=report_id):
+                yield self._parse_insights_report_results(
+                    report_id=report_id, resource_type=resource_type, report_results=page, projection=projection
+                )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to get insights report results (platform={}, ad_account_id={}, resource_type={}, from_datetime={}, to_datetime={}) through provider. Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    resource_type.name,
+                    from_datetime,
+                    to_datetime,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+    async def create_campaign(
+        self,
+        ad_account_id: str,
+        campaign_details: typing.Dict,
+    ) -> str:
+        validated_campaign_details = self._validate_campaign_details(campaign_details=campaign_details)
+
+        try:
+            created_campaign = await self.get_rest_api_client().create_campaign(
+                ad_account=ad_account_id, params=validated_campaign_details
+            )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create campaign (platform={}, ad_account_id={}, campaign_details={}). Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    campaign_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return created_campaign["id"]
+
+    async def update_campaign(
+        self,
+        ad_account_id: str,
+        campaign_id: str,
+        campaign_details: typing.Dict,
+    ) -> bool:
+        try:
+            updated_campaign = await self.get_rest_api_client().update_campaign(
+                campaign_id=campaign_id, params=campaign_details
+            )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update campaign (platform={}, campaign_id={}, campaign_details={}). Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    campaign_id,
+                    campaign_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return updated_campaign["success"]
+
+    async def create_adset(
+        self,
+        ad_account_id: str,
+        adset_details: typing.Dict,
+    ) -> str:
+        validated_adset_details = self._validate_adset_details(adset_details=adset_details)
+
+        try:
+            created_adset = await self.get_rest_api_client().create_adset(
+                ad_account_id=ad_account_id, params=validated_adset_details
+            )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create adset (platform={}, ad_account_id={}, adset_details={}). Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    adset_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return created_adset["id"]
+
+    async def update_adset(
+        self,
+        ad_account_id: str,
+        adset_id: str,
+        adset_details: typing.Dict,
+    ) -> bool:
+        try:
+            updated_adset = await self.get_rest_api_client().update_adset(adset_id=adset_id, params=adset_details)
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update adset (platform={}, adset_id={}, adset_details={}). Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    adset_id,
+                    adset_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return updated_adset["success"]
+
+    async def create_adcreative(
+        self,
+        ad_account_id: str,
+        adcreative_details: typing.Dict,
+    ) -> str:
+        validated_adcreative_details = self._validate_adcreative_details(adcreative_details=adcreative_details)
+
+        try:
+            created_adcreative = await self.get_rest_api_client().create_adcreative(
+                ad_account_id=ad_account_id, params=validated_adcreative_details
+            )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create adcreative (platform={}, ad_account_id={}, adcreative_details={}). Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    adcreative_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return created_adcreative["id"]
+
+    async def update_adcreative(
+        self,
+        adcreative_id: str,
+        adcreative_details: typing.Dict,
+    ) -> bool:
+        try:
+            updated_adcreative = await self.get_rest_api_client().update_adcreative(
+                adcreative_id=adcreative_id, params=adcreative_details
+            )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update adcreative (platform={}, adcreative_id={}, adcreative_details={}). Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    adcreative_id,
+                    adcreative_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return updated_adcreative["success"]
+
+    async def create_ad(
+        self,
+        ad_account_id: str,
+        ad_details: typing.Dict,
+    ) -> str:
+        validated_ad_details = self._validate_ad_details(ad_details=ad_details)
+
+        try:
+            created_ad = await self.get_rest_api_client().create_ad(
+                ad_account_id=ad_account_id, params=validated_ad_details
+            )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create ad (platform={}, ad_account_id={}, ad_details={}). Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    ad_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return created_ad["id"]
+
+    async def create_ads(self, ad_account_id: str, ads_details: typing.Dict) -> typing.List[str]:
+        return list(
+            await asyncio.gather(
+                *[self.create_ad(ad_account_id=ad_account_id, ad_details=ad_details) for ad_details in ads_details]
+            )
+        )
+
+    async def update_ad(
+        self,
+        ad_id: str,
+        ad_details: typing.Dict,
+    ) -> bool:
+        try:
+            updated_ad = await self.get_rest_api_client().update_ad(ad_id=ad_id, params=ad_details)
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update ad (platform={}, ad_id={}, ad_details={}). Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_id,
+                    ad_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return updated_ad["success"]
@@ -1,17 +1,19 @@
 import datetime
-import json
 import logging
-import time
 import typing
 
 from ads_manager import enums, utils
 from ads_manager.integrations.clients import base_client
 from ads_manager.integrations.clients import exceptions as client_exceptions
-from ads_manager.integrations.clients import messages
+from ads_manager.integrations.clients import insights_windows, messages
 from ads_manager.integrations.clients.facebook import (
     constants as facebook_client_constants,
 )
-from ads_manager.integrations.clients.facebook import schemas as facebook_client_schemas
+from ads_manager.integrations.clients.facebook import (
+    insights_scheduler as facebook_insights_scheduler,
+)
+from ads_manager.integrations.clients.facebook import parser as facebook_client_parser
+from ads_manager.integrations.gateways import pagination
 from ads_manager.integrations.gateways.facebook import client as facebook_api_client
 from ads_manager.integrations.gateways.facebook import (
     exceptions as facebook_api_client_exceptions,
@@ -22,7 +24,7 @@ from ads_manager.integrations.gateways.facebook import (
 logger = logging.getLogger(__name__)
 
 
-class FacebookClient(base_client.BaseClient):
+class FacebookClient(base_client.BaseClient, facebook_client_parser.FacebookResponseParser):
     def __init__(self, user_access_token: str, params: typing.Optional[typing.Dict] = None) -> None:
         super().__init__(user_access_token=user_access_token, params=params)
 
@@ -44,28 +46,39 @@ class FacebookClient(base_client.BaseClient):
                 )
             )
 
-        validated_data = utils.validate_marshmallow_schema(data=response, schema=facebook_client_schemas.AdAccounts())
-        if not validated_data:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Account data fetched (platform={}, response_data={}) is not valid".format(
-                    enums.Platform.FACEBOOK.name, response
-                )
-            )
+        return self._parse_account_ids(response=response)
 
-        message_to_return = [
-            messages.AdAccount(id_token=data["account_id"], account_id=data["id"], account_name=None)
-            for data in validated_data["ad_accounts"]
+    def get_account_campaigns_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.CampaignDetails]:
+        return [
+            data
+            for page in self.iter_account_campaigns_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
         ]
 
-        # return [data["id"] for data in validated_data["ad_accounts"]]
-        return message_to_return
-
-    def get_account_campaigns_details(self, ad_account_id: str) -> typing.List[messages.CampaignDetails]:
+    def iter_account_campaigns_details(
+        self,
+        ad_account_id: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        updated_since: typing.Optional[datetime.datetime] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.CampaignDetails]]:
         try:
-            response = self.get_rest_api_client().get_account_campaigns(
+            for page in self.get_rest_api_client().iter_account_campaigns(
                 ad_account=ad_account_id,
-                fields=self._get_resource_details_fields(resource_type=enums.ResourceType.CAMPAIGN),
-            )
+                fields=self._get_resource_details_fields(
+                    resource_type=enums.ResourceType.CAMPAIGN, projection=projection
+                ),
+                cursor=cursor,
+                filtering=self._get_updated_since_filtering(updated_since=updated_since),
+            ):
+                yield utils.filter_updated_since(
+                    details=self._parse_campaigns_details(
+                        ad_account_id=ad_account_id, response=page, projection=projection
+                    ),
+                    updated_since=updated_since,
+                )
         except facebook_api_client_exceptions.FacebookAPIClientError as e:
             raise client_exceptions.ClientProviderError(
                 "Unable to fetch campaign details (platform={}, ad_account_id={}) through provider. Error: {}".format(
@@ -75,37 +88,37 @@ class FacebookClient(base_client.BaseClient):
                 )
             )
 
-        validated_data = utils.validate_marshmallow_schema(
-            data=response, schema=facebook_client_schemas.CampaignsDetails()
-        )
-        if not validated_data:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Campaign details data fetched (platform={}, ad_account_id={}, response_data={}) is not valid".format(
-                    enums.Platform.FACEBOOK.name, ad_account_id, response
-                )
-            )
-
-        message_to_return = [
-            messages.CampaignDetails(
-                account_id=data["account_id"],
-                campaign_id=data["id"],
-                campaign_name=data["name"],
-                effective_status=data["effective_status"],
-                configured_status=data["configured_status"],
-                created_time=data["created_time"],
-                updated_time=data["updated_time"],
-            )
-            for data in validated_data["campaigns_details"]
+    def get_account_adsets_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdSetDetails]:
+        return [
+            data
+            for page in self.iter_account_adsets_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
         ]
 
-        return message_to_return
-
-    def get_account_adsets_details(self, ad_account_id: str) -> typing.List[messages.AdSetDetails]:
+    def iter_account_adsets_details(
+        self,
+        ad_account_id: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        updated_since: typing.Optional[datetime.datetime] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.AdSetDetails]]:
         try:
-            response = self.get_rest_api_client().get_account_adsets(
+            for page in self.get_rest_api_client().iter_account_adsets(
                 ad_account=ad_account_id,
-                fields=self._get_resource_details_fields(resource_type=enums.ResourceType.AD_SET),
-            )
+                fields=self._get_resource_details_fields(
+                    resource_type=enums.ResourceType.AD_SET, projection=projection
+                ),
+                cursor=cursor,
+                filtering=self._get_updated_since_filtering(updated_since=updated_since),
+            ):
+                yield utils.filter_updated_since(
+                    details=self._parse_adsets_details(
+                        ad_account_id=ad_account_id, response=page, projection=projection
+                    ),
+                    updated_since=updated_since,
+                )
         except facebook_api_client_exceptions.FacebookAPIClientError as e:
             raise client_exceptions.ClientProviderError(
                 "Unable to fetch adset details (platform={}, ad_account_id={}) through provider. Error: {}".format(
@@ -115,38 +128,33 @@ class FacebookClient(base_client.BaseClient):
                 )
             )
 
-        validated_data = utils.validate_marshmallow_schema(
-            data=response, schema=facebook_client_schemas.AdSetsDetails()
-        )
-        if not validated_data:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Adset details data (platform={}, ad_account_id={}, response_data={}) is not valid".format(
-                    enums.Platform.FACEBOOK.name, ad_account_id, response
-                )
-            )
-
-        message_to_return = [
-            messages.AdSetDetails(
-                account_id=data["account_id"],
-                campaign_id=data["campaign_id"],
-                adset_id=data["id"],
-                adset_name=data["name"],
-                effective_status=data["effective_status"],
-                configured_status=data["configured_status"],
-                created_time=data["created_time"],
-                updated_time=data["updated_time"],
-            )
-            for data in validated_data["adsets_details"]
+    def get_account_ads_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdDetails]:
+        return [
+            data
+            for page in self.iter_account_ads_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
         ]
 
-        return message_to_return
-
-    def get_account_ads_details(self, ad_account_id: str) -> typing.List[messages.AdDetails]:
+    def iter_account_ads_details(
+        self,
+        ad_account_id: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        updated_since: typing.Optional[datetime.datetime] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.AdDetails]]:
         try:
-            response = self.get_rest_api_client().get_account_ads(
+            for page in self.get_rest_api_client().iter_account_ads(
                 ad_account=ad_account_id,
-                fields=self._get_resource_details_fields(resource_type=enums.ResourceType.AD),
-            )
+                fields=self._get_resource_details_fields(resource_type=enums.ResourceType.AD, projection=projection),
+                cursor=cursor,
+                filtering=self._get_updated_since_filtering(updated_since=updated_since),
+            ):
+                yield utils.filter_updated_since(
+                    details=self._parse_ads_details(ad_account_id=ad_account_id, response=page, projection=projection),
+                    updated_since=updated_since,
+                )
         except facebook_api_client_exceptions.FacebookAPIClientError as e:
             raise client_exceptions.ClientProviderError(
                 "Unable to fetch ad details (platform={}, ad_account_id={}) through provider. Error: {}".format(
@@ -156,37 +164,19 @@ class FacebookClient(base_client.BaseClient):
                 )
             )
 
-        validated_data = utils.validate_marshmallow_schema(data=response, schema=facebook_client_schemas.AdsDetails())
-        if not validated_data:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Ad details data (platform={}, ad_account_id={}, response_data={}) is not valid".format(
-                    enums.Platform.FACEBOOK.name, ad_account_id, response
-                )
-            )
-
-        message_to_return = [
-            messages.AdDetails(
-                account_id=data["account_id"],
-                campaign_id=data["campaign_id"],
-                adset_id=data["ad_id"],
-                ad_id=data["id"],
-                ad_name=data["name"],
-                effective_status=data["effective_status"],
-                configured_status=data["configured_status"],
-                created_time=data["created_time"],
-                updated_time=data["updated_time"],
-            )
-            for data in validated_data["ads_details"]
-        ]
-
-        return message_to_return
-
     def get_account_ad_creatives(self, ad_account_id: str) -> typing.List[messages.AdCreativeDetails]:
+        return [data for page in self.iter_account_ad_creatives(ad_account_id=ad_account_id) for data in page]
+
+    def iter_account_ad_creatives(
+        self, ad_account_id: str, cursor: typing.Optional[pagination.PageCursor] = None
+    ) -> typing.Iterator[typing.List[messages.AdCreativeDetails]]:
         try:
-            response = self.get_rest_api_client().get_account_adcreatives(
+            for page in self.get_rest_api_client().iter_account_adcreatives(
                 ad_account=ad_account_id,
                 fields=self._get_resource_details_fields(resource_type=enums.ResourceType.AD_CREATIVE),
-            )
+                cursor=cursor,
+            ):
+                yield self._parse_ad_creatives(ad_account_id=ad_account_id, response=page)
         except facebook_api_client_exceptions.FacebookAPIClientError as e:
             raise client_exceptions.ClientProviderError(
                 "Unable to fetch ad creative details (platform={}, ad_account_id={}) through provider. Error: {}".format(
@@ -196,30 +186,6 @@ class FacebookClient(base_client.BaseClient):
                 )
             )
 
-        validated_data = utils.validate_marshmallow_schema(
-            data=response, schema=facebook_client_schemas.AdCreativesDetails()
-        )
-        if not validated_data:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Ad creatives data (platform={}, ad_account_id={}, response_data={}) is not valid".format(
-                    enums.Platform.FACEBOOK.name, ad_account_id, response
-                )
-            )
-
-        message_to_return = [
-            messages.AdCreativeDetails(
-                account_id=data["account_id"],
-                creative_id=data["id"],
-                creative_name=data.get("name", None),
-                title=data.get("title", None),
-                body=data.get("body", None),
-                image_url=data.get("image_url", None),
-            )
-            for data in validated_data["adcreatives_details"]
-        ]
-
-        return message_to_return
-
     def get_ad_creative(self, ad_creative_id: str) -> messages.AdCreativeDetails:
         try:
             response = self.get_rest_api_client().get_resource_details(
@@ -235,26 +201,30 @@ class FacebookClient(base_client.BaseClient):
                 )
             )
 
-        validated_data = utils.validate_marshmallow_schema(
-            data=response, schema=facebook_client_schemas.AdCreativeDetails()
-        )
-        if not validated_data:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Ad creative data (platform={}, ad_creative_id={}, response_data={}) is not valid".format(
-                    enums.Platform.FACEBOOK.name, ad_creative_id, response
+        return self._parse_ad_creative(ad_creative_id=ad_creative_id, response=response)
+
+    def get_ad_creatives(self, ad_creative_ids: typing.List[str]) -> typing.List[messages.AdCreativeDetails]:
+        """
+        Details of several ad creatives, fetched with `?ids=` lookups of up to 50 creatives per call.
+        """
+        try:
+            response = self.get_rest_api_client().get_resources_details(
+                resource_ids=ad_creative_ids,
+                fields=self._get_resource_details_fields(resource_type=enums.ResourceType.AD_CREATIVE),
+            )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch ad creatives details (platform={}, ad_creative_ids={}) through provider. Error: {}".format(
+                    enums.Platform.FACEBOOK,
+                    ad_creative_ids,
+                    utils.get_exception_message(exception=e),
                 )
             )
 
-        message_to_return = messages.AdCreativeDetails(
-            account_id=validated_data["account_id"],
-            creative_id=validated_data["id"],
-            creative_name=validated_data.get("name", None),
-            title=validated_data.get("title", None),
-            body=validated_data.get("body", None),
-            image_url=validated_data.get("image_url", None),
-        )
-
-        return message_to_return
+        return [
+            self._parse_ad_creative(ad_creative_id=ad_creative_id, response=response.get(ad_creative_id))
+            for ad_creative_id in ad_creative_ids
+        ]
 
     def get_insights(
         self,
@@ -262,12 +232,139 @@ class FacebookClient(base_client.BaseClient):
         resource_type: enums.ResourceType,
         from_datetime: datetime.datetime,
         to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
     ) -> typing.List[messages.ResourceInsightsReport]:
+        """
+        Ranges longer than `FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS` run as one report per window, all submitted up front
+        and polled together, and the results are merged in date order.
+        """
+        scheduler = facebook_insights_scheduler.InsightsJobScheduler(client=self)
+        for window_from_datetime, window_to_datetime in insights_windows.split_date_range(
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            max_days=facebook_client_constants.FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS,
+        ):
+            scheduler.submit(
+                ad_account_id=ad_account_id,
+                resource_type=resource_type,
+                from_datetime=window_from_datetime,
+                to_datetime=window_to_datetime,
+                projection=projection,
+            )
+        insights_jobs = scheduler.run()
+
+        return insights_windows.merge_insights_reports(
+            reports=[data for insights_job in insights_jobs for data in insights_job.results]
+        )
+
+    def iter_insights(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.ResourceInsightsReport]]:
+        """
+        Ranges longer than `FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS` run as one report per window, one after another.
+
+        A `cursor` with a `report_id` (of a finished report) resumes paging its results instead of creating a new
+        report, otherwise the id of the created report is stored in the cursor once the report is finished.
+        """
+        yield from insights_windows.iter_windows_pages(
+            windows=insights_windows.split_date_range(
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+                max_days=facebook_client_constants.FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS,
+            ),
+            iter_window_pages=lambda window_from_datetime, window_to_datetime, window_cursor: self._iter_window_insights(
+                ad_account_id=ad_account_id,
+                resource_type=resource_type,
+                from_datetime=window_from_datetime,
+                to_datetime=window_to_datetime,
+                cursor=window_cursor,
+                projection=projection,
+            ),
+            cursor=cursor,
+        )
+
+    def get_accounts_insights(
+        self,
+        ad_account_ids: typing.List[str],
+        resource_types: typing.List[enums.ResourceType],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        fetch_results: bool = True,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[facebook_insights_scheduler.InsightsJob]:
+        """
+        One job per account, resource type and window of at most `FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS` days, in that
+        order.
+        """
+        windows = insights_windows.split_date_range(
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            max_days=facebook_client_constants.FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS,
+        )
+        scheduler = facebook_insights_scheduler.InsightsJobScheduler(client=self, fetch_results=fetch_results)
+        for ad_account_id in ad_account_ids:
+            for resource_type in resource_types:
+                for window_from_datetime, window_to_datetime in windows:
+                    scheduler.submit(
+                        ad_account_id=ad_account_id,
+                        resource_type=resource_type,
+                        from_datetime=window_from_datetime,
+                        to_datetime=window_to_datetime,
+                        projection=projection,
+                    )
+
+        return scheduler.run()
+
+    def _iter_window_insights(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        cursor: pagination.PageCursor,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.ResourceInsightsReport]]:
+        if not cursor.report_id:
+            scheduler = facebook_insights_scheduler.InsightsJobScheduler(client=self, fetch_results=False)
+            insights_job = scheduler.submit(
+                ad_account_id=ad_account_id,
+                resource_type=resource_type,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+                projection=projection,
+            )
+            scheduler.run()
+            cursor.report_id = insights_job.report_id
+
+        yield from self.iter_insights_report_results(
+            ad_account_id=ad_account_id,
+            report_id=cursor.report_id,
+            resource_type=resource_type,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            cursor=cursor,
+            projection=projection,
+        )
+
+    def create_insights_report(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> str:
         try:
             report = self.get_rest_api_client().create_insights_report(
                 ad_account=ad_account_id,
                 level=resource_type.value,
-                fields=self._get_resource_insights_fields(resource_type=resource_type),
+                fields=self._get_resource_insights_fields(resource_type=resource_type, projection=projection),
                 time_increment=enums.TimeIncrement.DAY.value,
                 from_datetime=from_datetime,
                 to_datetime=to_datetime,
@@ -294,31 +391,59 @@ class FacebookClient(base_client.BaseClient):
                 )
             )
 
-        while True:
+        return report_id
+
+    def get_insights_report_status(self, report_id: str) -> typing.Dict:
+        try:
             report_status = self.get_rest_api_client().get_insights_report_status(report_id=report_id)
-            report_status_validated_data = utils.validate_marshmallow_schema(
-                data=report_status, schema=facebook_client_schemas.ReportStatus()
-            )
-            if not report_status_validated_data:
-                raise client_exceptions.ResponseDataNotValidError(
-                    "Report status data (platform={}, report_id={}, response_data={}) is not valid".format(
-                        enums.Platform.FACEBOOK.name, report_id, report_status
-                    )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to get insights report status (platform={}, report_id={}) through provider. Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    report_id,
+                    utils.get_exception_message(exception=e),
                 )
+            )
 
-            if (
-                not report_status_validated_data["is_running"]
-                and report_status_validated_data["async_percent_completion"] == 100
-            ):
-                break
-
-            logger.warning("Waiting for report {}: {}".format(report_id, json.dumps(report_status)))
-            time.sleep(5)
+        return self._parse_insights_report_status(report_id=report_id, report_status=report_status)
 
-        logger.warning("Report {} for account {} is ready".format(report_id, ad_account_id))
+    def get_insights_report_results(
+        self,
+        ad_account_id: str,
+        report_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.ResourceInsightsReport]:
+        return [
+            data
+            for page in self.iter_insights_report_results(
+                ad_account_id=ad_account_id,
+                report_id=report_id,
+                resource_type=resource_type,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+                projection=projection,
+            )
+            for data in page
+        ]
 
+    def iter_insights_report_results(
+        self,
+        ad_account_id: str,
+        report_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.ResourceInsightsReport]]:
         try:
-            report_results = self.get_rest_api_client().get_insights_report_results(report_id=report_id)
+            for page in self.get_rest_api_client().iter_insights_report_results(report_id=report_id, cursor=cursor):
+                yield self._parse_insights_report_results(
+                    report_id=report_id, resource_type=resource_type, report_results=page, projection=projection
+                )
         except facebook_api_client_exceptions.FacebookAPIClientError as e:
             raise client_exceptions.ClientProviderError(
                 "Unable to get insights report results (platform={}, ad_account_id={}, resource_type={}, from_datetime={}, to_datetime={}) through provider. Error: {}".format(
@@ -331,69 +456,12 @@ class FacebookClient(base_client.BaseClient):
                 )
             )
 
-        validated_report_results = utils.validate_marshmallow_schema(
-            data=report_results,
-            schema=facebook_client_constants.FACEBOOK_INSIGHTS_SCHEMAS[resource_type](),
-        )
-        if not validated_report_results:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Insights report data obtained from provider is not valid (platform={}, report_id={}, resource_type={})".format(
-                    enums.Platform.FACEBOOK.name, report_id, resource_type.name
-                )
-            )
-
-        message_to_return = [
-            messages.ResourceInsightsReport(
-                account_id=data["account_id"],
-                account_name=data["account_name"],
-                resource_type=resource_type.name,
-                campaign_id=data["campaign_id"],
-                campaign_name=data["campaign_name"],
-                adset_id=data.get("adset_id", None),
-                adset_name=data.get("adset_name", None),
-                ad_id=data.get("ad_id", None),
-                ad_name=data.get("ad_name", None),
-                spend="{}".format(data["spend"]),
-                impressions=data["impressions"],
-                clicks=data["clicks"],
-                ctr="{}".format(data["ctr"]) if data["ctr"] is not None else None,
-                cpm="{}".format(data["cpm"]) if data["cpm"] is not None else None,
-                cpc="{}".format(data["cpc"]) if data["cpc"] is not None else None,
-                reach=data["reach"],
-                actions=data["actions"],
-                conversions=data["conversions"],
-                cost_per_conversion=data["cost_per_conversion"],
-                conversion_rate=[
-                    {
-                        "action_type": conversion["action_type"],
-                        "value": (float(conversion["value"]) / float(data["clicks"])) * 100,
-                    }
-                    for conversion in data["conversions"]
-                ],
-                date_start=data["date_start"],
-                date_stop=data["date_stop"],
-            )
-            for data in validated_report_results["insights"]
-        ]
-
-        return message_to_return
-
     def create_campaign(
         self,
         ad_account_id: str,
         campaign_details: typing.Dict,
     ) -> str:
-        validated_campaign_details = utils.validate_marshmallow_schema(
-            data=campaign_details, schema=facebook_client_schemas.Campaign()
-        )
-
-        if not validated_campaign_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate campaign details (platform={}, campaign_details={})".format(
-                    enums.Platform.FACEBOOK.name,
-                    campaign_details,
-                )
-            )
+        validated_campaign_details = self._validate_campaign_details(campaign_details=campaign_details)
 
         try:
             created_campaign = self.get_rest_api_client().create_campaign(
@@ -438,17 +506,7 @@ class FacebookClient(base_client.BaseClient):
         ad_account_id: str,
         adset_details: typing.Dict,
     ) -> str:
-        validated_adset_details = utils.validate_marshmallow_schema(
-            data=adset_details, schema=facebook_client_schemas.AdSet()
-        )
-
-        if not validated_adset_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate adset details from provider (platform={}, adset_details={})".format(
-                    enums.Platform.FACEBOOK.name,
-                    adset_details,
-                )
-            )
+        validated_adset_details = self._validate_adset_details(adset_details=adset_details)
 
         try:
             created_adset = self.get_rest_api_client().create_adset(
@@ -491,17 +549,7 @@ class FacebookClient(base_client.BaseClient):
         ad_account_id: str,
         adcreative_details: typing.Dict,
     ) -> str:
-        validated_adcreative_details = utils.validate_marshmallow_schema(
-            data=adcreative_details, schema=facebook_client_schemas.AdCreative()
-        )
-
-        if not validated_adcreative_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate adcreative details (platform={}, adcreative_details={})".format(
-                    enums.Platform.FACEBOOK.name,
-                    adcreative_details,
-                )
-            )
+        validated_adcreative_details = self._validate_adcreative_details(adcreative_details=adcreative_details)
 
         try:
             created_adcreative = self.get_rest_api_client().create_adcreative(
@@ -545,15 +593,7 @@ class FacebookClient(base_client.BaseClient):
         ad_account_id: str,
         ad_details: typing.Dict,
     ) -> str:
-        validated_ad_details = utils.validate_marshmallow_schema(data=ad_details, schema=facebook_client_schemas.Ad())
-
-        if not validated_ad_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate ad details (platform={}, ad_details={})".format(
-                    enums.Platform.FACEBOOK.name,
-                    ad_details,
-                )
-            )
+        validated_ad_details = self._validate_ad_details(ad_details=ad_details)
 
         try:
             created_ad = self.get_rest_api_client().create_ad(ad_account_id=ad_account_id, params=validated_ad_details)
@@ -570,12 +610,42 @@ class FacebookClient(base_client.BaseClient):
         return created_ad["id"]
 
     def create_ads(self, ad_account_id: str, ads_details: typing.Dict) -> typing.List[str]:
-        created_ad_ids = []
+        """
+        Creates the ads with Graph API batches of up to 50 ads per call. Ads of a batch are created independently,
+        when some fail the error lists the ids of the ads that were created.
+        """
+        validated_ads_details = [self._validate_ad_details(ad_details=ad_details) for ad_details in ads_details]
+
+        try:
+            batch_responses = self.get_rest_api_client().create_ads(
+                ad_account_id=ad_account_id, ads_params=validated_ads_details
+            )
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create ads (platform={}, ad_account_id={}, ads_details={}). Error: {}".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    ads_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
 
-        for ad_details in ads_details:
-            created_ad_ids.append(self.create_ad(ad_account_id=ad_account_id, ad_details=ad_details))
+        failed_ads = {
+            index: batch_response.error for index, batch_response in enumerate(batch_responses) if not batch_response.ok
+        }
+        if failed_ads:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create {} of {} ads (platform={}, ad_account_id={}, created_ad_ids={}, errors={})".format(
+                    len(failed_ads),
+                    len(batch_responses),
+                    enums.Platform.FACEBOOK.name,
+                    ad_account_id,
+                    [batch_response.body["id"] for batch_response in batch_responses if batch_response.ok],
+                    failed_ads,
+                )
+            )
 
-        return created_ad_ids
+        return [batch_response.body["id"] for batch_response in batch_responses]
 
     def update_ad(
         self,
@@ -596,10 +666,49 @@ class FacebookClient(base_client.BaseClient):
 
         return updated_ad["success"]
 
-    @staticmethod
-    def _get_resource_details_fields(resource_type: enums.ResourceType) -> str:
-        return ",".join(facebook_client_constants.FACEBOOK_RESOURCE_DETAILS_FIELDS[resource_type])
+    def update_ads_batch(self, ads_details: typing.Dict[str, typing.Dict]) -> typing.Dict[str, bool]:
+        return self._update_resources(resource_name="ads", resources_details=ads_details)
+
+    def update_campaigns(self, campaigns_details: typing.Dict[str, typing.Dict]) -> typing.Dict[str, bool]:
+        return self._update_resources(resource_name="campaigns", resources_details=campaigns_details)
+
+    def update_adsets(self, adsets_details: typing.Dict[str, typing.Dict]) -> typing.Dict[str, bool]:
+        return self._update_resources(resource_name="adsets", resources_details=adsets_details)
+
+    def _update_resources(
+        self, resource_name: str, resources_details: typing.Dict[str, typing.Dict]
+    ) -> typing.Dict[str, bool]:
+        """
+        Updates objects by id with Graph API batches of up to 50 updates per call, returning `success` by id. Objects
+        are addressed by their own id, so no ad account is needed.
+        """
+        try:
+            batch_responses = self.get_rest_api_client().update_resources(resources_params=resources_details)
+        except facebook_api_client_exceptions.FacebookAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update {} (platform={}, {}_details={}). Error: {}".format(
+                    resource_name,
+                    enums.Platform.FACEBOOK.name,
+                    resource_name,
+                    resources_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        failed_resources = {
+            resource_id: batch_response.error
+            for resource_id, batch_response in batch_responses.items()
+            if not batch_response.ok
+        }
+        if failed_resources:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update {} of {} {} (platform={}, errors={})".format(
+                    len(failed_resources),
+                    len(batch_responses),
+                    resource_name,
+                    enums.Platform.FACEBOOK.name,
+                    failed_resources,
+                )
+            )
 
-    @staticmethod
-    def _get_resource_insights_fields(resource_type: enums.ResourceType) -> str:
-        return ",".join(facebook_client_constants.FACEBOOK_INSIGHTS_DETAILS_FIELDS[resource_type])
+        return {resource_id: batch_response.body["success"] for resource_id, batch_response in batch_responses.items()}
@@ -1,4 +1,5 @@
 from ads_manager import enums
+from ads_manager.integrations.clients import field_projection, messages
 from ads_manager.integrations.clients.facebook import schemas as facebook_client_schemas
 
 FACEBOOK_RESOURCE_DETAILS_FIELDS = {
@@ -112,3 +113,80 @@ FACEBOOK_INSIGHTS_SCHEMAS = {
     enums.ResourceType.AD_SET: facebook_client_schemas.AdSetsInsightReport,
     enums.ResourceType.AD: facebook_client_schemas.AdsInsightReport,
 }
+
+# Provider fields every projectable message field is built from, see `field_projection.ProjectionSpec`
+FACEBOOK_RESOURCE_DETAILS_PROJECTION_FIELDS = {
+    enums.ResourceType.CAMPAIGN: {
+        "campaign_name": ["name"],
+        "effective_status": ["effective_status"],
+        "configured_status": ["configured_status"],
+        "created_time": ["created_time"],
+    },
+    enums.ResourceType.AD_SET: {
+        "adset_name": ["name"],
+        "effective_status": ["effective_status"],
+        "configured_status": ["configured_status"],
+        "created_time": ["created_time"],
+    },
+    enums.ResourceType.AD: {
+        "ad_name": ["name"],
+        "effective_status": ["effective_status"],
+        "configured_status": ["configured_status"],
+        "created_time": ["created_time"],
+    },
+}
+
+FACEBOOK_INSIGHTS_PROJECTION_FIELDS = {
+    "spend": ["spend"],
+    "impressions": ["impressions"],
+    "clicks": ["clicks"],
+    "ctr": ["ctr"],
+    "cpm": ["cpm"],
+    "cpc": ["cpc"],
+    "reach": ["reach"],
+    "actions": ["actions"],
+    "conversions": ["conversions"],
+    "cost_per_conversion": ["cost_per_conversion"],
+    "conversion_rate": ["conversions", "clicks"],
+}
+
+FACEBOOK_RESOURCE_DETAILS_PROJECTIONS = {
+    enums.ResourceType.CAMPAIGN: field_projection.ProjectionSpec(
+        message_class=messages.CampaignDetails,
+        fields=FACEBOOK_RESOURCE_DETAILS_FIELDS[enums.ResourceType.CAMPAIGN],
+        projection_fields=FACEBOOK_RESOURCE_DETAILS_PROJECTION_FIELDS[enums.ResourceType.CAMPAIGN],
+        schema_class=facebook_client_schemas.CampaignsDetails,
+        nested_name="campaigns_details",
+    ),
+    enums.ResourceType.AD_SET: field_projection.ProjectionSpec(
+        message_class=messages.AdSetDetails,
+        fields=FACEBOOK_RESOURCE_DETAILS_FIELDS[enums.ResourceType.AD_SET],
+        projection_fields=FACEBOOK_RESOURCE_DETAILS_PROJECTION_FIELDS[enums.ResourceType.AD_SET],
+        schema_class=facebook_client_schemas.AdSetsDetails,
+        nested_name="adsets_details",
+    ),
+    enums.ResourceType.AD: field_projection.ProjectionSpec(
+        message_class=messages.AdDetails,
+        fields=FACEBOOK_RESOURCE_DETAILS_FIELDS[enums.ResourceType.AD],
+        projection_fields=FACEBOOK_RESOURCE_DETAILS_PROJECTION_FIELDS[enums.ResourceType.AD],
+        schema_class=facebook_client_schemas.AdsDetails,
+        nested_name="ads_details",
+    ),
+}
+
+FACEBOOK_INSIGHTS_PROJECTIONS = {
+    resource_type: field_projection.ProjectionSpec(
+        message_class=messages.ResourceInsightsReport,
+        fields=FACEBOOK_INSIGHTS_DETAILS_FIELDS[resource_type],
+        projection_fields=FACEBOOK_INSIGHTS_PROJECTION_FIELDS,
+        schema_class=schema_class,
+        nested_name="insights",
+    )
+    for resource_type, schema_class in FACEBOOK_INSIGHTS_SCHEMAS.items()
+}
+
+FACEBOOK_FAILED_REPORT_STATUSES = ["Job Failed", "Job Skipped"]
+
+# Longest date range of one async insights report run by `get_insights`, longer ranges run as several reports.
+# Ad level reports over many months tend to fail or time out in Facebook's async job queue.
+FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS = 31
@@ -0,0 +1,239 @@
+import asyncio
+import dataclasses
+import datetime
+import logging
+import time
+import typing
+
+from ads_manager import enums
+from ads_manager.integrations.clients import messages
+
+if typing.TYPE_CHECKING:
+    from ads_manager.integrations.clients.facebook import (
+        async_client as async_facebook_client,
+    )
+    from ads_manager.integrations.clients.facebook import client as facebook_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class InsightsJob(object):
+    ad_account_id: str
+    resource_type: enums.ResourceType
+    from_datetime: datetime.datetime
+    to_datetime: datetime.datetime
+    report_id: typing.Optional[str] = None
+    percent_completion: int = 0
+    submitted_at: float = 0.0
+    next_poll_at: float = 0.0
+    poll_interval: float = 0.0
+    results: typing.Optional[typing.List[messages.ResourceInsightsReport]] = None
+    projection: typing.Optional[typing.List[str]] = None  # Message fields requested, all of them when None
+
+
+class InsightsJobScheduler(object):
+    """
+    Submits Facebook async insights report runs up front and polls all of them together, fetching the
+    results of every job as soon as it finishes. The poll interval of a job follows its own
+    `async_percent_completion` rate, bounded by `min_poll_interval` and `max_poll_interval`.
+
+    With `fetch_results=False` jobs are only waited for, so the caller can stream the results page by page.
+    """
+
+    MIN_POLL_INTERVAL = 1.0
+    MAX_POLL_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        client: "facebook_client.FacebookClient",
+        min_poll_interval: float = MIN_POLL_INTERVAL,
+        max_poll_interval: float = MAX_POLL_INTERVAL,
+        fetch_results: bool = True,
+    ) -> None:
+        self._client = client
+        self._min_poll_interval = min_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._fetch_results = fetch_results
+        self._jobs = []
+        self._pending_jobs = []
+
+    def submit(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> InsightsJob:
+        report_id = self._client.create_insights_report(
+            ad_account_id=ad_account_id,
+            resource_type=resource_type,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            projection=projection,
+        )
+
+        return self._add_job(
+            insights_job=InsightsJob(
+                ad_account_id=ad_account_id,
+                resource_type=resource_type,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+                report_id=report_id,
+                projection=projection,
+            )
+        )
+
+    def iter_completed(self) -> typing.Iterator[InsightsJob]:
+        while self._pending_jobs:
+            now = time.monotonic()
+            due_jobs = [insights_job for insights_job in self._pending_jobs if insights_job.next_poll_at <= now]
+            if not due_jobs:
+                time.sleep(min(insights_job.next_poll_at for insights_job in self._pending_jobs) - now)
+                continue
+
+            for insights_job in due_jobs:
+                if not self._poll(insights_job=insights_job):
+                    continue
+
+                if self._fetch_results:
+                    insights_job.results = self._client.get_insights_report_results(
+                        ad_account_id=insights_job.ad_account_id,
+                        report_id=insights_job.report_id,
+                        resource_type=insights_job.resource_type,
+                        from_datetime=insights_job.from_datetime,
+                        to_datetime=insights_job.to_datetime,
+                        projection=insights_job.projection,
+                    )
+                self._pending_jobs.remove(insights_job)
+
+                yield insights_job
+
+    def run(self) -> typing.List[InsightsJob]:
+        for _ in self.iter_completed():
+            pass
+
+        return list(self._jobs)
+
+    def _poll(self, insights_job: InsightsJob) -> bool:
+        report_status = self._client.get_insights_report_status(report_id=insights_job.report_id)
+
+        return self._update_job(insights_job=insights_job, report_status=report_status)
+
+    def _add_job(self, insights_job: InsightsJob) -> InsightsJob:
+        insights_job.submitted_at = time.monotonic()
+        insights_job.poll_interval = self._min_poll_interval
+        insights_job.next_poll_at = insights_job.submitted_at + self._min_poll_interval
+
+        self._jobs.append(insights_job)
+        self._pending_jobs.append(insights_job)
+
+        return insights_job
+
+    def _update_job(self, insights_job: InsightsJob, report_status: typing.Dict) -> bool:
+        if not report_status["is_running"] and report_status["async_percent_completion"] == 100:
+            logger.warning(
+                "Report {} for account {} is ready".format(insights_job.report_id, insights_job.ad_account_id)
+            )
+            return True
+
+        now = time.monotonic()
+        insights_job.poll_interval = self._get_poll_interval(
+            insights_job=insights_job,
+            percent_completion=report_status["async_percent_completion"],
+            now=now,
+        )
+        insights_job.percent_completion = report_status["async_percent_completion"]
+        insights_job.next_poll_at = now + insights_job.poll_interval
+
+        logger.warning(
+            "Waiting for report {} ({}% completed, next poll in {:.1f}s)".format(
+                insights_job.report_id, insights_job.percent_completion, insights_job.poll_interval
+            )
+        )
+
+        return False
+
+    def _get_poll_interval(self, insights_job: InsightsJob, percent_completion: int, now: float) -> float:
+        if percent_completion <= 0 or percent_completion <= insights_job.percent_completion:
+            # No progress since the last poll, back off exponentially.
+            poll_interval = insights_job.poll_interval * 2
+        else:
+            # Poll again around the time the job is expected to finish at its current completion rate.
+            elapsed = now - insights_job.submitted_at
+            poll_interval = elapsed * (100 - percent_completion) / percent_completion
+
+        return max(self._min_poll_interval, min(poll_interval, self._max_poll_interval))
+
+
+class AsyncInsightsJobScheduler(InsightsJobScheduler):
+    """
+    asyncio variant of `InsightsJobScheduler`. Every submitted job is polled by its own task with the same
+    adaptive interval, so results are fetched as soon as the job finishes.
+    """
+
+    def __init__(
+        self,
+        client: "async_facebook_client.AsyncFacebookClient",
+        min_poll_interval: float = InsightsJobScheduler.MIN_POLL_INTERVAL,
+        max_poll_interval: float = InsightsJobScheduler.MAX_POLL_INTERVAL,
+        fetch_results: bool = True,
+    ) -> None:
+        super().__init__(
+            client=client,
+            min_poll_interval=min_poll_interval,
+            max_poll_interval=max_poll_interval,
+            fetch_results=fetch_results,
+        )
+
+    async def submit(
+        self,
+        ad_account_id: str,
+        resource_type: enums.ResourceType,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> InsightsJob:
+        report_id = await self._client.create_insights_report(
+            ad_account_id=ad_account_id,
+            resource_type=resource_type,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            projection=projection,
+        )
+
+        return self._add_job(
+            insights_job=InsightsJob(
+                ad_account_id=ad_account_id,
+                resource_type=resource_type,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+                report_id=report_id,
+                projection=projection,
+            )
+        )
+
+    async def run(self) -> typing.List[InsightsJob]:
+        await asyncio.gather(*[self._wait_for_job(insights_job=insights_job) for insights_job in self._pending_jobs])
+
+        return list(self._jobs)
+
+    async def _wait_for_job(self, insights_job: InsightsJob) -> None:
+        while True:
+            await asyncio.sleep(max(insights_job.next_poll_at - time.monotonic(), 0))
+
+            report_status = await self._client.get_insights_report_status(report_id=insights_job.report_id)
+            if self._update_job(insights_job=insights_job, report_status=report_status):
+                break
+
+        if self._fetch_results:
+            insights_job.results = await self._client.get_insights_report_results(
+                ad_account_id=insights_job.ad_account_id,
+                report_id=insights_job.report_id,
+                resource_type=insights_job.resource_type,
+                from_datetime=insights_job.from_datetime,
+                to_datetime=insights_job.to_datetime,
+                projection=insights_job.projection,
+            )
+        self._pending_jobs.remove(insights_job)
@@ -0,0 +1,379 @@
+import datetime
+import typing
+
+from ads_manager import enums, utils
+from ads_manager.integrations.clients import exceptions as client_exceptions
+from ads_manager.integrations.clients import messages
+from ads_manager.integrations.clients.facebook import (
+    constants as facebook_client_constants,
+)
+from ads_manager.integrations.clients.facebook import schemas as facebook_client_schemas
+
+
+class FacebookResponseParser(object):
+    """
+    Validation and message building shared by the sync and async Facebook clients.
+    """
+
+    @staticmethod
+    def _parse_account_ids(
+        response: typing.List[typing.Dict],
+    ) -> typing.List[messages.AdAccount]:
+        validated_data = utils.validate_marshmallow_schema(data=response, schema=facebook_client_schemas.AdAccounts())
+        if not validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Account data fetched (platform={}, response_data={}) is not valid".format(
+                    enums.Platform.FACEBOOK.name, response
+                )
+            )
+
+        message_to_return = [
+            messages.AdAccount(id_token=data["account_id"], account_id=data["id"], account_name=None)
+            for data in validated_data["ad_accounts"]
+        ]
+
+        # return [data["id"] for data in validated_data["ad_accounts"]]
+        return message_to_return
+
+    @staticmethod
+    def _parse_campaigns_details(
+        ad_account_id: str,
+        response: typing.List[typing.Dict],
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.CampaignDetails]:
+        validated_data = utils.validate_marshmallow_schema(
+            data=response,
+            schema=facebook_client_constants.FACEBOOK_RESOURCE_DETAILS_PROJECTIONS[
+                enums.ResourceType.CAMPAIGN
+            ].get_schema(projection=projection),
+        )
+        if not validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Campaign details data fetched (platform={}, ad_account_id={}, response_data={}) is not valid".format(
+                    enums.Platform.FACEBOOK.name, ad_account_id, response
+                )
+            )
+
+        message_to_return = [
+            messages.CampaignDetails(
+                account_id=data["account_id"],
+                campaign_id=data["id"],
+                campaign_name=data.get("name"),
+                effective_status=data.get("effective_status"),
+                configured_status=data.get("configured_status"),
+                created_time=data.get("created_time"),
+                updated_time=data["updated_time"],
+            )
+            for data in validated_data["campaigns_details"]
+        ]
+
+        return message_to_return
+
+    @staticmethod
+    def _parse_adsets_details(
+        ad_account_id: str,
+        response: typing.List[typing.Dict],
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.AdSetDetails]:
+        validated_data = utils.validate_marshmallow_schema(
+            data=response,
+            schema=facebook_client_constants.FACEBOOK_RESOURCE_DETAILS_PROJECTIONS[
+                enums.ResourceType.AD_SET
+            ].get_schema(projection=projection),
+        )
+        if not validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Adset details data (platform={}, ad_account_id={}, response_data={}) is not valid".format(
+                    enums.Platform.FACEBOOK.name, ad_account_id, response
+                )
+            )
+
+        message_to_return = [
+            messages.AdSetDetails(
+                account_id=data["account_id"],
+                campaign_id=data["campaign_id"],
+                adset_id=data["id"],
+                adset_name=data.get("name"),
+                effective_status=data.get("effective_status"),
+                configured_status=data.get("configured_status"),
+                created_time=data.get("created_time"),
+                updated_time=data["updated_time"],
+            )
+            for data in validated_data["adsets_details"]
+        ]
+
+        return message_to_return
+
+    @staticmethod
+    def _parse_ads_details(
+        ad_account_id: str,
+        response: typing.List[typing.Dict],
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.AdDetails]:
+        validated_data = utils.validate_marshmallow_schema(
+            data=response,
+            schema=facebook_client_constants.FACEBOOK_RESOURCE_DETAILS_PROJECTIONS[enums.ResourceType.AD].get_schema(
+                projection=projection
+            ),
+        )
+        if not validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Ad details data (platform={}, ad_account_id={}, response_data={}) is not valid".format(
+                    enums.Platform.FACEBOOK.name, ad_account_id, response
+                )
+            )
+
+        message_to_return = [
+            messages.AdDetails(
+                account_id=data["account_id"],
+                campaign_id=data["campaign_id"],
+                adset_id=data["adset_id"],
+                ad_id=data["id"],
+                ad_name=data.get("name"),
+                effective_status=data.get("effective_status"),
+                configured_status=data.get("configured_status"),
+                created_time=data.get("created_time"),
+                updated_time=data["updated_time"],
+            )
+            for data in validated_data["ads_details"]
+        ]
+
+        return message_to_return
+
+    @staticmethod
+    def _get_updated_since_filtering(
+        updated_since: typing.Optional[datetime.datetime],
+    ) -> typing.Optional[typing.List[typing.Dict]]:
+        if not updated_since:
+            return None
+
+        return [
+            {
+                "field": "updated_time",
+                "operator": "GREATER_THAN",
+                "value": int(utils.to_utc(updated_since).timestamp()),
+            }
+        ]
+
+    @staticmethod
+    def _parse_ad_creatives(
+        ad_account_id: str,
+        response: typing.List[typing.Dict],
+    ) -> typing.List[messages.AdCreativeDetails]:
+        validated_data = utils.validate_marshmallow_schema(
+            data=response, schema=facebook_client_schemas.AdCreativesDetails()
+        )
+        if not validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Ad creatives data (platform={}, ad_account_id={}, response_data={}) is not valid".format(
+                    enums.Platform.FACEBOOK.name, ad_account_id, response
+                )
+            )
+
+        message_to_return = [
+            messages.AdCreativeDetails(
+                account_id=data["account_id"],
+                creative_id=data["id"],
+                creative_name=data.get("name", None),
+                title=data.get("title", None),
+                body=data.get("body", None),
+                image_url=data.get("image_url", None),
+            )
+            for data in validated_data["adcreatives_details"]
+        ]
+
+        return message_to_return
+
+    @staticmethod
+    def _parse_ad_creative(
+        ad_creative_id: str,
+        response: typing.Dict,
+    ) -> messages.AdCreativeDetails:
+        validated_data = utils.validate_marshmallow_schema(
+            data=response, schema=facebook_client_schemas.AdCreativeDetails()
+        )
+        if not validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Ad creative data (platform={}, ad_creative_id={}, response_data={}) is not valid".format(
+                    enums.Platform.FACEBOOK.name, ad_creative_id, response
+                )
+            )
+
+        message_to_return = messages.AdCreativeDetails(
+            account_id=validated_data["account_id"],
+            creative_id=validated_data["id"],
+            creative_name=validated_data.get("name", None),
+            title=validated_data.get("title", None),
+            body=validated_data.get("body", None),
+            image_url=validated_data.get("image_url", None),
+        )
+
+        return message_to_return
+
+    @staticmethod
+    def _parse_insights_report_status(
+        report_id: str,
+        report_status: typing.Dict,
+    ) -> typing.Dict:
+        report_status_validated_data = utils.validate_marshmallow_schema(
+            data=report_status, schema=facebook_client_schemas.ReportStatus()
+        )
+        if not report_status_validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Report status data (platform={}, report_id={}, response_data={}) is not valid".format(
+                    enums.Platform.FACEBOOK.name, report_id, report_status
+                )
+            )
+
+        if (
+            report_status_validated_data.get("async_status")
+            in facebook_client_constants.FACEBOOK_FAILED_REPORT_STATUSES
+        ):
+            raise client_exceptions.ClientProviderError(
+                "Insights report job did not complete (platform={}, report_id={}, async_status={})".format(
+                    enums.Platform.FACEBOOK.name, report_id, report_status_validated_data["async_status"]
+                )
+            )
+
+        return report_status_validated_data
+
+    @staticmethod
+    def _parse_insights_report_results(
+        report_id: str,
+        resource_type: enums.ResourceType,
+        report_results: typing.List[typing.Dict],
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.ResourceInsightsReport]:
+        validated_report_results = utils.validate_marshmallow_schema(
+            data=report_results,
+            schema=facebook_client_constants.FACEBOOK_INSIGHTS_PROJECTIONS[resource_type].get_schema(
+                projection=projection
+            ),
+        )
+        if not validated_report_results:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Insights report data obtained from provider is not valid (platform={}, report_id={}, resource_type={})".format(
+                    enums.Platform.FACEBOOK.name, report_id, resource_type.name
+                )
+            )
+
+        message_to_return = [
+            messages.ResourceInsightsReport(
+                account_id=data["account_id"],
+                account_name=data["account_name"],
+                resource_type=resource_type.name,
+                campaign_id=data["campaign_id"],
+                campaign_name=data["campaign_name"],
+                adset_id=data.get("adset_id", None),
+                adset_name=data.get("adset_name", None),
+                ad_id=data.get("ad_id", None),
+                ad_name=data.get("ad_name", None),
+                spend="{}".format(data["spend"]) if "spend" in data else None,
+                impressions=data.get("impressions"),
+                clicks=data.get("clicks"),
+                ctr="{}".format(data["ctr"]) if data.get("ctr") is not None else None,
+                cpm="{}".format(data["cpm"]) if data.get("cpm") is not None else None,
+                cpc="{}".format(data["cpc"]) if data.get("cpc") is not None else None,
+                reach=data.get("reach"),
+                actions=data.get("actions"),
+                conversions=data.get("conversions"),
+                cost_per_conversion=data.get("cost_per_conversion"),
+                conversion_rate=[
+                    {
+                        "action_type": conversion["action_type"],
+                        "value": (float(conversion["value"]) / float(data["clicks"])) * 100,
+                    }
+                    for conversion in data["conversions"]
+                ]
+                if "conversions" in data and "clicks" in data
+                else None,
+                date_start=data["date_start"],
+                date_stop=data["date_stop"],
+            )
+            for data in validated_report_results["insights"]
+        ]
+
+        return message_to_return
+
+    @staticmethod
+    def _validate_campaign_details(campaign_details: typing.Dict) -> typing.Dict:
+        validated_campaign_details = utils.validate_marshmallow_schema(
+            data=campaign_details, schema=facebook_client_schemas.Campaign()
+        )
+
+        if not validated_campaign_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate campaign details (platform={}, campaign_details={})".format(
+                    enums.Platform.FACEBOOK.name,
+                    campaign_details,
+                )
+            )
+
+        return validated_campaign_details
+
+    @staticmethod
+    def _validate_adset_details(adset_details: typing.Dict) -> typing.Dict:
+        validated_adset_details = utils.validate_marshmallow_schema(
+            data=adset_details, schema=facebook_client_schemas.AdSet()
+        )
+
+        if not validated_adset_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate adset details from provider (platform={}, adset_details={})".format(
+                    enums.Platform.FACEBOOK.name,
+                    adset_details,
+                )
+            )
+
+        return validated_adset_details
+
+    @staticmethod
+    def _validate_adcreative_details(adcreative_details: typing.Dict) -> typing.Dict:
+        validated_adcreative_details = utils.validate_marshmallow_schema(
+            data=adcreative_details, schema=facebook_client_schemas.AdCreative()
+        )
+
+        if not validated_adcreative_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate adcreative details (platform={}, adcreative_details={})".format(
+                    enums.Platform.FACEBOOK.name,
+                    adcreative_details,
+                )
+            )
+
+        return validated_adcreative_details
+
+    @staticmethod
+    def _validate_ad_details(ad_details: typing.Dict) -> typing.Dict:
+        validated_ad_details = utils.validate_marshmallow_schema(data=ad_details, schema=facebook_client_schemas.Ad())
+
+        if not validated_ad_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate ad details (platform={}, ad_details={})".format(
+                    enums.Platform.FACEBOOK.name,
+                    ad_details,
+                )
+            )
+
+        return validated_ad_details
+
+    @staticmethod
+    def _get_resource_details_fields(
+        resource_type: enums.ResourceType, projection: typing.Optional[typing.List[str]] = None
+    ) -> str:
+        if projection is not None:
+            return ",".join(
+                facebook_client_constants.FACEBOOK_RESOURCE_DETAILS_PROJECTIONS[resource_type].get_fields(
+                    projection=projection
+                )
+            )
+
+        return ",".join(facebook_client_constants.FACEBOOK_RESOURCE_DETAILS_FIELDS[resource_type])
+
+    @staticmethod
+    def _get_resource_insights_fields(
+        resource_type: enums.ResourceType, projection: typing.Optional[typing.List[str]] = None
+    ) -> str:
+        return ",".join(
+            facebook_client_constants.FACEBOOK_INSIGHTS_PROJECTIONS[resource_type].get_fields(projection=projection)
+        )
@@ -1,9 +1,10 @@
 import datetime
-import json
 import typing
 
 from marshmallow import EXCLUDE, fields, post_load, pre_load, schema
 
+from ads_manager import json_codec
+
 
 class Schema(schema.Schema):
     class Meta:
@@ -63,7 +64,7 @@ class AdSetsDetails(Schema):
 class AdDetails(Schema):
     account_id = fields.Str(required=True, data_key="account_id")
     campaign_id = fields.Str(required=True, data_key="campaign_id")
-    ad_id = fields.Str(required=True, data_key="ad_id")
+    adset_id = fields.Str(required=True, data_key="adset_id")
     id = fields.Str(required=True, data_key="id")
     name = fields.Str(required=True, data_key="name")
     effective_status = fields.Str(required=True, data_key="effective_status")
@@ -100,6 +101,7 @@ class AdCreativesDetails(Schema):
 class ReportStatus(Schema):
     async_percent_completion = fields.Integer(required=True, data_key="async_percent_completion")
     is_running = fields.Bool(data_key="is_running", missing=False)
+    async_status = fields.Str(required=False, data_key="async_status")
 
 
 class Action(Schema):
@@ -170,7 +172,7 @@ class Campaign(Schema):
 
     @post_load
     def prepare_data(self, data: typing.Dict, **kwargs: typing.Any) -> typing.Dict:
-        data["special_ad_categories"] = json.dumps(data["special_ad_categories"])
+        data["special_ad_categories"] = json_codec.dumps(data["special_ad_categories"])
         return data
 
 
@@ -187,8 +189,8 @@ class AdSet(Schema):
 
     @post_load
     def prepare_data(self, data: typing.Dict, **kwargs: typing.Any) -> typing.Dict:
-        data["targeting"] = json.dumps(data["targeting"])
-        data["promoted_object"] = json.dumps(data["promoted_object"])
+        data["targeting"] = json_codec.dumps(data["targeting"])
+        data["promoted_object"] = json_codec.dumps(data["promoted_object"])
         return data
 
 
@@ -203,7 +205,7 @@ class AdCreative(Schema):
 
     @post_load
     def prepare_data(self, data: typing.Dict, **kwargs: typing.Any) -> typing.Dict:
-        data["object_story_spec"] = json.dumps(data["object_story_spec"])
+        data["object_story_spec"] = json_codec.dumps(data["object_story_spec"])
         return data
 
 
@@ -215,5 +217,5 @@ class Ad(Schema):
 
     @post_load
     def prepare_data(self, data: typing.Dict, **kwargs: typing.Any) -> typing.Dict:
-        data["creative"] = json.dumps(data["creative"])
+        data["creative"] = json_codec.dumps(data["creative"])
         return data
@@ -3,8 +3,14 @@ import typing
 
 from ads_manager import enums, exceptions
 from ads_manager.integrations.clients import exceptions as client_exceptions
+from ads_manager.integrations.clients.facebook import (
+    async_client as async_facebook_client,
+)
 from ads_manager.integrations.clients.facebook import client as facebook_client
+from ads_manager.integrations.clients.tiktok import async_client as async_tiktok_client
 from ads_manager.integrations.clients.tiktok import client as tiktok_client
+from ads_manager.integrations.gateways import async_connection_pool
+from ads_manager.integrations.gateways import retry as gateway_retry
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +21,11 @@ class Factory(object):
         enums.Platform.TIKTOK: tiktok_client.TiktokClient,
     }
 
+    _PLATFORM_ASYNC_CLIENTS_IMPLEMENTATION_MAP = {
+        enums.Platform.FACEBOOK: async_facebook_client.AsyncFacebookClient,
+        enums.Platform.TIKTOK: async_tiktok_client.AsyncTiktokClient,
+    }
+
     _LOG_PREFIX = "[PLATFORM-CLIENT-FACTORY]"
 
     @classmethod
@@ -26,4 +37,26 @@ class Factory(object):
             logger.error("{} {}.".format(cls._LOG_PREFIX, msg))
             raise client_exceptions.ClientProviderError()
 
+        # Every exporter and importer call creates its own client, which starts its run of the retry budget
+        gateway_retry.get_shared_retry_policy().start_run()
+
         return cls._PLATFORM_CLIENTS_IMPLEMENTATION_MAP[platform](user_access_token=user_access_token, params=params)
+
+    @classmethod
+    def create_async(
+        cls,
+        platform: enums.Platform,
+        user_access_token: str,
+        params: typing.Optional[typing.Dict] = None,
+        connection_pool: typing.Optional[async_connection_pool.AsyncConnectionPool] = None,
+    ) -> typing.Union[async_facebook_client.AsyncFacebookClient, async_tiktok_client.AsyncTiktokClient]:
+        if platform not in cls._PLATFORM_ASYNC_CLIENTS_IMPLEMENTATION_MAP:
+            msg = "Platform {} is not supported".format(platform.name)
+            logger.error("{} {}.".format(cls._LOG_PREFIX, msg))
+            raise client_exceptions.ClientProviderError()
+
+        gateway_retry.get_shared_retry_policy().start_run()
+
+        return cls._PLATFORM_ASYNC_CLIENTS_IMPLEMENTATION_MAP[platform](
+            user_access_token=user_access_token, params=params, connection_pool=connection_pool
+        )
@@ -0,0 +1,106 @@
+import dataclasses
+import typing
+
+from marshmallow import schema as marshmallow_schema
+
+from ads_manager.integrations.clients import exceptions as client_exceptions
+from ads_manager.integrations.clients import messages
+
+# Message fields kept by every projection: the ids, names and dates identifying a record, and the `updated_time`
+# incremental detail syncs filter on.
+MESSAGE_KEY_FIELDS = {
+    messages.CampaignDetails: ["account_id", "campaign_id", "updated_time"],
+    messages.AdSetDetails: ["account_id", "campaign_id", "adset_id", "updated_time"],
+    messages.AdDetails: ["account_id", "campaign_id", "adset_id", "ad_id", "updated_time"],
+    messages.ResourceInsightsReport: [
+        "account_id",
+        "account_name",
+        "resource_type",
+        "campaign_id",
+        "campaign_name",
+        "adset_id",
+        "adset_name",
+        "ad_id",
+        "ad_name",
+        "date_start",
+        "date_stop",
+    ],
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class ProjectionSpec(object):
+    """
+    How a projection (a list of message field names, e.g. ["spend", "impressions"]) narrows one kind of provider
+    records: the provider fields requested and the schema validating them.
+
+    `projection_fields` maps every projectable message field to the provider fields it's built from. Provider
+    fields no projectable message field maps to (ids, names and dates) are requested by every projection.
+    """
+
+    message_class: type
+    fields: typing.List[str]  # Provider fields of the full records, in request order
+    projection_fields: typing.Dict[str, typing.List[str]]
+    schema_class: typing.Type[marshmallow_schema.Schema]
+    nested_name: str  # Field of `schema_class` holding the records
+
+    def get_fields(self, projection: typing.Optional[typing.List[str]] = None) -> typing.List[str]:
+        if projection is None:
+            return list(self.fields)
+
+        excluded_fields = self._get_excluded_fields(projection=projection)
+
+        return [field for field in self.fields if field not in excluded_fields]
+
+    def get_schema(
+        self, projection: typing.Optional[typing.List[str]] = None, **kwargs: typing.Any
+    ) -> marshmallow_schema.Schema:
+        """
+        Schema without the fields left out of the request, so their `required` checks are skipped. `kwargs` are
+        passed to the schema.
+        """
+        if projection is None:
+            return self.schema_class(**kwargs)
+
+        excluded_fields = self._get_excluded_fields(projection=projection)
+        nested_schema = self.schema_class._declared_fields[self.nested_name].nested
+
+        return self.schema_class(
+            only=[
+                "{}.{}".format(self.nested_name, name)
+                for name, field in nested_schema._declared_fields.items()
+                if (field.data_key or name) not in excluded_fields
+            ],
+            **kwargs,
+        )
+
+    def _get_excluded_fields(self, projection: typing.List[str]) -> typing.Set[str]:
+        validate_projection(message_class=self.message_class, projection=projection)
+        projectable_fields = {field for fields in self.projection_fields.values() for field in fields}
+        projected_fields = {field for name in projection for field in self.projection_fields.get(name, [])}
+
+        return projectable_fields - projected_fields
+
+
+def validate_projection(message_class: type, projection: typing.List[str]) -> None:
+    message_fields = [field.name for field in dataclasses.fields(message_class)]
+    unknown_fields = [name for name in projection if name not in message_fields]
+    if unknown_fields:
+        raise client_exceptions.ProjectionNotValidError(
+            "Projection has fields missing from the records (message={}, unknown_fields={}, fields={})".format(
+                message_class.__name__, unknown_fields, message_fields
+            )
+        )
+
+
+def to_record(message: typing.Any, projection: typing.Optional[typing.List[str]] = None) -> typing.Dict:
+    """
+    `dataclasses.asdict` of a parsed message, with only the key fields and the fields of `projection` when given.
+    """
+    record = dataclasses.asdict(message)
+    if projection is None:
+        return record
+
+    key_fields = MESSAGE_KEY_FIELDS.get(type(message), [])
+
+    return {name: value for name, value in record.items() if name in key_fields or name in projection}
@@ -0,0 +1,81 @@
+import datetime
+import typing
+
+from ads_manager.integrations.clients import messages
+from ads_manager.integrations.gateways import pagination
+
+T = typing.TypeVar("T")
+
+
+def split_date_range(
+    from_datetime: datetime.datetime, to_datetime: datetime.datetime, max_days: int
+) -> typing.List[typing.Tuple[datetime.datetime, datetime.datetime]]:
+    """
+    Splits the inclusive day range into consecutive inclusive windows of at most `max_days` days, in date order.
+    """
+    windows = []
+    window_start = from_datetime
+    while window_start.date() <= to_datetime.date():
+        window_end = min(window_start + datetime.timedelta(days=max_days - 1), to_datetime)
+        windows.append((window_start, window_end))
+        window_start = datetime.datetime.combine(
+            window_end.date() + datetime.timedelta(days=1), datetime.time(), tzinfo=from_datetime.tzinfo
+        )
+
+    return windows
+
+
+def iter_windows_pages(
+    windows: typing.List[typing.Tuple[datetime.datetime, datetime.datetime]],
+    iter_window_pages: typing.Callable[
+        [datetime.datetime, datetime.datetime, pagination.PageCursor], typing.Iterator[T]
+    ],
+    cursor: typing.Optional[pagination.PageCursor] = None,
+) -> typing.Iterator[T]:
+    """
+    Pages of every window in date order. `cursor` holds the window being paged (`window`) and the position inside
+    it, and is moved to the start of the next window once a window is done, so it's only done after the last page
+    of the last window. A resumed `cursor` skips the windows before its own.
+    """
+    cursor = cursor if cursor else pagination.PageCursor()
+    first_window = cursor.window if cursor.window else 0
+
+    for window, (window_from_datetime, window_to_datetime) in enumerate(windows):
+        if window < first_window:
+            continue
+
+        window_cursor = (
+            pagination.PageCursor(after=cursor.after, page=cursor.page, report_id=cursor.report_id, done=cursor.done)
+            if window == first_window
+            else pagination.PageCursor()
+        )
+        for page in iter_window_pages(window_from_datetime, window_to_datetime, window_cursor):
+            if window_cursor.done and window < len(windows) - 1:
+                _move_cursor(cursor=cursor, window=window + 1, window_cursor=pagination.PageCursor())
+            else:
+                _move_cursor(cursor=cursor, window=window, window_cursor=window_cursor)
+
+            yield page
+
+
+def merge_insights_reports(
+    reports: typing.Iterable[messages.ResourceInsightsReport],
+) -> typing.List[messages.ResourceInsightsReport]:
+    """
+    Merges the reports of several windows, keeping the first report of every resource and day, ordered by day.
+    Reports of the same day keep the order the provider returned them in.
+    """
+    merged_reports = {}
+    for report in reports:
+        key = (report.resource_type, report.campaign_id, report.adset_id, report.ad_id, report.date_start)
+        merged_reports.setdefault(key, report)
+
+    return sorted(merged_reports.values(), key=lambda report: report.date_start)
+
+
+def _move_cursor(cursor: pagination.PageCursor, window: int, window_cursor: pagination.PageCursor) -> None:
+    cursor.window = window
+    cursor.after = window_cursor.after
+    cursor.page = window_cursor.page
+    cursor.report_id = window_cursor.report_id
+    cursor.done = window_cursor.done
@@ -0,0 +1,220 @@
+import concurrent.futures
+import dataclasses
+import hashlib
+import logging
+import mimetypes
+import tempfile
+import time
+import typing
+import urllib.parse
+
+import botocore.exceptions
+import requests
+from requests import adapters
+
+from ads_manager import utils
+from ads_manager.integrations.clients.s3 import constants as s3_client_constants
+
+logger = logging.getLogger(__name__)
+
+_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+]
+
+
+@dataclasses.dataclass
+class AssetUpload(object):
+    asset_id: str
+    source_url: str
+    key: str  # Key of the object, with the bucket prefix and without the extension
+
+
+@dataclasses.dataclass
+class AssetUploadResult(object):
+    asset_id: str
+    source_url: str
+    s3_path: typing.Optional[str] = None  # Key of the object, with the bucket prefix
+    content_type: typing.Optional[str] = None
+    size: int = 0  # Bytes downloaded
+    seconds: float = 0.0  # Download and upload time
+    skipped: bool = False  # The same content was already stored under the key
+    error: typing.Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.size / self.seconds if self.seconds else 0.0
+
+
+@dataclasses.dataclass
+class AssetsUploadReport(object):
+    results: typing.List[AssetUploadResult]
+    seconds: float = 0.0
+
+    @property
+    def uploaded(self) -> typing.List[AssetUploadResult]:
+        return [result for result in self.results if result.ok and not result.skipped]
+
+    @property
+    def skipped(self) -> typing.List[AssetUploadResult]:
+        return [result for result in self.results if result.skipped]
+
+    @property
+    def failed(self) -> typing.List[AssetUploadResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def bytes_per_second(self) -> float:
+        return sum(result.size for result in self.results) / self.seconds if self.seconds else 0.0
+
+
+class AssetMirror(object):
+    """
+    Copies assets from their source URLs into the bucket, `max_workers` assets at a time.
+
+    Every worker streams the download into a spooled temporary file (in memory up to a few MB, on disk above),
+    hashing it on the way, and uploads it with the content type read from the response or sniffed from the first
+    bytes. Downloads share one keep-alive session sized to the workers, uploads share the thread safe S3 client.
+    An object already holding the same MD5 under the key is left in place. A failed asset is reported in its
+    result and doesn't stop the others.
+    """
+
+    def __init__(
+        self,
+        s3_client: typing.Any,
+        bucket_name: str,
+        max_workers: int = s3_client_constants.ASSET_MAX_WORKERS,
+        session: typing.Optional[requests.Session] = None,
+    ) -> None:
+        self._s3_client = s3_client
+        self._bucket_name = bucket_name
+        self._max_workers = max(max_workers, 1)
+        self._session = session if session else self._create_session(pool_maxsize=self._max_workers)
+
+    def mirror(self, uploads: typing.List[AssetUpload]) -> AssetsUploadReport:
+        started_at = time.monotonic()
+        if self._max_workers <= 1 or len(uploads) <= 1:
+            results = [self._mirror_asset(upload=upload) for upload in uploads]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self._max_workers, len(uploads))) as executor:
+                results = list(executor.map(lambda upload: self._mirror_asset(upload=upload), uploads))
+
+        report = AssetsUploadReport(results=results, seconds=time.monotonic() - started_at)
+        logger.warning(
+            "Mirrored {} assets (uploaded={}, skipped={}, failed={}, bytes_per_second={:.0f})".format(
+                len(results), len(report.uploaded), len(report.skipped), len(report.failed), report.bytes_per_second
+            )
+        )
+
+        return report
+
+    def _mirror_asset(self, upload: AssetUpload) -> AssetUploadResult:
+        result = AssetUploadResult(asset_id=upload.asset_id, source_url=upload.source_url)
+        started_at = time.monotonic()
+        try:
+            with tempfile.SpooledTemporaryFile(max_size=s3_client_constants.ASSET_SPOOL_MAX_SIZE) as file:
+                content_type, md5 = self._download(url=upload.source_url, file=file)
+                result.size = file.tell()
+                result.content_type = content_type
+                result.s3_path = "{}.{}".format(upload.key, get_extension(content_type=result.content_type))
+
+                result.skipped = self._get_stored_md5(key=result.s3_path) == md5
+                if not result.skipped:
+                    file.seek(0)
+                    self._s3_client.upload_fileobj(
+                        file,
+                        self._bucket_name,
+                        result.s3_path,
+                        ExtraArgs={"ContentType": result.content_type, "Metadata": {"md5": md5}},
+                    )
+        except Exception as e:
+            result.error = utils.get_exception_message(exception=e)
+            logger.warning(
+                "Unable to mirror asset (asset_id={}, source_url={}, s3_path={}). Error: {}".format(
+                    upload.asset_id, upload.source_url, result.s3_path, result.error
+                )
+            )
+
+        result.seconds = time.monotonic() - started_at
+
+        return result
+
+    def _download(self, url: str, file: typing.BinaryIO) -> typing.Tuple[str, str]:
+        md5 = hashlib.md5()
+        head = b""
+        with self._session.get(url, stream=True, timeout=s3_client_constants.ASSET_DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=s3_client_constants.ASSET_DOWNLOAD_CHUNK_SIZE):
+                if len(head) < 16:
+                    head += chunk[:16]
+                md5.update(chunk)
+                file.write(chunk)
+
+            content_type = detect_content_type(header=response.headers.get("Content-Type"), head=head, url=url)
+
+        return content_type, md5.hexdigest()
+
+    def _get_stored_md5(self, key: str) -> typing.Optional[str]:
+        """
+        MD5 of the object stored under the key, from the metadata written by the mirror. The ETag is only the MD5
+        of objects uploaded in a single part, it's used for objects the mirror didn't write.
+        """
+        try:
+            stored_object = self._s3_client.head_object(Bucket=self._bucket_name, Key=key)
+        except botocore.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+        md5 = stored_object.get("Metadata", {}).get("md5")
+        etag = stored_object.get("ETag", "").strip('"')
+
+        return md5 if md5 else etag
+
+    @staticmethod
+    def _create_session(pool_maxsize: int) -> requests.Session:
+        adapter = adapters.HTTPAdapter(pool_maxsize=pool_maxsize)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+
+def detect_content_type(header: typing.Optional[str], head: bytes, url: str) -> str:
+    """
+    Content type of a downloaded asset: the response header when it names a media type, otherwise the type
+    sniffed from the first bytes, otherwise the type of the URL path extension.
+    """
+    content_type = header.split(";")[0].strip().lower() if header else ""
+    if content_type and content_type not in ("application/octet-stream", "binary/octet-stream"):
+        return content_type
+
+    for signature, sniffed_content_type in _SIGNATURES:
+        if head.startswith(signature):
+            return sniffed_content_type
+
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+
+    if head[4:8] == b"ftyp":
+        return "video/mp4"
+
+    guessed_content_type, _ = mimetypes.guess_type(urllib.parse.urlparse(url).path)
+
+    return guessed_content_type if guessed_content_type else "application/octet-stream"
+
+
+def get_extension(content_type: str) -> str:
+    if content_type in s3_client_constants.ASSET_EXTENSIONS:
+        return s3_client_constants.ASSET_EXTENSIONS[content_type]
+
+    extension = mimetypes.guess_extension(content_type)
+
+    return extension.lstrip(".") if extension else "bin"
@@ -1,25 +1,28 @@
+import collections
+import concurrent.futures
 import datetime
-import json
 import logging
 import typing
 
 import boto3
-import requests
 
-from ads_manager import enums, utils
+from ads_manager import columnar, enums, exceptions, json_codec, utils
+from ads_manager.integrations.clients.s3 import assets as s3_assets
 from ads_manager.integrations.clients.s3 import constants as s3_client_constants
 from ads_manager.integrations.clients.s3 import exceptions as s3_client_exceptions
+from ads_manager.integrations.clients.s3 import multipart as s3_multipart
 
 logger = logging.getLogger(__name__)
 
 
 class S3Uploader(object):
-    def __init__(self, s3_path: str) -> None:
+    def __init__(self, s3_path: str, endpoint_url: typing.Optional[str] = None) -> None:
         self._bucket_name = None
         self._prefix = None
         self._setup_bucket_name_and_prefix(s3_path=s3_path)
 
-        self._bucket = boto3.Session().resource(service_name="s3").Bucket(self._bucket_name)
+        # `endpoint_url` points the uploader to an S3 compatible stand-in (e.g. MinIO or moto) instead of AWS.
+        self._bucket = boto3.Session().resource(service_name="s3", endpoint_url=endpoint_url).Bucket(self._bucket_name)
 
     def _setup_bucket_name_and_prefix(self, s3_path: str) -> None:
         if not s3_path.startswith("s3://"):
@@ -43,64 +46,201 @@ class S3Uploader(object):
             ),
         )
 
+    def upload_resource_details_records(
+        self,
+        records: typing.Iterable[typing.Dict],
+        resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType, enums.FacebookResourceType],
+        date_created: datetime.datetime,
+        part_size: int = s3_client_constants.MULTIPART_DEFAULT_PART_SIZE,
+        max_concurrency: int = s3_client_constants.MULTIPART_DEFAULT_MAX_CONCURRENCY,
+    ) -> str:
+        return self.upload_records(
+            records=records,
+            file_path="{}/date_created={}/details.jsonl".format(
+                resource_type.value,
+                self._get_formatted_date_created(date_created=date_created),
+            ),
+            part_size=part_size,
+            max_concurrency=max_concurrency,
+        )
+
+    def upload_records(
+        self,
+        records: typing.Iterable[typing.Dict],
+        file_path: str,
+        part_size: int = s3_client_constants.MULTIPART_DEFAULT_PART_SIZE,
+        max_concurrency: int = s3_client_constants.MULTIPART_DEFAULT_MAX_CONCURRENCY,
+    ) -> str:
+        """
+        Streams `records` to a single JSON Lines object with multipart upload, without serializing the whole
+        payload in memory first.
+        """
+        file_path_with_prefix = f"{self._prefix}/{file_path}"
+        try:
+            s3_multipart.MultipartUpload(
+                s3_client=self._bucket.meta.client,
+                bucket_name=self._bucket_name,
+                key=file_path_with_prefix,
+                part_size=part_size,
+                max_concurrency=max_concurrency,
+            ).upload(chunks=self._iter_json_lines_chunks(records=records))
+        except s3_client_exceptions.S3MultipartUploadError as e:
+            raise s3_client_exceptions.S3ClientError(
+                "Unable to upload records to S3 path (path_name={}). Error: {}".format(
+                    file_path_with_prefix, utils.get_exception_message(exception=e)
+                )
+            )
+
+        return self._get_full_s3_path(file_path=file_path_with_prefix)
+
     def upload_resource_performance(
         self,
         resource_performance: typing.List[typing.Dict],
         resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType, enums.FacebookResourceType],
         date_created: datetime.datetime,
+        batched: bool = False,
+        rows_per_object: typing.Optional[int] = None,
+        max_workers: int = s3_client_constants.UPLOAD_MAX_WORKERS,
     ) -> typing.List[str]:
-        uploaded_paths = []
+        """
+        By default every row is written to its own `performance_{date_start}.json` object. With `batched=True` the
+        rows of a resource are grouped into compact JSON Lines objects (at most `rows_per_object` rows each) under
+        the same `{resource}={id}/date_created=` partition. Objects are uploaded concurrently on `max_workers`
+        threads, the returned paths follow the order of the rows (of the first row of each batch).
+        """
         date_created_formatted = self._get_formatted_date_created(date_created=date_created)
-        for performance_data in resource_performance:
-            uploaded_path = self._upload_data(
-                data=performance_data,
-                file_path="{}/{}={}/date_created={}/performance_{}.json".format(
-                    resource_type.value,
-                    resource_type.value,
-                    performance_data["{}_id".format(resource_type.value)],
-                    date_created_formatted,
-                    performance_data["date_start"],
-                ),
+        if batched:
+            uploads = self._get_batched_performance_uploads(
+                resource_performance=resource_performance,
+                resource_type=resource_type,
+                date_created_formatted=date_created_formatted,
+                rows_per_object=rows_per_object,
             )
-            uploaded_paths.append(uploaded_path)
+        else:
+            uploads = [
+                (
+                    "{}/{}={}/date_created={}/performance_{}.json".format(
+                        resource_type.value,
+                        resource_type.value,
+                        performance_data["{}_id".format(resource_type.value)],
+                        date_created_formatted,
+                        performance_data["date_start"],
+                    ),
+                    json_codec.dumps(performance_data, pretty=True),
+                )
+                for performance_data in resource_performance
+            ]
 
-        return uploaded_paths
+        if max_workers <= 1 or len(uploads) <= 1:
+            return [self._upload_body(body=body, file_path=file_path) for file_path, body in uploads]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(uploads))) as executor:
+            return list(executor.map(lambda upload: self._upload_body(body=upload[1], file_path=upload[0]), uploads))
+
+    def upload_resource_performance_parquet(
+        self,
+        resource_performance: typing.Iterable[typing.Dict],
+        resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType, enums.FacebookResourceType],
+        date_created: datetime.datetime,
+    ) -> str:
+        """
+        Writes all rows to a single typed Parquet object under the `date_created=` partition of the resource.
+        """
+        try:
+            body = columnar.get_insights_parquet_bytes(records=resource_performance)
+        except exceptions.ColumnarFormatException as e:
+            raise s3_client_exceptions.S3ClientError(utils.get_exception_message(exception=e))
+
+        return self._upload_body(
+            body=body,
+            file_path=self.get_performance_parquet_path(resource_type=resource_type, date_created=date_created),
+        )
+
+    @classmethod
+    def get_performance_parquet_path(
+        cls,
+        resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType, enums.FacebookResourceType],
+        date_created: datetime.datetime,
+    ) -> str:
+        return "{}/date_created={}/{}".format(
+            resource_type.value,
+            cls._get_formatted_date_created(date_created=date_created),
+            s3_client_constants.PERFORMANCE_PARQUET_FILE_NAME,
+        )
 
     def upload_resource_assets(
         self,
         asset_list: typing.List[typing.Dict],
         resource_type: enums.ResourceType,
         date_created: datetime.datetime,
+        max_workers: int = s3_client_constants.ASSET_MAX_WORKERS,
     ) -> typing.List[str]:
-        s3_paths = []
-        date_created_formatted = self._get_formatted_date_created(date_created=date_created)
-        for asset in asset_list:
-            if not asset.get("image_url"):
-                continue
+        """
+        Paths of the mirrored assets, see `mirror_resource_assets`. Assets that failed are reported together in
+        one error once the whole batch has been mirrored.
+        """
+        report = self.mirror_resource_assets(
+            asset_list=asset_list, resource_type=resource_type, date_created=date_created, max_workers=max_workers
+        )
+        if report.failed:
+            raise s3_client_exceptions.S3ClientError(
+                "Unable to upload assets to S3 (failed={}, total={}). Errors: {}".format(
+                    len(report.failed),
+                    len(report.results),
+                    ["{}: {}".format(result.source_url, result.error) for result in report.failed],
+                )
+            )
 
-            upload_path = self._upload_image_from_url(
-                file_path="{}/{}={}/date_created={}/asset.png".format(
+        return [result.s3_path for result in report.results]
+
+    def mirror_resource_assets(
+        self,
+        asset_list: typing.List[typing.Dict],
+        resource_type: enums.ResourceType,
+        date_created: datetime.datetime,
+        max_workers: int = s3_client_constants.ASSET_MAX_WORKERS,
+    ) -> s3_assets.AssetsUploadReport:
+        """
+        Copies the `image_url` of every asset to `{resource}={id}/date_created=/asset.{extension}`, the extension
+        following the detected content type. Assets are mirrored concurrently on `max_workers` threads, unchanged
+        objects are skipped and every asset gets its own result (path, size, time, error) in the report.
+        """
+        date_created_formatted = self._get_formatted_date_created(date_created=date_created)
+        uploads = [
+            s3_assets.AssetUpload(
+                asset_id=asset["id"],
+                source_url=asset["image_url"],
+                key="{}/{}/{}={}/date_created={}/asset".format(
+                    self._prefix,
                     resource_type.value,
                     resource_type.value,
                     asset["id"],
                     date_created_formatted,
                 ),
-                image_url=asset["image_url"],
             )
-            s3_paths.append(upload_path)
+            for asset in asset_list
+            if asset.get("image_url")
+        ]
 
-        return s3_paths
+        return s3_assets.AssetMirror(
+            s3_client=self._bucket.meta.client, bucket_name=self._bucket_name, max_workers=max_workers
+        ).mirror(uploads=uploads)
 
     def _upload_data(
         self,
         data: typing.Union[typing.List[typing.Dict], typing.Dict],
         file_path: str,
     ) -> str:
+        return self._upload_body(body=json_codec.dumps(data, pretty=True), file_path=file_path)
+
+    def _upload_body(self, body: typing.Union[str, bytes], file_path: str) -> str:
         file_path_with_prefix = f"{self._prefix}/{file_path}"
         try:
-            self._bucket.put_object(
+            # The low-level client is thread safe, unlike the bucket resource.
+            self._bucket.meta.client.put_object(
+                Bucket=self._bucket_name,
                 Key=file_path_with_prefix,
-                Body=json.dumps(data, indent=4),
+                Body=body,
             )
         except Exception as e:
             raise s3_client_exceptions.S3ClientError(
@@ -111,24 +251,54 @@ class S3Uploader(object):
 
         return self._get_full_s3_path(file_path=file_path_with_prefix)
 
-    def _upload_image_from_url(
-        self,
-        file_path: str,
-        image_url: str,
-    ) -> str:
-        file_path_with_prefix = f"{self._prefix}/{file_path}"
-        try:
-            self._bucket.upload_fileobj(requests.get(image_url, stream=True).raw, file_path_with_prefix)
-        except Exception as e:
-            raise s3_client_exceptions.S3ClientError(
-                "Unable to upload image data to S3 path (path_name={}, image_url={}). Error: {}".format(
-                    file_path_with_prefix,
-                    image_url,
-                    utils.get_exception_message(exception=e),
+    @staticmethod
+    def _get_batched_performance_uploads(
+        resource_performance: typing.List[typing.Dict],
+        resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType, enums.FacebookResourceType],
+        date_created_formatted: str,
+        rows_per_object: typing.Optional[int],
+    ) -> typing.List[typing.Tuple[str, str]]:
+        resources_performance = collections.defaultdict(list)
+        for performance_data in resource_performance:
+            resources_performance[performance_data["{}_id".format(resource_type.value)]].append(performance_data)
+
+        uploads = []
+        for resource_id, performance_rows in resources_performance.items():
+            performance_rows = sorted(performance_rows, key=lambda performance_data: performance_data["date_start"])
+            batch_size = rows_per_object if rows_per_object else len(performance_rows)
+            for i in range(0, len(performance_rows), batch_size):
+                batch = performance_rows[i : i + batch_size]
+                uploads.append(
+                    (
+                        "{}/{}={}/date_created={}/performance_{}_{}.jsonl".format(
+                            resource_type.value,
+                            resource_type.value,
+                            resource_id,
+                            date_created_formatted,
+                            batch[0]["date_start"],
+                            batch[-1]["date_start"],
+                        ),
+                        "".join(json_codec.dumps(performance_data) + "\n" for performance_data in batch),
+                    )
                 )
-            )
 
-        return file_path_with_prefix
+        return uploads
+
+    @staticmethod
+    def _iter_json_lines_chunks(records: typing.Iterable[typing.Dict]) -> typing.Iterator[bytes]:
+        lines = []
+        lines_size = 0
+        for record in records:
+            line = json_codec.dumps_bytes(record) + b"\n"
+            lines.append(line)
+            lines_size += len(line)
+            if lines_size >= s3_client_constants.MULTIPART_CHUNK_SIZE:
+                yield b"".join(lines)
+                lines = []
+                lines_size = 0
+
+        if lines:
+            yield b"".join(lines)
 
     @staticmethod
     def _get_formatted_date_created(date_created: datetime) -> str:
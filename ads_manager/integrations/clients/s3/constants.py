@@ -1 +1,24 @@
 DATE_CREATED_FORMAT = "%Y-%m-%d-%H"  # "yyyy-MM-dd-hh"
+
+UPLOAD_MAX_WORKERS = 8  # Objects uploaded at the same time by a single call
+
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024  # S3 rejects smaller parts, except for the last one
+MULTIPART_DEFAULT_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_PARTS = 10000
+MULTIPART_DEFAULT_MAX_CONCURRENCY = 4
+MULTIPART_CHUNK_SIZE = 64 * 1024  # Serialized records are buffered into chunks of roughly this size
+
+PERFORMANCE_PARQUET_FILE_NAME = "performance.parquet"
+
+ASSET_MAX_WORKERS = 8  # Assets downloaded and uploaded at the same time by a single call
+ASSET_DOWNLOAD_TIMEOUT = 60.0  # Seconds
+ASSET_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+ASSET_SPOOL_MAX_SIZE = 8 * 1024 * 1024  # Larger assets are buffered on disk instead of in memory
+ASSET_EXTENSIONS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/gif": "gif",
+    "image/webp": "webp",
+    "video/mp4": "mp4",
+    "video/quicktime": "mov",
+}
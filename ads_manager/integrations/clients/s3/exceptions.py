@@ -8,3 +8,7 @@ class S3PathIsNotValidError(S3UploaderError):
 
 class S3ClientError(S3UploaderError):
     pass
+
+
+class S3MultipartUploadError(S3ClientError):
+    pass
@@ -0,0 +1,178 @@
+import concurrent.futures
+import logging
+import threading
+import typing
+
+from ads_manager import utils
+from ads_manager.integrations.clients.s3 import constants as s3_client_constants
+from ads_manager.integrations.clients.s3 import exceptions as s3_client_exceptions
+
+logger = logging.getLogger(__name__)
+
+
+class MultipartUpload(object):
+    """
+    Uploads a stream of byte chunks to a single S3 object with multipart upload.
+
+    Chunks are buffered into parts of `part_size` bytes and up to `max_concurrency` parts are uploaded at the
+    same time, so memory stays bounded by roughly `(max_concurrency + 1) * part_size`. A stream that never fills
+    the first part is sent with a single `put_object` instead. If anything fails, the multipart upload is aborted
+    so no orphaned parts are left behind in the bucket.
+    """
+
+    def __init__(
+        self,
+        s3_client: typing.Any,
+        bucket_name: str,
+        key: str,
+        part_size: int = s3_client_constants.MULTIPART_DEFAULT_PART_SIZE,
+        max_concurrency: int = s3_client_constants.MULTIPART_DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        if part_size < s3_client_constants.MULTIPART_MIN_PART_SIZE:
+            raise s3_client_exceptions.S3MultipartUploadError(
+                "Multipart part size (part_size={}) is smaller than the S3 minimum of {} bytes".format(
+                    part_size, s3_client_constants.MULTIPART_MIN_PART_SIZE
+                )
+            )
+
+        self._s3_client = s3_client
+        self._bucket_name = bucket_name
+        self._key = key
+        self._part_size = part_size
+        self._max_concurrency = max(max_concurrency, 1)
+        self._upload_id = None
+        self._parts = []
+        self._parts_lock = threading.Lock()
+
+    def upload(self, chunks: typing.Iterable[bytes]) -> int:
+        buffer = bytearray()
+        chunks = iter(chunks)
+
+        for chunk in chunks:
+            buffer.extend(chunk)
+            if len(buffer) >= self._part_size:
+                break
+        else:
+            self._put_object(body=bytes(buffer))
+            return len(buffer)
+
+        try:
+            return self._upload_parts(buffer=buffer, chunks=chunks)
+        except Exception as e:
+            self._abort()
+            if isinstance(e, s3_client_exceptions.S3MultipartUploadError):
+                raise
+
+            raise s3_client_exceptions.S3MultipartUploadError(
+                "Multipart upload failed (bucket={}, key={}, upload_id={}). Error: {}".format(
+                    self._bucket_name, self._key, self._upload_id, utils.get_exception_message(exception=e)
+                )
+            )
+
+    def _upload_parts(self, buffer: bytearray, chunks: typing.Iterator[bytes]) -> int:
+        self._upload_id = self._s3_client.create_multipart_upload(Bucket=self._bucket_name, Key=self._key)["UploadId"]
+
+        uploaded_bytes = 0
+        part_number = 0
+        in_flight = threading.BoundedSemaphore(self._max_concurrency)
+        futures = []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+
+            def _submit(body: bytes) -> None:
+                nonlocal part_number, uploaded_bytes
+
+                part_number += 1
+                if part_number > s3_client_constants.MULTIPART_MAX_PARTS:
+                    raise s3_client_exceptions.S3MultipartUploadError(
+                        "Multipart upload exceeds {} parts (bucket={}, key={}, part_size={})".format(
+                            s3_client_constants.MULTIPART_MAX_PARTS, self._bucket_name, self._key, self._part_size
+                        )
+                    )
+
+                # Blocks the producer while `max_concurrency` parts are already being uploaded.
+                in_flight.acquire()
+                future = executor.submit(self._upload_part, part_number=part_number, body=body)
+                future.add_done_callback(lambda _: in_flight.release())
+                futures.append(future)
+                uploaded_bytes += len(body)
+
+            try:
+                while True:
+                    while len(buffer) >= self._part_size:
+                        _submit(body=bytes(buffer[: self._part_size]))
+                        del buffer[: self._part_size]
+
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+
+                    buffer.extend(chunk)
+
+                    # Surface a failed part early instead of serializing the rest of the stream.
+                    for future in futures:
+                        if future.done() and future.exception():
+                            raise future.exception()
+
+                if buffer:
+                    _submit(body=bytes(buffer))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        for future in futures:
+            future.result()
+
+        with self._parts_lock:
+            parts = sorted(self._parts, key=lambda part: part["PartNumber"])
+
+        self._s3_client.complete_multipart_upload(
+            Bucket=self._bucket_name,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+        logger.info(
+            "Completed multipart upload (bucket={}, key={}, parts={}, bytes={})".format(
+                self._bucket_name, self._key, len(parts), uploaded_bytes
+            )
+        )
+
+        return uploaded_bytes
+
+    def _upload_part(self, part_number: int, body: bytes) -> None:
+        response = self._s3_client.upload_part(
+            Bucket=self._bucket_name,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+
+        with self._parts_lock:
+            self._parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+
+    def _put_object(self, body: bytes) -> None:
+        try:
+            self._s3_client.put_object(Bucket=self._bucket_name, Key=self._key, Body=body)
+        except Exception as e:
+            raise s3_client_exceptions.S3MultipartUploadError(
+                "Unable to upload data (bucket={}, key={}). Error: {}".format(
+                    self._bucket_name, self._key, utils.get_exception_message(exception=e)
+                )
+            )
+
+    def _abort(self) -> None:
+        if not self._upload_id:
+            return
+
+        try:
+            self._s3_client.abort_multipart_upload(Bucket=self._bucket_name, Key=self._key, UploadId=self._upload_id)
+        except Exception as e:
+            logger.warning(
+                "Unable to abort multipart upload (bucket={}, key={}, upload_id={}). Error: {}".format(
+                    self._bucket_name, self._key, self._upload_id, utils.get_exception_message(exception=e)
+                )
+            )
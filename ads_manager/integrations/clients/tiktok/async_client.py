@@ -0,0 +1,626 @@
+import asyncio
+import datetime
+import typing
+
+from ads_manager import enums, utils
+from ads_manager.integrations.clients import async_base_client
+from ads_manager.integrations.clients import exceptions as client_exceptions
+from ads_manager.integrations.clients import insights_windows, messages
+from ads_manager.integrations.clients.tiktok import constants as tiktok_client_constants
+from ads_manager.integrations.clients.tiktok import enums as tiktok_client_enums
+from ads_manager.integrations.clients.tiktok import (
+    material_cache as tiktok_material_cache,
+)
+from ads_manager.integrations.clients.tiktok import parser as tiktok_client_parser
+from ads_manager.integrations.gateways import async_connection_pool
+from ads_manager.integrations.gateways.tiktok import (
+    async_client as async_tiktok_api_client,
+)
+from ads_manager.integrations.gateways.tiktok import (
+    exceptions as tiktok_api_client_exceptions,
+)
+
+
+class AsyncTiktokClient(async_base_client.AsyncBaseClient, tiktok_client_parser.TiktokResponseParser):
+    def __init__(
+        self,
+        user_access_token: str,
+        params: typing.Optional[typing.Dict] = None,
+        connection_pool: typing.Optional[async_connection_pool.AsyncConnectionPool] = None,
+    ) -> None:
+        super().__init__(user_access_token=user_access_token, params=params, connection_pool=connection_pool)
+
+    def get_rest_api_client(self) -> async_tiktok_api_client.AsyncTikTokApiClient:
+        if not self._rest_api_client:
+            self._rest_api_client = async_tiktok_api_client.AsyncTikTokApiClient(
+                user_access_token=self._user_access_token, params=self._params, pool=self._connection_pool
+            )
+        return self._rest_api_client
+
+    async def get_account_ids(
+        self,
+    ) -> typing.List[messages.AdAccount]:
+        utils.validate_params(self._params)
+
+        try:
+            response = await self.get_rest_api_client().get_ad_accounts(params=self._params)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch account ids (platform={}, app_id={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    self._params["app_id"],
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return self._parse_account_ids(app_id=self._params["app_id"], response=response)
+
+    async def get_account_campaigns_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.CampaignDetails]:
+        return [
+            data
+            async for page in self.iter_account_campaigns_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
+        ]
+
+    async def iter_account_campaigns_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.AsyncIterator[typing.List[messages.CampaignDetails]]:
+        try:
+            async for page in self.get_rest_api_client().iter_advertiser_campaigns(
+                advertiser_id=ad_account_id,
+                fields=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_PROJECTIONS[
+                    enums.ResourceType.CAMPAIGN
+                ].get_fields(projection=projection),
+            ):
+                yield self._parse_campaigns_details(ad_account_id=ad_account_id, response=page, projection=projection)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch campaign details (platform={}, advertiser_id={}) through provider. Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+    async def get_account_adsets_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdSetDetails]:
+        return [
+            data
+            async for page in self.iter_account_adsets_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
+        ]
+
+    async def iter_account_adsets_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.AsyncIterator[typing.List[messages.AdSetDetails]]:
+        try:
+            async for page in self.get_rest_api_client().iter_advertiser_adgroups(
+                advertiser_id=ad_account_id,
+                fields=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_PROJECTIONS[
+                    enums.TiktokResourceType.AD_GROUP
+                ].get_fields(projection=projection),
+            ):
+                yield self._parse_adgroups_details(ad_account_id=ad_account_id, response=page, projection=projection)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch adgroup details (platform={}, advertiser_id={}) through provider. Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+    async def get_account_ads_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdDetails]:
+        return [
+            data
+            async for page in self.iter_account_ads_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
+        ]
+
+    async def iter_account_ads_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.AsyncIterator[typing.List[messages.AdDetails]]:
+        try:
+            async for page in self.get_rest_api_client().iter_advertiser_ads(
+                advertiser_id=ad_account_id,
+                fields=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_PROJECTIONS[enums.ResourceType.AD].get_fields(
+                    projection=projection
+                ),
+            ):
+                yield self._parse_ads_details(ad_account_id=ad_account_id, response=page, projection=projection)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to fetch ad details (platform={}, advertiser_id={}) through provider. Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+    async def create_ads(self, ad_account_id: str, ads_details: typing.Dict) -> typing.List[str]:
+        validated_ad_details = self._prepare_ads_create_params(ad_account_id=ad_account_id, ads_details=ads_details)
+
+        try:
+            created_ad = await self.get_rest_api_client().create_ads(ad_params=validated_ad_details)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create ads (platform={}, advertiser_id={}, ad_details={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    validated_ad_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return created_ad["ad_ids"]
+
+    async def update_ads(self, ad_account_id: str, adgroup_id: str, ad_details: typing.Dict) -> bool:
+        validated_ad_details = self._prepare_ads_update_params(
+            ad_account_id=ad_account_id, adgroup_id=adgroup_id, ad_details=ad_details
+        )
+
+        try:
+            updated_ads = await self.get_rest_api_client().update_ads(ad_params=validated_ad_details)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update ad (platform={}, advertiser_id={}, adgroup_id={}, ad_details={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    adgroup_id,
+                    validated_ad_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return bool(updated_ads)
+
+    async def update_ads_status(self, ad_account_id: str, ads_status_details: typing.Dict) -> bool:
+        validated_ads_status_details = self._prepare_ads_status_params(
+            ad_account_id=ad_account_id, ads_status_details=ads_status_details
+        )
+
+        try:
+            updated_ads = await self.get_rest_api_client().update_ads_status(
+                ads_status_params=validated_ads_status_details
+            )
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update ads status details (platform={}, advertiser_id={}, ads_status_details={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    validated_ads_status_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return bool(updated_ads["ad_ids"])
+
+    async def create_campaign(self, ad_account_id: str, campaign_details: typing.Dict) -> str:
+        validated_campaign_details = self._prepare_campaign_create_params(
+            ad_account_id=ad_account_id, campaign_details=campaign_details
+        )
+
+        try:
+            created_campaign = await self.get_rest_api_client().create_campaign(
+                campaign_params=validated_campaign_details
+            )
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create campaign (platform={}, advertiser_id={}, campaign_details={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    validated_campaign_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return created_campaign["campaign_id"]
+
+    async def update_campaign(
+        self,
+        ad_account_id: str,
+        campaign_id: str,
+        campaign_details: typing.Dict,
+    ) -> bool:
+        validated_campaign_details = self._prepare_campaign_update_params(
+            ad_account_id=ad_account_id, campaign_id=campaign_id, campaign_details=campaign_details
+        )
+
+        try:
+            updated_campaign = await self.get_rest_api_client().update_campaign(
+                campaign_params=validated_campaign_details
+            )
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update campaign (platform={}, advertiser_id={}, campaign_id={}, campaign_details={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    campaign_id,
+                    validated_campaign_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return bool(updated_campaign)
+
+    async def create_adset(self, ad_account_id: str, adset_details: typing.Dict) -> str:
+        validated_adgroup_details = self._prepare_adgroup_create_params(
+            ad_account_id=ad_account_id, adset_details=adset_details
+        )
+
+        try:
+            created_adgroup = await self.get_rest_api_client().create_adgroup(adgroup_params=validated_adgroup_details)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create adgroup (platform={}, advertiser_id={}, adgroup_details={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    validated_adgroup_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return created_adgroup["adgroup_id"]
+
+    async def update_adset(
+        self,
+        ad_account_id: str,
+        adset_id: str,
+        adset_details: typing.Dict,
+    ) -> bool:
+        validated_adgroup_details = self._prepare_adgroup_update_params(
+            ad_account_id=ad_account_id, adset_id=adset_id, adset_details=adset_details
+        )
+
+        try:
+            updated_adgroup = await self.get_rest_api_client().update_adgroup(adgroup_params=validated_adgroup_details)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update adgroup (platform={}, advertiser_id={}, adgroup_id={}, adgroup_details={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    adset_id,
+                    validated_adgroup_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return bool(updated_adgroup)
+
+    async def create_image(
+        self,
+        ad_account_id: str,
+        image_details: typing.Dict,
+        material_cache: typing.Optional[tiktok_material_cache.MaterialCache] = None,
+    ) -> str:
+        """
+        With a `material_cache`, a file already uploaded to the advertiser (same MD5 signature) isn't uploaded again,
+        the cached `image_id` is returned instead.
+        """
+        signature = (
+            tiktok_material_cache.get_material_signature(
+                material_details=image_details, material_type=tiktok_client_enums.MaterialType.IMAGE
+            )
+            if material_cache is not None
+            else None
+        )
+        if signature:
+            cached_image_id = material_cache.get_material_id(
+                advertiser_id=ad_account_id, material_type=tiktok_client_enums.MaterialType.IMAGE, signature=signature
+            )
+            if cached_image_id:
+                return cached_image_id
+
+        validated_image_details = self._prepare_image_create_params(
+            ad_account_id=ad_account_id, image_details=image_details
+        )
+
+        try:
+            created_image = await self.get_rest_api_client().upload_image(image_params=validated_image_details)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create image (platform={}, advertiser_id={}, image_details={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    validated_image_details,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        image_id = created_image["image_id"]
+        if signature:
+            material_cache.save_material_id(
+                advertiser_id=ad_account_id,
+                material_type=tiktok_client_enums.MaterialType.IMAGE,
+                signature=signature,
+                material_id=image_id,
+            )
+
+        return image_id
+
+    async def update_image_name(self, ad_account_id: str, image_id: str, image_name: str) -> bool:
+        validated_image_details = self._prepare_image_update_params(
+            ad_account_id=ad_account_id, image_id=image_id, image_name=image_name
+        )
+
+        try:
+            updated_image = await self.get_rest_api_client().update_image_name(image_params=validated_image_details)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update image (platform={}, advertiser_id={}, image_id={}, image_name={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    image_id,
+                    image_name,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return bool(updated_image)
+
+    async def get_images_info(
+        self, ad_account_id: str, image_ids: typing.List[str]
+    ) -> typing.List[messages.ImageDetails]:
+        """
+        Ids are requested in chunks of `TIKTOK_IMAGE_INFO_MAX_IDS`, the most one request accepts.
+        """
+        images_info = []
+        for index in range(0, len(image_ids), tiktok_client_constants.TIKTOK_IMAGE_INFO_MAX_IDS):
+            images_info.extend(
+                await self._get_images_info_chunk(
+                    ad_account_id=ad_account_id,
+                    image_ids=image_ids[index : index + tiktok_client_constants.TIKTOK_IMAGE_INFO_MAX_IDS],
+                )
+            )
+
+        return images_info
+
+    async def _get_images_info_chunk(
+        self, ad_account_id: str, image_ids: typing.List[str]
+    ) -> typing.List[messages.ImageDetails]:
+        validated_image_params = self._prepare_images_info_params(ad_account_id=ad_account_id, image_ids=image_ids)
+
+        try:
+            images_info_details = await self.get_rest_api_client().get_images_info(image_params=validated_image_params)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to get images info details (platform={}, advertiser_id={}, image_ids={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    image_ids,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return self._parse_images_info(
+            ad_account_id=ad_account_id, image_ids=image_ids, images_info_details=images_info_details
+        )
+
+    async def create_video(
+        self,
+        ad_account_id: str,
+        video_details: typing.Dict,
+        material_cache: typing.Optional[tiktok_material_cache.MaterialCache] = None,
+    ) -> str:
+        """
+        With a `material_cache`, a file already uploaded to the advertiser (same MD5 signature) isn't uploaded again,
+        the cached `video_id` is returned instead.
+        """
+        signature = (
+            tiktok_material_cache.get_material_signature(
+                material_details=video_details, material_type=tiktok_client_enums.MaterialType.VIDEO
+            )
+            if material_cache is not None
+            else None
+        )
+        if signature:
+            cached_video_id = material_cache.get_material_id(
+                advertiser_id=ad_account_id, material_type=tiktok_client_enums.MaterialType.VIDEO, signature=signature
+            )
+            if cached_video_id:
+                return cached_video_id
+
+        validated_video_params = self._prepare_video_create_params(
+            ad_account_id=ad_account_id, video_details=video_details
+        )
+
+        try:
+            created_video = await self.get_rest_api_client().upload_video(video_params=validated_video_params)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to create video (platform={}, advertiser_id={}, video_details={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    validated_video_params,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        video_id = created_video[0]["video_id"]
+        if signature:
+            material_cache.save_material_id(
+                advertiser_id=ad_account_id,
+                material_type=tiktok_client_enums.MaterialType.VIDEO,
+                signature=signature,
+                material_id=video_id,
+            )
+
+        return video_id
+
+    async def update_video_name(self, ad_account_id: str, video_id: str, video_name: str) -> bool:
+        validated_video_params = self._prepare_video_update_params(
+            ad_account_id=ad_account_id, video_id=video_id, video_name=video_name
+        )
+
+        try:
+            updated_video = await self.get_rest_api_client().update_video_name(video_params=validated_video_params)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to update video (platform={}, advertiser_id={}, video_id={}, video_name={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    video_id,
+                    video_name,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return bool(updated_video)
+
+    async def get_videos_info(
+        self, ad_account_id: str, video_ids: typing.List[str]
+    ) -> typing.List[messages.VideoDetails]:
+        """
+        Ids are requested in chunks of `TIKTOK_VIDEO_INFO_MAX_IDS`, the most one request accepts.
+        """
+        videos_info = []
+        for index in range(0, len(video_ids), tiktok_client_constants.TIKTOK_VIDEO_INFO_MAX_IDS):
+            videos_info.extend(
+                await self._get_videos_info_chunk(
+                    ad_account_id=ad_account_id,
+                    video_ids=video_ids[index : index + tiktok_client_constants.TIKTOK_VIDEO_INFO_MAX_IDS],
+                )
+            )
+
+        return videos_info
+
+    async def _get_videos_info_chunk(
+        self, ad_account_id: str, video_ids: typing.List[str]
+    ) -> typing.List[messages.VideoDetails]:
+        validated_video_params = self._prepare_videos_info_params(ad_account_id=ad_account_id, video_ids=video_ids)
+
+        try:
+            video_details = await self.get_rest_api_client().get_videos_info(video_params=validated_video_params)
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to get video details (platform={}, advertiser_id={}, video_ids={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    video_ids,
+                    utils.get_exception_message(exception=e),
+                )
+            )
+
+        return self._parse_videos_info(ad_account_id=ad_account_id, video_ids=video_ids, video_details=video_details)
+
+    async def get_insights(
+        self,
+        ad_account_id: str,
+        resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.ResourceInsightsReport]:
+        """
+        Ranges longer than `TIKTOK_INSIGHTS_MAX_WINDOW_DAYS` are requested as several windows, up to
+        `TIKTOK_INSIGHTS_MAX_WORKERS` at a time (paced by the gateway rate limiter), and merged in date order.
+        """
+        semaphore = asyncio.Semaphore(tiktok_client_constants.TIKTOK_INSIGHTS_MAX_WORKERS)
+
+        async def _get_window_insights(
+            window_from_datetime: datetime.datetime, window_to_datetime: datetime.datetime
+        ) -> typing.List[messages.ResourceInsightsReport]:
+            async with semaphore:
+                return [
+                    data
+                    async for page in self._iter_window_insights(
+                        ad_account_id=ad_account_id,
+                        resource_type=resource_type,
+                        from_datetime=window_from_datetime,
+                        to_datetime=window_to_datetime,
+                        projection=projection,
+                    )
+                    for data in page
+                ]
+
+        windows_insights = await asyncio.gather(
+            *[
+                _get_window_insights(window_from_datetime=window_from_datetime, window_to_datetime=window_to_datetime)
+                for window_from_datetime, window_to_datetime in insights_windows.split_date_range(
+                    from_datetime=from_datetime,
+                    to_datetime=to_datetime,
+                    max_days=tiktok_client_constants.TIKTOK_INSIGHTS_MAX_WINDOW_DAYS,
+                )
+            ]
+        )
+
+        return insights_windows.merge_insights_reports(
+            reports=[data for window_insights in windows_insights for data in window_insights]
+        )
+
+    async def iter_insights(
+        self,
+        ad_account_id: str,
+        resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.AsyncIterator[typing.List[messages.ResourceInsightsReport]]:
+        """
+        Ranges longer than `TIKTOK_INSIGHTS_MAX_WINDOW_DAYS` are paged one window after another.
+        """
+        for window_from_datetime, window_to_datetime in insights_windows.split_date_range(
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            max_days=tiktok_client_constants.TIKTOK_INSIGHTS_MAX_WINDOW_DAYS,
+        ):
+            async for page in self._iter_window_insights(
+                ad_account_id=ad_account_id,
+                resource_type=resource_type,
+                from_datetime=window_from_datetime,
+                to_datetime=window_to_datetime,
+                projection=projection,
+            ):
+                yield page
+
+    async def _iter_window_insights(
+        self,
+        ad_account_id: str,
+        resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.AsyncIterator[typing.List[messages.ResourceInsightsReport]]:
+        if resource_type == enums.ResourceType.AD_SET:
+            resource_type = enums.TiktokResourceType.AD_GROUP
+
+        try:
+            async for page in self.get_rest_api_client().iter_insights_report(
+                advertiser_id=ad_account_id,
+                service_type=tiktok_client_enums.ServiceType.AUCTION.value,
+                report_type=tiktok_client_enums.ReportType.BASIC.value,
+                data_level=tiktok_client_enums.DataLevel.from_service_and_resource_type(
+                    service_type=tiktok_client_enums.ServiceType.AUCTION,
+                    resource_type=resource_type,
+                ).value,
+                dimensions=tiktok_client_constants.TIKTOK_INSIGHTS_DETAILS_FIELDS[resource_type]["dimensions"],
+                metrics=tiktok_client_constants.TIKTOK_INSIGHTS_PROJECTIONS[resource_type].get_fields(
+                    projection=projection
+                ),
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            ):
+                yield self._parse_insights_report(
+                    ad_account_id=ad_account_id,
+                    resource_type=resource_type,
+                    from_datetime=from_datetime,
+                    to_datetime=to_datetime,
+                    insights_report=page,
+                    projection=projection,
+                )
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to get insights report (platform={}, advertiser_id={}, resource_type={}, from_datetime={}, to_datetime={}). Error: {}".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    resource_type.name,
+                    from_datetime,
+                    to_datetime,
+                    utils.get_exception_message(exception=e),
+                )
+            )
@@ -1,20 +1,26 @@
+import concurrent.futures
 import datetime
 import typing
 
 from ads_manager import enums, utils
 from ads_manager.integrations.clients import base_client
 from ads_manager.integrations.clients import exceptions as client_exceptions
-from ads_manager.integrations.clients import messages
+from ads_manager.integrations.clients import insights_windows, messages
 from ads_manager.integrations.clients.tiktok import constants as tiktok_client_constants
 from ads_manager.integrations.clients.tiktok import enums as tiktok_client_enums
-from ads_manager.integrations.clients.tiktok import schemas as tiktok_client_schemas
+from ads_manager.integrations.clients.tiktok import (
+    material_cache as tiktok_material_cache,
+)
+from ads_manager.integrations.clients.tiktok import parser as tiktok_client_parser
+from ads_manager.integrations.gateways import pagination
+from ads_manager.integrations.gateways.tiktok import chunked_upload
 from ads_manager.integrations.gateways.tiktok import client as tiktok_api_client
 from ads_manager.integrations.gateways.tiktok import (
     exceptions as tiktok_api_client_exceptions,
 )
 
 
-class TiktokClient(base_client.BaseClient):
+class TiktokClient(base_client.BaseClient, tiktok_client_parser.TiktokResponseParser):
     def __init__(self, user_access_token: str, params: typing.Optional[typing.Dict] = None) -> None:
         super().__init__(user_access_token=user_access_token, params=params)
 
@@ -41,28 +47,39 @@ class TiktokClient(base_client.BaseClient):
                 )
             )
 
-        validated_data = utils.validate_marshmallow_schema(data=response, schema=tiktok_client_schemas.AdAccounts())
-        if not validated_data:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Account data fetched (platform={}, app_id={}, response_data={}) is not valid".format(
-                    enums.Platform.TIKTOK.name, self._params["app_id"], response
-                )
-            )
+        return self._parse_account_ids(app_id=self._params["app_id"], response=response)
 
-        message_to_return = [
-            messages.AdAccount(id_token=None, account_id=data["advertiser_id"], account_name=data["advertiser_name"])
-            for data in validated_data["ad_accounts"]
+    def get_account_campaigns_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.CampaignDetails]:
+        return [
+            data
+            for page in self.iter_account_campaigns_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
         ]
 
-        # return [data["advertiser_id"] for data in validated_data["ad_accounts"]]
-        return message_to_return
-
-    def get_account_campaigns_details(self, ad_account_id: str) -> typing.List[messages.CampaignDetails]:
+    def iter_account_campaigns_details(
+        self,
+        ad_account_id: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        updated_since: typing.Optional[datetime.datetime] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.CampaignDetails]]:
         try:
-            response = self.get_rest_api_client().get_advertiser_campaigns(
+            for page in self.get_rest_api_client().iter_advertiser_campaigns(
                 advertiser_id=ad_account_id,
-                fields=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_FIELDS[enums.ResourceType.CAMPAIGN],
-            )
+                fields=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_PROJECTIONS[
+                    enums.ResourceType.CAMPAIGN
+                ].get_fields(projection=projection),
+                cursor=cursor,
+                filtering=self._get_updated_since_filtering(updated_since=updated_since),
+            ):
+                yield utils.filter_updated_since(
+                    details=self._parse_campaigns_details(
+                        ad_account_id=ad_account_id, response=page, projection=projection
+                    ),
+                    updated_since=updated_since,
+                )
         except tiktok_api_client_exceptions.TikTokAPIClientError as e:
             raise client_exceptions.ClientProviderError(
                 "Unable to fetch campaign details (platform={}, advertiser_id={}) through provider. Error: {}".format(
@@ -72,37 +89,37 @@ class TiktokClient(base_client.BaseClient):
                 )
             )
 
-        validated_data = utils.validate_marshmallow_schema(
-            data=response, schema=tiktok_client_schemas.CampaignsDetails()
-        )
-        if not validated_data:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Campaign details data (platform={}, advertiser_id={}, response_data={}) is not valid".format(
-                    enums.Platform.TIKTOK.name, ad_account_id, response
-                )
-            )
-
-        message_to_return = [
-            messages.CampaignDetails(
-                account_id=data["account_id"],
-                campaign_id=data["id"],
-                campaign_name=data["name"],
-                effective_status=data["effective_status"],
-                configured_status=data.get("configured_status", None),
-                created_time=data["created_time"],
-                updated_time=data["updated_time"],
-            )
-            for data in validated_data["campaigns_details"]
+    def get_account_adsets_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdSetDetails]:
+        return [
+            data
+            for page in self.iter_account_adsets_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
         ]
 
-        return message_to_return
-
-    def get_account_adsets_details(self, ad_account_id: str) -> typing.List[messages.AdSetDetails]:
+    def iter_account_adsets_details(
+        self,
+        ad_account_id: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        updated_since: typing.Optional[datetime.datetime] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.AdSetDetails]]:
         try:
-            response = self.get_rest_api_client().get_advertiser_adgroups(
+            for page in self.get_rest_api_client().iter_advertiser_adgroups(
                 advertiser_id=ad_account_id,
-                fields=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_FIELDS[enums.TiktokResourceType.AD_GROUP],
-            )
+                fields=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_PROJECTIONS[
+                    enums.TiktokResourceType.AD_GROUP
+                ].get_fields(projection=projection),
+                cursor=cursor,
+                filtering=self._get_updated_since_filtering(updated_since=updated_since),
+            ):
+                yield utils.filter_updated_since(
+                    details=self._parse_adgroups_details(
+                        ad_account_id=ad_account_id, response=page, projection=projection
+                    ),
+                    updated_since=updated_since,
+                )
         except tiktok_api_client_exceptions.TikTokAPIClientError as e:
             raise client_exceptions.ClientProviderError(
                 "Unable to fetch adgroup details (platform={}, advertiser_id={}) through provider. Error: {}".format(
@@ -112,38 +129,35 @@ class TiktokClient(base_client.BaseClient):
                 )
             )
 
-        validated_data = utils.validate_marshmallow_schema(
-            data=response, schema=tiktok_client_schemas.AdGroupsDetails()
-        )
-        if not validated_data:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Adgroup details data (platform={}, advertiser_id={}, response_data={}) is not valid".format(
-                    enums.Platform.TIKTOK.name, ad_account_id, response
-                )
-            )
-
-        message_to_return = [
-            messages.AdSetDetails(
-                account_id=data["account_id"],
-                campaign_id=data["campaign_id"],
-                adset_id=data["id"],
-                adset_name=data["name"],
-                effective_status=data["effective_status"],
-                configured_status=data.get("configured_status", None),
-                created_time=data["created_time"],
-                updated_time=data["updated_time"],
-            )
-            for data in validated_data["adgroups_details"]
+    def get_account_ads_details(
+        self, ad_account_id: str, projection: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[messages.AdDetails]:
+        return [
+            data
+            for page in self.iter_account_ads_details(ad_account_id=ad_account_id, projection=projection)
+            for data in page
         ]
 
-        return message_to_return
-
-    def get_account_ads_details(self, ad_account_id: str) -> typing.List[messages.AdDetails]:
+    def iter_account_ads_details(
+        self,
+        ad_account_id: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        updated_since: typing.Optional[datetime.datetime] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.AdDetails]]:
         try:
-            response = self.get_rest_api_client().get_advertiser_ads(
+            for page in self.get_rest_api_client().iter_advertiser_ads(
                 advertiser_id=ad_account_id,
-                fields=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_FIELDS[enums.ResourceType.AD],
-            )
+                fields=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_PROJECTIONS[enums.ResourceType.AD].get_fields(
+                    projection=projection
+                ),
+                cursor=cursor,
+                filtering=self._get_updated_since_filtering(updated_since=updated_since),
+            ):
+                yield utils.filter_updated_since(
+                    details=self._parse_ads_details(ad_account_id=ad_account_id, response=page, projection=projection),
+                    updated_since=updated_since,
+                )
         except tiktok_api_client_exceptions.TikTokAPIClientError as e:
             raise client_exceptions.ClientProviderError(
                 "Unable to fetch ad details (platform={}, advertiser_id={}) through provider. Error: {}".format(
@@ -153,47 +167,8 @@ class TiktokClient(base_client.BaseClient):
                 )
             )
 
-        validated_data = utils.validate_marshmallow_schema(data=response, schema=tiktok_client_schemas.AdsDetails())
-        if not validated_data:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Ad details data (platform={}, advertiser_id={}, response_data={}) is not valid".format(
-                    enums.Platform.TIKTOK.name, ad_account_id, response
-                )
-            )
-
-        message_to_return = [
-            messages.AdDetails(
-                account_id=data["account_id"],
-                campaign_id=data["campaign_id"],
-                adset_id=data["adgroup_id"],
-                ad_id=data["id"],
-                ad_name=data["name"],
-                effective_status=data["effective_status"],
-                configured_status=data.get("configured_status", None),
-                created_time=data["created_time"],
-                updated_time=data["updated_time"],
-            )
-            for data in validated_data["ads_details"]
-        ]
-
-        return message_to_return
-
     def create_ads(self, ad_account_id: str, ads_details: typing.Dict) -> typing.List[str]:
-        if "adset_id" in ads_details:
-            ads_details.update({"adgroup_id": ads_details["adset_id"]})
-            del ads_details["adset_id"]
-
-        ads_details["advertiser_id"] = ad_account_id
-
-        validated_ad_details = utils.validate_marshmallow_schema(
-            data=ads_details, schema=tiktok_client_schemas.AdCreate()
-        )
-        if not validated_ad_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate ad details (platform={}, advertiser_id={}, ad_details={})".format(
-                    enums.Platform.TIKTOK.name, ad_account_id, ads_details
-                )
-            )
+        validated_ad_details = self._prepare_ads_create_params(ad_account_id=ad_account_id, ads_details=ads_details)
 
         try:
             created_ad = self.get_rest_api_client().create_ads(ad_params=validated_ad_details)
@@ -210,19 +185,9 @@ class TiktokClient(base_client.BaseClient):
         return created_ad["ad_ids"]
 
     def update_ads(self, ad_account_id: str, adgroup_id: str, ad_details: typing.Dict) -> bool:
-        ad_details.update({"advertiser_id": ad_account_id, "adgroup_id": adgroup_id})
-        validated_ad_details = utils.validate_marshmallow_schema(
-            data=ad_details, schema=tiktok_client_schemas.AdUpdate()
+        validated_ad_details = self._prepare_ads_update_params(
+            ad_account_id=ad_account_id, adgroup_id=adgroup_id, ad_details=ad_details
         )
-        if not validated_ad_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate ad details (platform={}, advertiser_id={}, adgroup_id={}, ad_details={})".format(
-                    enums.Platform.TIKTOK.name,
-                    ad_account_id,
-                    adgroup_id,
-                    ad_details,
-                )
-            )
 
         try:
             updated_ads = self.get_rest_api_client().update_ads(ad_params=validated_ad_details)
@@ -240,16 +205,9 @@ class TiktokClient(base_client.BaseClient):
         return bool(updated_ads)
 
     def update_ads_status(self, ad_account_id: str, ads_status_details: typing.Dict) -> bool:
-        ads_status_details["advertiser_id"] = ad_account_id
-        validated_ads_status_details = utils.validate_marshmallow_schema(
-            data=ads_status_details, schema=tiktok_client_schemas.AdStatusUpdate()
+        validated_ads_status_details = self._prepare_ads_status_params(
+            ad_account_id=ad_account_id, ads_status_details=ads_status_details
         )
-        if not validated_ads_status_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate ads status details (platform={}, advertiser_id={}, ads_status_details={})".format(
-                    enums.Platform.TIKTOK.name, ad_account_id, ads_status_details
-                )
-            )
 
         try:
             updated_ads = self.get_rest_api_client().update_ads_status(ads_status_params=validated_ads_status_details)
@@ -266,16 +224,9 @@ class TiktokClient(base_client.BaseClient):
         return bool(updated_ads["ad_ids"])
 
     def create_campaign(self, ad_account_id: str, campaign_details: typing.Dict) -> str:
-        campaign_details["advertiser_id"] = ad_account_id
-        validated_campaign_details = utils.validate_marshmallow_schema(
-            data=campaign_details, schema=tiktok_client_schemas.CampaignCreate()
+        validated_campaign_details = self._prepare_campaign_create_params(
+            ad_account_id=ad_account_id, campaign_details=campaign_details
         )
-        if not validated_campaign_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate campaign details (platform={}, advertiser_id={}, campaign_details={})".format(
-                    enums.Platform.TIKTOK.name, ad_account_id, campaign_details
-                )
-            )
 
         try:
             created_campaign = self.get_rest_api_client().create_campaign(campaign_params=validated_campaign_details)
@@ -297,19 +248,9 @@ class TiktokClient(base_client.BaseClient):
         campaign_id: str,
         campaign_details: typing.Dict,
     ) -> bool:
-        campaign_details.update({"advertiser_id": ad_account_id, "campaign_id": campaign_id})
-        validated_campaign_details = utils.validate_marshmallow_schema(
-            data=campaign_details, schema=tiktok_client_schemas.CampaignUpdate()
+        validated_campaign_details = self._prepare_campaign_update_params(
+            ad_account_id=ad_account_id, campaign_id=campaign_id, campaign_details=campaign_details
         )
-        if not validated_campaign_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate campaign details (platform={}, advertiser_id={}, campaign_id={}, campaign_details={})".format(
-                    enums.Platform.TIKTOK.name,
-                    ad_account_id,
-                    campaign_id,
-                    campaign_details,
-                )
-            )
 
         try:
             updated_campaign = self.get_rest_api_client().update_campaign(campaign_params=validated_campaign_details)
@@ -327,16 +268,9 @@ class TiktokClient(base_client.BaseClient):
         return bool(updated_campaign)
 
     def create_adset(self, ad_account_id: str, adset_details: typing.Dict) -> str:
-        adset_details["advertiser_id"] = ad_account_id
-        validated_adgroup_details = utils.validate_marshmallow_schema(
-            data=adset_details, schema=tiktok_client_schemas.AdGroupCreate()
+        validated_adgroup_details = self._prepare_adgroup_create_params(
+            ad_account_id=ad_account_id, adset_details=adset_details
         )
-        if not validated_adgroup_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate adgroup details (platform={}, advertiser_id={}, adgroup_details={})".format(
-                    enums.Platform.TIKTOK.name, ad_account_id, adset_details
-                )
-            )
 
         try:
             created_adgroup = self.get_rest_api_client().create_adgroup(adgroup_params=validated_adgroup_details)
@@ -358,19 +292,9 @@ class TiktokClient(base_client.BaseClient):
         adset_id: str,
         adset_details: typing.Dict,
     ) -> bool:
-        adset_details.update({"advertiser_id": ad_account_id, "adgroup_id": adset_id})
-        validated_adgroup_details = utils.validate_marshmallow_schema(
-            data=adset_details, schema=tiktok_client_schemas.AdGroupUpdate()
+        validated_adgroup_details = self._prepare_adgroup_update_params(
+            ad_account_id=ad_account_id, adset_id=adset_id, adset_details=adset_details
         )
-        if not validated_adgroup_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate adgroup details (platform={}, advertiser_id={}, adgroup_id={}, adgroup_details={})".format(
-                    enums.Platform.TIKTOK.name,
-                    ad_account_id,
-                    adset_id,
-                    adset_details,
-                )
-            )
 
         try:
             updated_adgroup = self.get_rest_api_client().update_adgroup(adgroup_params=validated_adgroup_details)
@@ -387,17 +311,33 @@ class TiktokClient(base_client.BaseClient):
 
         return bool(updated_adgroup)
 
-    def create_image(self, ad_account_id: str, image_details: typing.Dict) -> str:
-        image_details["advertiser_id"] = ad_account_id
-        validated_image_details = utils.validate_marshmallow_schema(
-            data=image_details, schema=tiktok_client_schemas.ImageCreate()
+    def create_image(
+        self,
+        ad_account_id: str,
+        image_details: typing.Dict,
+        material_cache: typing.Optional[tiktok_material_cache.MaterialCache] = None,
+    ) -> str:
+        """
+        With a `material_cache`, a file already uploaded to the advertiser (same MD5 signature) isn't uploaded again,
+        the cached `image_id` is returned instead.
+        """
+        signature = (
+            tiktok_material_cache.get_material_signature(
+                material_details=image_details, material_type=tiktok_client_enums.MaterialType.IMAGE
+            )
+            if material_cache is not None
+            else None
         )
-        if not validated_image_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate image details (platform={}, advertiser_id={}, image_details={})".format(
-                    enums.Platform.TIKTOK.name, ad_account_id, image_details
-                )
+        if signature:
+            cached_image_id = material_cache.get_material_id(
+                advertiser_id=ad_account_id, material_type=tiktok_client_enums.MaterialType.IMAGE, signature=signature
             )
+            if cached_image_id:
+                return cached_image_id
+
+        validated_image_details = self._prepare_image_create_params(
+            ad_account_id=ad_account_id, image_details=image_details
+        )
 
         try:
             created_image = self.get_rest_api_client().upload_image(image_params=validated_image_details)
@@ -411,27 +351,21 @@ class TiktokClient(base_client.BaseClient):
                 )
             )
 
-        return created_image["image_id"]
+        image_id = created_image["image_id"]
+        if signature:
+            material_cache.save_material_id(
+                advertiser_id=ad_account_id,
+                material_type=tiktok_client_enums.MaterialType.IMAGE,
+                signature=signature,
+                material_id=image_id,
+            )
+
+        return image_id
 
     def update_image_name(self, ad_account_id: str, image_id: str, image_name: str) -> bool:
-        image_details = {
-            "advertiser_id": ad_account_id,
-            "image_id": image_id,
-            "file_name": image_name,
-        }
-
-        validated_image_details = utils.validate_marshmallow_schema(
-            data=image_details, schema=tiktok_client_schemas.ImageUpdate()
+        validated_image_details = self._prepare_image_update_params(
+            ad_account_id=ad_account_id, image_id=image_id, image_name=image_name
         )
-        if not validated_image_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate image details (platform={}, advertiser_id={}, image_id={}, image_name={})".format(
-                    enums.Platform.TIKTOK.name,
-                    ad_account_id,
-                    image_id,
-                    image_name,
-                )
-            )
 
         try:
             updated_image = self.get_rest_api_client().update_image_name(image_params=validated_image_details)
@@ -449,23 +383,22 @@ class TiktokClient(base_client.BaseClient):
         return bool(updated_image)
 
     def get_images_info(self, ad_account_id: str, image_ids: typing.List[str]) -> typing.List[messages.ImageDetails]:
-        image_params = {
-            "advertiser_id": ad_account_id,
-            "image_ids": image_ids,
-        }
-
-        validated_image_params = utils.validate_marshmallow_schema(
-            data=image_params, schema=tiktok_client_schemas.ImageInfoParams()
-        )
-
-        if not validated_image_params:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate image details (platform={}, advertiser_id={}, image_ids={})".format(
-                    enums.Platform.TIKTOK.name,
-                    ad_account_id,
-                    image_ids,
-                )
+        """
+        Ids are requested in chunks of `TIKTOK_IMAGE_INFO_MAX_IDS`, the most one request accepts.
+        """
+        return [
+            image_info
+            for index in range(0, len(image_ids), tiktok_client_constants.TIKTOK_IMAGE_INFO_MAX_IDS)
+            for image_info in self._get_images_info_chunk(
+                ad_account_id=ad_account_id,
+                image_ids=image_ids[index : index + tiktok_client_constants.TIKTOK_IMAGE_INFO_MAX_IDS],
             )
+        ]
+
+    def _get_images_info_chunk(
+        self, ad_account_id: str, image_ids: typing.List[str]
+    ) -> typing.List[messages.ImageDetails]:
+        validated_image_params = self._prepare_images_info_params(ad_account_id=ad_account_id, image_ids=image_ids)
 
         try:
             images_info_details = self.get_rest_api_client().get_images_info(image_params=validated_image_params)
@@ -479,50 +412,37 @@ class TiktokClient(base_client.BaseClient):
                 )
             )
 
-        validated_image_details = utils.validate_marshmallow_schema(
-            data=images_info_details,
-            schema=tiktok_client_schemas.ImageDetailsResponse(),
+        return self._parse_images_info(
+            ad_account_id=ad_account_id, image_ids=image_ids, images_info_details=images_info_details
         )
-        if not validated_image_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate image details (platform={}, advertiser_id={}, image_ids={})".format(
-                    enums.Platform.TIKTOK.name,
-                    ad_account_id,
-                    image_ids,
-                )
-            )
-
-        message_to_return = [
-            messages.ImageDetails(
-                image_id=data["image_id"],
-                material_id=data["material_id"],
-                size=data["size"],
-                width=data["width"],
-                height=data["height"],
-                format=data["format"],
-                image_url=data["image_url"],
-                signature=data["signature"],
-                file_name=data["file_name"],
-                create_time=data["create_time"],
-                modify_time=data["modify_time"],
-                displayable=data["displayable"],
-            )
-            for data in validated_image_details["image_details"]
-        ]
-
-        return message_to_return
 
-    def create_video(self, ad_account_id: str, video_details: typing.Dict) -> str:
-        video_details["advertiser_id"] = ad_account_id
-        validated_video_params = utils.validate_marshmallow_schema(
-            data=video_details, schema=tiktok_client_schemas.VideoCreate()
+    def create_video(
+        self,
+        ad_account_id: str,
+        video_details: typing.Dict,
+        material_cache: typing.Optional[tiktok_material_cache.MaterialCache] = None,
+    ) -> str:
+        """
+        With a `material_cache`, a file already uploaded to the advertiser (same MD5 signature) isn't uploaded again,
+        the cached `video_id` is returned instead.
+        """
+        signature = (
+            tiktok_material_cache.get_material_signature(
+                material_details=video_details, material_type=tiktok_client_enums.MaterialType.VIDEO
+            )
+            if material_cache is not None
+            else None
         )
-        if not validated_video_params:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate video details (platform={}, advertiser_id={}, video_details={})".format(
-                    enums.Platform.TIKTOK.name, ad_account_id, video_details
-                )
+        if signature:
+            cached_video_id = material_cache.get_material_id(
+                advertiser_id=ad_account_id, material_type=tiktok_client_enums.MaterialType.VIDEO, signature=signature
             )
+            if cached_video_id:
+                return cached_video_id
+
+        validated_video_params = self._prepare_video_create_params(
+            ad_account_id=ad_account_id, video_details=video_details
+        )
 
         try:
             created_video = self.get_rest_api_client().upload_video(video_params=validated_video_params)
@@ -536,28 +456,89 @@ class TiktokClient(base_client.BaseClient):
                 )
             )
 
-        return created_video[0]["video_id"]
+        video_id = created_video[0]["video_id"]
+        if signature:
+            material_cache.save_material_id(
+                advertiser_id=ad_account_id,
+                material_type=tiktok_client_enums.MaterialType.VIDEO,
+                signature=signature,
+                material_id=video_id,
+            )
 
-    def update_video_name(self, ad_account_id: str, video_id: str, video_name: str) -> bool:
-        video_details = {
-            "advertiser_id": ad_account_id,
-            "video_id": video_id,
-            "file_name": video_name,
-        }
-
-        validated_video_params = utils.validate_marshmallow_schema(
-            data=video_details, schema=tiktok_client_schemas.VideoUpdate()
+        return video_id
+
+    def create_video_in_chunks(
+        self,
+        ad_account_id: str,
+        file_path: str,
+        video_details: typing.Optional[typing.Dict] = None,
+        upload_cursor: typing.Optional[chunked_upload.ChunkedUploadCursor] = None,
+        material_cache: typing.Optional[tiktok_material_cache.MaterialCache] = None,
+    ) -> str:
+        """
+        Creates a video from a large local file, streamed to TikTok in chunks instead of one request holding the
+        whole file. `video_details` can carry the other `create_video` options (e.g. `file_name`).
+
+        Keep the `upload_cursor` to retry a failed upload: passed again, the upload resumes after the last chunk
+        TikTok acknowledged. With a `material_cache`, a file already uploaded to the advertiser isn't sent again.
+        """
+        signature = (
+            tiktok_material_cache.get_material_signature(
+                material_details={"video_file": file_path}, material_type=tiktok_client_enums.MaterialType.VIDEO
+            )
+            if material_cache is not None
+            else None
         )
-        if not validated_video_params:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate video details (platform={}, advertiser_id={}, video_id={}, video_name={})".format(
+        if signature:
+            cached_video_id = material_cache.get_material_id(
+                advertiser_id=ad_account_id, material_type=tiktok_client_enums.MaterialType.VIDEO, signature=signature
+            )
+            if cached_video_id:
+                return cached_video_id
+
+        try:
+            file_id = self.get_rest_api_client().upload_file_in_chunks(
+                advertiser_id=ad_account_id, file_path=file_path, cursor=upload_cursor
+            )
+        except tiktok_api_client_exceptions.TikTokAPIClientError as e:
+            raise client_exceptions.ClientProviderError(
+                "Unable to upload video (platform={}, advertiser_id={}, file_path={}, upload_cursor={}). "
+                "Error: {}".format(
                     enums.Platform.TIKTOK.name,
                     ad_account_id,
-                    video_id,
-                    video_name,
+                    file_path,
+                    upload_cursor,
+                    utils.get_exception_message(exception=e),
                 )
             )
 
+        video_id = self.create_video(
+            ad_account_id=ad_account_id,
+            video_details={
+                **{
+                    key: value
+                    for key, value in (video_details or {}).items()
+                    if key not in ("video_file", "video_signature", "video_url")
+                },
+                "upload_type": "UPLOAD_BY_FILE_ID",
+                "file_id": file_id,
+            },
+        )
+        if signature:
+            material_cache.save_material_id(
+                advertiser_id=ad_account_id,
+                material_type=tiktok_client_enums.MaterialType.VIDEO,
+                signature=signature,
+                material_id=video_id,
+            )
+
+        return video_id
+
+    def update_video_name(self, ad_account_id: str, video_id: str, video_name: str) -> bool:
+        validated_video_params = self._prepare_video_update_params(
+            ad_account_id=ad_account_id, video_id=video_id, video_name=video_name
+        )
+
         try:
             updated_video = self.get_rest_api_client().update_video_name(video_params=validated_video_params)
         except tiktok_api_client_exceptions.TikTokAPIClientError as e:
@@ -574,22 +555,22 @@ class TiktokClient(base_client.BaseClient):
         return bool(updated_video)
 
     def get_videos_info(self, ad_account_id: str, video_ids: typing.List[str]) -> typing.List[messages.VideoDetails]:
-        video_params = {
-            "advertiser_id": ad_account_id,
-            "video_ids": video_ids,
-        }
-
-        validated_video_params = utils.validate_marshmallow_schema(
-            data=video_params, schema=tiktok_client_schemas.VideoInfoParams()
-        )
-        if not validated_video_params:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate video info params (platform={}, advertiser_id={}, video_ids={})".format(
-                    enums.Platform.TIKTOK.name,
-                    ad_account_id,
-                    video_ids,
-                )
+        """
+        Ids are requested in chunks of `TIKTOK_VIDEO_INFO_MAX_IDS`, the most one request accepts.
+        """
+        return [
+            video_info
+            for index in range(0, len(video_ids), tiktok_client_constants.TIKTOK_VIDEO_INFO_MAX_IDS)
+            for video_info in self._get_videos_info_chunk(
+                ad_account_id=ad_account_id,
+                video_ids=video_ids[index : index + tiktok_client_constants.TIKTOK_VIDEO_INFO_MAX_IDS],
             )
+        ]
+
+    def _get_videos_info_chunk(
+        self, ad_account_id: str, video_ids: typing.List[str]
+    ) -> typing.List[messages.VideoDetails]:
+        validated_video_params = self._prepare_videos_info_params(ad_account_id=ad_account_id, video_ids=video_ids)
 
         try:
             video_details = self.get_rest_api_client().get_videos_info(video_params=validated_video_params)
@@ -603,56 +584,96 @@ class TiktokClient(base_client.BaseClient):
                 )
             )
 
-        validated_video_details = utils.validate_marshmallow_schema(
-            data=video_details, schema=tiktok_client_schemas.VideoDetailsResponse()
+        return self._parse_videos_info(ad_account_id=ad_account_id, video_ids=video_ids, video_details=video_details)
+
+    def get_insights(
+        self,
+        ad_account_id: str,
+        resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.ResourceInsightsReport]:
+        """
+        Ranges longer than `TIKTOK_INSIGHTS_MAX_WINDOW_DAYS` are requested as several windows, up to
+        `TIKTOK_INSIGHTS_MAX_WORKERS` at a time (paced by the gateway rate limiter), and merged in date order.
+        """
+        windows = insights_windows.split_date_range(
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            max_days=tiktok_client_constants.TIKTOK_INSIGHTS_MAX_WINDOW_DAYS,
         )
-        if not validated_video_details:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Failed to validate video details (platform={}, advertiser_id={}, video_ids={})".format(
-                    enums.Platform.TIKTOK.name,
-                    ad_account_id,
-                    video_ids,
+
+        def _get_window_insights(
+            window: typing.Tuple[datetime.datetime, datetime.datetime]
+        ) -> typing.List[messages.ResourceInsightsReport]:
+            return [
+                data
+                for page in self._iter_window_insights(
+                    ad_account_id=ad_account_id,
+                    resource_type=resource_type,
+                    from_datetime=window[0],
+                    to_datetime=window[1],
+                    projection=projection,
                 )
-            )
+                for data in page
+            ]
 
-        message_to_return = [
-            messages.VideoDetails(
-                video_id=data["image_id"],
-                material_id=data["material_id"],
-                duration=data["duration"],
-                bit_rate=data["bit_rate"],
-                size=data["size"],
-                width=data["width"],
-                height=data["height"],
-                format=data["format"],
-                video_cover_url=data["video_cover_url"],
-                preview_url=data["preview_url"],
-                preview_url_expire_time=data["preview_url_expire_time"],
-                signature=data["signature"],
-                file_name=data["file_name"],
-                create_time=data["create_time"],
-                modify_time=data["modify_time"],
-                displayable=data["displayable"],
-                allow_download=data["allow_download"],
-                allowed_placements=data["allowed_placements"],
-            )
-            for data in validated_video_details["video_details"]
-        ]
+        if len(windows) == 1:
+            return _get_window_insights(window=windows[0])
 
-        return message_to_return
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(tiktok_client_constants.TIKTOK_INSIGHTS_MAX_WORKERS, len(windows))
+        ) as executor:
+            windows_insights = list(executor.map(_get_window_insights, windows))
 
-    def get_insights(
+        return insights_windows.merge_insights_reports(
+            reports=[data for window_insights in windows_insights for data in window_insights]
+        )
+
+    def iter_insights(
         self,
         ad_account_id: str,
         resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType],
         from_datetime: datetime.datetime,
         to_datetime: datetime.datetime,
-    ) -> typing.List[messages.ResourceInsightsReport]:
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.ResourceInsightsReport]]:
+        """
+        Ranges longer than `TIKTOK_INSIGHTS_MAX_WINDOW_DAYS` are paged one window after another.
+        """
+        yield from insights_windows.iter_windows_pages(
+            windows=insights_windows.split_date_range(
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+                max_days=tiktok_client_constants.TIKTOK_INSIGHTS_MAX_WINDOW_DAYS,
+            ),
+            iter_window_pages=lambda window_from_datetime, window_to_datetime, window_cursor: self._iter_window_insights(
+                ad_account_id=ad_account_id,
+                resource_type=resource_type,
+                from_datetime=window_from_datetime,
+                to_datetime=window_to_datetime,
+                cursor=window_cursor,
+                projection=projection,
+            ),
+            cursor=cursor,
+        )
+
+    def _iter_window_insights(
+        self,
+        ad_account_id: str,
+        resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Iterator[typing.List[messages.ResourceInsightsReport]]:
         if resource_type == enums.ResourceType.AD_SET:
             resource_type = enums.TiktokResourceType.AD_GROUP
 
         try:
-            insights_report = self.get_rest_api_client().get_insights_report(
+            for page in self.get_rest_api_client().iter_insights_report(
                 advertiser_id=ad_account_id,
                 service_type=tiktok_client_enums.ServiceType.AUCTION.value,
                 report_type=tiktok_client_enums.ReportType.BASIC.value,
@@ -661,10 +682,21 @@ class TiktokClient(base_client.BaseClient):
                     resource_type=resource_type,
                 ).value,
                 dimensions=tiktok_client_constants.TIKTOK_INSIGHTS_DETAILS_FIELDS[resource_type]["dimensions"],
-                metrics=tiktok_client_constants.TIKTOK_INSIGHTS_DETAILS_FIELDS[resource_type]["metrics"],
+                metrics=tiktok_client_constants.TIKTOK_INSIGHTS_PROJECTIONS[resource_type].get_fields(
+                    projection=projection
+                ),
                 from_datetime=from_datetime,
                 to_datetime=to_datetime,
-            )
+                cursor=cursor,
+            ):
+                yield self._parse_insights_report(
+                    ad_account_id=ad_account_id,
+                    resource_type=resource_type,
+                    from_datetime=from_datetime,
+                    to_datetime=to_datetime,
+                    insights_report=page,
+                    projection=projection,
+                )
         except tiktok_api_client_exceptions.TikTokAPIClientError as e:
             raise client_exceptions.ClientProviderError(
                 "Unable to get insights report (platform={}, advertiser_id={}, resource_type={}, from_datetime={}, to_datetime={}). Error: {}".format(
@@ -676,49 +708,3 @@ class TiktokClient(base_client.BaseClient):
                     utils.get_exception_message(exception=e),
                 )
             )
-
-        validated_insights_report = utils.validate_marshmallow_schema(
-            data=insights_report,
-            schema=tiktok_client_constants.TIKTOK_INSIGHTS_SCHEMAS[resource_type](advertiser_id=ad_account_id),
-        )
-        if not validated_insights_report:
-            raise client_exceptions.ResponseDataNotValidError(
-                "Resource insights data fetched from provider (platform={}, advertiser_id={}, resource_type={}, from_datetime={}, to_datetime={}, insights_report={}) is not valid".format(
-                    enums.Platform.TIKTOK.name,
-                    ad_account_id,
-                    resource_type.name,
-                    from_datetime,
-                    to_datetime,
-                    insights_report,
-                )
-            )
-
-        message_to_return = [
-            messages.ResourceInsightsReport(
-                account_id=data["advertiser_id"],
-                account_name=None,
-                resource_type=resource_type.name,
-                campaign_id=data["campaign_id"],
-                campaign_name=data["campaign_name"],
-                adset_id=data.get("adgroup_id", None),
-                adset_name=data.get("adgroup_name", None),
-                ad_id=data.get("ad_id", None),
-                ad_name=data.get("ad_name", None),
-                spend="{}".format(data["spend"]),
-                impressions=data["impressions"],
-                clicks=data["clicks"],
-                ctr="{}".format(data["ctr"]),
-                cpm="{}".format(data["cpm"]),
-                cpc="{}".format(data["cpc"]),
-                reach=data["reach"],
-                actions=None,
-                conversions=[{"action_type": "conversion", "value": data["conversions"]}],
-                cost_per_conversion=[{"action_type": "conversion", "value": data["cost_per_conversion"]}],
-                conversion_rate=[{"action_type": "conversion", "value": data["conversion_rate"]}],
-                date_start=data["start_date"],
-                date_stop=data["end_date"],
-            )
-            for data in validated_insights_report["resource_insights"]
-        ]
-
-        return message_to_return
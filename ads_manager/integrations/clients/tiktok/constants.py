@@ -1,4 +1,5 @@
 from ads_manager import enums
+from ads_manager.integrations.clients import field_projection, messages
 from ads_manager.integrations.clients.tiktok import schemas as tiktok_client_schemas
 
 TIKTOK_RESOURCE_DETAILS_FIELDS = {
@@ -97,3 +98,84 @@ TIKTOK_INSIGHTS_SCHEMAS = {
     enums.TiktokResourceType.AD_GROUP: tiktok_client_schemas.AdGroupInsightsReport,
     enums.ResourceType.AD: tiktok_client_schemas.AdInsightsReport,
 }
+
+# Provider fields every projectable message field is built from, see `field_projection.ProjectionSpec`. Insights
+# dimensions are requested by every projection.
+TIKTOK_RESOURCE_DETAILS_PROJECTION_FIELDS = {
+    enums.ResourceType.CAMPAIGN: {
+        "campaign_name": ["campaign_name"],
+        "effective_status": ["operation_status"],
+        "configured_status": ["secondary_status"],
+        "created_time": ["create_time"],
+    },
+    enums.TiktokResourceType.AD_GROUP: {
+        "adset_name": ["adgroup_name"],
+        "effective_status": ["operation_status"],
+        "configured_status": ["secondary_status"],
+        "created_time": ["create_time"],
+    },
+    enums.ResourceType.AD: {
+        "ad_name": ["ad_name"],
+        "effective_status": ["operation_status"],
+        "configured_status": ["secondary_status"],
+        "created_time": ["create_time"],
+    },
+}
+
+TIKTOK_INSIGHTS_PROJECTION_FIELDS = {
+    "spend": ["spend"],
+    "impressions": ["impressions"],
+    "clicks": ["clicks"],
+    "ctr": ["ctr"],
+    "cpm": ["cpm"],
+    "cpc": ["cpc"],
+    "reach": ["reach"],
+    "actions": [],  # Not reported by TikTok
+    "conversions": ["conversion"],
+    "cost_per_conversion": ["cost_per_conversion"],
+    "conversion_rate": ["conversion_rate"],
+}
+
+TIKTOK_RESOURCE_DETAILS_PROJECTIONS = {
+    enums.ResourceType.CAMPAIGN: field_projection.ProjectionSpec(
+        message_class=messages.CampaignDetails,
+        fields=TIKTOK_RESOURCE_DETAILS_FIELDS[enums.ResourceType.CAMPAIGN],
+        projection_fields=TIKTOK_RESOURCE_DETAILS_PROJECTION_FIELDS[enums.ResourceType.CAMPAIGN],
+        schema_class=tiktok_client_schemas.CampaignsDetails,
+        nested_name="campaigns_details",
+    ),
+    enums.TiktokResourceType.AD_GROUP: field_projection.ProjectionSpec(
+        message_class=messages.AdSetDetails,
+        fields=TIKTOK_RESOURCE_DETAILS_FIELDS[enums.TiktokResourceType.AD_GROUP],
+        projection_fields=TIKTOK_RESOURCE_DETAILS_PROJECTION_FIELDS[enums.TiktokResourceType.AD_GROUP],
+        schema_class=tiktok_client_schemas.AdGroupsDetails,
+        nested_name="adgroups_details",
+    ),
+    enums.ResourceType.AD: field_projection.ProjectionSpec(
+        message_class=messages.AdDetails,
+        fields=TIKTOK_RESOURCE_DETAILS_FIELDS[enums.ResourceType.AD],
+        projection_fields=TIKTOK_RESOURCE_DETAILS_PROJECTION_FIELDS[enums.ResourceType.AD],
+        schema_class=tiktok_client_schemas.AdsDetails,
+        nested_name="ads_details",
+    ),
+}
+
+TIKTOK_INSIGHTS_PROJECTIONS = {
+    resource_type: field_projection.ProjectionSpec(
+        message_class=messages.ResourceInsightsReport,
+        fields=TIKTOK_INSIGHTS_DETAILS_FIELDS[resource_type]["metrics"],
+        projection_fields=TIKTOK_INSIGHTS_PROJECTION_FIELDS,
+        schema_class=schema_class,
+        nested_name="resource_insights",
+    )
+    for resource_type, schema_class in TIKTOK_INSIGHTS_SCHEMAS.items()
+}
+
+# `report/integrated/get` accepts at most 30 days per request with a daily dimension, `get_insights` splits longer
+# ranges and requests up to `TIKTOK_INSIGHTS_MAX_WORKERS` windows concurrently.
+TIKTOK_INSIGHTS_MAX_WINDOW_DAYS = 30
+TIKTOK_INSIGHTS_MAX_WORKERS = 4
+
+# Most ids accepted by one `file/image/ad/info` and `file/video/ad/info` request
+TIKTOK_IMAGE_INFO_MAX_IDS = 100
+TIKTOK_VIDEO_INFO_MAX_IDS = 60
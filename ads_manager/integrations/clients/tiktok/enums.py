@@ -13,6 +13,11 @@ class ReportType(enum.Enum):
     BASIC = "BASIC"
 
 
+class MaterialType(enum.Enum):
+    IMAGE = "image"
+    VIDEO = "video"
+
+
 class DataLevel(enum.Enum):
     AUCTION_CAMPAIGN = "AUCTION_CAMPAIGN"
     AUCTION_ADGROUP = "AUCTION_ADGROUP"
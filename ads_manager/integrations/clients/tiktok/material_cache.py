@@ -0,0 +1,127 @@
+import datetime
+import hashlib
+import os
+import sqlite3
+import threading
+import typing
+
+from ads_manager.integrations.clients.tiktok import enums as tiktok_client_enums
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS material_cache (
+    advertiser_id TEXT NOT NULL,
+    material_type TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    material_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (advertiser_id, material_type, signature)
+)
+"""
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class MaterialCache(object):
+    """
+    SQLite backed map of uploaded TikTok images and videos, from the MD5 signature of the file and the advertiser
+    to the `image_id`/`video_id` TikTok assigned, so the same file is uploaded to an advertiser only once.
+
+    Materials are per advertiser in TikTok, the same file pushed to another advertiser is still uploaded there.
+    A material deleted in TikTok stays cached until `delete` is called for it. One cache can be shared by threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(_SCHEMA)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get_material_id(
+        self, advertiser_id: str, material_type: tiktok_client_enums.MaterialType, signature: str
+    ) -> typing.Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT material_id FROM material_cache WHERE advertiser_id = ? AND material_type = ? AND signature = ?",
+                (advertiser_id, material_type.value, signature.lower()),
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def save_material_id(
+        self,
+        advertiser_id: str,
+        material_type: tiktok_client_enums.MaterialType,
+        signature: str,
+        material_id: str,
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO material_cache "
+                "(advertiser_id, material_type, signature, material_id, created_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    advertiser_id,
+                    material_type.value,
+                    signature.lower(),
+                    material_id,
+                    datetime.datetime.utcnow().isoformat(),
+                ),
+            )
+
+    def delete(self, advertiser_id: str, material_type: tiktok_client_enums.MaterialType, signature: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM material_cache WHERE advertiser_id = ? AND material_type = ? AND signature = ?",
+                (advertiser_id, material_type.value, signature.lower()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "MaterialCache":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def get_material_signature(
+    material_details: typing.Dict, material_type: tiktok_client_enums.MaterialType
+) -> typing.Optional[str]:
+    """
+    MD5 signature of the uploaded file: the `image_signature`/`video_signature` given with the upload, otherwise the
+    hash of `image_file`/`video_file` (bytes, a path or a binary file object). None for uploads by URL or file id,
+    whose content isn't known before uploading.
+    """
+    signature = material_details.get("{}_signature".format(material_type.value))
+    if signature:
+        return signature.lower()
+
+    material_file = material_details.get("{}_file".format(material_type.value))
+    if isinstance(material_file, (bytes, bytearray)):
+        return hashlib.md5(material_file).hexdigest()
+
+    if isinstance(material_file, (str, os.PathLike)) and os.path.isfile(material_file):
+        with open(material_file, "rb") as file:
+            return _get_file_md5(file=file)
+
+    if hasattr(material_file, "read") and hasattr(material_file, "seek"):
+        position = material_file.tell()
+        signature = _get_file_md5(file=material_file)
+        material_file.seek(position)
+        return signature
+
+    return None
+
+
+def _get_file_md5(file: typing.BinaryIO) -> str:
+    md5 = hashlib.md5()
+    for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+        md5.update(chunk)
+
+    return md5.hexdigest()
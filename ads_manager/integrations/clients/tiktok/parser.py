@@ -0,0 +1,577 @@
+import datetime
+import typing
+
+from ads_manager import enums, utils
+from ads_manager.integrations.clients import exceptions as client_exceptions
+from ads_manager.integrations.clients import messages
+from ads_manager.integrations.clients.tiktok import constants as tiktok_client_constants
+from ads_manager.integrations.clients.tiktok import schemas as tiktok_client_schemas
+
+
+class TiktokResponseParser(object):
+    """
+    Validation and message building shared by the sync and async TikTok clients.
+    """
+
+    @staticmethod
+    def _parse_account_ids(
+        app_id: str,
+        response: typing.List[typing.Dict],
+    ) -> typing.List[messages.AdAccount]:
+        validated_data = utils.validate_marshmallow_schema(data=response, schema=tiktok_client_schemas.AdAccounts())
+        if not validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Account data fetched (platform={}, app_id={}, response_data={}) is not valid".format(
+                    enums.Platform.TIKTOK.name, app_id, response
+                )
+            )
+
+        message_to_return = [
+            messages.AdAccount(id_token=None, account_id=data["advertiser_id"], account_name=data["advertiser_name"])
+            for data in validated_data["ad_accounts"]
+        ]
+
+        # return [data["advertiser_id"] for data in validated_data["ad_accounts"]]
+        return message_to_return
+
+    @staticmethod
+    def _parse_campaigns_details(
+        ad_account_id: str,
+        response: typing.List[typing.Dict],
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.CampaignDetails]:
+        validated_data = utils.validate_marshmallow_schema(
+            data=response,
+            schema=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_PROJECTIONS[enums.ResourceType.CAMPAIGN].get_schema(
+                projection=projection
+            ),
+        )
+        if not validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Campaign details data (platform={}, advertiser_id={}, response_data={}) is not valid".format(
+                    enums.Platform.TIKTOK.name, ad_account_id, response
+                )
+            )
+
+        message_to_return = [
+            messages.CampaignDetails(
+                account_id=data["account_id"],
+                campaign_id=data["id"],
+                campaign_name=data.get("name"),
+                effective_status=data.get("effective_status"),
+                configured_status=data.get("configured_status", None),
+                created_time=data.get("created_time"),
+                updated_time=data["updated_time"],
+            )
+            for data in validated_data["campaigns_details"]
+        ]
+
+        return message_to_return
+
+    @staticmethod
+    def _parse_adgroups_details(
+        ad_account_id: str,
+        response: typing.List[typing.Dict],
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.AdSetDetails]:
+        validated_data = utils.validate_marshmallow_schema(
+            data=response,
+            schema=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_PROJECTIONS[
+                enums.TiktokResourceType.AD_GROUP
+            ].get_schema(projection=projection),
+        )
+        if not validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Adgroup details data (platform={}, advertiser_id={}, response_data={}) is not valid".format(
+                    enums.Platform.TIKTOK.name, ad_account_id, response
+                )
+            )
+
+        message_to_return = [
+            messages.AdSetDetails(
+                account_id=data["account_id"],
+                campaign_id=data["campaign_id"],
+                adset_id=data["id"],
+                adset_name=data.get("name"),
+                effective_status=data.get("effective_status"),
+                configured_status=data.get("configured_status", None),
+                created_time=data.get("created_time"),
+                updated_time=data["updated_time"],
+            )
+            for data in validated_data["adgroups_details"]
+        ]
+
+        return message_to_return
+
+    @staticmethod
+    def _parse_ads_details(
+        ad_account_id: str,
+        response: typing.List[typing.Dict],
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.AdDetails]:
+        validated_data = utils.validate_marshmallow_schema(
+            data=response,
+            schema=tiktok_client_constants.TIKTOK_RESOURCE_DETAILS_PROJECTIONS[enums.ResourceType.AD].get_schema(
+                projection=projection
+            ),
+        )
+        if not validated_data:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Ad details data (platform={}, advertiser_id={}, response_data={}) is not valid".format(
+                    enums.Platform.TIKTOK.name, ad_account_id, response
+                )
+            )
+
+        message_to_return = [
+            messages.AdDetails(
+                account_id=data["account_id"],
+                campaign_id=data["campaign_id"],
+                adset_id=data["adgroup_id"],
+                ad_id=data["id"],
+                ad_name=data.get("name"),
+                effective_status=data.get("effective_status"),
+                configured_status=data.get("configured_status", None),
+                created_time=data.get("created_time"),
+                updated_time=data["updated_time"],
+            )
+            for data in validated_data["ads_details"]
+        ]
+
+        return message_to_return
+
+    @staticmethod
+    def _get_updated_since_filtering(
+        updated_since: typing.Optional[datetime.datetime],
+    ) -> typing.Optional[typing.Dict]:
+        if not updated_since:
+            return None
+
+        return {"modified_after": utils.to_utc(updated_since).strftime("%Y-%m-%d %H:%M:%S")}
+
+    @staticmethod
+    def _prepare_ads_create_params(
+        ad_account_id: str,
+        ads_details: typing.Dict,
+    ) -> typing.Dict:
+        if "adset_id" in ads_details:
+            ads_details.update({"adgroup_id": ads_details["adset_id"]})
+            del ads_details["adset_id"]
+
+        ads_details["advertiser_id"] = ad_account_id
+
+        validated_ad_details = utils.validate_marshmallow_schema(
+            data=ads_details, schema=tiktok_client_schemas.AdCreate()
+        )
+        if not validated_ad_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate ad details (platform={}, advertiser_id={}, ad_details={})".format(
+                    enums.Platform.TIKTOK.name, ad_account_id, ads_details
+                )
+            )
+
+        return validated_ad_details
+
+    @staticmethod
+    def _prepare_ads_update_params(
+        ad_account_id: str,
+        adgroup_id: str,
+        ad_details: typing.Dict,
+    ) -> typing.Dict:
+        ad_details.update({"advertiser_id": ad_account_id, "adgroup_id": adgroup_id})
+        validated_ad_details = utils.validate_marshmallow_schema(
+            data=ad_details, schema=tiktok_client_schemas.AdUpdate()
+        )
+        if not validated_ad_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate ad details (platform={}, advertiser_id={}, adgroup_id={}, ad_details={})".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    adgroup_id,
+                    ad_details,
+                )
+            )
+
+        return validated_ad_details
+
+    @staticmethod
+    def _prepare_ads_status_params(
+        ad_account_id: str,
+        ads_status_details: typing.Dict,
+    ) -> typing.Dict:
+        ads_status_details["advertiser_id"] = ad_account_id
+        validated_ads_status_details = utils.validate_marshmallow_schema(
+            data=ads_status_details, schema=tiktok_client_schemas.AdStatusUpdate()
+        )
+        if not validated_ads_status_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate ads status details (platform={}, advertiser_id={}, ads_status_details={})".format(
+                    enums.Platform.TIKTOK.name, ad_account_id, ads_status_details
+                )
+            )
+
+        return validated_ads_status_details
+
+    @staticmethod
+    def _prepare_campaign_create_params(
+        ad_account_id: str,
+        campaign_details: typing.Dict,
+    ) -> typing.Dict:
+        campaign_details["advertiser_id"] = ad_account_id
+        validated_campaign_details = utils.validate_marshmallow_schema(
+            data=campaign_details, schema=tiktok_client_schemas.CampaignCreate()
+        )
+        if not validated_campaign_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate campaign details (platform={}, advertiser_id={}, campaign_details={})".format(
+                    enums.Platform.TIKTOK.name, ad_account_id, campaign_details
+                )
+            )
+
+        return validated_campaign_details
+
+    @staticmethod
+    def _prepare_campaign_update_params(
+        ad_account_id: str,
+        campaign_id: str,
+        campaign_details: typing.Dict,
+    ) -> typing.Dict:
+        campaign_details.update({"advertiser_id": ad_account_id, "campaign_id": campaign_id})
+        validated_campaign_details = utils.validate_marshmallow_schema(
+            data=campaign_details, schema=tiktok_client_schemas.CampaignUpdate()
+        )
+        if not validated_campaign_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate campaign details (platform={}, advertiser_id={}, campaign_id={}, campaign_details={})".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    campaign_id,
+                    campaign_details,
+                )
+            )
+
+        return validated_campaign_details
+
+    @staticmethod
+    def _prepare_adgroup_create_params(
+        ad_account_id: str,
+        adset_details: typing.Dict,
+    ) -> typing.Dict:
+        adset_details["advertiser_id"] = ad_account_id
+        validated_adgroup_details = utils.validate_marshmallow_schema(
+            data=adset_details, schema=tiktok_client_schemas.AdGroupCreate()
+        )
+        if not validated_adgroup_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate adgroup details (platform={}, advertiser_id={}, adgroup_details={})".format(
+                    enums.Platform.TIKTOK.name, ad_account_id, adset_details
+                )
+            )
+
+        return validated_adgroup_details
+
+    @staticmethod
+    def _prepare_adgroup_update_params(
+        ad_account_id: str,
+        adset_id: str,
+        adset_details: typing.Dict,
+    ) -> typing.Dict:
+        adset_details.update({"advertiser_id": ad_account_id, "adgroup_id": adset_id})
+        validated_adgroup_details = utils.validate_marshmallow_schema(
+            data=adset_details, schema=tiktok_client_schemas.AdGroupUpdate()
+        )
+        if not validated_adgroup_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate adgroup details (platform={}, advertiser_id={}, adgroup_id={}, adgroup_details={})".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    adset_id,
+                    adset_details,
+                )
+            )
+
+        return validated_adgroup_details
+
+    @staticmethod
+    def _prepare_image_create_params(
+        ad_account_id: str,
+        image_details: typing.Dict,
+    ) -> typing.Dict:
+        image_details["advertiser_id"] = ad_account_id
+        validated_image_details = utils.validate_marshmallow_schema(
+            data=image_details, schema=tiktok_client_schemas.ImageCreate()
+        )
+        if not validated_image_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate image details (platform={}, advertiser_id={}, image_details={})".format(
+                    enums.Platform.TIKTOK.name, ad_account_id, image_details
+                )
+            )
+
+        return validated_image_details
+
+    @staticmethod
+    def _prepare_image_update_params(
+        ad_account_id: str,
+        image_id: str,
+        image_name: str,
+    ) -> typing.Dict:
+        image_details = {
+            "advertiser_id": ad_account_id,
+            "image_id": image_id,
+            "file_name": image_name,
+        }
+
+        validated_image_details = utils.validate_marshmallow_schema(
+            data=image_details, schema=tiktok_client_schemas.ImageUpdate()
+        )
+        if not validated_image_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate image details (platform={}, advertiser_id={}, image_id={}, image_name={})".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    image_id,
+                    image_name,
+                )
+            )
+
+        return validated_image_details
+
+    @staticmethod
+    def _prepare_images_info_params(
+        ad_account_id: str,
+        image_ids: typing.List[str],
+    ) -> typing.Dict:
+        image_params = {
+            "advertiser_id": ad_account_id,
+            "image_ids": image_ids,
+        }
+
+        validated_image_params = utils.validate_marshmallow_schema(
+            data=image_params, schema=tiktok_client_schemas.ImageInfoParams()
+        )
+
+        if not validated_image_params:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate image details (platform={}, advertiser_id={}, image_ids={})".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    image_ids,
+                )
+            )
+
+        return validated_image_params
+
+    @staticmethod
+    def _parse_images_info(
+        ad_account_id: str,
+        image_ids: typing.List[str],
+        images_info_details: typing.List[typing.Dict],
+    ) -> typing.List[messages.ImageDetails]:
+        validated_image_details = utils.validate_marshmallow_schema(
+            data=images_info_details,
+            schema=tiktok_client_schemas.ImageDetailsResponse(),
+        )
+        if not validated_image_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate image details (platform={}, advertiser_id={}, image_ids={})".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    image_ids,
+                )
+            )
+
+        message_to_return = [
+            messages.ImageDetails(
+                image_id=data["image_id"],
+                material_id=data["material_id"],
+                size=data["size"],
+                width=data["width"],
+                height=data["height"],
+                format=data["format"],
+                image_url=data["image_url"],
+                signature=data["signature"],
+                file_name=data["file_name"],
+                create_time=data["create_time"],
+                modify_time=data["modify_time"],
+                displayable=data["displayable"],
+            )
+            for data in validated_image_details["image_details"]
+        ]
+
+        return message_to_return
+
+    @staticmethod
+    def _prepare_video_create_params(
+        ad_account_id: str,
+        video_details: typing.Dict,
+    ) -> typing.Dict:
+        video_details["advertiser_id"] = ad_account_id
+        validated_video_params = utils.validate_marshmallow_schema(
+            data=video_details, schema=tiktok_client_schemas.VideoCreate()
+        )
+        if not validated_video_params:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate video details (platform={}, advertiser_id={}, video_details={})".format(
+                    enums.Platform.TIKTOK.name, ad_account_id, video_details
+                )
+            )
+
+        return validated_video_params
+
+    @staticmethod
+    def _prepare_video_update_params(
+        ad_account_id: str,
+        video_id: str,
+        video_name: str,
+    ) -> typing.Dict:
+        video_details = {
+            "advertiser_id": ad_account_id,
+            "video_id": video_id,
+            "file_name": video_name,
+        }
+
+        validated_video_params = utils.validate_marshmallow_schema(
+            data=video_details, schema=tiktok_client_schemas.VideoUpdate()
+        )
+        if not validated_video_params:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate video details (platform={}, advertiser_id={}, video_id={}, video_name={})".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    video_id,
+                    video_name,
+                )
+            )
+
+        return validated_video_params
+
+    @staticmethod
+    def _prepare_videos_info_params(
+        ad_account_id: str,
+        video_ids: typing.List[str],
+    ) -> typing.Dict:
+        video_params = {
+            "advertiser_id": ad_account_id,
+            "video_ids": video_ids,
+        }
+
+        validated_video_params = utils.validate_marshmallow_schema(
+            data=video_params, schema=tiktok_client_schemas.VideoInfoParams()
+        )
+        if not validated_video_params:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate video info params (platform={}, advertiser_id={}, video_ids={})".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    video_ids,
+                )
+            )
+
+        return validated_video_params
+
+    @staticmethod
+    def _parse_videos_info(
+        ad_account_id: str,
+        video_ids: typing.List[str],
+        video_details: typing.List[typing.Dict],
+    ) -> typing.List[messages.VideoDetails]:
+        validated_video_details = utils.validate_marshmallow_schema(
+            data=video_details, schema=tiktok_client_schemas.VideoDetailsResponse()
+        )
+        if not validated_video_details:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Failed to validate video details (platform={}, advertiser_id={}, video_ids={})".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    video_ids,
+                )
+            )
+
+        message_to_return = [
+            messages.VideoDetails(
+                video_id=data["video_id"],
+                material_id=data["material_id"],
+                duration=data["duration"],
+                bit_rate=data["bit_rate"],
+                size=data["size"],
+                width=data["width"],
+                height=data["height"],
+                format=data["format"],
+                video_cover_url=data["video_cover_url"],
+                preview_url=data["preview_url"],
+                preview_url_expire_time=data["preview_url_expire_time"],
+                signature=data["signature"],
+                file_name=data["file_name"],
+                create_time=data["create_time"],
+                modify_time=data["modify_time"],
+                displayable=data["displayable"],
+                allow_download=data["allow_download"],
+                allowed_placements=data["allowed_placements"],
+            )
+            for data in validated_video_details["video_details"]
+        ]
+
+        return message_to_return
+
+    @staticmethod
+    def _parse_insights_report(
+        ad_account_id: str,
+        resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        insights_report: typing.List[typing.Dict],
+        projection: typing.Optional[typing.List[str]] = None,
+    ) -> typing.List[messages.ResourceInsightsReport]:
+        validated_insights_report = utils.validate_marshmallow_schema(
+            data=insights_report,
+            schema=tiktok_client_constants.TIKTOK_INSIGHTS_PROJECTIONS[resource_type].get_schema(
+                projection=projection, advertiser_id=ad_account_id
+            ),
+        )
+        if not validated_insights_report:
+            raise client_exceptions.ResponseDataNotValidError(
+                "Resource insights data fetched from provider (platform={}, advertiser_id={}, resource_type={}, from_datetime={}, to_datetime={}, insights_report={}) is not valid".format(
+                    enums.Platform.TIKTOK.name,
+                    ad_account_id,
+                    resource_type.name,
+                    from_datetime,
+                    to_datetime,
+                    insights_report,
+                )
+            )
+
+        message_to_return = [
+            messages.ResourceInsightsReport(
+                account_id=data["advertiser_id"],
+                account_name=None,
+                resource_type=resource_type.name,
+                campaign_id=data["campaign_id"],
+                campaign_name=data["campaign_name"],
+                adset_id=data.get("adgroup_id", None),
+                adset_name=data.get("adgroup_name", None),
+                ad_id=data.get("ad_id", None),
+                ad_name=data.get("ad_name", None),
+                spend="{}".format(data["spend"]) if "spend" in data else None,
+                impressions=data.get("impressions"),
+                clicks=data.get("clicks"),
+                ctr="{}".format(data["ctr"]) if "ctr" in data else None,
+                cpm="{}".format(data["cpm"]) if "cpm" in data else None,
+                cpc="{}".format(data["cpc"]) if "cpc" in data else None,
+                reach=data.get("reach"),
+                actions=None,
+                conversions=[{"action_type": "conversion", "value": data["conversions"]}]
+                if "conversions" in data
+                else None,
+                cost_per_conversion=[{"action_type": "conversion", "value": data["cost_per_conversion"]}]
+                if "cost_per_conversion" in data
+                else None,
+                conversion_rate=[{"action_type": "conversion", "value": data["conversion_rate"]}]
+                if "conversion_rate" in data
+                else None,
+                date_start=data["start_date"],
+                date_stop=data["end_date"],
+            )
+            for data in validated_insights_report["resource_insights"]
+        ]
+
+        return message_to_return
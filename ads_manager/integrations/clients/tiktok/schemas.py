@@ -481,8 +481,8 @@ class AdInsights(ResourceInsights, AdInsightsMetrics, AdInsightDimensions):
 
 
 class InsightsReport(Schema):
-    def __init__(self, advertiser_id):
-        super(InsightsReport, self).__init__()
+    def __init__(self, advertiser_id, **kwargs):
+        super(InsightsReport, self).__init__(**kwargs)
         self.advertiser_id = advertiser_id
 
     resource_insights = fields.Nested(ResourceInsights, many=True)
@@ -0,0 +1,84 @@
+import typing
+
+import requests
+
+from ads_manager.integrations.gateways import connection_pool
+from ads_manager.integrations.gateways import exceptions as gateway_exceptions
+
+
+class AsyncConnectionPool(object):
+    """
+    Keep-alive HTTP connections for the asyncio gateway clients, backed by `httpx.AsyncClient`.
+
+    The pool is bound to the event loop it is first used on, so unlike the sync pool there is no process wide
+    shared instance. Transport errors are raised as their `requests` counterparts, which keeps the error handling
+    of the async gateways identical to the sync ones.
+    """
+
+    def __init__(self, config: typing.Optional[connection_pool.ConnectionPoolConfig] = None) -> None:
+        self._config = config if config else connection_pool.ConnectionPoolConfig()
+        self._stats = connection_pool._HttpxStats()
+        self._client = self._create_client()
+
+    @property
+    def config(self) -> connection_pool.ConnectionPoolConfig:
+        return self._config
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: typing.Optional[typing.Dict] = None,
+        headers: typing.Optional[typing.Dict] = None,
+        data: typing.Optional[typing.Any] = None,
+        files: typing.Optional[typing.Dict] = None,
+    ) -> typing.Any:
+        import httpx
+
+        headers = dict(headers) if headers else {}
+        if not self._config.http2:
+            headers.setdefault("Connection", "keep-alive" if self._config.keep_alive else "close")
+
+        try:
+            response = await self._client.request(
+                method=method.upper(),
+                url=url,
+                params=connection_pool._get_httpx_params(params=params),
+                headers=headers,
+                data=data,
+                files=files,
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e)
+        except httpx.HTTPError as e:
+            raise requests.RequestException(e)
+
+        self._stats.record_request(client=self._client, response=response)
+
+        return response
+
+    def get_stats(self) -> typing.List[connection_pool.HostPoolStats]:
+        return self._stats.get_stats(client=self._client)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncConnectionPool":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    def _create_client(self) -> typing.Any:
+        try:
+            import httpx
+        except ImportError:
+            raise gateway_exceptions.ConnectionPoolError(
+                'Async transport requires the optional "httpx" dependency to be installed'
+            )
+
+        return httpx.AsyncClient(
+            http2=self._config.http2,
+            timeout=self._config.timeout,
+            limits=connection_pool._get_httpx_limits(config=self._config),
+        )
@@ -0,0 +1,266 @@
+import collections
+import dataclasses
+import threading
+import typing
+
+import requests
+from requests import adapters
+
+from ads_manager.integrations.gateways import exceptions as gateway_exceptions
+
+
+@dataclasses.dataclass
+class ConnectionPoolConfig(object):
+    pool_connections: int = 10  # Number of distinct hosts kept in the pool manager
+    pool_maxsize: int = 10  # Connections kept per host
+    pool_block: bool = False  # Wait for a free connection instead of opening an extra one
+    keep_alive: bool = True
+    keep_alive_expiry: float = 60.0  # Seconds an idle HTTP/2 connection is kept open
+    http2: bool = False  # Requires the optional "httpx[http2]" dependency
+    timeout: typing.Optional[float] = None
+
+
+@dataclasses.dataclass
+class HostPoolStats(object):
+    host: str
+    requests: int
+    connections_opened: int
+    connections_reused: int
+    connections_idle: int
+
+
+class _HTTPAdapter(adapters.HTTPAdapter):
+    def get_host_pools(self) -> typing.List[typing.Any]:
+        host_pools = []
+        for key in self.poolmanager.pools.keys():
+            try:
+                host_pools.append(self.poolmanager.pools[key])
+            except KeyError:
+                # Pool was evicted between listing the keys and reading it.
+                continue
+
+        return host_pools
+
+
+class _HttpxStats(object):
+    """
+    Per-host request and connection counters for httpx clients, read from the httpcore connection pool.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests = collections.Counter()
+        self._connections = collections.defaultdict(set)
+
+    def record_request(self, client: typing.Any, response: typing.Any) -> None:
+        host = "{}://{}:{}".format(
+            response.url.scheme,
+            response.url.host,
+            response.url.port or (443 if response.url.scheme == "https" else 80),
+        )
+
+        with self._lock:
+            self._requests[host] += 1
+            for connection in self._get_connections(client=client):
+                if str(getattr(connection, "_origin", "")) == host:
+                    self._connections[host].add(id(connection))
+
+    def get_stats(self, client: typing.Any) -> typing.List[HostPoolStats]:
+        idle_connections = collections.Counter(
+            str(getattr(connection, "_origin", ""))
+            for connection in self._get_connections(client=client)
+            if connection.is_idle()
+        )
+
+        with self._lock:
+            return [
+                HostPoolStats(
+                    host=host,
+                    requests=requests_count,
+                    connections_opened=len(self._connections[host]),
+                    connections_reused=max(requests_count - len(self._connections[host]), 0),
+                    connections_idle=idle_connections[host],
+                )
+                for host, requests_count in self._requests.items()
+            ]
+
+    @staticmethod
+    def _get_connections(client: typing.Any) -> typing.List[typing.Any]:
+        transport_pool = getattr(client._transport, "_pool", None)
+        return list(transport_pool.connections) if transport_pool is not None else []
+
+
+def _get_httpx_limits(config: ConnectionPoolConfig) -> typing.Any:
+    import httpx
+
+    return httpx.Limits(
+        max_connections=config.pool_connections * config.pool_maxsize,
+        max_keepalive_connections=config.pool_maxsize if config.keep_alive else 0,
+        keepalive_expiry=config.keep_alive_expiry,
+    )
+
+
+def _get_httpx_params(params: typing.Optional[typing.Dict]) -> typing.Optional[typing.Dict]:
+    # requests silently drops None query params, httpx would send them as empty strings.
+    return {key: value for key, value in params.items() if value is not None} if params else None
+
+
+class ConnectionPool(object):
+    """
+    Keep-alive HTTP sessions shared by the gateway clients.
+
+    Responses are always read in full before the connection is handed back, so a connection is only
+    reused once the previous exchange on it is complete (requests never pipelines).
+    """
+
+    def __init__(self, config: typing.Optional[ConnectionPoolConfig] = None) -> None:
+        self._config = config if config else ConnectionPoolConfig()
+        self._session = None
+        self._adapter = None
+        self._http2_client = None
+        self._http2_stats = _HttpxStats()
+
+        if self._config.http2:
+            self._http2_client = self._create_http2_client()
+        else:
+            self._session = self._create_session()
+
+    @property
+    def config(self) -> ConnectionPoolConfig:
+        return self._config
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: typing.Optional[typing.Dict] = None,
+        headers: typing.Optional[typing.Dict] = None,
+        data: typing.Optional[typing.Any] = None,
+        files: typing.Optional[typing.Dict] = None,
+    ) -> requests.Response:
+        headers = dict(headers) if headers else {}
+        headers.setdefault("Connection", "keep-alive" if self._config.keep_alive else "close")
+
+        if self._http2_client is not None:
+            return self._http2_request(method=method, url=url, params=params, headers=headers, data=data, files=files)
+
+        return self._session.request(
+            method=method,
+            url=url,
+            params=params,
+            headers=headers,
+            data=data,
+            files=files,
+            timeout=self._config.timeout,
+        )
+
+    def get_stats(self) -> typing.List[HostPoolStats]:
+        if self._http2_client is not None:
+            return self._http2_stats.get_stats(client=self._http2_client)
+
+        stats = []
+        for host_pool in self._adapter.get_host_pools():
+            idle_connections = host_pool.pool.queue if host_pool.pool is not None else []
+            stats.append(
+                HostPoolStats(
+                    host="{}://{}:{}".format(host_pool.scheme, host_pool.host, host_pool.port),
+                    requests=host_pool.num_requests,
+                    connections_opened=host_pool.num_connections,
+                    connections_reused=max(host_pool.num_requests - host_pool.num_connections, 0),
+                    connections_idle=len([connection for connection in idle_connections if connection is not None]),
+                )
+            )
+
+        return stats
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+        if self._http2_client is not None:
+            self._http2_client.close()
+
+    def _create_session(self) -> requests.Session:
+        self._adapter = _HTTPAdapter(
+            pool_connections=self._config.pool_connections,
+            pool_maxsize=self._config.pool_maxsize,
+            pool_block=self._config.pool_block,
+        )
+
+        session = requests.Session()
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+
+        return session
+
+    def _create_http2_client(self) -> typing.Any:
+        try:
+            import httpx
+        except ImportError:
+            raise gateway_exceptions.ConnectionPoolError(
+                'HTTP/2 transport requires the optional "httpx[http2]" dependency to be installed'
+            )
+
+        return httpx.Client(http2=True, timeout=self._config.timeout, limits=_get_httpx_limits(config=self._config))
+
+    def _http2_request(
+        self,
+        method: str,
+        url: str,
+        params: typing.Optional[typing.Dict],
+        headers: typing.Dict,
+        data: typing.Optional[typing.Any],
+        files: typing.Optional[typing.Dict],
+    ) -> typing.Any:
+        import httpx
+
+        # Connection management headers are not allowed on HTTP/2 requests.
+        headers.pop("Connection", None)
+
+        try:
+            response = self._http2_client.request(
+                method=method.upper(),
+                url=url,
+                params=_get_httpx_params(params=params),
+                headers=headers,
+                data=data,
+                files=files,
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e)
+        except httpx.HTTPError as e:
+            raise requests.RequestException(e)
+
+        self._http2_stats.record_request(client=self._http2_client, response=response)
+
+        return response
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_pool() -> ConnectionPool:
+    global _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ConnectionPool()
+
+        return _shared_pool
+
+
+def configure_shared_pool(config: ConnectionPoolConfig) -> ConnectionPool:
+    """
+    Replace the shared pool and close the previous one. Gateway clients created without an explicit pool look the
+    shared pool up on every request, so they move to the new pool; call this before exports start, requests
+    already in flight on the previous pool are not waited for.
+    """
+    global _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.close()
+
+        _shared_pool = ConnectionPool(config=config)
+
+        return _shared_pool
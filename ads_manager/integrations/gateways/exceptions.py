@@ -0,0 +1,6 @@
+class GatewayError(Exception):
+    pass
+
+
+class ConnectionPoolError(GatewayError):
+    pass
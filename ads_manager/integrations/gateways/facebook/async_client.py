@@ -0,0 +1,385 @@
+import asyncio
+import datetime
+import functools
+import typing
+
+import requests
+
+from ads_manager import enums, utils
+from ads_manager.integrations.gateways import async_connection_pool
+from ads_manager.integrations.gateways import page_size as gateway_page_size
+from ads_manager.integrations.gateways import rate_limiter as gateway_rate_limiter
+from ads_manager.integrations.gateways import response as gateway_response
+from ads_manager.integrations.gateways import retry as gateway_retry
+from ads_manager.integrations.gateways.facebook import client as facebook_api_client
+from ads_manager.integrations.gateways.facebook import (
+    exceptions as facebook_api_exceptions,
+)
+
+
+class AsyncFacebookApiClient(object):
+    """
+    asyncio counterpart of `FacebookApiClient` with the same method surface, awaitable.
+    """
+
+    BASE_URL = facebook_api_client.FacebookApiClient.BASE_URL
+    VALID_STATUS_CODES = facebook_api_client.FacebookApiClient.VALID_STATUS_CODES
+    LIMIT = facebook_api_client.FacebookApiClient.LIMIT
+
+    def __init__(
+        self,
+        user_access_token: str,
+        pool: typing.Optional[async_connection_pool.AsyncConnectionPool] = None,
+        rate_limiter: typing.Optional[gateway_rate_limiter.RateLimiter] = None,
+        retry_policy: typing.Optional[gateway_retry.RetryPolicy] = None,
+        page_size_controller: typing.Optional[gateway_page_size.PageSizeController] = None,
+    ) -> None:
+        self._user_access_token = user_access_token
+        self._owns_connection_pool = pool is None
+        self._connection_pool = pool if pool else async_connection_pool.AsyncConnectionPool()
+        self._rate_limiter = rate_limiter if rate_limiter else gateway_rate_limiter.get_shared_rate_limiter()
+        self._retry_policy = retry_policy if retry_policy else gateway_retry.get_shared_retry_policy()
+        self._page_size_controller = (
+            page_size_controller if page_size_controller else gateway_page_size.get_shared_page_size_controller()
+        )
+        self._token_rate_limit_key = gateway_rate_limiter.get_token_key(
+            platform=enums.Platform.FACEBOOK.value, user_access_token=user_access_token
+        )
+
+    async def aclose(self) -> None:
+        if self._owns_connection_pool:
+            await self._connection_pool.aclose()
+
+    async def get_accounts(self) -> typing.List[typing.Dict]:
+        return await self._get_paginated_content(endpoint="me/adaccounts")
+
+    async def get_resource_details(
+        self,
+        resource_id: str,
+        fields: str,
+    ) -> typing.Dict:
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                method=enums.HttpMethod.GET,
+                endpoint=resource_id,
+                params={
+                    "fields": fields,
+                },
+            )
+        )
+
+    async def create_insights_report(
+        self,
+        ad_account: str,
+        level: str,
+        fields: str,
+        time_increment: int,
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+    ) -> typing.Dict:
+        params = {
+            "level": level,
+            "fields": fields,
+            "time_increment": time_increment,
+            "time_range": facebook_api_client.FacebookApiClient._get_time_range(
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+            ),
+        }
+
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                endpoint=f"{ad_account}/insights",
+                method=enums.HttpMethod.POST,
+                params=params,
+            )
+        )
+
+    async def get_insights_report_status(self, report_id: str) -> typing.Dict:
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                endpoint=report_id,
+                method=enums.HttpMethod.GET,
+            )
+        )
+
+    async def get_insights_report_results(self, report_id: str) -> typing.List[typing.Dict]:
+        return await self._get_paginated_content(endpoint=f"{report_id}/insights")
+
+    def iter_insights_report_results(self, report_id: str) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(endpoint=f"{report_id}/insights")
+
+    async def get_account_campaigns(
+        self,
+        ad_account: str,
+        fields: str,
+    ) -> typing.List[typing.Dict]:
+        return await self._get_paginated_content(endpoint=f"{ad_account}/campaigns", params={"fields": fields})
+
+    def iter_account_campaigns(
+        self,
+        ad_account: str,
+        fields: str,
+    ) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(endpoint=f"{ad_account}/campaigns", params={"fields": fields})
+
+    async def get_account_adsets(
+        self,
+        ad_account: str,
+        fields: str,
+    ) -> typing.List[typing.Dict]:
+        return await self._get_paginated_content(endpoint=f"{ad_account}/adsets", params={"fields": fields})
+
+    def iter_account_adsets(
+        self,
+        ad_account: str,
+        fields: str,
+    ) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(endpoint=f"{ad_account}/adsets", params={"fields": fields})
+
+    async def get_account_ads(
+        self,
+        ad_account: str,
+        fields: str,
+    ) -> typing.List[typing.Dict]:
+        return await self._get_paginated_content(endpoint=f"{ad_account}/ads", params={"fields": fields})
+
+    def iter_account_ads(
+        self,
+        ad_account: str,
+        fields: str,
+    ) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(endpoint=f"{ad_account}/ads", params={"fields": fields})
+
+    async def get_account_adcreatives(
+        self,
+        ad_account: str,
+        fields: str,
+    ) -> typing.List[typing.Dict]:
+        return await self._get_paginated_content(endpoint=f"{ad_account}/adcreatives", params={"fields": fields})
+
+    def iter_account_adcreatives(
+        self,
+        ad_account: str,
+        fields: str,
+    ) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(endpoint=f"{ad_account}/adcreatives", params={"fields": fields})
+
+    async def create_campaign(
+        self,
+        ad_account: str,
+        params: typing.Dict,
+    ) -> typing.Dict:
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                endpoint=f"{ad_account}/campaigns",
+                method=enums.HttpMethod.POST,
+                params=params,
+            )
+        )
+
+    async def update_campaign(
+        self,
+        campaign_id: str,
+        params: typing.Dict,
+    ) -> typing.Dict:
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                endpoint=campaign_id,
+                method=enums.HttpMethod.POST,
+                params=params,
+            )
+        )
+
+    async def create_adset(
+        self,
+        ad_account_id: str,
+        params: typing.Dict,
+    ) -> typing.Dict:
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                endpoint=f"{ad_account_id}/adsets",
+                method=enums.HttpMethod.POST,
+                params=params,
+            )
+        )
+
+    async def update_adset(
+        self,
+        adset_id: str,
+        params: typing.Dict,
+    ) -> typing.Dict:
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                endpoint=adset_id,
+                method=enums.HttpMethod.POST,
+                params=params,
+            )
+        )
+
+    async def create_adcreative(
+        self,
+        ad_account_id: str,
+        params: typing.Dict,
+    ) -> typing.Dict:
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                endpoint=f"{ad_account_id}/adcreatives",
+                method=enums.HttpMethod.POST,
+                params=params,
+            )
+        )
+
+    async def update_adcreative(
+        self,
+        adcreative_id: str,
+        params: typing.Dict,
+    ) -> typing.Dict:
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                endpoint=adcreative_id,
+                method=enums.HttpMethod.POST,
+                params=params,
+            )
+        )
+
+    async def create_ad(
+        self,
+        ad_account_id: str,
+        params: typing.Dict,
+    ) -> typing.Dict:
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                endpoint=f"{ad_account_id}/ads",
+                method=enums.HttpMethod.POST,
+                params=params,
+            )
+        )
+
+    async def update_ad(
+        self,
+        ad_id: str,
+        params: typing.Dict,
+    ) -> typing.Dict:
+        return facebook_api_client.FacebookApiClient._get_content(
+            response=await self._request(
+                endpoint=ad_id,
+                method=enums.HttpMethod.POST,
+                params=params,
+            )
+        )
+
+    async def _get_paginated_content(
+        self,
+        endpoint: str,
+        params: typing.Optional[typing.Dict] = None,
+    ) -> typing.List[typing.Dict]:
+        return [data async for page in self._iter_paginated_content(endpoint=endpoint, params=params) for data in page]
+
+    async def _iter_paginated_content(
+        self,
+        endpoint: str,
+        params: typing.Optional[typing.Dict] = None,
+    ) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        params = dict(params) if params else {}
+        page_size = gateway_page_size.ListingPageSize(
+            controller=self._page_size_controller, platform=enums.Platform.FACEBOOK.value, endpoint=endpoint
+        )
+
+        while True:
+            params["limit"] = page_size.start_page()
+            try:
+                response = await self._request(method=enums.HttpMethod.GET, endpoint=endpoint, params=params)
+            except facebook_api_exceptions.BadResponseCodeError as e:
+                if facebook_api_client.FacebookApiClient._is_page_too_large(error=e) and page_size.shrink():
+                    continue
+
+                raise
+
+            data = facebook_api_client.FacebookApiClient._get_content(response=response)
+            page_size.record_page(rows=len(data.get("data") or []), content_size=len(response.content))
+            if data.get("data"):
+                yield data["data"]
+
+            after = data.get("paging", {}).get("cursors", {}).get("after")
+            if not after or not data.get("data"):
+                break
+
+            params["after"] = after
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: enums.HttpMethod,
+        params: typing.Optional[typing.Dict] = None,
+        payload: typing.Optional[typing.Dict] = None,
+    ) -> gateway_response.ResponseEnvelope:
+        return await self._retry_policy.call_async(
+            func=lambda: self._send_request(endpoint=endpoint, method=method, params=params, payload=payload),
+            is_retryable=functools.partial(
+                facebook_api_client.FacebookApiClient._is_retryable, idempotent=method == enums.HttpMethod.GET
+            ),
+            description="{} {}".format(method.value.upper(), endpoint),
+        )
+
+    async def _send_request(
+        self,
+        endpoint: str,
+        method: enums.HttpMethod,
+        params: typing.Optional[typing.Dict] = None,
+        payload: typing.Optional[typing.Dict] = None,
+    ) -> gateway_response.ResponseEnvelope:
+        full_endpoint = f"{self.BASE_URL}/{endpoint}"
+        account_rate_limit_key = facebook_api_client.FacebookApiClient._get_account_rate_limit_key(endpoint=endpoint)
+        delay = self._rate_limiter.reserve(keys=[self._token_rate_limit_key, account_rate_limit_key])
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        try:
+            response = gateway_response.ResponseEnvelope(
+                response=await self._connection_pool.request(
+                    url=full_endpoint,
+                    method=method.value,
+                    params=self._construct_request_params(params=params),
+                    data=payload,
+                )
+            )
+            facebook_api_client.FacebookApiClient._update_rate_limits(
+                rate_limiter=self._rate_limiter,
+                response=response,
+                token_key=self._token_rate_limit_key,
+                account_key=account_rate_limit_key,
+            )
+            if response.status_code not in self.VALID_STATUS_CODES:
+                error = facebook_api_client.FacebookApiClient._get_error(response=response)
+                raise facebook_api_exceptions.BadResponseCodeError(
+                    message="Invalid API client response (status_code={}, data={})".format(
+                        response.status_code,
+                        response.content.decode(encoding="utf-8"),
+                    ),
+                    code=response.status_code,
+                    error_code=error.get("code"),
+                    is_transient=bool(error.get("is_transient")),
+                    error_message=error.get("message"),
+                )
+        except requests.exceptions.ConnectTimeout as e:
+            raise facebook_api_exceptions.RequestError(
+                "Connection timeout. Error: {}".format(utils.get_exception_message(exception=e))
+            )
+        except requests.RequestException as e:
+            raise facebook_api_exceptions.RequestError(
+                "Request exception. Error: {}".format(utils.get_exception_message(exception=e))
+            )
+
+        return response
+
+    def _construct_request_params(self, params: typing.Optional[typing.Dict]) -> typing.Dict:
+        mandatory_params = {
+            "access_token": self._user_access_token,
+            "limit": self.LIMIT,
+        }
+
+        if params:
+            mandatory_params.update(params)
+
+        return mandatory_params
@@ -0,0 +1,64 @@
+import dataclasses
+import typing
+import urllib.parse
+
+from ads_manager import enums, json_codec
+
+
+@dataclasses.dataclass
+class BatchRequest(object):
+    """
+    One sub-request of a Graph API batch, `relative_url` is relative to the versioned API root (e.g. "act_1/ads").
+    """
+
+    method: enums.HttpMethod
+    relative_url: str
+    params: typing.Optional[typing.Dict] = None
+
+
+@dataclasses.dataclass
+class BatchResponse(object):
+    code: typing.Optional[int]  # None when Facebook timed out the sub-request without running it
+    body: typing.Optional[typing.Dict] = None
+    error: typing.Optional[typing.Dict] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.code == 200 and not self.error
+
+
+def encode_batch(batch_requests: typing.List[BatchRequest]) -> str:
+    encoded_requests = []
+    for batch_request in batch_requests:
+        encoded_request = {"method": batch_request.method.value.upper(), "relative_url": batch_request.relative_url}
+        if batch_request.params:
+            if batch_request.method == enums.HttpMethod.GET:
+                encoded_request["relative_url"] += "?" + urllib.parse.urlencode(batch_request.params)
+            else:
+                encoded_request["body"] = urllib.parse.urlencode(batch_request.params)
+        encoded_requests.append(encoded_request)
+
+    return json_codec.dumps(encoded_requests)
+
+
+def decode_batch(content: typing.List[typing.Optional[typing.Dict]]) -> typing.List[BatchResponse]:
+    batch_responses = []
+    for sub_response in content:
+        if sub_response is None:
+            batch_responses.append(
+                BatchResponse(code=None, error={"message": "Sub-request timed out before it was processed"})
+            )
+            continue
+
+        try:
+            body = json_codec.loads(sub_response.get("body") or "null")
+        except ValueError:
+            body = {"message": sub_response.get("body")}
+
+        error = body.get("error") if isinstance(body, dict) else None
+        if sub_response.get("code") != 200 and not error:
+            error = body if isinstance(body, dict) else {"message": body}
+
+        batch_responses.append(BatchResponse(code=sub_response.get("code"), body=body, error=error))
+
+    return batch_responses
@@ -1,10 +1,17 @@
 import datetime
-import json
+import functools
 import typing
 
 import requests
 
-from ads_manager import enums, utils
+from ads_manager import enums, json_codec, utils
+from ads_manager.integrations.gateways import connection_pool
+from ads_manager.integrations.gateways import page_size as gateway_page_size
+from ads_manager.integrations.gateways import pagination
+from ads_manager.integrations.gateways import rate_limiter as gateway_rate_limiter
+from ads_manager.integrations.gateways import response as gateway_response
+from ads_manager.integrations.gateways import retry as gateway_retry
+from ads_manager.integrations.gateways.facebook import batch as facebook_api_batch
 from ads_manager.integrations.gateways.facebook import (
     constants as facebook_api_constants,
 )
@@ -17,9 +24,30 @@ class FacebookApiClient:
     BASE_URL = "https://graph.facebook.com/v18.0"
     VALID_STATUS_CODES = [200]
     LIMIT = 100
+    BATCH_LIMIT = 50  # Sub-requests per batch call, and ids per `?ids=` lookup
+    PREFETCH_DEPTH = 2  # Pages of a listing fetched ahead of the caller, 0 fetches a page only when it's needed
+    THROTTLE_STATUS_CODE = 429
 
-    def __init__(self, user_access_token: str) -> None:
+    def __init__(
+        self,
+        user_access_token: str,
+        pool: typing.Optional[connection_pool.ConnectionPool] = None,
+        rate_limiter: typing.Optional[gateway_rate_limiter.RateLimiter] = None,
+        retry_policy: typing.Optional[gateway_retry.RetryPolicy] = None,
+        page_size_controller: typing.Optional[gateway_page_size.PageSizeController] = None,
+        prefetch_depth: typing.Optional[int] = None,
+    ) -> None:
         self._user_access_token = user_access_token
+        self._pool = pool  # None uses the shared pool, looked up per request
+        self._rate_limiter = rate_limiter if rate_limiter else gateway_rate_limiter.get_shared_rate_limiter()
+        self._retry_policy = retry_policy if retry_policy else gateway_retry.get_shared_retry_policy()
+        self._page_size_controller = (
+            page_size_controller if page_size_controller else gateway_page_size.get_shared_page_size_controller()
+        )
+        self._prefetch_depth = prefetch_depth if prefetch_depth is not None else self.PREFETCH_DEPTH
+        self._token_rate_limit_key = gateway_rate_limiter.get_token_key(
+            platform=enums.Platform.FACEBOOK.value, user_access_token=user_access_token
+        )
 
     def get_accounts(self) -> typing.List[typing.Dict]:
         return self._get_paginated_content(endpoint="me/adaccounts")
@@ -39,6 +67,63 @@ class FacebookApiClient:
             )
         )
 
+    def get_resources_details(
+        self,
+        resource_ids: typing.List[str],
+        fields: str,
+    ) -> typing.Dict[str, typing.Dict]:
+        """
+        Details of several objects by id with `?ids=` lookups of `BATCH_LIMIT` ids each, keyed by id.
+        """
+        resources_details = {}
+        for index in range(0, len(resource_ids), self.BATCH_LIMIT):
+            resources_details.update(
+                self._get_content(
+                    response=self._request(
+                        method=enums.HttpMethod.GET,
+                        endpoint="",
+                        params={
+                            "ids": ",".join(resource_ids[index : index + self.BATCH_LIMIT]),
+                            "fields": fields,
+                        },
+                    )
+                )
+            )
+
+        return resources_details
+
+    def send_batch(
+        self, batch_requests: typing.List[facebook_api_batch.BatchRequest]
+    ) -> typing.List[facebook_api_batch.BatchResponse]:
+        """
+        Sends the sub-requests as Graph API batches of `BATCH_LIMIT`, responses are returned in request order.
+        A failed sub-request only fails its own response, the others still run.
+
+        Batches are POSTs, so the retry policy only repeats a batch the provider throttled as a whole (rejected
+        before any sub-request ran). Server side and transport errors are not retried, the sub-requests may
+        already have been applied and repeating creates would duplicate objects.
+        """
+        batch_responses = []
+        for index in range(0, len(batch_requests), self.BATCH_LIMIT):
+            batch_responses.extend(
+                facebook_api_batch.decode_batch(
+                    content=self._get_content(
+                        response=self._request(
+                            method=enums.HttpMethod.POST,
+                            endpoint="",
+                            payload={
+                                "batch": facebook_api_batch.encode_batch(
+                                    batch_requests=batch_requests[index : index + self.BATCH_LIMIT]
+                                ),
+                                "include_headers": "false",
+                            },
+                        )
+                    )
+                )
+            )
+
+        return batch_responses
+
     def create_insights_report(
         self,
         ad_account: str,
@@ -77,6 +162,11 @@ class FacebookApiClient:
     def get_insights_report_results(self, report_id: str) -> typing.List[typing.Dict]:
         return self._get_paginated_content(endpoint=f"{report_id}/insights")
 
+    def iter_insights_report_results(
+        self, report_id: str, cursor: typing.Optional[pagination.PageCursor] = None
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(endpoint=f"{report_id}/insights", cursor=cursor)
+
     def get_account_campaigns(
         self,
         ad_account: str,
@@ -84,6 +174,19 @@ class FacebookApiClient:
     ) -> typing.List[typing.Dict]:
         return self._get_paginated_content(endpoint=f"{ad_account}/campaigns", params={"fields": fields})
 
+    def iter_account_campaigns(
+        self,
+        ad_account: str,
+        fields: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        filtering: typing.Optional[typing.List[typing.Dict]] = None,
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint=f"{ad_account}/campaigns",
+            params=self._get_listing_params(fields=fields, filtering=filtering),
+            cursor=cursor,
+        )
+
     def get_account_adsets(
         self,
         ad_account: str,
@@ -91,6 +194,19 @@ class FacebookApiClient:
     ) -> typing.List[typing.Dict]:
         return self._get_paginated_content(endpoint=f"{ad_account}/adsets", params={"fields": fields})
 
+    def iter_account_adsets(
+        self,
+        ad_account: str,
+        fields: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        filtering: typing.Optional[typing.List[typing.Dict]] = None,
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint=f"{ad_account}/adsets",
+            params=self._get_listing_params(fields=fields, filtering=filtering),
+            cursor=cursor,
+        )
+
     def get_account_ads(
         self,
         ad_account: str,
@@ -98,6 +214,19 @@ class FacebookApiClient:
     ) -> typing.List[typing.Dict]:
         return self._get_paginated_content(endpoint=f"{ad_account}/ads", params={"fields": fields})
 
+    def iter_account_ads(
+        self,
+        ad_account: str,
+        fields: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        filtering: typing.Optional[typing.List[typing.Dict]] = None,
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint=f"{ad_account}/ads",
+            params=self._get_listing_params(fields=fields, filtering=filtering),
+            cursor=cursor,
+        )
+
     def get_account_adcreatives(
         self,
         ad_account: str,
@@ -105,6 +234,16 @@ class FacebookApiClient:
     ) -> typing.List[typing.Dict]:
         return self._get_paginated_content(endpoint=f"{ad_account}/adcreatives", params={"fields": fields})
 
+    def iter_account_adcreatives(
+        self,
+        ad_account: str,
+        fields: str,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint=f"{ad_account}/adcreatives", params={"fields": fields}, cursor=cursor
+        )
+
     def create_campaign(
         self,
         ad_account: str,
@@ -209,61 +348,172 @@ class FacebookApiClient:
             )
         )
 
+    def create_ads(
+        self,
+        ad_account_id: str,
+        ads_params: typing.List[typing.Dict],
+    ) -> typing.List[facebook_api_batch.BatchResponse]:
+        return self.send_batch(
+            batch_requests=[
+                facebook_api_batch.BatchRequest(
+                    method=enums.HttpMethod.POST, relative_url=f"{ad_account_id}/ads", params=params
+                )
+                for params in ads_params
+            ]
+        )
+
+    def update_resources(
+        self,
+        resources_params: typing.Dict[str, typing.Dict],
+    ) -> typing.Dict[str, facebook_api_batch.BatchResponse]:
+        """
+        Batched updates of campaigns, adsets, ads or adcreatives, by object id.
+        """
+        resource_ids = list(resources_params)
+        batch_responses = self.send_batch(
+            batch_requests=[
+                facebook_api_batch.BatchRequest(
+                    method=enums.HttpMethod.POST, relative_url=resource_id, params=resources_params[resource_id]
+                )
+                for resource_id in resource_ids
+            ]
+        )
+
+        return dict(zip(resource_ids, batch_responses))
+
     def _get_paginated_content(
         self,
         endpoint: str,
         params: typing.Optional[typing.Dict] = None,
     ) -> typing.List[typing.Dict]:
-        params = params if params else {}
-        all_data = []
+        return [data for page in self._iter_paginated_content(endpoint=endpoint, params=params) for data in page]
+
+    def _iter_paginated_content(
+        self,
+        endpoint: str,
+        params: typing.Optional[typing.Dict] = None,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        params = dict(params) if params else {}
+        cursor = cursor if cursor else pagination.PageCursor()
+        if cursor.done:
+            return
+
+        if cursor.after:
+            params["after"] = cursor.after
+
+        for data in pagination.prefetch(
+            items=self._iter_pages(endpoint=endpoint, params=params), depth=self._prefetch_depth
+        ):
+            after = data.get("paging", {}).get("cursors", {}).get("after")
+            cursor.after = after
+            cursor.done = not after or not data.get("data")
+
+            if data.get("data"):
+                yield data["data"]
+
+            if cursor.done:
+                break
 
+    def _iter_pages(self, endpoint: str, params: typing.Dict) -> typing.Iterator[typing.Dict]:
+        """
+        Response bodies of the listing from `params["after"]` on. The next page is requested as soon as the cursor
+        of the previous one is known, independently of the caller moving its `PageCursor`.
+        """
+        params = dict(params)
+        page_size = gateway_page_size.ListingPageSize(
+            controller=self._page_size_controller, platform=enums.Platform.FACEBOOK.value, endpoint=endpoint
+        )
         while True:
-            data = self._get_content(
-                response=self._request(method=enums.HttpMethod.GET, endpoint=endpoint, params=params)
-            )
-            all_data.extend(data.get("data", []))
+            params["limit"] = page_size.start_page()
+            try:
+                response = self._request(method=enums.HttpMethod.GET, endpoint=endpoint, params=params)
+            except facebook_api_exceptions.BadResponseCodeError as e:
+                # The cursor isn't moved, the same page is requested again with fewer rows
+                if self._is_page_too_large(error=e) and page_size.shrink():
+                    continue
+
+                raise
+
+            data = self._get_content(response=response)
+            page_size.record_page(rows=len(data.get("data") or []), content_size=len(response.content))
+            yield data
+
             after = data.get("paging", {}).get("cursors", {}).get("after")
             if not after or not data.get("data"):
                 break
 
             params["after"] = after
 
-        return all_data
-
     def _request(
         self,
         endpoint: str,
         method: enums.HttpMethod,
         params: typing.Optional[typing.Dict] = None,
         payload: typing.Optional[typing.Dict] = None,
-    ) -> requests.Response:
+    ) -> gateway_response.ResponseEnvelope:
+        return self._retry_policy.call(
+            func=lambda: self._send_request(endpoint=endpoint, method=method, params=params, payload=payload),
+            is_retryable=functools.partial(FacebookApiClient._is_retryable, idempotent=method == enums.HttpMethod.GET),
+            description="{} {}".format(method.value.upper(), endpoint),
+        )
+
+    def _send_request(
+        self,
+        endpoint: str,
+        method: enums.HttpMethod,
+        params: typing.Optional[typing.Dict] = None,
+        payload: typing.Optional[typing.Dict] = None,
+    ) -> gateway_response.ResponseEnvelope:
         full_endpoint = f"{self.BASE_URL}/{endpoint}"
+        account_rate_limit_key = self._get_account_rate_limit_key(endpoint=endpoint)
+        self._rate_limiter.acquire(keys=[self._token_rate_limit_key, account_rate_limit_key])
         try:
-            response = requests.request(
-                url=full_endpoint,
-                method=method.value,
-                params=self._construct_request_params(params=params),
-                data=payload,
+            response = gateway_response.ResponseEnvelope(
+                response=self._get_connection_pool().request(
+                    url=full_endpoint,
+                    method=method.value,
+                    params=self._construct_request_params(params=params),
+                    data=payload,
+                )
+            )
+            self._update_rate_limits(
+                rate_limiter=self._rate_limiter,
+                response=response,
+                token_key=self._token_rate_limit_key,
+                account_key=account_rate_limit_key,
             )
             if response.status_code not in self.VALID_STATUS_CODES:
+                error = FacebookApiClient._get_error(response=response)
                 raise facebook_api_exceptions.BadResponseCodeError(
                     message="Invalid API client response (status_code={}, data={})".format(
                         response.status_code,
                         response.content.decode(encoding="utf-8"),
                     ),
                     code=response.status_code,
+                    error_code=error.get("code"),
+                    is_transient=bool(error.get("is_transient")),
+                    error_message=error.get("message"),
                 )
         except requests.exceptions.ConnectTimeout as e:
-            raise facebook_api_exceptions.FacebookAPIClientError(
+            raise facebook_api_exceptions.RequestError(
                 "Connection timeout. Error: {}".format(utils.get_exception_message(exception=e))
             )
         except requests.RequestException as e:
-            raise facebook_api_exceptions.FacebookAPIClientError(
+            raise facebook_api_exceptions.RequestError(
                 "Request exception. Error: {}".format(utils.get_exception_message(exception=e))
             )
 
         return response
 
+    @staticmethod
+    def _get_listing_params(fields: str, filtering: typing.Optional[typing.List[typing.Dict]]) -> typing.Dict:
+        params = {"fields": fields}
+        if filtering:
+            params["filtering"] = json_codec.dumps(filtering)
+
+        return params
+
     def _construct_request_params(self, params: typing.Optional[typing.Dict]) -> typing.Dict:
         mandatory_params = {
             "access_token": self._user_access_token,
@@ -276,12 +526,145 @@ class FacebookApiClient:
         return mandatory_params
 
     @staticmethod
-    def _get_content(response: requests.Response) -> typing.Dict:
-        return json.loads(response.content)
+    def _get_account_rate_limit_key(endpoint: str) -> typing.Optional[str]:
+        ad_account = endpoint.split("/")[0]
+        if not ad_account.startswith("act_"):
+            return None
+
+        return gateway_rate_limiter.get_account_key(platform=enums.Platform.FACEBOOK.value, account_id=ad_account)
+
+    @staticmethod
+    def _update_rate_limits(
+        rate_limiter: gateway_rate_limiter.RateLimiter,
+        response: typing.Any,
+        token_key: str,
+        account_key: typing.Optional[str],
+    ) -> None:
+        """
+        Feeds the usage headers (app, business use case and ad account level) and throttling error codes of a
+        Graph API response into the rate limiter.
+        """
+        token_usage, token_regain_seconds = FacebookApiClient._get_token_usage(headers=response.headers)
+        if token_usage is not None:
+            rate_limiter.update_usage(key=token_key, usage=token_usage, regain_seconds=token_regain_seconds)
+
+        ad_account_usage = FacebookApiClient._get_header_json(
+            headers=response.headers, name=facebook_api_constants.FACEBOOK_AD_ACCOUNT_USAGE_HEADER
+        )
+        if account_key and ad_account_usage:
+            usage = float(ad_account_usage.get("acc_id_util_pct") or 0)
+            rate_limiter.update_usage(
+                key=account_key,
+                usage=usage,
+                regain_seconds=float(ad_account_usage.get("reset_time_duration") or 0) if usage >= 100 else None,
+            )
+
+        if response.status_code in FacebookApiClient.VALID_STATUS_CODES:
+            return
+
+        error_code = FacebookApiClient._get_error(response=response).get("code")
+        if (
+            response.status_code == FacebookApiClient.THROTTLE_STATUS_CODE
+            or error_code in facebook_api_constants.FACEBOOK_THROTTLE_ERROR_CODES
+        ):
+            for key in filter(None, [token_key, account_key]):
+                rate_limiter.throttle(key=key, seconds=token_regain_seconds)
+
+    def _get_connection_pool(self) -> connection_pool.ConnectionPool:
+        # The shared pool is looked up on every request, so clients created before `configure_shared_pool`
+        # switch to the new pool instead of holding on to the closed one.
+        return self._pool if self._pool else connection_pool.get_shared_pool()
+
+    @staticmethod
+    def _is_retryable(error: Exception, idempotent: bool) -> bool:
+        """
+        Throttled requests were rejected before being processed, so they are safe to repeat even for POST calls.
+        Server side and transport errors are only retried for reads, a repeated create could duplicate the object.
+        """
+        if isinstance(error, facebook_api_exceptions.RequestError):
+            return idempotent
+
+        if not isinstance(error, facebook_api_exceptions.BadResponseCodeError):
+            return False
+
+        if FacebookApiClient._is_page_too_large(error=error):
+            # Repeating the same request gets the same answer, paginated listings repeat it with a smaller page
+            return False
+
+        if (
+            error.code == FacebookApiClient.THROTTLE_STATUS_CODE
+            or error.error_code in facebook_api_constants.FACEBOOK_THROTTLE_ERROR_CODES
+        ):
+            return True
+
+        return idempotent and (
+            error.code >= 500
+            or error.is_transient
+            or error.error_code in facebook_api_constants.FACEBOOK_RETRYABLE_ERROR_CODES
+        )
+
+    @staticmethod
+    def _is_page_too_large(error: facebook_api_exceptions.BadResponseCodeError) -> bool:
+        return bool(
+            error.error_message
+            and facebook_api_constants.FACEBOOK_REDUCE_DATA_ERROR_MESSAGE in error.error_message.lower()
+        )
+
+    @staticmethod
+    def _get_error(response: typing.Any) -> typing.Dict:
+        try:
+            error = FacebookApiClient._get_content(response=response).get("error")
+        except (ValueError, AttributeError):
+            return {}
+
+        return error if isinstance(error, dict) else {}
+
+    @staticmethod
+    def _get_token_usage(headers: typing.Mapping) -> typing.Tuple[typing.Optional[float], typing.Optional[float]]:
+        usages = []
+        regain_seconds = None
+
+        app_usage = FacebookApiClient._get_header_json(
+            headers=headers, name=facebook_api_constants.FACEBOOK_APP_USAGE_HEADER
+        )
+        if app_usage:
+            usages.append(FacebookApiClient._get_max_usage(usage=app_usage))
+
+        business_use_case_usage = FacebookApiClient._get_header_json(
+            headers=headers, name=facebook_api_constants.FACEBOOK_BUSINESS_USE_CASE_USAGE_HEADER
+        )
+        for business_usages in (business_use_case_usage or {}).values():
+            for usage in business_usages:
+                usages.append(FacebookApiClient._get_max_usage(usage=usage))
+                # Regain time is reported in minutes.
+                regain_minutes = float(usage.get("estimated_time_to_regain_access") or 0)
+                if regain_minutes:
+                    regain_seconds = max(regain_seconds or 0, regain_minutes * 60)
+
+        return (max(usages) if usages else None), regain_seconds
+
+    @staticmethod
+    def _get_max_usage(usage: typing.Dict) -> float:
+        return max(float(usage.get(name) or 0) for name in ["call_count", "total_cputime", "total_time"])
+
+    @staticmethod
+    def _get_header_json(headers: typing.Mapping, name: str) -> typing.Optional[typing.Dict]:
+        value = headers.get(name)
+        if not value:
+            return None
+
+        try:
+            return json_codec.loads(value)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _get_content(response: gateway_response.ResponseEnvelope) -> typing.Dict:
+        return response.data
 
     @staticmethod
     def _get_time_range(from_datetime: datetime.datetime, to_datetime: datetime.datetime) -> str:
-        return json.dumps(
+        return json_codec.dumps(
             {
                 "since": datetime.datetime.strftime(from_datetime, facebook_api_constants.FACEBOOK_DATE_FORMAT),
                 "until": datetime.datetime.strftime(to_datetime, facebook_api_constants.FACEBOOK_DATE_FORMAT),
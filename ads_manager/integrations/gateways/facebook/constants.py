@@ -1 +1,11 @@
 FACEBOOK_DATE_FORMAT = "%Y-%m-%d"  # "YYYY-MM-DD"
+
+# https://developers.facebook.com/docs/graph-api/overview/rate-limiting
+FACEBOOK_APP_USAGE_HEADER = "X-App-Usage"
+FACEBOOK_BUSINESS_USE_CASE_USAGE_HEADER = "X-Business-Use-Case-Usage"
+FACEBOOK_AD_ACCOUNT_USAGE_HEADER = "X-Ad-Account-Usage"
+FACEBOOK_THROTTLE_ERROR_CODES = [4, 17, 32, 613] + list(range(80000, 80015))
+# Unknown error / temporary service issue, retried besides the throttling codes and HTTP 5xx
+FACEBOOK_RETRYABLE_ERROR_CODES = [1, 2]
+# Returned (error code 1) for pages whose response would be too large, the page has to be requested smaller
+FACEBOOK_REDUCE_DATA_ERROR_MESSAGE = "reduce the amount of data"
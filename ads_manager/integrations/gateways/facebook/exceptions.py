@@ -1,9 +1,26 @@
+import typing
+
+
 class FacebookAPIClientError(Exception):
     pass
 
 
+class RequestError(FacebookAPIClientError):
+    pass
+
+
 class BadResponseCodeError(FacebookAPIClientError):
-    def __init__(self, message: str, code: int) -> None:
+    def __init__(
+        self,
+        message: str,
+        code: int,
+        error_code: typing.Optional[int] = None,
+        is_transient: bool = False,
+        error_message: typing.Optional[str] = None,
+    ) -> None:
         FacebookAPIClientError.__init__(self)
         self.message = message
         self.code = code
+        self.error_code = error_code
+        self.is_transient = is_transient
+        self.error_message = error_message
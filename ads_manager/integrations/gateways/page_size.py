@@ -0,0 +1,221 @@
+import dataclasses
+import datetime
+import logging
+import re
+import sqlite3
+import threading
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_sizes (
+    endpoint_key TEXT NOT NULL PRIMARY KEY,
+    page_size INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+)
+"""
+
+
+@dataclasses.dataclass
+class PageSizeConfig(object):
+    initial_size: int = 100  # Page size of an endpoint without a recorded size
+    min_size: int = 10
+    max_size: int = 1000
+    growth_factor: float = 2.0  # Applied after a full page that stayed well within the targets
+    shrink_factor: float = 0.5  # Applied after a page over the targets, or one rejected as too large
+    target_latency: float = 5.0  # Seconds per page
+    target_bytes: int = 4 * 1024 * 1024  # Response body size per page
+
+
+class PageSizeStore(object):
+    """
+    SQLite backed page size per endpoint, so later runs start from the size earlier runs settled on.
+    One store can be shared by threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(_SCHEMA)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get_page_size(self, endpoint_key: str) -> typing.Optional[int]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT page_size FROM page_sizes WHERE endpoint_key = ?", (endpoint_key,)
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def save_page_size(self, endpoint_key: str, page_size: int) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO page_sizes (endpoint_key, page_size, updated_at) VALUES (?, ?, ?)",
+                (endpoint_key, page_size, datetime.datetime.utcnow().isoformat()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "PageSizeStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class PageSizeController(object):
+    """
+    Picks the page size of paginated listings per endpoint (e.g. "facebook:act_{id}/ads").
+
+    After every page the size is doubled when the page came back full, fast and small enough to stay within the
+    latency and size targets after doubling, and halved when it went over a target. A page the provider rejected
+    as too large is halved right away and the same page is requested again, down to `min_size`, the rejected size
+    isn't grown back to for the rest of the process. The size is kept per endpoint for the process, and in the
+    `store` when one is given.
+    """
+
+    def __init__(
+        self, config: typing.Optional[PageSizeConfig] = None, store: typing.Optional[PageSizeStore] = None
+    ) -> None:
+        self._config = config if config else PageSizeConfig()
+        self._store = store
+        self._page_sizes = {}
+        self._rejected_page_sizes = {}  # Smallest size rejected as too large, per endpoint
+        self._lock = threading.Lock()
+
+    def get_page_size(self, endpoint_key: str) -> int:
+        with self._lock:
+            if endpoint_key not in self._page_sizes:
+                page_size = self._store.get_page_size(endpoint_key=endpoint_key) if self._store else None
+                self._page_sizes[endpoint_key] = self._clamp(page_size=page_size or self._config.initial_size)
+
+            return self._page_sizes[endpoint_key]
+
+    def record_page(self, endpoint_key: str, page_size: int, rows: int, seconds: float, content_size: int) -> int:
+        """
+        Returns the size of the next page.
+        """
+        if seconds > self._config.target_latency or content_size > self._config.target_bytes:
+            return self._set_page_size(endpoint_key=endpoint_key, page_size=page_size * self._config.shrink_factor)
+
+        with self._lock:
+            rejected_page_size = self._rejected_page_sizes.get(endpoint_key)
+
+        if (
+            rows >= page_size
+            and (rejected_page_size is None or page_size * self._config.growth_factor < rejected_page_size)
+            and seconds * self._config.growth_factor <= self._config.target_latency
+            and content_size * self._config.growth_factor <= self._config.target_bytes
+        ):
+            return self._set_page_size(endpoint_key=endpoint_key, page_size=page_size * self._config.growth_factor)
+
+        return page_size
+
+    def shrink(self, endpoint_key: str, page_size: int) -> typing.Optional[int]:
+        """
+        Size to request a rejected page with again, None when `page_size` is already the smallest allowed.
+        """
+        if page_size <= self._config.min_size:
+            return None
+
+        with self._lock:
+            self._rejected_page_sizes[endpoint_key] = min(
+                page_size, self._rejected_page_sizes.get(endpoint_key, page_size)
+            )
+
+        return self._set_page_size(endpoint_key=endpoint_key, page_size=page_size * self._config.shrink_factor)
+
+    def _set_page_size(self, endpoint_key: str, page_size: float) -> int:
+        page_size = self._clamp(page_size=int(page_size))
+        with self._lock:
+            changed = self._page_sizes.get(endpoint_key) != page_size
+            self._page_sizes[endpoint_key] = page_size
+
+        if changed:
+            logger.info("Page size changed (endpoint={}, page_size={})".format(endpoint_key, page_size))
+            if self._store:
+                self._store.save_page_size(endpoint_key=endpoint_key, page_size=page_size)
+
+        return page_size
+
+    def _clamp(self, page_size: int) -> int:
+        return max(self._config.min_size, min(self._config.max_size, page_size))
+
+
+class ListingPageSize(object):
+    """
+    Page size of one paginated listing, used by the sync and async gateways alike: `start_page` gives the size to
+    request, then the response is reported with `record_page`, or `shrink` is called when the provider rejected
+    the page as too large.
+    """
+
+    def __init__(self, controller: PageSizeController, platform: str, endpoint: str) -> None:
+        self._controller = controller
+        self._endpoint_key = get_endpoint_key(platform=platform, endpoint=endpoint)
+        self._page_size = controller.get_page_size(endpoint_key=self._endpoint_key)
+        self._started_at = 0.0
+
+    def start_page(self) -> int:
+        self._started_at = time.monotonic()
+
+        return self._page_size
+
+    def record_page(self, rows: int, content_size: int) -> None:
+        self._page_size = self._controller.record_page(
+            endpoint_key=self._endpoint_key,
+            page_size=self._page_size,
+            rows=rows,
+            seconds=time.monotonic() - self._started_at,
+            content_size=content_size,
+        )
+
+    def shrink(self) -> bool:
+        """
+        Lowers the size the page is requested again with, False when it's already the smallest allowed.
+        """
+        page_size = self._controller.shrink(endpoint_key=self._endpoint_key, page_size=self._page_size)
+        if page_size is None:
+            return False
+
+        self._page_size = page_size
+
+        return True
+
+
+def get_endpoint_key(platform: str, endpoint: str) -> str:
+    # Object ids are replaced, so all ad accounts (or report runs) of an edge share one size.
+    return "{}:{}".format(platform, re.sub(r"\d+", "{id}", endpoint))
+
+
+_shared_page_size_controller = None
+_shared_page_size_controller_lock = threading.Lock()
+
+
+def get_shared_page_size_controller() -> PageSizeController:
+    global _shared_page_size_controller
+
+    with _shared_page_size_controller_lock:
+        if _shared_page_size_controller is None:
+            _shared_page_size_controller = PageSizeController()
+
+        return _shared_page_size_controller
+
+
+def configure_shared_page_size_controller(
+    config: PageSizeConfig, store: typing.Optional[PageSizeStore] = None
+) -> PageSizeController:
+    global _shared_page_size_controller
+
+    with _shared_page_size_controller_lock:
+        _shared_page_size_controller = PageSizeController(config=config, store=store)
+
+        return _shared_page_size_controller
@@ -0,0 +1,74 @@
+import dataclasses
+import queue
+import threading
+import typing
+
+_DONE = object()
+_PUT_TIMEOUT = 0.1  # Seconds between checks whether the consumer stopped
+
+
+@dataclasses.dataclass
+class PageCursor(object):
+    """
+    Position of a paginated listing, shared between the gateway iterator and its caller.
+
+    A cursor passed to an `iter_*` gateway method makes it start from the stored position, and before every page
+    is yielded the cursor is moved to the page that follows it. A caller that persists the cursor after handling a
+    page can therefore resume the listing later from the first page it has not handled yet.
+    """
+
+    after: typing.Optional[str] = None  # Facebook `paging.cursors.after`
+    page: typing.Optional[int] = None  # TikTok `page_info.page`
+    report_id: typing.Optional[str] = None  # Facebook insights `report_run_id` whose results are being paged
+    window: typing.Optional[int] = None  # Index of the insights date window being paged, for split date ranges
+    done: bool = False
+
+
+def prefetch(items: typing.Iterator[typing.Any], depth: int) -> typing.Iterator[typing.Any]:
+    """
+    Yields the items of `items`, which is consumed on a background thread up to `depth` items ahead of the caller,
+    so fetching the next page overlaps with the handling of the current one. At most `depth` items wait in the
+    queue (and one more in the producer). Errors are raised to the caller at the position they happened in, and
+    the producer stops when the caller stops iterating. A `depth` of 0 consumes `items` in the caller's thread.
+    """
+    if depth <= 0:
+        yield from items
+        return
+
+    prefetched = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def _put(item: typing.Any, error: typing.Optional[BaseException]) -> bool:
+        while not stopped.is_set():
+            try:
+                prefetched.put((item, error), timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in items:
+                if not _put(item=item, error=None):
+                    return
+        except BaseException as e:
+            _put(item=_DONE, error=e)
+            return
+
+        _put(item=_DONE, error=None)
+
+    producer = threading.Thread(target=_produce, name="page-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = prefetched.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+
+            yield item
+    finally:
+        stopped.set()
@@ -0,0 +1,215 @@
+import dataclasses
+import hashlib
+import logging
+import threading
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class RateLimiterConfig(object):
+    requests_per_second: float = 10.0  # Pace of a single token / ad account while the provider reports low usage
+    burst: int = 10  # Requests that can be sent back to back before pacing kicks in
+    slowdown_threshold: float = 75.0  # Reported usage (%) from which the pace is lowered
+    min_requests_per_second: float = 0.5  # Pace right below 100% usage
+    throttle_pause: float = 60.0  # Seconds to stop sending when throttled without a regain time from the provider
+
+
+@dataclasses.dataclass
+class RateLimitStats(object):
+    key: str
+    requests: int
+    waited_seconds: float
+    requests_per_second: float
+    usage: float  # Last usage (%) reported by the provider
+    paused_until: float  # `time.monotonic()` timestamp, 0 when not paused
+
+
+class TokenBucket(object):
+    """
+    Classic token bucket: `rate` tokens per second up to `capacity`. `reserve` always takes a token and returns
+    how long the caller has to wait for it, so concurrent callers queue up instead of racing for the refill.
+
+    A rate lowered below its `target_rate` (e.g. while throttled) doubles with every token taken once the pause is
+    over, until it is back at the target.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self._rate = rate
+        self._target_rate = rate
+        self._capacity = max(capacity, 1)
+        self._tokens = float(self._capacity)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def paused_until(self) -> float:
+        return self._paused_until
+
+    def set_rate(self, rate: float, target_rate: typing.Optional[float] = None) -> None:
+        with self._lock:
+            self._refill(now=time.monotonic())
+            self._rate = rate
+            self._target_rate = max(target_rate, rate) if target_rate else rate
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            # The provider window restarts after the pause, do not let a full burst go out right away.
+            self._tokens = min(self._tokens, 1.0)
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now=now)
+            self._tokens -= 1.0
+
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            if self._rate < self._target_rate and now >= self._paused_until:
+                self._rate = min(self._rate * 2, self._target_rate)
+
+            return max(delay, self._paused_until - now, 0.0)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+
+class RateLimiter(object):
+    """
+    Paces gateway requests per access token and per ad account.
+
+    Every request reserves a token from the bucket of its access token and from the bucket of its ad account (when
+    known) and waits for the later of the two. The gateways report the usage signals of each response back through
+    `update_usage` and `throttle`: a usage above `slowdown_threshold` lowers the pace of the bucket, a throttled
+    response pauses it until the provider lets calls through again and then ramps its pace back up from
+    `min_requests_per_second` to `requests_per_second`. One limiter is shared by all threads (and
+    gateway clients) of the process, so concurrent exports of the same token are paced together.
+    """
+
+    def __init__(self, config: typing.Optional[RateLimiterConfig] = None) -> None:
+        self._config = config if config else RateLimiterConfig()
+        self._buckets = {}
+        self._usage = {}
+        self._requests = {}
+        self._waited = {}
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> RateLimiterConfig:
+        return self._config
+
+    def reserve(self, keys: typing.Iterable[typing.Optional[str]]) -> float:
+        """
+        Takes a token for every key and returns the seconds to wait before sending the request. `None` keys
+        (e.g. a request that is not bound to an ad account) are skipped.
+        """
+        delay = 0.0
+        for key in filter(None, keys):
+            key_delay = self._get_bucket(key=key).reserve()
+            with self._lock:
+                self._requests[key] = self._requests.get(key, 0) + 1
+                self._waited[key] = self._waited.get(key, 0.0) + key_delay
+            delay = max(delay, key_delay)
+
+        return delay
+
+    def acquire(self, keys: typing.Iterable[typing.Optional[str]]) -> float:
+        delay = self.reserve(keys=keys)
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
+
+    def update_usage(self, key: str, usage: float, regain_seconds: typing.Optional[float] = None) -> None:
+        """
+        Applies a usage percentage reported by the provider. At 100% (or with a regain time) the key is paused,
+        above `slowdown_threshold` its pace drops linearly down to `min_requests_per_second`.
+        """
+        bucket = self._get_bucket(key=key)
+        with self._lock:
+            self._usage[key] = usage
+
+        if regain_seconds or usage >= 100:
+            self.throttle(key=key, seconds=regain_seconds)
+            return
+
+        bucket.set_rate(rate=self._get_rate(usage=usage))
+
+    def throttle(self, key: str, seconds: typing.Optional[float] = None) -> None:
+        seconds = seconds if seconds else self._config.throttle_pause
+        logger.warning("Rate limit reached, pausing requests (key={}, seconds={})".format(key, seconds))
+
+        bucket = self._get_bucket(key=key)
+        bucket.set_rate(rate=self._config.min_requests_per_second, target_rate=self._config.requests_per_second)
+        bucket.pause(seconds=seconds)
+
+    def get_stats(self) -> typing.List[RateLimitStats]:
+        with self._lock:
+            buckets = dict(self._buckets)
+
+            return [
+                RateLimitStats(
+                    key=key,
+                    requests=self._requests.get(key, 0),
+                    waited_seconds=self._waited.get(key, 0.0),
+                    requests_per_second=bucket.rate,
+                    usage=self._usage.get(key, 0.0),
+                    paused_until=bucket.paused_until,
+                )
+                for key, bucket in buckets.items()
+            ]
+
+    def _get_bucket(self, key: str) -> TokenBucket:
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = TokenBucket(rate=self._config.requests_per_second, capacity=self._config.burst)
+
+            return self._buckets[key]
+
+    def _get_rate(self, usage: float) -> float:
+        if usage < self._config.slowdown_threshold:
+            return self._config.requests_per_second
+
+        remaining = (100.0 - usage) / (100.0 - self._config.slowdown_threshold)
+        return max(self._config.requests_per_second * remaining, self._config.min_requests_per_second)
+
+
+def get_token_key(platform: str, user_access_token: str) -> str:
+    # Access tokens are secrets, only a digest of them ends up in the keys (and in the logs).
+    return "{}:token:{}".format(platform, hashlib.sha256(user_access_token.encode("utf-8")).hexdigest()[:16])
+
+
+def get_account_key(platform: str, account_id: str) -> str:
+    return "{}:account:{}".format(platform, account_id)
+
+
+_shared_rate_limiter = None
+_shared_rate_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> RateLimiter:
+    global _shared_rate_limiter
+
+    with _shared_rate_limiter_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = RateLimiter()
+
+        return _shared_rate_limiter
+
+
+def configure_shared_rate_limiter(config: RateLimiterConfig) -> RateLimiter:
+    global _shared_rate_limiter
+
+    with _shared_rate_limiter_lock:
+        _shared_rate_limiter = RateLimiter(config=config)
+
+        return _shared_rate_limiter
@@ -0,0 +1,45 @@
+import typing
+
+from ads_manager import json_codec
+
+
+class ResponseEnvelope(object):
+    """
+    Provider response whose JSON body is decoded at most once.
+
+    Validation, rate limit bookkeeping and the caller all read the body of the same response, the envelope decodes
+    it on the first access to `data` and hands every later reader the cached result. Wraps both `requests` and
+    `httpx` responses.
+    """
+
+    _NOT_DECODED = object()
+
+    def __init__(self, response: typing.Any) -> None:
+        self._response = response
+        self._data = self._NOT_DECODED
+
+    @property
+    def response(self) -> typing.Any:
+        return self._response
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> typing.Mapping:
+        return self._response.headers
+
+    @property
+    def content(self) -> bytes:
+        return self._response.content
+
+    @property
+    def data(self) -> typing.Any:
+        """
+        Raises `ValueError` for a body that isn't JSON, on every access.
+        """
+        if self._data is self._NOT_DECODED:
+            self._data = json_codec.loads(data=self._response.content)
+
+        return self._data
@@ -0,0 +1,162 @@
+import asyncio
+import dataclasses
+import logging
+import random
+import threading
+import time
+import typing
+
+from ads_manager import utils
+
+logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+
+
+@dataclasses.dataclass
+class RetryConfig(object):
+    max_attempts: int = 5  # Attempts of a single request, including the first one
+    base_delay: float = 1.0  # Seconds, doubled on every retry of the same request
+    max_delay: float = 60.0  # Cap of a single backoff delay
+    run_budget: typing.Optional[int] = 100  # Retries shared by all requests of a run, None for no limit
+
+
+@dataclasses.dataclass
+class RetryStats(object):
+    retries: int  # Since the policy was created
+    exhausted_calls: int  # Requests that failed after using all their attempts (or the run budget)
+    run_budget_left: typing.Optional[int]  # Of the current run
+
+
+class RetryPolicy(object):
+    """
+    Retries a single gateway request on transient errors with exponential backoff and full jitter.
+
+    Each request gets up to `max_attempts` attempts, and all requests sent through the same policy share the
+    `run_budget` retries, so a provider outage fails the run quickly instead of every request sleeping through its
+    own backoff. Retrying happens per request, a paginated listing therefore repeats only the page that failed.
+    Whether an error is retryable is decided by the gateway, which knows the provider error codes.
+
+    A run lasts until `start_run` is called again, the client factory starts one for every client it creates (i.e.
+    every exporter or importer call), so a long-lived process does not use up the budget for good.
+    """
+
+    def __init__(self, config: typing.Optional[RetryConfig] = None) -> None:
+        self._config = config if config else RetryConfig()
+        self._retries = 0
+        self._run_retries = 0
+        self._exhausted_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> RetryConfig:
+        return self._config
+
+    def call(
+        self,
+        func: typing.Callable[[], T],
+        is_retryable: typing.Callable[[Exception], bool],
+        description: str,
+    ) -> T:
+        attempt = 1
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                delay = self._get_retry_delay(error=e, attempt=attempt, is_retryable=is_retryable)
+                if delay is None:
+                    raise
+
+                self._log_retry(error=e, attempt=attempt, delay=delay, description=description)
+                time.sleep(delay)
+                attempt += 1
+
+    async def call_async(
+        self,
+        func: typing.Callable[[], typing.Awaitable[T]],
+        is_retryable: typing.Callable[[Exception], bool],
+        description: str,
+    ) -> T:
+        attempt = 1
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                delay = self._get_retry_delay(error=e, attempt=attempt, is_retryable=is_retryable)
+                if delay is None:
+                    raise
+
+                self._log_retry(error=e, attempt=attempt, delay=delay, description=description)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def start_run(self) -> None:
+        """
+        Restores the full `run_budget`. Runs sharing the policy concurrently also share the restored budget.
+        """
+        with self._lock:
+            self._run_retries = 0
+
+    def get_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self._config.max_delay, self._config.base_delay * 2 ** (attempt - 1)))
+
+    def get_stats(self) -> RetryStats:
+        with self._lock:
+            return RetryStats(
+                retries=self._retries,
+                exhausted_calls=self._exhausted_calls,
+                run_budget_left=(
+                    max(self._config.run_budget - self._run_retries, 0) if self._config.run_budget is not None else None
+                ),
+            )
+
+    def _get_retry_delay(
+        self, error: Exception, attempt: int, is_retryable: typing.Callable[[Exception], bool]
+    ) -> typing.Optional[float]:
+        if not is_retryable(error):
+            return None
+
+        with self._lock:
+            budget_exhausted = self._config.run_budget is not None and self._run_retries >= self._config.run_budget
+            if attempt >= self._config.max_attempts or budget_exhausted:
+                self._exhausted_calls += 1
+                return None
+
+            self._retries += 1
+            self._run_retries += 1
+
+        return self.get_delay(attempt=attempt)
+
+    @staticmethod
+    def _log_retry(error: Exception, attempt: int, delay: float, description: str) -> None:
+        logger.warning(
+            "Retrying request (request={}, attempt={}, delay={:.2f}s). Error: {}".format(
+                description, attempt, delay, utils.get_exception_message(exception=error)
+            )
+        )
+
+
+_shared_retry_policy = None
+_shared_retry_policy_lock = threading.Lock()
+
+
+def get_shared_retry_policy() -> RetryPolicy:
+    global _shared_retry_policy
+
+    with _shared_retry_policy_lock:
+        if _shared_retry_policy is None:
+            _shared_retry_policy = RetryPolicy()
+
+        return _shared_retry_policy
+
+
+def configure_shared_retry_policy(config: RetryConfig) -> RetryPolicy:
+    """
+    Replaces the shared policy, which also starts a new run budget.
+    """
+    global _shared_retry_policy
+
+    with _shared_retry_policy_lock:
+        _shared_retry_policy = RetryPolicy(config=config)
+
+        return _shared_retry_policy
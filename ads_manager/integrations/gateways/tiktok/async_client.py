@@ -0,0 +1,391 @@
+import asyncio
+import datetime
+import functools
+import typing
+
+import requests
+
+from ads_manager import enums, json_codec, utils
+from ads_manager.integrations.gateways import async_connection_pool
+from ads_manager.integrations.gateways import rate_limiter as gateway_rate_limiter
+from ads_manager.integrations.gateways import response as gateway_response
+from ads_manager.integrations.gateways import retry as gateway_retry
+from ads_manager.integrations.gateways.tiktok import client as tiktok_api_client
+from ads_manager.integrations.gateways.tiktok import exceptions as tiktok_api_exceptions
+
+
+class AsyncTikTokApiClient(object):
+    """
+    asyncio counterpart of `TikTokApiClient` with the same method surface, awaitable.
+    """
+
+    BASE_URL_PROD = tiktok_api_client.TikTokApiClient.BASE_URL_PROD
+    BASE_URL_SANDBOX = tiktok_api_client.TikTokApiClient.BASE_URL_SANDBOX
+    VALID_STATUS_CODES = tiktok_api_client.TikTokApiClient.VALID_STATUS_CODES
+    LIMIT = tiktok_api_client.TikTokApiClient.LIMIT
+
+    def __init__(
+        self,
+        user_access_token: str,
+        params: typing.Dict = None,
+        pool: typing.Optional[async_connection_pool.AsyncConnectionPool] = None,
+        rate_limiter: typing.Optional[gateway_rate_limiter.RateLimiter] = None,
+        retry_policy: typing.Optional[gateway_retry.RetryPolicy] = None,
+    ) -> None:
+        self._user_access_token = user_access_token
+        self._params = params  # {"sandbox: True"}
+        self._owns_connection_pool = pool is None
+        self._connection_pool = pool if pool else async_connection_pool.AsyncConnectionPool()
+        self._rate_limiter = rate_limiter if rate_limiter else gateway_rate_limiter.get_shared_rate_limiter()
+        self._retry_policy = retry_policy if retry_policy else gateway_retry.get_shared_retry_policy()
+        self._token_rate_limit_key = gateway_rate_limiter.get_token_key(
+            platform=enums.Platform.TIKTOK.value, user_access_token=user_access_token
+        )
+
+    @property
+    def base_url(self):
+        if self._params and self._params.get("sandbox"):
+            return self.BASE_URL_SANDBOX
+        return self.BASE_URL_PROD
+
+    async def aclose(self) -> None:
+        if self._owns_connection_pool:
+            await self._connection_pool.aclose()
+
+    async def get_ad_accounts(self, params) -> typing.List[typing.Dict]:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(endpoint="oauth2/advertiser/get/", method=enums.HttpMethod.GET, params=params),
+        )["data"]["list"]
+
+    async def get_advertiser_campaigns(self, advertiser_id: str, fields: typing.List[str]) -> typing.List[typing.Dict]:
+        return await self._get_paginated_content(
+            endpoint="campaign/get/",
+            params={
+                "advertiser_id": advertiser_id,
+                "fields": json_codec.dumps(fields),
+            },
+        )
+
+    def iter_advertiser_campaigns(
+        self, advertiser_id: str, fields: typing.List[str]
+    ) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint="campaign/get/",
+            params={
+                "advertiser_id": advertiser_id,
+                "fields": json_codec.dumps(fields),
+            },
+        )
+
+    async def get_advertiser_adgroups(self, advertiser_id: str, fields: typing.List[str]) -> typing.List[typing.Dict]:
+        return await self._get_paginated_content(
+            endpoint="adgroup/get/",
+            params={
+                "advertiser_id": advertiser_id,
+                "fields": json_codec.dumps(fields),
+            },
+        )
+
+    def iter_advertiser_adgroups(
+        self, advertiser_id: str, fields: typing.List[str]
+    ) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint="adgroup/get/",
+            params={
+                "advertiser_id": advertiser_id,
+                "fields": json_codec.dumps(fields),
+            },
+        )
+
+    async def get_advertiser_ads(self, advertiser_id: str, fields: typing.List[str]) -> typing.List[typing.Dict]:
+        return await self._get_paginated_content(
+            endpoint="ad/get/",
+            params={
+                "advertiser_id": advertiser_id,
+                "fields": json_codec.dumps(fields),
+            },
+        )
+
+    def iter_advertiser_ads(
+        self, advertiser_id: str, fields: typing.List[str]
+    ) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint="ad/get/",
+            params={
+                "advertiser_id": advertiser_id,
+                "fields": json_codec.dumps(fields),
+            },
+        )
+
+    async def create_ads(self, ad_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="ad/create",
+                method=enums.HttpMethod.POST,
+                params=ad_params,
+            )
+        )["data"]
+
+    async def update_ads(self, ad_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="ad/update",
+                method=enums.HttpMethod.POST,
+                params=ad_params,
+            )
+        )["data"]
+
+    async def update_ads_status(self, ads_status_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="ad/status/update",
+                method=enums.HttpMethod.POST,
+                params=ads_status_params,
+            )
+        )["data"]
+
+    async def create_campaign(self, campaign_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="campaign/create",
+                method=enums.HttpMethod.POST,
+                params=campaign_params,
+            )
+        )["data"]
+
+    async def update_campaign(self, campaign_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="campaign/update",
+                method=enums.HttpMethod.POST,
+                params=campaign_params,
+            )
+        )["data"]
+
+    async def create_adgroup(self, adgroup_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="adgroup/create",
+                method=enums.HttpMethod.POST,
+                params=adgroup_params,
+            )
+        )["data"]
+
+    async def update_adgroup(self, adgroup_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="adgroup/update",
+                method=enums.HttpMethod.POST,
+                params=adgroup_params,
+            )
+        )["data"]
+
+    async def upload_image(self, image_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="file/image/ad/upload",
+                method=enums.HttpMethod.POST,
+                params=image_params,
+            )
+        )["data"]
+
+    async def update_image_name(self, image_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="file/image/ad/update",
+                method=enums.HttpMethod.POST,
+                params=image_params,
+            )
+        )["data"]
+
+    async def get_images_info(self, image_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="file/image/ad/info",
+                method=enums.HttpMethod.GET,
+                params=image_params,
+            )
+        )["data"]["list"]
+
+    async def upload_video(self, video_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="file/video/ad/upload",
+                method=enums.HttpMethod.POST,
+                params=video_params,
+            )
+        )["data"]
+
+    async def update_video_name(self, video_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="file/video/ad/update",
+                method=enums.HttpMethod.POST,
+                params=video_params,
+            )
+        )["data"]
+
+    async def get_videos_info(self, video_params: typing.Dict) -> typing.Dict:
+        return tiktok_api_client.TikTokApiClient._get_content(
+            response=await self._request(
+                endpoint="file/video/ad/info",
+                method=enums.HttpMethod.GET,
+                params=video_params,
+            )
+        )["data"]["list"]
+
+    async def get_insights_report(
+        self,
+        advertiser_id: str,
+        service_type: str,
+        report_type: str,
+        data_level: str,
+        dimensions: typing.List[str],
+        metrics: typing.List[str],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+    ) -> typing.List[typing.Dict]:
+        return await self._get_paginated_content(
+            endpoint="report/integrated/get",
+            params={
+                "advertiser_id": advertiser_id,
+                "service_type": service_type,
+                "report_type": report_type,
+                "data_level": data_level,
+                "dimensions": json_codec.dumps(dimensions),
+                "metrics": json_codec.dumps(metrics),
+                "start_date": utils.format_tiktok_date(from_datetime),
+                "end_date": utils.format_tiktok_date(to_datetime),
+            },
+        )
+
+    def iter_insights_report(
+        self,
+        advertiser_id: str,
+        service_type: str,
+        report_type: str,
+        data_level: str,
+        dimensions: typing.List[str],
+        metrics: typing.List[str],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+    ) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint="report/integrated/get",
+            params={
+                "advertiser_id": advertiser_id,
+                "service_type": service_type,
+                "report_type": report_type,
+                "data_level": data_level,
+                "dimensions": json_codec.dumps(dimensions),
+                "metrics": json_codec.dumps(metrics),
+                "start_date": utils.format_tiktok_date(from_datetime),
+                "end_date": utils.format_tiktok_date(to_datetime),
+            },
+        )
+
+    async def _get_paginated_content(
+        self,
+        endpoint: str,
+        params: typing.Optional[typing.Dict] = None,
+        page_size: typing.Optional[int] = None,
+    ) -> typing.List[typing.Dict]:
+        return [
+            data
+            async for page in self._iter_paginated_content(endpoint=endpoint, params=params, page_size=page_size)
+            for data in page
+        ]
+
+    async def _iter_paginated_content(
+        self,
+        endpoint: str,
+        params: typing.Optional[typing.Dict] = None,
+        page_size: typing.Optional[int] = None,
+    ) -> typing.AsyncIterator[typing.List[typing.Dict]]:
+        params = dict(params) if params else {}
+        params["page_size"] = self.LIMIT if not page_size else page_size
+
+        while True:
+            data = tiktok_api_client.TikTokApiClient._get_content(
+                response=await self._request(
+                    endpoint=endpoint,
+                    method=enums.HttpMethod.GET,
+                    params=params,
+                )
+            )["data"]
+            if data.get("list"):
+                yield data["list"]
+
+            page_number = data["page_info"]["page"]
+            if page_number >= data["page_info"]["total_page"]:
+                break
+
+            page_number += 1
+            params["page"] = page_number
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: enums.HttpMethod,
+        params: typing.Optional[typing.Dict] = None,
+        payload: typing.Optional[typing.Dict] = None,
+    ) -> gateway_response.ResponseEnvelope:
+        return await self._retry_policy.call_async(
+            func=lambda: self._send_request(endpoint=endpoint, method=method, params=params, payload=payload),
+            is_retryable=functools.partial(
+                tiktok_api_client.TikTokApiClient._is_retryable, idempotent=method == enums.HttpMethod.GET
+            ),
+            description="{} {}".format(method.value.upper(), endpoint),
+        )
+
+    async def _send_request(
+        self,
+        endpoint: str,
+        method: enums.HttpMethod,
+        params: typing.Optional[typing.Dict] = None,
+        payload: typing.Optional[typing.Dict] = None,
+    ) -> gateway_response.ResponseEnvelope:
+        full_endpoint = f"{self.base_url}/{endpoint}"
+        account_rate_limit_key = tiktok_api_client.TikTokApiClient._get_account_rate_limit_key(params=params)
+        delay = self._rate_limiter.reserve(keys=[self._token_rate_limit_key, account_rate_limit_key])
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        try:
+            response = gateway_response.ResponseEnvelope(
+                response=await self._connection_pool.request(
+                    url=full_endpoint,
+                    method=method.value,
+                    params=params,
+                    headers={
+                        "Access-Token": self._user_access_token,
+                        "Accept": "application/json",
+                        "Content-Type": "application/json",
+                    },
+                    data=payload,
+                )
+            )
+            tiktok_api_client.TikTokApiClient._update_rate_limits(
+                rate_limiter=self._rate_limiter,
+                response=response,
+                token_key=self._token_rate_limit_key,
+                account_key=account_rate_limit_key,
+            )
+            if response.status_code not in self.VALID_STATUS_CODES:
+                raise tiktok_api_exceptions.BadResponseCodeError(
+                    message="Invalid API client response (status_code={}, data={})".format(
+                        response.status_code,
+                        response.content.decode(encoding="utf-8"),
+                    ),
+                    code=response.status_code,
+                )
+        except requests.exceptions.ConnectTimeout as e:
+            raise tiktok_api_exceptions.RequestError(
+                "Connection timeout. Error: {}".format(utils.get_exception_message(exception=e))
+            )
+        except requests.RequestException as e:
+            raise tiktok_api_exceptions.RequestError(
+                "Request exception. Error: {}".format(utils.get_exception_message(exception=e))
+            )
+
+        return tiktok_api_client.TikTokApiClient._validate_response(response=response)
@@ -0,0 +1,30 @@
+import dataclasses
+import hashlib
+import typing
+
+
+@dataclasses.dataclass
+class ChunkedUploadCursor(object):
+    """
+    Progress of a chunked file upload, shared between `TikTokApiClient.upload_file_in_chunks` and its caller.
+
+    The cursor is updated after every chunk TikTok acknowledged, a caller that persists it (e.g. as JSON with
+    `dataclasses.asdict`) can pass it back after a failure to resume the upload from the first chunk that was not
+    acknowledged, instead of uploading the file from the start.
+    """
+
+    upload_id: typing.Optional[str] = None
+    start_offset: int = 0  # First byte not acknowledged yet
+    end_offset: typing.Optional[int] = None  # End of the next chunk, when TikTok suggested one
+    size: typing.Optional[int] = None
+    file_id: typing.Optional[str] = None  # Set once the upload is finished
+
+
+def read_chunk(file: typing.BinaryIO, start_offset: int, end_offset: int) -> typing.Tuple[bytes, str]:
+    """
+    Reads the bytes of `start_offset`-`end_offset` (exclusive) from a buffered binary file, with their MD5.
+    """
+    file.seek(start_offset)
+    chunk = file.read(end_offset - start_offset)
+
+    return chunk, hashlib.md5(chunk).hexdigest()
@@ -1,10 +1,18 @@
+import collections
+import concurrent.futures
 import datetime
-import json
+import functools
+import os
 import typing
 
 import requests
 
-from ads_manager import enums, utils
+from ads_manager import enums, json_codec, utils
+from ads_manager.integrations.gateways import connection_pool, pagination
+from ads_manager.integrations.gateways import rate_limiter as gateway_rate_limiter
+from ads_manager.integrations.gateways import response as gateway_response
+from ads_manager.integrations.gateways import retry as gateway_retry
+from ads_manager.integrations.gateways.tiktok import chunked_upload
 from ads_manager.integrations.gateways.tiktok import exceptions as tiktok_api_exceptions
 
 
@@ -14,10 +22,28 @@ class TikTokApiClient(object):
     VALID_STATUS_CODES = [200]
     VALID_PAYLOAD_STATUS_CODES = [0, 20001]
     LIMIT = 1000
+    UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024  # Bytes, TikTok accepts chunks of 1 MB up to 64 MB
+    THROTTLE_STATUS_CODE = 429
+    THROTTLE_PAYLOAD_STATUS_CODES = [40100]  # "Too many requests"
+    RETRYABLE_PAYLOAD_STATUS_CODES = [50000]  # "Internal system error"
+    THROTTLE_PAUSE = 5.0  # Seconds, TikTok limits are enforced per second/minute and report no regain time
 
-    def __init__(self, user_access_token: str, params: typing.Dict = None) -> None:
+    def __init__(
+        self,
+        user_access_token: str,
+        params: typing.Dict = None,
+        pool: typing.Optional[connection_pool.ConnectionPool] = None,
+        rate_limiter: typing.Optional[gateway_rate_limiter.RateLimiter] = None,
+        retry_policy: typing.Optional[gateway_retry.RetryPolicy] = None,
+    ) -> None:
         self._user_access_token = user_access_token
-        self._params = params  # {"sandbox: True"}
+        self._params = params  # {"sandbox: True", "page_workers": 4}
+        self._pool = pool  # None uses the shared pool, looked up per request
+        self._rate_limiter = rate_limiter if rate_limiter else gateway_rate_limiter.get_shared_rate_limiter()
+        self._retry_policy = retry_policy if retry_policy else gateway_retry.get_shared_retry_policy()
+        self._token_rate_limit_key = gateway_rate_limiter.get_token_key(
+            platform=enums.Platform.TIKTOK.value, user_access_token=user_access_token
+        )
 
     @property
     def base_url(self):
@@ -25,6 +51,13 @@ class TikTokApiClient(object):
             return self.BASE_URL_SANDBOX
         return self.BASE_URL_PROD
 
+    @property
+    def page_workers(self) -> int:
+        """
+        Pages of a listing requested concurrently after the first one, 1 (the default) pages sequentially.
+        """
+        return max(int(self._params.get("page_workers") or 1), 1) if self._params else 1
+
     def get_ad_accounts(self, params) -> typing.List[typing.Dict]:
         return self._get_content(
             response=self._request(endpoint="oauth2/advertiser/get/", method=enums.HttpMethod.GET, params=params),
@@ -35,28 +68,67 @@ class TikTokApiClient(object):
             endpoint="campaign/get/",
             params={
                 "advertiser_id": advertiser_id,
-                "fields": json.dumps(fields),
+                "fields": json_codec.dumps(fields),
             },
         )
 
+    def iter_advertiser_campaigns(
+        self,
+        advertiser_id: str,
+        fields: typing.List[str],
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        filtering: typing.Optional[typing.Dict] = None,
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint="campaign/get/",
+            params=self._get_listing_params(advertiser_id=advertiser_id, fields=fields, filtering=filtering),
+            cursor=cursor,
+        )
+
     def get_advertiser_adgroups(self, advertiser_id: str, fields: typing.List[str]) -> typing.List[typing.Dict]:
         return self._get_paginated_content(
             endpoint="adgroup/get/",
             params={
                 "advertiser_id": advertiser_id,
-                "fields": json.dumps(fields),
+                "fields": json_codec.dumps(fields),
             },
         )
 
+    def iter_advertiser_adgroups(
+        self,
+        advertiser_id: str,
+        fields: typing.List[str],
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        filtering: typing.Optional[typing.Dict] = None,
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint="adgroup/get/",
+            params=self._get_listing_params(advertiser_id=advertiser_id, fields=fields, filtering=filtering),
+            cursor=cursor,
+        )
+
     def get_advertiser_ads(self, advertiser_id: str, fields: typing.List[str]) -> typing.List[typing.Dict]:
         return self._get_paginated_content(
             endpoint="ad/get/",
             params={
                 "advertiser_id": advertiser_id,
-                "fields": json.dumps(fields),
+                "fields": json_codec.dumps(fields),
             },
         )
 
+    def iter_advertiser_ads(
+        self,
+        advertiser_id: str,
+        fields: typing.List[str],
+        cursor: typing.Optional[pagination.PageCursor] = None,
+        filtering: typing.Optional[typing.Dict] = None,
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint="ad/get/",
+            params=self._get_listing_params(advertiser_id=advertiser_id, fields=fields, filtering=filtering),
+            cursor=cursor,
+        )
+
     def create_ads(self, ad_params: typing.Dict) -> typing.Dict:
         return self._get_content(
             response=self._request(
@@ -174,6 +246,122 @@ class TikTokApiClient(object):
             )
         )["data"]["list"]
 
+    def start_file_upload(self, upload_params: typing.Dict) -> typing.Dict:
+        return self._get_content(
+            response=self._request(
+                endpoint="file/start/upload/",
+                method=enums.HttpMethod.POST,
+                params=upload_params,
+            )
+        )["data"]
+
+    def transfer_file_chunk(self, chunk_params: typing.Dict, chunk: bytes) -> typing.Dict:
+        """
+        The chunk is addressed by its `start_offset`, so a repeated transfer overwrites the same bytes and the
+        request is retried like a read.
+        """
+        return self._get_content(
+            response=self._request(
+                endpoint="file/transfer/upload/",
+                method=enums.HttpMethod.POST,
+                payload=chunk_params,
+                files={"file": chunk},
+                idempotent=True,
+            )
+        )["data"]
+
+    def finish_file_upload(self, upload_params: typing.Dict) -> typing.Dict:
+        return self._get_content(
+            response=self._request(
+                endpoint="file/finish/upload/",
+                method=enums.HttpMethod.POST,
+                params=upload_params,
+            )
+        )["data"]
+
+    def upload_file_in_chunks(
+        self,
+        advertiser_id: str,
+        file_path: str,
+        content_type: str = "video",
+        cursor: typing.Optional[chunked_upload.ChunkedUploadCursor] = None,
+        chunk_size: typing.Optional[int] = None,
+    ) -> str:
+        """
+        Uploads the file through TikTok's chunk upload endpoints and returns the `file_id` of the uploaded file.
+
+        The file is streamed from disk one chunk at a time, every chunk is sent with its MD5 `signature` so TikTok
+        rejects a chunk that was corrupted on the way. The `cursor` is moved past every acknowledged chunk, when
+        a previously used cursor is passed the upload resumes from its `start_offset` instead of the first byte.
+        """
+        cursor = cursor if cursor is not None else chunked_upload.ChunkedUploadCursor()
+        if cursor.file_id:
+            return cursor.file_id
+
+        size = os.path.getsize(file_path)
+        if cursor.upload_id is None:
+            started_upload = self.start_file_upload(
+                upload_params={
+                    "advertiser_id": advertiser_id,
+                    "size": size,
+                    "content_type": content_type,
+                }
+            )
+            cursor.upload_id = started_upload["upload_id"]
+            cursor.start_offset = started_upload.get("start_offset", 0)
+            cursor.end_offset = started_upload.get("end_offset")
+            cursor.size = size
+        elif cursor.size != size:
+            raise tiktok_api_exceptions.ChunkedUploadError(
+                "File changed since the upload started (upload_id={}, size={}, uploaded_size={})".format(
+                    cursor.upload_id, size, cursor.size
+                )
+            )
+
+        chunk_size = chunk_size if chunk_size else self.UPLOAD_CHUNK_SIZE
+        with open(file_path, "rb") as file:
+            while cursor.start_offset < size:
+                end_offset = min(
+                    cursor.end_offset if cursor.end_offset else cursor.start_offset + chunk_size,
+                    size,
+                )
+                chunk, signature = chunked_upload.read_chunk(
+                    file=file, start_offset=cursor.start_offset, end_offset=end_offset
+                )
+                if len(chunk) != end_offset - cursor.start_offset:
+                    raise tiktok_api_exceptions.ChunkedUploadError(
+                        "File truncated during the upload (upload_id={}, start_offset={}, end_offset={})".format(
+                            cursor.upload_id, cursor.start_offset, end_offset
+                        )
+                    )
+
+                transferred_chunk = self.transfer_file_chunk(
+                    chunk_params={
+                        "advertiser_id": advertiser_id,
+                        "upload_id": cursor.upload_id,
+                        "start_offset": cursor.start_offset,
+                        "signature": signature,
+                    },
+                    chunk=chunk,
+                )
+                next_start_offset = transferred_chunk.get("start_offset", end_offset)
+                if next_start_offset <= cursor.start_offset:
+                    raise tiktok_api_exceptions.ChunkedUploadError(
+                        "Chunk not acknowledged (upload_id={}, start_offset={}, next_start_offset={})".format(
+                            cursor.upload_id, cursor.start_offset, next_start_offset
+                        )
+                    )
+
+                cursor.start_offset = next_start_offset
+                cursor.end_offset = transferred_chunk.get("end_offset")
+
+        finished_upload = self.finish_file_upload(
+            upload_params={"advertiser_id": advertiser_id, "upload_id": cursor.upload_id}
+        )
+        cursor.file_id = finished_upload["file_id"]
+
+        return cursor.file_id
+
     def get_insights_report(
         self,
         advertiser_id: str,
@@ -192,11 +380,38 @@ class TikTokApiClient(object):
                 "service_type": service_type,
                 "report_type": report_type,
                 "data_level": data_level,
-                "dimensions": json.dumps(dimensions),
-                "metrics": json.dumps(metrics),
+                "dimensions": json_codec.dumps(dimensions),
+                "metrics": json_codec.dumps(metrics),
+                "start_date": utils.format_tiktok_date(from_datetime),
+                "end_date": utils.format_tiktok_date(to_datetime),
+            },
+        )
+
+    def iter_insights_report(
+        self,
+        advertiser_id: str,
+        service_type: str,
+        report_type: str,
+        data_level: str,
+        dimensions: typing.List[str],
+        metrics: typing.List[str],
+        from_datetime: datetime.datetime,
+        to_datetime: datetime.datetime,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        return self._iter_paginated_content(
+            endpoint="report/integrated/get",
+            params={
+                "advertiser_id": advertiser_id,
+                "service_type": service_type,
+                "report_type": report_type,
+                "data_level": data_level,
+                "dimensions": json_codec.dumps(dimensions),
+                "metrics": json_codec.dumps(metrics),
                 "start_date": utils.format_tiktok_date(from_datetime),
                 "end_date": utils.format_tiktok_date(to_datetime),
             },
+            cursor=cursor,
         )
 
     def _get_paginated_content(
@@ -205,9 +420,31 @@ class TikTokApiClient(object):
         params: typing.Optional[typing.Dict] = None,
         page_size: typing.Optional[int] = None,
     ) -> typing.List[typing.Dict]:
-        params = params if params else {}
+        return [
+            data
+            for page in self._iter_paginated_content(endpoint=endpoint, params=params, page_size=page_size)
+            for data in page
+        ]
+
+    def _iter_paginated_content(
+        self,
+        endpoint: str,
+        params: typing.Optional[typing.Dict] = None,
+        page_size: typing.Optional[int] = None,
+        cursor: typing.Optional[pagination.PageCursor] = None,
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        params = dict(params) if params else {}
         params["page_size"] = self.LIMIT if not page_size else page_size
-        all_data = []
+        cursor = cursor if cursor else pagination.PageCursor()
+        if cursor.done:
+            return
+
+        if cursor.page:
+            params["page"] = cursor.page
+
+        if self.page_workers > 1:
+            yield from self._iter_fanned_out_pages(endpoint=endpoint, params=params, cursor=cursor)
+            return
 
         while True:
             data = self._get_content(
@@ -217,16 +454,66 @@ class TikTokApiClient(object):
                     params=params,
                 )
             )["data"]
-            all_data.extend(data.get("list", []))
 
             page_number = data["page_info"]["page"]
-            if page_number >= data["page_info"]["total_page"]:
+            cursor.done = page_number >= data["page_info"]["total_page"]
+            cursor.page = page_number if cursor.done else page_number + 1
+
+            if data.get("list"):
+                yield data["list"]
+
+            if cursor.done:
                 break
 
-            page_number += 1
-            params["page"] = page_number
+            params["page"] = cursor.page
 
-        return all_data
+    def _iter_fanned_out_pages(
+        self, endpoint: str, params: typing.Dict, cursor: pagination.PageCursor
+    ) -> typing.Iterator[typing.List[typing.Dict]]:
+        """
+        Requests the first page, then keeps up to `page_workers` of the following pages (up to `total_page`) in
+        flight on a thread pool, paced by the rate limiter like any other request. Pages are yielded and the cursor
+        is moved in page order, so at most `page_workers` fetched pages wait in memory for an earlier one.
+        """
+        data = self._get_page(endpoint=endpoint, params=params, page=params.get("page", 1))
+        total_page = data["page_info"]["total_page"]
+        next_page = data["page_info"]["page"] + 1
+        pending_pages = collections.deque()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.page_workers) as executor:
+            try:
+                while True:
+                    # Later pages can report more pages when rows were added in the meantime
+                    total_page = max(total_page, data["page_info"]["total_page"])
+                    while next_page <= total_page and len(pending_pages) < self.page_workers:
+                        pending_pages.append(
+                            executor.submit(self._get_page, endpoint=endpoint, params=params, page=next_page)
+                        )
+                        next_page += 1
+
+                    page_number = data["page_info"]["page"]
+                    cursor.done = not pending_pages
+                    cursor.page = page_number if cursor.done else page_number + 1
+
+                    if data.get("list"):
+                        yield data["list"]
+
+                    if cursor.done:
+                        break
+
+                    data = pending_pages.popleft().result()
+            finally:
+                for pending_page in pending_pages:
+                    pending_page.cancel()
+
+    def _get_page(self, endpoint: str, params: typing.Dict, page: int) -> typing.Dict:
+        return self._get_content(
+            response=self._request(
+                endpoint=endpoint,
+                method=enums.HttpMethod.GET,
+                params={**params, "page": page},
+            )
+        )["data"]
 
     def _request(
         self,
@@ -234,19 +521,55 @@ class TikTokApiClient(object):
         method: enums.HttpMethod,
         params: typing.Optional[typing.Dict] = None,
         payload: typing.Optional[typing.Dict] = None,
-    ) -> requests.Response:
+        files: typing.Optional[typing.Dict] = None,
+        idempotent: typing.Optional[bool] = None,
+    ) -> gateway_response.ResponseEnvelope:
+        return self._retry_policy.call(
+            func=lambda: self._send_request(
+                endpoint=endpoint, method=method, params=params, payload=payload, files=files
+            ),
+            is_retryable=functools.partial(
+                TikTokApiClient._is_retryable,
+                idempotent=idempotent if idempotent is not None else method == enums.HttpMethod.GET,
+            ),
+            description="{} {}".format(method.value.upper(), endpoint),
+        )
+
+    def _send_request(
+        self,
+        endpoint: str,
+        method: enums.HttpMethod,
+        params: typing.Optional[typing.Dict] = None,
+        payload: typing.Optional[typing.Dict] = None,
+        files: typing.Optional[typing.Dict] = None,
+    ) -> gateway_response.ResponseEnvelope:
         full_endpoint = f"{self.base_url}/{endpoint}"
+        account_rate_limit_key = self._get_account_rate_limit_key(params=params if params else payload)
+        self._rate_limiter.acquire(keys=[self._token_rate_limit_key, account_rate_limit_key])
+        headers = {
+            "Access-Token": self._user_access_token,
+            "Accept": "application/json",
+        }
+        if not files:
+            # Multipart requests get their Content-Type, with the boundary, from the HTTP library
+            headers["Content-Type"] = "application/json"
+
         try:
-            response = requests.request(
-                url=full_endpoint,
-                method=method.value,
-                params=params,
-                headers={
-                    "Access-Token": self._user_access_token,
-                    "Accept": "application/json",
-                    "Content-Type": "application/json",
-                },
-                data=payload,
+            response = gateway_response.ResponseEnvelope(
+                response=self._get_connection_pool().request(
+                    url=full_endpoint,
+                    method=method.value,
+                    params=params,
+                    headers=headers,
+                    data=payload,
+                    files=files,
+                )
+            )
+            self._update_rate_limits(
+                rate_limiter=self._rate_limiter,
+                response=response,
+                token_key=self._token_rate_limit_key,
+                account_key=account_rate_limit_key,
             )
             if response.status_code not in self.VALID_STATUS_CODES:
                 raise tiktok_api_exceptions.BadResponseCodeError(
@@ -257,18 +580,18 @@ class TikTokApiClient(object):
                     code=response.status_code,
                 )
         except requests.exceptions.ConnectTimeout as e:
-            raise tiktok_api_exceptions.TikTokAPIClientError(
+            raise tiktok_api_exceptions.RequestError(
                 "Connection timeout. Error: {}".format(utils.get_exception_message(exception=e))
             )
         except requests.RequestException as e:
-            raise tiktok_api_exceptions.TikTokAPIClientError(
+            raise tiktok_api_exceptions.RequestError(
                 "Request exception. Error: {}".format(utils.get_exception_message(exception=e))
             )
 
         return self._validate_response(response=response)
 
     @staticmethod
-    def _validate_response(response: requests.Response) -> requests.Response:
+    def _validate_response(response: gateway_response.ResponseEnvelope) -> gateway_response.ResponseEnvelope:
         """
         As per this reference page: https://ads.tiktok.com/marketing_api/docs?id=1737172488964097
         The payload can contain their own status
@@ -288,5 +611,77 @@ class TikTokApiClient(object):
         return response
 
     @staticmethod
-    def _get_content(response: requests.Response) -> typing.Dict:
-        return json.loads(response.content)
+    def _get_listing_params(
+        advertiser_id: str, fields: typing.List[str], filtering: typing.Optional[typing.Dict]
+    ) -> typing.Dict:
+        params = {
+            "advertiser_id": advertiser_id,
+            "fields": json_codec.dumps(fields),
+        }
+        if filtering:
+            params["filtering"] = json_codec.dumps(filtering)
+
+        return params
+
+    @staticmethod
+    def _get_account_rate_limit_key(params: typing.Optional[typing.Dict]) -> typing.Optional[str]:
+        advertiser_id = params.get("advertiser_id") if params else None
+        if not advertiser_id:
+            return None
+
+        return gateway_rate_limiter.get_account_key(platform=enums.Platform.TIKTOK.value, account_id=str(advertiser_id))
+
+    @staticmethod
+    def _update_rate_limits(
+        rate_limiter: gateway_rate_limiter.RateLimiter,
+        response: typing.Any,
+        token_key: str,
+        account_key: typing.Optional[str],
+    ) -> None:
+        """
+        TikTok sends no usage headers, throttling is only reported through HTTP 429 or the payload status code.
+        """
+        throttled = response.status_code == TikTokApiClient.THROTTLE_STATUS_CODE
+        if not throttled:
+            try:
+                payload_status_code = TikTokApiClient._get_content(response=response).get("code")
+            except (ValueError, AttributeError):
+                payload_status_code = None
+
+            throttled = payload_status_code in TikTokApiClient.THROTTLE_PAYLOAD_STATUS_CODES
+
+        if throttled:
+            for key in filter(None, [token_key, account_key]):
+                rate_limiter.throttle(key=key, seconds=TikTokApiClient.THROTTLE_PAUSE)
+
+    def _get_connection_pool(self) -> connection_pool.ConnectionPool:
+        # The shared pool is looked up on every request, so clients created before `configure_shared_pool`
+        # switch to the new pool instead of holding on to the closed one.
+        return self._pool if self._pool else connection_pool.get_shared_pool()
+
+    @staticmethod
+    def _is_retryable(error: Exception, idempotent: bool) -> bool:
+        """
+        Throttled requests are always repeated, server side and transport errors only for reads, since a repeated
+        create could duplicate the object.
+        """
+        if isinstance(error, tiktok_api_exceptions.RequestError):
+            return idempotent
+
+        if isinstance(error, tiktok_api_exceptions.BadPayloadCodeError):
+            if error.payload_code in TikTokApiClient.THROTTLE_PAYLOAD_STATUS_CODES:
+                return True
+
+            return idempotent and error.payload_code in TikTokApiClient.RETRYABLE_PAYLOAD_STATUS_CODES
+
+        if isinstance(error, tiktok_api_exceptions.BadResponseCodeError):
+            if error.code == TikTokApiClient.THROTTLE_STATUS_CODE:
+                return True
+
+            return idempotent and error.code >= 500
+
+        return False
+
+    @staticmethod
+    def _get_content(response: gateway_response.ResponseEnvelope) -> typing.Dict:
+        return response.data
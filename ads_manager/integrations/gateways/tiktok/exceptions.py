@@ -2,6 +2,10 @@ class TikTokAPIClientError(Exception):
     pass
 
 
+class RequestError(TikTokAPIClientError):
+    pass
+
+
 class BadResponseCodeError(TikTokAPIClientError):
     def __init__(self, message: str, code: int) -> None:
         TikTokAPIClientError.__init__(self)
@@ -15,3 +19,7 @@ class BadPayloadCodeError(TikTokAPIClientError):
         self.message = message
         self.code = code
         self.payload_code = payload_code
+
+
+class ChunkedUploadError(TikTokAPIClientError):
+    pass
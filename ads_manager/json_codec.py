@@ -0,0 +1,106 @@
+import enum
+import json
+import threading
+import typing
+
+from ads_manager import exceptions
+
+
+class JsonBackend(enum.Enum):
+    STDLIB = "json"
+    ORJSON = "orjson"  # Requires the optional "orjson" dependency
+
+
+class JsonCodec(object):
+    """
+    Decodes and encodes all JSON of the package (provider responses, exports, S3 objects) with one backend.
+
+    `orjson` parses and serializes several times faster than the standard library and is used when it is
+    installed, otherwise the standard library is. Both backends produce the same data. Compact output (JSON Lines,
+    request parameters) has no spaces after separators and keeps non-ASCII characters as UTF-8 with `orjson`.
+    `pretty` output is always written by the standard library, indented by 4 spaces with non-ASCII characters
+    escaped, so the exported documents stay byte for byte the same whichever backend is installed.
+    """
+
+    def __init__(self, backend: typing.Optional[JsonBackend] = None) -> None:
+        self._orjson = None
+        if backend is None:
+            try:
+                self._orjson = _import_orjson()
+            except exceptions.JsonCodecException:
+                pass
+        elif backend == JsonBackend.ORJSON:
+            self._orjson = _import_orjson()
+
+    @property
+    def backend(self) -> JsonBackend:
+        return JsonBackend.ORJSON if self._orjson is not None else JsonBackend.STDLIB
+
+    def loads(self, data: typing.Union[bytes, bytearray, str]) -> typing.Any:
+        """
+        Raises `ValueError` (a `json.JSONDecodeError` with both backends) for invalid JSON.
+        """
+        if self._orjson is not None:
+            return self._orjson.loads(data)
+
+        return json.loads(data)
+
+    def dumps(self, data: typing.Any, pretty: bool = False) -> str:
+        if self._orjson is not None and not pretty:
+            return self.dumps_bytes(data=data).decode("utf-8")
+
+        return json.dumps(data, indent=4 if pretty else None)
+
+    def dumps_bytes(self, data: typing.Any, pretty: bool = False) -> bytes:
+        """
+        UTF-8 encoded `dumps`, without the round trip through `str` when `orjson` is used.
+        """
+        if self._orjson is not None and not pretty:
+            return self._orjson.dumps(data, option=self._orjson.OPT_NON_STR_KEYS)
+
+        return json.dumps(data, indent=4 if pretty else None).encode("utf-8")
+
+
+_shared_codec = None
+_shared_codec_lock = threading.Lock()
+
+
+def get_codec() -> JsonCodec:
+    global _shared_codec
+
+    with _shared_codec_lock:
+        if _shared_codec is None:
+            _shared_codec = JsonCodec()
+
+        return _shared_codec
+
+
+def configure_codec(backend: JsonBackend) -> JsonCodec:
+    global _shared_codec
+
+    codec = JsonCodec(backend=backend)
+    with _shared_codec_lock:
+        _shared_codec = codec
+
+    return codec
+
+
+def loads(data: typing.Union[bytes, bytearray, str]) -> typing.Any:
+    return get_codec().loads(data=data)
+
+
+def dumps(data: typing.Any, pretty: bool = False) -> str:
+    return get_codec().dumps(data=data, pretty=pretty)
+
+
+def dumps_bytes(data: typing.Any, pretty: bool = False) -> bytes:
+    return get_codec().dumps_bytes(data=data, pretty=pretty)
+
+
+def _import_orjson() -> typing.Any:
+    try:
+        import orjson
+    except ImportError:
+        raise exceptions.JsonCodecException('The orjson JSON backend requires the optional "orjson" dependency')
+
+    return orjson
@@ -0,0 +1,41 @@
+import concurrent.futures
+import dataclasses
+import logging
+import typing
+
+from ads_manager import utils
+from ads_manager.integrations.clients import exceptions as client_exceptions
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class AccountResult(object):
+    account_id: str
+    data: typing.List[typing.Dict]
+    error: typing.Optional[str] = None
+
+
+def run_per_account(
+    fetch: typing.Callable[[str], typing.List[typing.Dict]],
+    account_ids: typing.List[str],
+    max_workers: int = 1,
+) -> typing.List[AccountResult]:
+    """
+    Runs `fetch` for every account on a bounded worker pool. Results are returned in the order of
+    `account_ids` and a failing account only marks its own result as failed.
+    """
+    if max_workers <= 1 or len(account_ids) <= 1:
+        return [_fetch_account(fetch=fetch, account_id=account_id) for account_id in account_ids]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(account_ids))) as executor:
+        return list(executor.map(lambda account_id: _fetch_account(fetch=fetch, account_id=account_id), account_ids))
+
+
+def _fetch_account(fetch: typing.Callable[[str], typing.List[typing.Dict]], account_id: str) -> AccountResult:
+    try:
+        return AccountResult(account_id=account_id, data=fetch(account_id))
+    except client_exceptions.ClientError as e:
+        error = utils.get_exception_message(exception=e)
+        logger.warning("Export failed for account (account_id={}). Error: {}".format(account_id, error))
+        return AccountResult(account_id=account_id, data=[], error=error)
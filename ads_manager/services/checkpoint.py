@@ -0,0 +1,160 @@
+import datetime
+import sqlite3
+import threading
+import typing
+
+from ads_manager.integrations.gateways import pagination
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS export_checkpoints (
+    export_key TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    after_cursor TEXT,
+    page INTEGER,
+    report_run_id TEXT,
+    insights_window INTEGER,
+    finished INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (export_key, account_id)
+)
+"""
+
+
+class CheckpointStore(object):
+    """
+    SQLite backed progress of per-account exports, so a rerun can skip finished accounts and resume the
+    pagination of unfinished ones.
+
+    Progress is kept per `export_key` (what is exported, e.g. "facebook:ad_insights:2024-01-01:2024-01-31") and
+    account: the `PageCursor` of the listing (Facebook `after` cursor / TikTok `page`, and the Facebook
+    `report_run_id` of a finished insights report, and the date window of a split insights range) and whether the
+    account is done. The cursor is saved after each
+    page has been written, so a page is written at least once, and at most once more after a crash.
+    One store can be shared by the export worker threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(_SCHEMA)
+            # Stores created before insights ranges were split into windows
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(export_checkpoints)")]
+            if "insights_window" not in columns:
+                self._connection.execute("ALTER TABLE export_checkpoints ADD COLUMN insights_window INTEGER")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get_cursor(self, export_key: str, account_id: str) -> pagination.PageCursor:
+        row = self._fetch_one(
+            "SELECT after_cursor, page, report_run_id, insights_window, finished FROM export_checkpoints "
+            "WHERE export_key = ? AND account_id = ?",
+            (export_key, account_id),
+        )
+        if not row:
+            return pagination.PageCursor()
+
+        return pagination.PageCursor(after=row[0], page=row[1], report_id=row[2], window=row[3], done=bool(row[4]))
+
+    def save_cursor(self, export_key: str, account_id: str, cursor: pagination.PageCursor) -> None:
+        self._upsert(
+            export_key=export_key,
+            account_id=account_id,
+            after_cursor=cursor.after,
+            page=cursor.page,
+            report_run_id=cursor.report_id,
+            insights_window=cursor.window,
+            finished=cursor.done,
+        )
+
+    def mark_finished(self, export_key: str, account_id: str) -> None:
+        cursor = self.get_cursor(export_key=export_key, account_id=account_id)
+        cursor.done = True
+        self.save_cursor(export_key=export_key, account_id=account_id, cursor=cursor)
+
+    def is_finished(self, export_key: str, account_id: str) -> bool:
+        return self.get_cursor(export_key=export_key, account_id=account_id).done
+
+    def get_finished_accounts(self, export_key: str) -> typing.Set[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT account_id FROM export_checkpoints WHERE export_key = ? AND finished = 1", (export_key,)
+            ).fetchall()
+
+        return {row[0] for row in rows}
+
+    def get_report_run_ids(self, export_key: str) -> typing.Dict[str, str]:
+        """
+        Facebook insights reports already finished for the export, by account id.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT account_id, report_run_id FROM export_checkpoints "
+                "WHERE export_key = ? AND report_run_id IS NOT NULL",
+                (export_key,),
+            ).fetchall()
+
+        return {row[0]: row[1] for row in rows}
+
+    def clear(self, export_key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM export_checkpoints WHERE export_key = ?", (export_key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "CheckpointStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _fetch_one(self, query: str, params: typing.Tuple) -> typing.Optional[typing.Tuple]:
+        with self._lock:
+            return self._connection.execute(query, params).fetchone()
+
+    def _upsert(
+        self,
+        export_key: str,
+        account_id: str,
+        after_cursor: typing.Optional[str],
+        page: typing.Optional[int],
+        report_run_id: typing.Optional[str],
+        insights_window: typing.Optional[int],
+        finished: bool,
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO export_checkpoints "
+                "(export_key, account_id, after_cursor, page, report_run_id, insights_window, finished, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    export_key,
+                    account_id,
+                    after_cursor,
+                    page,
+                    report_run_id,
+                    insights_window,
+                    int(finished),
+                    datetime.datetime.utcnow().isoformat(),
+                ),
+            )
+
+
+def get_export_key(
+    platform: str,
+    export_name: str,
+    date_from: typing.Optional[datetime.datetime] = None,
+    date_to: typing.Optional[datetime.datetime] = None,
+) -> str:
+    parts = [platform, export_name]
+    if date_from or date_to:
+        parts.extend(
+            [date.strftime("%Y-%m-%d") if date else "" for date in [date_from, date_to]],
+        )
+
+    return ":".join(parts)
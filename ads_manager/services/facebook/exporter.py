@@ -1,12 +1,12 @@
 import datetime
-import json
 import logging
 import typing
 from dataclasses import asdict
 
-from ads_manager import enums, exceptions, utils
+from ads_manager import enums, exceptions, json_codec, utils
 from ads_manager.integrations.clients import exceptions as client_exceptions
-from ads_manager.integrations.clients import factory
+from ads_manager.integrations.clients import factory, field_projection
+from ads_manager.services import json_lines
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +27,26 @@ def get_account_ids(user_access_token: str) -> typing.List[str]:
         raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
 
-def get_campaigns_details(user_access_token: str, account_ids: typing.List[str]) -> str:
-    campaigns_details = []
+def get_campaigns_details(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    campaigns_details = iter_campaigns_details(
+        user_access_token=user_access_token, account_ids=account_ids, projection=projection
+    )
+
+    if output is not None:
+        return json_lines.write_records(records=campaigns_details, output=output)
+
+    return json_codec.dumps(list(campaigns_details), pretty=True)
+
+
+def iter_campaigns_details(
+    user_access_token: str, account_ids: typing.List[str], projection: typing.Optional[typing.List[str]] = None
+) -> typing.Iterator[typing.Dict]:
+    campaigns_count = 0
 
     facebook_integration_client = factory.Factory.create(
         platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
@@ -38,20 +56,40 @@ def get_campaigns_details(user_access_token: str, account_ids: typing.List[str])
 
     for account_id in account_ids:
         try:
-            campaign_details = facebook_integration_client.get_account_campaigns_details(ad_account_id=account_id)
+            for campaign_details in facebook_integration_client.iter_account_campaigns_details(
+                ad_account_id=account_id, projection=projection
+            ):
+                campaigns_count += len(campaign_details)
+                yield from [
+                    field_projection.to_record(message=campaign_detail, projection=projection)
+                    for campaign_detail in campaign_details
+                ]
         except client_exceptions.ClientError as e:
             raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
-        campaign_details = [asdict(campaigns_detail) for campaigns_detail in campaign_details]
-        campaigns_details.extend(campaign_details)
+    logger.warning("Fetched {} facebook campaigns".format(campaigns_count))
+
 
-    logger.warning("Fetched {} facebook campaigns".format(len(campaigns_details)))
+def get_adsets_details(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    adsets_details = iter_adsets_details(
+        user_access_token=user_access_token, account_ids=account_ids, projection=projection
+    )
 
-    return json.dumps(campaigns_details, indent=4)
+    if output is not None:
+        return json_lines.write_records(records=adsets_details, output=output)
 
+    return json_codec.dumps(list(adsets_details), pretty=True)
 
-def get_adsets_details(user_access_token: str, account_ids: typing.List[str]) -> str:
-    adsets_details = []
+
+def iter_adsets_details(
+    user_access_token: str, account_ids: typing.List[str], projection: typing.Optional[typing.List[str]] = None
+) -> typing.Iterator[typing.Dict]:
+    adsets_count = 0
 
     facebook_integration_client = factory.Factory.create(
         platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
@@ -61,20 +99,38 @@ def get_adsets_details(user_access_token: str, account_ids: typing.List[str]) ->
 
     for account_id in account_ids:
         try:
-            adset_details = facebook_integration_client.get_account_adsets_details(ad_account_id=account_id)
+            for adset_details in facebook_integration_client.iter_account_adsets_details(
+                ad_account_id=account_id, projection=projection
+            ):
+                adsets_count += len(adset_details)
+                yield from [
+                    field_projection.to_record(message=adset_detail, projection=projection)
+                    for adset_detail in adset_details
+                ]
         except client_exceptions.ClientError as e:
             raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
-        adset_details = [asdict(adset_detail) for adset_detail in adset_details]
-        adsets_details.extend(adset_details)
+    logger.warning("Fetched {} facebook adsets".format(adsets_count))
+
+
+def get_ads_details(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    ads_details = iter_ads_details(user_access_token=user_access_token, account_ids=account_ids, projection=projection)
 
-    logger.warning("Fetched {} facebook adsets".format(len(adsets_details)))
+    if output is not None:
+        return json_lines.write_records(records=ads_details, output=output)
 
-    return json.dumps(adsets_details, indent=4)
+    return json_codec.dumps(list(ads_details), pretty=True)
 
 
-def get_ads_details(user_access_token: str, account_ids: typing.List[str]) -> str:
-    ads_details = []
+def iter_ads_details(
+    user_access_token: str, account_ids: typing.List[str], projection: typing.Optional[typing.List[str]] = None
+) -> typing.Iterator[typing.Dict]:
+    ads_count = 0
 
     facebook_integration_client = factory.Factory.create(
         platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
@@ -84,16 +140,17 @@ def get_ads_details(user_access_token: str, account_ids: typing.List[str]) -> st
 
     for account_id in account_ids:
         try:
-            ad_details = facebook_integration_client.get_account_ads_details(ad_account_id=account_id)
+            for ad_details in facebook_integration_client.iter_account_ads_details(
+                ad_account_id=account_id, projection=projection
+            ):
+                ads_count += len(ad_details)
+                yield from [
+                    field_projection.to_record(message=ad_detail, projection=projection) for ad_detail in ad_details
+                ]
         except client_exceptions.ClientError as e:
             raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
-        ad_details = [asdict(ad_detail) for ad_detail in ad_details]
-        ads_details.extend(ad_details)
-
-    logger.warning("Fetched {} facebook adsets".format(len(ads_details)))
-
-    return json.dumps(ads_details, indent=4)
+    logger.warning("Fetched {} facebook ads".format(ads_count))
 
 
 def get_campaign_insights(
@@ -101,30 +158,38 @@ def get_campaign_insights(
     account_ids: typing.List[str],
     date_from: typing.Optional[datetime.datetime],
     date_to: typing.Optional[datetime.datetime],
-) -> str:
-    campaigns_performance = []
-
-    facebook_integration_client = factory.Factory.create(
-        platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    campaigns_performance = iter_campaign_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        date_from=date_from,
+        date_to=date_to,
+        projection=projection,
     )
 
-    logger.warning("Fetched {} facebook ad account ids".format(len(account_ids)))
+    if output is not None:
+        return json_lines.write_records(records=campaigns_performance, output=output)
 
-    for account_id in account_ids:
-        try:
-            campaign_performances = facebook_integration_client.get_insights(
-                ad_account_id=account_id,
-                resource_type=enums.ResourceType.CAMPAIGN,
-                from_datetime=date_from,
-                to_datetime=date_to,
-            )
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+    return json_codec.dumps(list(campaigns_performance), pretty=True)
 
-        campaign_performances = [asdict(campaign_performance) for campaign_performance in campaign_performances]
-        campaigns_performance.extend(campaign_performances)
 
-    return json.dumps(campaigns_performance, indent=4)
+def iter_campaign_insights(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    date_from: typing.Optional[datetime.datetime],
+    date_to: typing.Optional[datetime.datetime],
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    return _iter_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        resource_type=enums.ResourceType.CAMPAIGN,
+        date_from=date_from,
+        date_to=date_to,
+        projection=projection,
+    )
 
 
 def get_adset_insights(
@@ -132,30 +197,38 @@ def get_adset_insights(
     account_ids: typing.List[str],
     date_from: typing.Optional[datetime.datetime],
     date_to: typing.Optional[datetime.datetime],
-) -> str:
-    adsets_performance = []
-
-    facebook_integration_client = factory.Factory.create(
-        platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    adsets_performance = iter_adset_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        date_from=date_from,
+        date_to=date_to,
+        projection=projection,
     )
 
-    logger.warning("Fetched {} facebook ad account ids".format(len(account_ids)))
+    if output is not None:
+        return json_lines.write_records(records=adsets_performance, output=output)
 
-    for account_id in account_ids:
-        try:
-            adset_performances = facebook_integration_client.get_insights(
-                ad_account_id=account_id,
-                resource_type=enums.ResourceType.AD_SET,
-                from_datetime=date_from,
-                to_datetime=date_to,
-            )
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+    return json_codec.dumps(list(adsets_performance), pretty=True)
 
-        adset_performances = [asdict(adset_performance) for adset_performance in adset_performances]
-        adsets_performance.extend(adset_performances)
 
-    return json.dumps(adsets_performance, indent=4)
+def iter_adset_insights(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    date_from: typing.Optional[datetime.datetime],
+    date_to: typing.Optional[datetime.datetime],
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    return _iter_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        resource_type=enums.ResourceType.AD_SET,
+        date_from=date_from,
+        date_to=date_to,
+        projection=projection,
+    )
 
 
 def get_ad_insights(
@@ -163,81 +236,128 @@ def get_ad_insights(
     account_ids: typing.List[str],
     date_from: typing.Optional[datetime.datetime],
     date_to: typing.Optional[datetime.datetime],
-) -> str:
-    ads_performance = []
-
-    facebook_integration_client = factory.Factory.create(
-        platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    ads_performance = iter_ad_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        date_from=date_from,
+        date_to=date_to,
+        projection=projection,
     )
 
-    logger.warning("Fetched {} facebook ad account ids".format(len(account_ids)))
+    if output is not None:
+        return json_lines.write_records(records=ads_performance, output=output)
 
-    for account_id in account_ids:
-        try:
-            ad_performances = facebook_integration_client.get_insights(
-                ad_account_id=account_id,
-                resource_type=enums.ResourceType.AD,
-                from_datetime=date_from,
-                to_datetime=date_to,
-            )
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+    return json_codec.dumps(list(ads_performance), pretty=True)
 
-        ad_performances = [asdict(ad_performance) for ad_performance in ad_performances]
-        ads_performance.extend(ad_performances)
 
-    return json.dumps(ads_performance, indent=4)
+def iter_ad_insights(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    date_from: typing.Optional[datetime.datetime],
+    date_to: typing.Optional[datetime.datetime],
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    return _iter_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        resource_type=enums.ResourceType.AD,
+        date_from=date_from,
+        date_to=date_to,
+        projection=projection,
+    )
 
 
 def get_ad_creatives_list(user_access_token: str, account_ids: typing.List[str]) -> typing.List[str]:
     return [
         ad_creative["id"]
-        for ad_creative in _get_all_ad_creatives(user_access_token=user_access_token, account_ids=account_ids)
+        for ad_creative in _iter_all_ad_creatives(user_access_token=user_access_token, account_ids=account_ids)
     ]
 
 
-def get_ad_creatives(user_access_token: str, account_ids: typing.List[str], asset_ids: typing.List[str]) -> str:
+def get_ad_creatives(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    asset_ids: typing.List[str],
+    output: typing.Optional[typing.TextIO] = None,
+) -> typing.Union[str, int]:
     ad_creatives = (
-        _get_all_ad_creatives(user_access_token=user_access_token, account_ids=account_ids)
+        _iter_all_ad_creatives(user_access_token=user_access_token, account_ids=account_ids)
         if not asset_ids
         else _get_ad_creatives(user_access_token=user_access_token, ad_creative_ids=asset_ids)
     )
 
-    return json.dumps(ad_creatives, indent=4)
+    if output is not None:
+        return json_lines.write_records(records=ad_creatives, output=output)
 
+    return json_codec.dumps(list(ad_creatives), pretty=True)
 
-def _get_ad_creatives(user_access_token: str, ad_creative_ids: typing.List[str]) -> typing.List[typing.Dict]:
-    ad_creatives = []
 
-    for ad_creative_id in ad_creative_ids:
-        try:
-            ad_creative = factory.Factory.create(
-                platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
-            ).get_ad_creative(ad_creative_id=ad_creative_id)
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
-
-        ad_creatives.append(asdict(ad_creative))
+def _get_ad_creatives(user_access_token: str, ad_creative_ids: typing.List[str]) -> typing.List[typing.Dict]:
+    try:
+        ad_creatives = factory.Factory.create(
+            platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
+        ).get_ad_creatives(ad_creative_ids=ad_creative_ids)
+    except client_exceptions.ClientError as e:
+        raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
-    return ad_creatives
+    return [asdict(ad_creative) for ad_creative in ad_creatives]
 
 
-def _get_all_ad_creatives(user_access_token: str, account_ids: typing.List[str]) -> typing.List[typing.Dict]:
+def _iter_all_ad_creatives(user_access_token: str, account_ids: typing.List[str]) -> typing.Iterator[typing.Dict]:
     facebook_integration_client = factory.Factory.create(
         platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
     )
 
-    all_ad_creatives = []
-
     logger.warning("Fetched {} facebook ad account ids".format(len(account_ids)))
 
     for account_id in account_ids:
         try:
-            ad_creatives = facebook_integration_client.get_account_ad_creatives(ad_account_id=account_id)
+            for ad_creatives in facebook_integration_client.iter_account_ad_creatives(ad_account_id=account_id):
+                yield from [asdict(ad_creative) for ad_creative in ad_creatives]
         except client_exceptions.ClientError as e:
             raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
-        ad_creatives = [asdict(ad_creative) for ad_creative in ad_creatives]
-        all_ad_creatives.extend(ad_creatives)
 
-    return all_ad_creatives
+def _iter_insights(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    resource_type: enums.ResourceType,
+    date_from: typing.Optional[datetime.datetime],
+    date_to: typing.Optional[datetime.datetime],
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    facebook_integration_client = factory.Factory.create(
+        platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
+    )
+
+    logger.warning("Fetched {} facebook ad account ids".format(len(account_ids)))
+
+    try:
+        # All report runs are scheduled up front, their results are then streamed one page at a time.
+        insights_jobs = facebook_integration_client.get_accounts_insights(
+            ad_account_ids=account_ids,
+            resource_types=[resource_type],
+            from_datetime=date_from,
+            to_datetime=date_to,
+            fetch_results=False,
+            projection=projection,
+        )
+
+        for insights_job in insights_jobs:
+            for resources_performance in facebook_integration_client.iter_insights_report_results(
+                ad_account_id=insights_job.ad_account_id,
+                report_id=insights_job.report_id,
+                resource_type=insights_job.resource_type,
+                from_datetime=insights_job.from_datetime,
+                to_datetime=insights_job.to_datetime,
+                projection=insights_job.projection,
+            ):
+                yield from [
+                    field_projection.to_record(message=resource_performance, projection=projection)
+                    for resource_performance in resources_performance
+                ]
+    except client_exceptions.ClientError as e:
+        raise exceptions.ImporterException(utils.get_exception_message(exception=e))
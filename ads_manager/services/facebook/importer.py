@@ -43,6 +43,22 @@ def update_campaign(
     return campaign_updated
 
 
+def update_campaigns(
+    user_access_token: str,
+    campaigns_details: typing.Dict[str, typing.Dict],
+) -> typing.Dict[str, bool]:
+    try:
+        campaigns_updated = factory.Factory.create(
+            platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
+        ).update_campaigns(campaigns_details=campaigns_details)
+    except client_exceptions.ClientError as e:
+        raise exceptions.ActionException(utils.get_exception_message(exception=e))
+
+    logger.warning("Updated facebook campaigns (success={})".format(campaigns_updated))
+
+    return campaigns_updated
+
+
 def create_ad_set(
     user_access_token: str,
     ad_account_id: str,
@@ -78,6 +94,22 @@ def update_ad_set(
     return adset_updated
 
 
+def update_ad_sets(
+    user_access_token: str,
+    adsets_details: typing.Dict[str, typing.Dict],
+) -> typing.Dict[str, bool]:
+    try:
+        adsets_updated = factory.Factory.create(
+            platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
+        ).update_adsets(adsets_details=adsets_details)
+    except client_exceptions.ClientError as e:
+        raise exceptions.ActionException(utils.get_exception_message(exception=e))
+
+    logger.warning("Updated facebook adsets (success={})".format(adsets_updated))
+
+    return adsets_updated
+
+
 def create_ad_creative(
     user_access_token: str,
     ad_account_id: str,
@@ -161,3 +193,22 @@ def set_ad_status(
     logger.warning("Updated facebook ad (id={}, success={})".format(ad_id, ad_updated))
 
     return ad_updated
+
+
+def set_ads_status(
+    user_access_token: str,
+    ads_details: typing.Dict[str, typing.Dict],
+) -> typing.Dict[str, bool]:
+    """
+    `set_ad_status` for several ads at once, `ads_details` maps ad ids to their details (e.g. {"status": "PAUSED"}).
+    """
+    try:
+        ads_updated = factory.Factory.create(
+            platform=enums.Platform.FACEBOOK, user_access_token=user_access_token
+        ).update_ads_batch(ads_details=ads_details)
+    except client_exceptions.ClientError as e:
+        raise exceptions.ActionException(utils.get_exception_message(exception=e))
+
+    logger.warning("Updated facebook ads (success={})".format(ads_updated))
+
+    return ads_updated
@@ -0,0 +1,168 @@
+import dataclasses
+import datetime
+import sqlite3
+import threading
+import typing
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS insights_partitions (
+    platform TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    resource_type TEXT NOT NULL,
+    date TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (platform, account_id, resource_type, date)
+)
+"""
+
+
+@dataclasses.dataclass
+class InsightsWindow(object):
+    date_from: datetime.date
+    date_to: datetime.date  # Inclusive, like the report date ranges of both providers
+
+    @property
+    def days(self) -> int:
+        return (self.date_to - self.date_from).days + 1
+
+
+class InsightsLedger(object):
+    """
+    SQLite backed ledger of the daily insights partitions already fetched, by platform, account and resource type,
+    with the time of their last fetch.
+
+    A partition is final once it has been fetched after its restatement horizon passed, the providers don't change
+    it anymore, and is never fetched again. Partitions still inside the horizon are fetched again when their last
+    fetch is older than the refresh interval, so late attributions are picked up while reruns and overlapping
+    syncs within the interval fetch nothing twice. One ledger can be shared by the sync worker threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(_SCHEMA)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get_fetched_at(
+        self,
+        platform: str,
+        account_id: str,
+        resource_type: str,
+        date_from: datetime.date,
+        date_to: datetime.date,
+    ) -> typing.Dict[datetime.date, datetime.datetime]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT date, fetched_at FROM insights_partitions "
+                "WHERE platform = ? AND account_id = ? AND resource_type = ? AND date BETWEEN ? AND ?",
+                (platform, account_id, resource_type, date_from.isoformat(), date_to.isoformat()),
+            ).fetchall()
+
+        return {datetime.date.fromisoformat(row[0]): datetime.datetime.fromisoformat(row[1]) for row in rows}
+
+    def mark_fetched(
+        self,
+        platform: str,
+        account_id: str,
+        resource_type: str,
+        window: InsightsWindow,
+        fetched_at: datetime.datetime,
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO insights_partitions (platform, account_id, resource_type, date, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (platform, account_id, resource_type, date.isoformat(), fetched_at.isoformat())
+                    for date in _iter_dates(date_from=window.date_from, date_to=window.date_to)
+                ],
+            )
+
+    def clear(self, platform: str, account_id: str, resource_type: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM insights_partitions WHERE platform = ? AND account_id = ? AND resource_type = ?",
+                (platform, account_id, resource_type),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "InsightsLedger":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def plan_insights_windows(
+    fetched_at: typing.Dict[datetime.date, datetime.datetime],
+    date_from: datetime.date,
+    date_to: datetime.date,
+    now: datetime.datetime,
+    restatement_horizon: datetime.timedelta,
+    refresh_interval: datetime.timedelta,
+    max_window_days: int,
+) -> typing.List[InsightsWindow]:
+    """
+    Smallest list of report windows covering the dates of `date_from`-`date_to` that are missing from the ledger
+    (`fetched_at`) or stale: fetched before their restatement horizon passed and longer than `refresh_interval`
+    ago. Consecutive dates to fetch share a window, split only where a window would exceed `max_window_days`.
+    All times are naive UTC.
+    """
+    dates_to_fetch = [
+        date
+        for date in _iter_dates(date_from=date_from, date_to=date_to)
+        if _is_partition_stale(
+            date=date,
+            fetched_at=fetched_at.get(date),
+            now=now,
+            restatement_horizon=restatement_horizon,
+            refresh_interval=refresh_interval,
+        )
+    ]
+
+    windows = []
+    for date in dates_to_fetch:
+        last_window = windows[-1] if windows else None
+        if (
+            last_window
+            and last_window.date_to + datetime.timedelta(days=1) == date
+            and last_window.days < max_window_days
+        ):
+            last_window.date_to = date
+        else:
+            windows.append(InsightsWindow(date_from=date, date_to=date))
+
+    return windows
+
+
+def _is_partition_stale(
+    date: datetime.date,
+    fetched_at: typing.Optional[datetime.datetime],
+    now: datetime.datetime,
+    restatement_horizon: datetime.timedelta,
+    refresh_interval: datetime.timedelta,
+) -> bool:
+    if fetched_at is None:
+        return True
+
+    # The day is over at midnight of the next one, restatements can happen until the horizon passes after that.
+    settled_at = datetime.datetime.combine(date + datetime.timedelta(days=1), datetime.time()) + restatement_horizon
+    if fetched_at >= settled_at:
+        return False
+
+    return now - fetched_at >= refresh_interval
+
+
+def _iter_dates(date_from: datetime.date, date_to: datetime.date) -> typing.Iterator[datetime.date]:
+    date = date_from
+    while date <= date_to:
+        yield date
+        date += datetime.timedelta(days=1)
@@ -0,0 +1,42 @@
+import threading
+import typing
+
+from ads_manager import json_codec
+
+
+class JsonLinesWriter(object):
+    """
+    Writes records as newline-delimited JSON (one compact object per line) to a text file-like object.
+    Writes are serialized, so one writer can be shared by the per-account export workers.
+    """
+
+    def __init__(self, output: typing.TextIO) -> None:
+        self._output = output
+        self._lock = threading.Lock()
+        self._records_written = 0
+
+    @property
+    def records_written(self) -> int:
+        return self._records_written
+
+    def write(self, records: typing.Iterable[typing.Dict]) -> int:
+        lines = [json_codec.dumps(record) + "\n" for record in records]
+
+        with self._lock:
+            self._output.writelines(lines)
+            self._records_written += len(lines)
+
+        return len(lines)
+
+
+def iter_lines(records: typing.Iterable[typing.Dict]) -> typing.Iterator[str]:
+    for record in records:
+        yield json_codec.dumps(record) + "\n"
+
+
+def write_records(records: typing.Iterable[typing.Dict], output: typing.TextIO) -> int:
+    writer = JsonLinesWriter(output=output)
+    for record in records:
+        writer.write(records=[record])
+
+    return writer.records_written
@@ -0,0 +1,191 @@
+import datetime
+import sqlite3
+import threading
+import typing
+
+from ads_manager import json_codec
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS resource_snapshots (
+        platform TEXT NOT NULL,
+        resource_type TEXT NOT NULL,
+        account_id TEXT NOT NULL,
+        resource_id TEXT NOT NULL,
+        record TEXT NOT NULL,
+        PRIMARY KEY (platform, resource_type, account_id, resource_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS snapshot_watermarks (
+        platform TEXT NOT NULL,
+        resource_type TEXT NOT NULL,
+        account_id TEXT NOT NULL,
+        watermark TEXT NOT NULL,
+        synced_at TEXT NOT NULL,
+        PRIMARY KEY (platform, resource_type, account_id)
+    )
+    """,
+]
+
+
+class DetailsSnapshotStore(object):
+    """
+    SQLite backed local copy of resource details (campaigns, adsets, ads) kept up to date by incremental syncs.
+
+    Records are kept per platform, resource type and account, keyed by the resource id, next to the account
+    watermark: the latest `updated_time` merged so far. A sync fetches only the resources updated after the
+    watermark and merges them with `merge`, which replaces the stored records and moves the watermark in one
+    transaction, so an interrupted sync never leaves a watermark ahead of its records. A full sync swaps the
+    account records and watermark for the fetched ones with `replace`, also in one transaction.
+    One store can be shared by the sync worker threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get_watermark(self, platform: str, resource_type: str, account_id: str) -> typing.Optional[datetime.datetime]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT watermark FROM snapshot_watermarks WHERE platform = ? AND resource_type = ? AND account_id = ?",
+                (platform, resource_type, account_id),
+            ).fetchone()
+
+        return datetime.datetime.fromisoformat(row[0]) if row else None
+
+    def merge(
+        self,
+        platform: str,
+        resource_type: str,
+        account_id: str,
+        records: typing.List[typing.Dict],
+        id_field: str,
+        watermark: typing.Optional[datetime.datetime],
+    ) -> None:
+        """
+        Upserts `records` by their `id_field` and sets the account watermark. A watermark older than the stored one
+        is ignored, so re-merging an overlapping window can't move it backwards.
+        """
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT watermark FROM snapshot_watermarks WHERE platform = ? AND resource_type = ? AND account_id = ?",
+                (platform, resource_type, account_id),
+            ).fetchone()
+            stored_watermark = datetime.datetime.fromisoformat(row[0]) if row else None
+            if stored_watermark and (watermark is None or watermark < stored_watermark):
+                watermark = stored_watermark
+
+            self._write(
+                platform=platform,
+                resource_type=resource_type,
+                account_id=account_id,
+                records=records,
+                id_field=id_field,
+                watermark=watermark,
+            )
+
+    def replace(
+        self,
+        platform: str,
+        resource_type: str,
+        account_id: str,
+        records: typing.List[typing.Dict],
+        id_field: str,
+        watermark: typing.Optional[datetime.datetime],
+    ) -> None:
+        """
+        Swaps the account records and watermark for `records` and `watermark`, dropping the resources missing from
+        `records`. Nothing is dropped until the new records are written, so a failed full fetch keeps the snapshot.
+        """
+        with self._lock, self._connection:
+            self._delete(platform=platform, resource_type=resource_type, account_id=account_id)
+            self._write(
+                platform=platform,
+                resource_type=resource_type,
+                account_id=account_id,
+                records=records,
+                id_field=id_field,
+                watermark=watermark,
+            )
+
+    def get_records(
+        self, platform: str, resource_type: str, account_ids: typing.Optional[typing.List[str]] = None
+    ) -> typing.List[typing.Dict]:
+        query = "SELECT record FROM resource_snapshots WHERE platform = ? AND resource_type = ?"
+        params = [platform, resource_type]
+        if account_ids is not None:
+            query += " AND account_id IN ({})".format(", ".join("?" for _ in account_ids))
+            params.extend(account_ids)
+
+        with self._lock:
+            rows = self._connection.execute(query + " ORDER BY account_id, resource_id", params).fetchall()
+
+        return [json_codec.loads(row[0]) for row in rows]
+
+    def clear(self, platform: str, resource_type: str, account_id: str) -> None:
+        """
+        Drops the account records and watermark, the next sync of the account fetches all its resources again.
+        """
+        with self._lock, self._connection:
+            self._delete(platform=platform, resource_type=resource_type, account_id=account_id)
+
+    def _write(
+        self,
+        platform: str,
+        resource_type: str,
+        account_id: str,
+        records: typing.List[typing.Dict],
+        id_field: str,
+        watermark: typing.Optional[datetime.datetime],
+    ) -> None:
+        # Called with the lock held, inside the transaction of the caller
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO resource_snapshots (platform, resource_type, account_id, resource_id, record) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (platform, resource_type, account_id, str(record[id_field]), json_codec.dumps(record))
+                for record in records
+            ],
+        )
+
+        if watermark is not None:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO snapshot_watermarks "
+                "(platform, resource_type, account_id, watermark, synced_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    platform,
+                    resource_type,
+                    account_id,
+                    watermark.isoformat(),
+                    datetime.datetime.utcnow().isoformat(),
+                ),
+            )
+
+    def _delete(self, platform: str, resource_type: str, account_id: str) -> None:
+        # Called with the lock held, inside the transaction of the caller
+        params = (platform, resource_type, account_id)
+        self._connection.execute(
+            "DELETE FROM resource_snapshots WHERE platform = ? AND resource_type = ? AND account_id = ?", params
+        )
+        self._connection.execute(
+            "DELETE FROM snapshot_watermarks WHERE platform = ? AND resource_type = ? AND account_id = ?", params
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "DetailsSnapshotStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
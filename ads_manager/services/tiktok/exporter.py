@@ -1,12 +1,12 @@
 import datetime
-import json
 import logging
 import typing
 from dataclasses import asdict
 
-from ads_manager import enums, exceptions, utils
+from ads_manager import enums, exceptions, json_codec, utils
 from ads_manager.integrations.clients import exceptions as client_exceptions
-from ads_manager.integrations.clients import factory
+from ads_manager.integrations.clients import factory, field_projection
+from ads_manager.services import json_lines
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +26,30 @@ def get_account_ids(user_access_token: str, params: typing.Dict) -> typing.List[
         raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
 
-def get_campaigns_details(user_access_token: str, account_ids: typing.List[str], params: typing.Dict) -> str:
-    campaigns_details = []
+def get_campaigns_details(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    params: typing.Dict,
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    campaigns_details = iter_campaigns_details(
+        user_access_token=user_access_token, account_ids=account_ids, params=params, projection=projection
+    )
+
+    if output is not None:
+        return json_lines.write_records(records=campaigns_details, output=output)
+
+    return json_codec.dumps(list(campaigns_details), pretty=True)
+
+
+def iter_campaigns_details(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    params: typing.Dict,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    campaigns_count = 0
 
     tiktok_integration_client = factory.Factory.create(
         platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
@@ -37,20 +59,44 @@ def get_campaigns_details(user_access_token: str, account_ids: typing.List[str],
 
     for account_id in account_ids:
         try:
-            campaign_details = tiktok_integration_client.get_account_campaigns_details(ad_account_id=account_id)
+            for campaign_details in tiktok_integration_client.iter_account_campaigns_details(
+                ad_account_id=account_id, projection=projection
+            ):
+                campaigns_count += len(campaign_details)
+                yield from [
+                    field_projection.to_record(message=campaign_detail, projection=projection)
+                    for campaign_detail in campaign_details
+                ]
         except client_exceptions.ClientError as e:
             raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
-        campaign_details = [asdict(campaigns_detail) for campaigns_detail in campaign_details]
-        campaigns_details.extend(campaign_details)
+    logger.warning("Fetched {} tiktok campaigns".format(campaigns_count))
+
+
+def get_adgroups_details(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    params: typing.Dict,
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    adgroups_details = iter_adgroups_details(
+        user_access_token=user_access_token, account_ids=account_ids, params=params, projection=projection
+    )
 
-    logger.warning("Fetched {} tiktok campaigns".format(len(campaigns_details)))
+    if output is not None:
+        return json_lines.write_records(records=adgroups_details, output=output)
 
-    return json.dumps(campaigns_details, indent=4)
+    return json_codec.dumps(list(adgroups_details), pretty=True)
 
 
-def get_adgroups_details(user_access_token: str, account_ids: typing.List[str], params: typing.Dict) -> str:
-    adgroups_details = []
+def iter_adgroups_details(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    params: typing.Dict,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    adgroups_count = 0
 
     tiktok_integration_client = factory.Factory.create(
         platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
@@ -60,20 +106,44 @@ def get_adgroups_details(user_access_token: str, account_ids: typing.List[str],
 
     for account_id in account_ids:
         try:
-            adgroup_details = tiktok_integration_client.get_account_adsets_details(ad_account_id=account_id)
+            for adgroup_details in tiktok_integration_client.iter_account_adsets_details(
+                ad_account_id=account_id, projection=projection
+            ):
+                adgroups_count += len(adgroup_details)
+                yield from [
+                    field_projection.to_record(message=adgroup_detail, projection=projection)
+                    for adgroup_detail in adgroup_details
+                ]
         except client_exceptions.ClientError as e:
             raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
-        adgroup_details = [asdict(adgroup_detail) for adgroup_detail in adgroup_details]
-        adgroups_details.extend(adgroup_details)
+    logger.warning("Fetched {} tiktok adgroups".format(adgroups_count))
+
+
+def get_ads_details(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    params: typing.Dict,
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    ads_details = iter_ads_details(
+        user_access_token=user_access_token, account_ids=account_ids, params=params, projection=projection
+    )
 
-    logger.warning("Fetched {} tiktok adgroups".format(len(adgroups_details)))
+    if output is not None:
+        return json_lines.write_records(records=ads_details, output=output)
 
-    return json.dumps(adgroups_details, indent=4)
+    return json_codec.dumps(list(ads_details), pretty=True)
 
 
-def get_ads_details(user_access_token: str, account_ids: typing.List[str], params: typing.Dict) -> str:
-    ads_details = []
+def iter_ads_details(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    params: typing.Dict,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    ads_count = 0
 
     tiktok_integration_client = factory.Factory.create(
         platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
@@ -83,16 +153,17 @@ def get_ads_details(user_access_token: str, account_ids: typing.List[str], param
 
     for account_id in account_ids:
         try:
-            ad_details = tiktok_integration_client.get_account_ads_details(ad_account_id=account_id)
+            for ad_details in tiktok_integration_client.iter_account_ads_details(
+                ad_account_id=account_id, projection=projection
+            ):
+                ads_count += len(ad_details)
+                yield from [
+                    field_projection.to_record(message=ad_detail, projection=projection) for ad_detail in ad_details
+                ]
         except client_exceptions.ClientError as e:
             raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
-        ad_details = [asdict(ad_detail) for ad_detail in ad_details]
-        ads_details.extend(ad_details)
-
-    logger.warning("Fetched {} tiktok ads".format(len(ads_details)))
-
-    return json.dumps(ads_details, indent=4)
+    logger.warning("Fetched {} tiktok ads".format(ads_count))
 
 
 def get_campaign_insights(
@@ -101,30 +172,41 @@ def get_campaign_insights(
     date_from: datetime.datetime,
     date_to: datetime.datetime,
     params: typing.Dict,
-) -> str:
-    campaigns_insights = []
-
-    tiktok_integration_client = factory.Factory.create(
-        platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    campaigns_insights = iter_campaign_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        date_from=date_from,
+        date_to=date_to,
+        params=params,
+        projection=projection,
     )
 
-    logger.warning("Fetched {} tiktok advertiser ids".format(len(account_ids)))
+    if output is not None:
+        return json_lines.write_records(records=campaigns_insights, output=output)
 
-    for account_id in account_ids:
-        try:
-            campaign_insights = tiktok_integration_client.get_insights(
-                ad_account_id=account_id,
-                resource_type=enums.ResourceType.CAMPAIGN,
-                from_datetime=date_from,
-                to_datetime=date_to,
-            )
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+    return json_codec.dumps(list(campaigns_insights), pretty=True)
 
-        campaign_insights = [asdict(campaign_insight) for campaign_insight in campaign_insights]
-        campaigns_insights.extend(campaign_insights)
 
-    return json.dumps(campaigns_insights, indent=4)
+def iter_campaign_insights(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    date_from: datetime.datetime,
+    date_to: datetime.datetime,
+    params: typing.Dict,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    return _iter_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        resource_type=enums.ResourceType.CAMPAIGN,
+        date_from=date_from,
+        date_to=date_to,
+        params=params,
+        projection=projection,
+    )
 
 
 def get_adgroup_insights(
@@ -133,30 +215,41 @@ def get_adgroup_insights(
     date_from: datetime.datetime,
     date_to: datetime.datetime,
     params: typing.Dict,
-) -> str:
-    adgroups_insights = []
-
-    tiktok_integration_client = factory.Factory.create(
-        platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    adgroups_insights = iter_adgroup_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        date_from=date_from,
+        date_to=date_to,
+        params=params,
+        projection=projection,
     )
 
-    logger.warning("Fetched {} tiktok advertiser ids".format(len(account_ids)))
+    if output is not None:
+        return json_lines.write_records(records=adgroups_insights, output=output)
 
-    for account_id in account_ids:
-        try:
-            adgroup_insights = tiktok_integration_client.get_insights(
-                ad_account_id=account_id,
-                resource_type=enums.TiktokResourceType.AD_GROUP,
-                from_datetime=date_from,
-                to_datetime=date_to,
-            )
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+    return json_codec.dumps(list(adgroups_insights), pretty=True)
 
-        adgroup_insights = [asdict(adgroup_insight) for adgroup_insight in adgroup_insights]
-        adgroups_insights.extend(adgroup_insights)
 
-    return json.dumps(adgroups_insights, indent=4)
+def iter_adgroup_insights(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    date_from: datetime.datetime,
+    date_to: datetime.datetime,
+    params: typing.Dict,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    return _iter_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        resource_type=enums.TiktokResourceType.AD_GROUP,
+        date_from=date_from,
+        date_to=date_to,
+        params=params,
+        projection=projection,
+    )
 
 
 def get_ad_insights(
@@ -165,37 +258,49 @@ def get_ad_insights(
     date_from: datetime.datetime,
     date_to: datetime.datetime,
     params: typing.Dict,
-) -> str:
-    ads_insights = []
-
-    tiktok_integration_client = factory.Factory.create(
-        platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
+    output: typing.Optional[typing.TextIO] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    ads_insights = iter_ad_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        date_from=date_from,
+        date_to=date_to,
+        params=params,
+        projection=projection,
     )
 
-    logger.warning("Fetched {} tiktok advertiser ids".format(len(account_ids)))
+    if output is not None:
+        return json_lines.write_records(records=ads_insights, output=output)
 
-    for account_id in account_ids:
-        try:
-            ad_insights = tiktok_integration_client.get_insights(
-                ad_account_id=account_id,
-                resource_type=enums.ResourceType.AD,
-                from_datetime=date_from,
-                to_datetime=date_to,
-            )
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+    return json_codec.dumps(list(ads_insights), pretty=True)
 
-        ad_insights = [asdict(ad_insight) for ad_insight in ad_insights]
-        ads_insights.extend(ad_insights)
 
-    return json.dumps(ads_insights, indent=4)
+def iter_ad_insights(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    date_from: datetime.datetime,
+    date_to: datetime.datetime,
+    params: typing.Dict,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    return _iter_insights(
+        user_access_token=user_access_token,
+        account_ids=account_ids,
+        resource_type=enums.ResourceType.AD,
+        date_from=date_from,
+        date_to=date_to,
+        params=params,
+        projection=projection,
+    )
 
 
 def get_images_details(
     user_access_token: str,
     advertiser_id: str,
     image_ids: typing.List[str],
-) -> str:
+    output: typing.Optional[typing.TextIO] = None,
+) -> typing.Union[str, int]:
     try:
         images_info = factory.Factory.create(
             platform=enums.Platform.TIKTOK, user_access_token=user_access_token
@@ -212,14 +317,18 @@ def get_images_details(
 
     images_info = [asdict(image_info) for image_info in images_info]
 
-    return json.dumps(images_info, indent=4)
+    if output is not None:
+        return json_lines.write_records(records=images_info, output=output)
+
+    return json_codec.dumps(images_info, pretty=True)
 
 
 def get_videos_details(
     user_access_token: str,
     advertiser_id: str,
     video_ids: typing.List[str],
-) -> str:
+    output: typing.Optional[typing.TextIO] = None,
+) -> typing.Union[str, int]:
     try:
         videos_info = factory.Factory.create(
             platform=enums.Platform.TIKTOK, user_access_token=user_access_token
@@ -236,4 +345,39 @@ def get_videos_details(
 
     videos_info = [asdict(video_info) for video_info in videos_info]
 
-    return json.dumps(videos_info, indent=4)
+    if output is not None:
+        return json_lines.write_records(records=videos_info, output=output)
+
+    return json_codec.dumps(videos_info, pretty=True)
+
+
+def _iter_insights(
+    user_access_token: str,
+    account_ids: typing.List[str],
+    resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType],
+    date_from: datetime.datetime,
+    date_to: datetime.datetime,
+    params: typing.Dict,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict]:
+    tiktok_integration_client = factory.Factory.create(
+        platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
+    )
+
+    logger.warning("Fetched {} tiktok advertiser ids".format(len(account_ids)))
+
+    for account_id in account_ids:
+        try:
+            for resources_insights in tiktok_integration_client.iter_insights(
+                ad_account_id=account_id,
+                resource_type=resource_type,
+                from_datetime=date_from,
+                to_datetime=date_to,
+                projection=projection,
+            ):
+                yield from [
+                    field_projection.to_record(message=resource_insights, projection=projection)
+                    for resource_insights in resources_insights
+                ]
+        except client_exceptions.ClientError as e:
+            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
@@ -4,6 +4,10 @@ import typing
 from ads_manager import enums, exceptions, utils
 from ads_manager.integrations.clients import exceptions as client_exceptions
 from ads_manager.integrations.clients import factory
+from ads_manager.integrations.clients.tiktok import (
+    material_cache as tiktok_material_cache,
+)
+from ads_manager.integrations.gateways.tiktok import chunked_upload
 
 logger = logging.getLogger(__name__)
 
@@ -121,11 +125,17 @@ def update_ads_status(
     return updated_ads_status
 
 
-def create_image(user_access_token: str, ad_account_id: str, image_details: typing.Dict, params: typing.Dict) -> str:
+def create_image(
+    user_access_token: str,
+    ad_account_id: str,
+    image_details: typing.Dict,
+    params: typing.Dict,
+    material_cache: typing.Optional[tiktok_material_cache.MaterialCache] = None,
+) -> str:
     try:
         image_id = factory.Factory.create(
             platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
-        ).create_image(ad_account_id=ad_account_id, image_details=image_details)
+        ).create_image(ad_account_id=ad_account_id, image_details=image_details, material_cache=material_cache)
     except client_exceptions.ClientError as e:
         raise exceptions.AdAssetsException(utils.get_exception_message(exception=e))
 
@@ -153,11 +163,17 @@ def update_image_name(
     return image_updated
 
 
-def create_video(user_access_token: str, ad_account_id: str, video_details: typing.Dict, params: typing.Dict) -> str:
+def create_video(
+    user_access_token: str,
+    ad_account_id: str,
+    video_details: typing.Dict,
+    params: typing.Dict,
+    material_cache: typing.Optional[tiktok_material_cache.MaterialCache] = None,
+) -> str:
     try:
         video_id = factory.Factory.create(
             platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
-        ).create_video(ad_account_id=ad_account_id, video_details=video_details)
+        ).create_video(ad_account_id=ad_account_id, video_details=video_details, material_cache=material_cache)
     except client_exceptions.ClientError as e:
         raise exceptions.AdAssetsException(utils.get_exception_message(exception=e))
 
@@ -166,6 +182,33 @@ def create_video(user_access_token: str, ad_account_id: str, video_details: typi
     return video_id
 
 
+def create_video_in_chunks(
+    user_access_token: str,
+    ad_account_id: str,
+    file_path: str,
+    params: typing.Dict,
+    video_details: typing.Optional[typing.Dict] = None,
+    upload_cursor: typing.Optional[chunked_upload.ChunkedUploadCursor] = None,
+    material_cache: typing.Optional[tiktok_material_cache.MaterialCache] = None,
+) -> str:
+    try:
+        video_id = factory.Factory.create(
+            platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
+        ).create_video_in_chunks(
+            ad_account_id=ad_account_id,
+            file_path=file_path,
+            video_details=video_details,
+            upload_cursor=upload_cursor,
+            material_cache=material_cache,
+        )
+    except client_exceptions.ClientError as e:
+        raise exceptions.AdAssetsException(utils.get_exception_message(exception=e))
+
+    logger.warning("Created video in chunks (id={})".format(video_id))
+
+    return video_id
+
+
 def update_video_name(
     user_access_token: str, ad_account_id: str, video_id: str, video_name: str, params: typing.Dict
 ) -> bool:
@@ -0,0 +1,117 @@
+import concurrent.futures
+import dataclasses
+import logging
+import typing
+
+from ads_manager import enums, utils
+from ads_manager.integrations.clients import exceptions as client_exceptions
+from ads_manager.integrations.clients import factory, messages
+from ads_manager.integrations.clients.tiktok import constants as tiktok_client_constants
+from ads_manager.integrations.clients.tiktok import enums as tiktok_client_enums
+from ads_manager.services.unified import constants as unified_constants
+
+logger = logging.getLogger(__name__)
+
+_MAX_IDS = {
+    tiktok_client_enums.MaterialType.IMAGE: tiktok_client_constants.TIKTOK_IMAGE_INFO_MAX_IDS,
+    tiktok_client_enums.MaterialType.VIDEO: tiktok_client_constants.TIKTOK_VIDEO_INFO_MAX_IDS,
+}
+
+
+@dataclasses.dataclass
+class MaterialsInfoReport(object):
+    material_type: tiktok_client_enums.MaterialType
+    details: typing.List[typing.Union[messages.ImageDetails, messages.VideoDetails]]
+    missing_ids: typing.Dict[str, typing.List[str]]  # By advertiser id, ids TikTok returned no details for
+    failed_ids: typing.Dict[str, typing.List[str]]  # By advertiser id, ids of the requests that failed
+    errors: typing.Dict[str, typing.List[str]]  # By advertiser id, errors of the failed requests
+
+
+def get_materials_info(
+    user_access_token: str,
+    material_type: tiktok_client_enums.MaterialType,
+    material_ids: typing.Dict[str, typing.List[str]],
+    params: typing.Optional[typing.Dict] = None,
+    max_workers: typing.Optional[int] = None,
+) -> MaterialsInfoReport:
+    """
+    Image or video details of many advertisers' libraries. `material_ids` maps advertiser ids to the image or video
+    ids to fetch, which are split into requests of the most ids TikTok accepts. The requests of all advertisers
+    run on one bounded worker pool, paced by the gateway rate limiter.
+
+    A failed request only fails its own ids, which are reported in `failed_ids` with the error, and ids TikTok
+    returned nothing for are reported in `missing_ids`. Details keep the order of `material_ids`.
+    """
+    integration_client = factory.Factory.create(
+        platform=enums.Platform.TIKTOK, user_access_token=user_access_token, params=params
+    )
+    get_info = (
+        integration_client.get_images_info
+        if material_type == tiktok_client_enums.MaterialType.IMAGE
+        else integration_client.get_videos_info
+    )
+
+    chunks = [
+        (advertiser_id, unique_ids[index : index + _MAX_IDS[material_type]])
+        for advertiser_id, ids in material_ids.items()
+        for unique_ids in [list(dict.fromkeys(ids))]
+        for index in range(0, len(unique_ids), _MAX_IDS[material_type])
+    ]
+
+    def _fetch_chunk(
+        chunk: typing.Tuple[str, typing.List[str]]
+    ) -> typing.Tuple[typing.List[typing.Union[messages.ImageDetails, messages.VideoDetails]], typing.Optional[str]]:
+        advertiser_id, ids = chunk
+        try:
+            return get_info(ad_account_id=advertiser_id, **{_get_ids_argument(material_type=material_type): ids}), None
+        except client_exceptions.ClientError as e:
+            error = utils.get_exception_message(exception=e)
+            logger.warning(
+                "Unable to get {} info (advertiser_id={}, ids={}). Error: {}".format(
+                    material_type.value, advertiser_id, ids, error
+                )
+            )
+            return [], error
+
+    workers = max_workers if max_workers else unified_constants.EXPORT_MAX_WORKERS[enums.Platform.TIKTOK]
+    if workers <= 1 or len(chunks) <= 1:
+        chunk_results = [_fetch_chunk(chunk=chunk) for chunk in chunks]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            chunk_results = list(executor.map(_fetch_chunk, chunks))
+
+    report = MaterialsInfoReport(material_type=material_type, details=[], missing_ids={}, failed_ids={}, errors={})
+    for (advertiser_id, ids), (details, error) in zip(chunks, chunk_results):
+        if error is not None:
+            report.failed_ids.setdefault(advertiser_id, []).extend(ids)
+            report.errors.setdefault(advertiser_id, []).append(error)
+            continue
+
+        report.details.extend(details)
+        found_ids = {_get_material_id(material_type=material_type, details=detail) for detail in details}
+        missing_ids = [material_id for material_id in ids if material_id not in found_ids]
+        if missing_ids:
+            report.missing_ids.setdefault(advertiser_id, []).extend(missing_ids)
+
+    logger.warning(
+        "Got info for {} {}s of {} advertisers (missing={}, failed={})".format(
+            len(report.details),
+            material_type.value,
+            len(material_ids),
+            sum(len(ids) for ids in report.missing_ids.values()),
+            sum(len(ids) for ids in report.failed_ids.values()),
+        )
+    )
+
+    return report
+
+
+def _get_ids_argument(material_type: tiktok_client_enums.MaterialType) -> str:
+    return "image_ids" if material_type == tiktok_client_enums.MaterialType.IMAGE else "video_ids"
+
+
+def _get_material_id(
+    material_type: tiktok_client_enums.MaterialType,
+    details: typing.Union[messages.ImageDetails, messages.VideoDetails],
+) -> str:
+    return details.image_id if material_type == tiktok_client_enums.MaterialType.IMAGE else details.video_id
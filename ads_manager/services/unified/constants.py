@@ -0,0 +1,33 @@
+import datetime
+
+from ads_manager import enums
+from ads_manager.integrations.clients.facebook import (
+    constants as facebook_client_constants,
+)
+from ads_manager.integrations.clients.tiktok import constants as tiktok_client_constants
+
+# Default number of accounts exported concurrently per platform. Accounts are exported one after another unless
+# callers opt in to concurrency through `max_workers`.
+EXPORT_MAX_WORKERS = {
+    enums.Platform.FACEBOOK: 1,
+    enums.Platform.TIKTOK: 1,
+}
+
+# Overlap of incremental detail syncs with the previous one, covering resources whose `updated_time` was written
+# out of order or while the previous sync was paging.
+DETAILS_SYNC_LOOKBACK = datetime.timedelta(minutes=5)
+
+RESOURCE_DETAILS_ID_FIELDS = {
+    enums.ResourceType.CAMPAIGN: "campaign_id",
+    enums.ResourceType.AD_SET: "adset_id",
+    enums.ResourceType.AD: "ad_id",
+}
+
+# Insights syncs: days after which the providers stop restating a day (attribution windows), minimal time between
+# two fetches of a day still inside that horizon, and the longest date range requested with one report.
+INSIGHTS_RESTATEMENT_HORIZON = datetime.timedelta(days=28)
+INSIGHTS_REFRESH_INTERVAL = datetime.timedelta(hours=12)
+INSIGHTS_MAX_WINDOW_DAYS = {
+    enums.Platform.FACEBOOK: facebook_client_constants.FACEBOOK_INSIGHTS_MAX_WINDOW_DAYS,
+    enums.Platform.TIKTOK: tiktok_client_constants.TIKTOK_INSIGHTS_MAX_WINDOW_DAYS,
+}
@@ -1,12 +1,17 @@
 import datetime
-import json
 import logging
 import typing
 from dataclasses import asdict
 
-from ads_manager import enums, exceptions, utils
+from ads_manager import enums, exceptions, json_codec, utils
 from ads_manager.integrations.clients import exceptions as client_exceptions
-from ads_manager.integrations.clients import factory
+from ads_manager.integrations.clients import factory, field_projection
+from ads_manager.integrations.gateways import pagination
+from ads_manager.services import account_runner
+from ads_manager.services import checkpoint as export_checkpoint
+from ads_manager.services import insights_ledger, json_lines
+from ads_manager.services import snapshot as details_snapshot
+from ads_manager.services.unified import constants as unified_constants
 
 logger = logging.getLogger(__name__)
 
@@ -28,72 +33,211 @@ def get_account_ids(user_access_token: str, platform: enums.Platform, params: ty
 
 
 def get_campaigns_details(
-    user_access_token: str, platform: enums.Platform, account_ids: typing.List[str], params: typing.Dict = None
-) -> str:
-    campaigns_details = []
-
+    user_access_token: str,
+    platform: enums.Platform,
+    account_ids: typing.List[str],
+    params: typing.Dict = None,
+    max_workers: typing.Optional[int] = None,
+    output: typing.Optional[typing.TextIO] = None,
+    checkpoint_store: typing.Optional[export_checkpoint.CheckpointStore] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    _validate_checkpoint_store(checkpoint_store=checkpoint_store, output=output)
     integration_client = factory.Factory.create(platform=platform, user_access_token=user_access_token, params=params)
 
     logger.warning("Fetched {} {} ad account ids".format(len(account_ids), platform.value))
 
-    for account_id in account_ids:
-        try:
-            campaign_details = integration_client.get_account_campaigns_details(ad_account_id=account_id)
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
-
-        campaign_details = [asdict(campaigns_detail) for campaigns_detail in campaign_details]
-        campaigns_details.extend(campaign_details)
+    if output is not None:
+        return _stream_per_account(
+            platform=platform,
+            account_ids=account_ids,
+            iter_pages=lambda account_id, cursor: integration_client.iter_account_campaigns_details(
+                ad_account_id=account_id, cursor=cursor, projection=projection
+            ),
+            output=output,
+            max_workers=max_workers,
+            checkpoint_store=checkpoint_store,
+            projection=projection,
+            export_key=export_checkpoint.get_export_key(platform=platform.value, export_name="campaigns_details"),
+        )
+
+    campaigns_details = _export_per_account(
+        platform=platform,
+        account_ids=account_ids,
+        fetch=lambda account_id: [
+            field_projection.to_record(message=campaign_details, projection=projection)
+            for campaign_details in integration_client.get_account_campaigns_details(
+                ad_account_id=account_id, projection=projection
+            )
+        ],
+        max_workers=max_workers,
+    )
 
     logger.warning("Fetched {} {} campaigns".format(len(campaigns_details), platform.value))
 
-    return json.dumps(campaigns_details, indent=4)
+    return json_codec.dumps(campaigns_details, pretty=True)
 
 
 def get_adsets_details(
-    user_access_token: str, platform: enums.Platform, account_ids: typing.List[str], params: typing.Dict = None
-) -> str:
-    adsets_details = []
-
+    user_access_token: str,
+    platform: enums.Platform,
+    account_ids: typing.List[str],
+    params: typing.Dict = None,
+    max_workers: typing.Optional[int] = None,
+    output: typing.Optional[typing.TextIO] = None,
+    checkpoint_store: typing.Optional[export_checkpoint.CheckpointStore] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    _validate_checkpoint_store(checkpoint_store=checkpoint_store, output=output)
     integration_client = factory.Factory.create(platform=platform, user_access_token=user_access_token, params=params)
 
     logger.warning("Fetched {} {} ad account ids".format(len(account_ids), platform.value))
 
-    for account_id in account_ids:
-        try:
-            adset_details = integration_client.get_account_adsets_details(ad_account_id=account_id)
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
-
-        adset_details = [asdict(adset_detail) for adset_detail in adset_details]
-        adsets_details.extend(adset_details)
+    if output is not None:
+        return _stream_per_account(
+            platform=platform,
+            account_ids=account_ids,
+            iter_pages=lambda account_id, cursor: integration_client.iter_account_adsets_details(
+                ad_account_id=account_id, cursor=cursor, projection=projection
+            ),
+            output=output,
+            max_workers=max_workers,
+            checkpoint_store=checkpoint_store,
+            projection=projection,
+            export_key=export_checkpoint.get_export_key(platform=platform.value, export_name="adsets_details"),
+        )
+
+    adsets_details = _export_per_account(
+        platform=platform,
+        account_ids=account_ids,
+        fetch=lambda account_id: [
+            field_projection.to_record(message=adset_details, projection=projection)
+            for adset_details in integration_client.get_account_adsets_details(
+                ad_account_id=account_id, projection=projection
+            )
+        ],
+        max_workers=max_workers,
+    )
 
     logger.warning("Fetched {} {} adsets".format(len(adsets_details), platform.value))
 
-    return json.dumps(adsets_details, indent=4)
+    return json_codec.dumps(adsets_details, pretty=True)
 
 
 def get_ads_details(
-    user_access_token: str, platform: enums.Platform, account_ids: typing.List[str], params: typing.Dict = None
-) -> str:
-    ads_details = []
-
+    user_access_token: str,
+    platform: enums.Platform,
+    account_ids: typing.List[str],
+    params: typing.Dict = None,
+    max_workers: typing.Optional[int] = None,
+    output: typing.Optional[typing.TextIO] = None,
+    checkpoint_store: typing.Optional[export_checkpoint.CheckpointStore] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    _validate_checkpoint_store(checkpoint_store=checkpoint_store, output=output)
     integration_client = factory.Factory.create(platform=platform, user_access_token=user_access_token, params=params)
 
     logger.warning("Fetched {} {} ad account ids".format(len(account_ids), platform.value))
 
-    for account_id in account_ids:
-        try:
-            ad_details = integration_client.get_account_ads_details(ad_account_id=account_id)
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+    if output is not None:
+        return _stream_per_account(
+            platform=platform,
+            account_ids=account_ids,
+            iter_pages=lambda account_id, cursor: integration_client.iter_account_ads_details(
+                ad_account_id=account_id, cursor=cursor, projection=projection
+            ),
+            output=output,
+            max_workers=max_workers,
+            checkpoint_store=checkpoint_store,
+            projection=projection,
+            export_key=export_checkpoint.get_export_key(platform=platform.value, export_name="ads_details"),
+        )
+
+    ads_details = _export_per_account(
+        platform=platform,
+        account_ids=account_ids,
+        fetch=lambda account_id: [
+            field_projection.to_record(message=ad_details, projection=projection)
+            for ad_details in integration_client.get_account_ads_details(
+                ad_account_id=account_id, projection=projection
+            )
+        ],
+        max_workers=max_workers,
+    )
+
+    logger.warning("Fetched {} {} ads".format(len(ads_details), platform.value))
+
+    return json_codec.dumps(ads_details, pretty=True)
+
 
-        ad_details = [asdict(ad_detail) for ad_detail in ad_details]
-        ads_details.extend(ad_details)
+def sync_resource_details(
+    user_access_token: str,
+    platform: enums.Platform,
+    account_ids: typing.List[str],
+    resource_type: enums.ResourceType,
+    snapshot_store: details_snapshot.DetailsSnapshotStore,
+    params: typing.Dict = None,
+    max_workers: typing.Optional[int] = None,
+    full_sync: bool = False,
+) -> str:
+    """
+    Incremental variant of the `get_*_details` exports. Per account, only the resources updated after the
+    snapshot watermark (minus `DETAILS_SYNC_LOOKBACK`) are fetched and merged into `snapshot_store`, and the
+    merged records are returned. Accounts without a watermark, or all of them with `full_sync`, are fetched in
+    full. The complete details are read with `snapshot_store.get_records`.
+
+    Deleted resources are not listed by the providers, a periodic `full_sync` refreshes them in the snapshot.
+    """
+    if resource_type not in unified_constants.RESOURCE_DETAILS_ID_FIELDS:
+        raise exceptions.ImporterException(
+            "Incremental sync is not supported for resource type (resource_type={})".format(resource_type.value)
+        )
 
-    logger.warning("Fetched {} {} adsets".format(len(ads_details), platform.value))
+    integration_client = factory.Factory.create(platform=platform, user_access_token=user_access_token, params=params)
+    iter_details = {
+        enums.ResourceType.CAMPAIGN: integration_client.iter_account_campaigns_details,
+        enums.ResourceType.AD_SET: integration_client.iter_account_adsets_details,
+        enums.ResourceType.AD: integration_client.iter_account_ads_details,
+    }[resource_type]
+
+    def _sync_account(account_id: str) -> typing.List[typing.Dict]:
+        watermark = (
+            None
+            if full_sync
+            else snapshot_store.get_watermark(
+                platform=platform.value, resource_type=resource_type.value, account_id=account_id
+            )
+        )
+        updated_since = watermark - unified_constants.DETAILS_SYNC_LOOKBACK if watermark else None
+
+        details = [
+            detail for page in iter_details(ad_account_id=account_id, updated_since=updated_since) for detail in page
+        ]
+        updated_times = [utils.parse_updated_time(detail.updated_time) for detail in details]
+        # The snapshot of a full sync is replaced only once every resource was fetched, a failed fetch keeps it
+        write_snapshot = snapshot_store.replace if full_sync else snapshot_store.merge
+        write_snapshot(
+            platform=platform.value,
+            resource_type=resource_type.value,
+            account_id=account_id,
+            records=[asdict(detail) for detail in details],
+            id_field=unified_constants.RESOURCE_DETAILS_ID_FIELDS[resource_type],
+            watermark=max([updated_time for updated_time in updated_times if updated_time], default=None),
+        )
+
+        logger.warning(
+            "Synced {} updated {} {} (account_id={}, updated_since={})".format(
+                len(details), platform.value, resource_type.value, account_id, updated_since
+            )
+        )
 
-    return json.dumps(ads_details, indent=4)
+        return [asdict(detail) for detail in details]
+
+    synced_details = _export_per_account(
+        platform=platform, account_ids=account_ids, fetch=_sync_account, max_workers=max_workers
+    )
+
+    return json_codec.dumps(synced_details, pretty=True)
 
 
 def get_insights_by_resource_type(
@@ -104,28 +248,33 @@ def get_insights_by_resource_type(
     date_from: typing.Optional[datetime.datetime],
     date_to: typing.Optional[datetime.datetime],
     params: typing.Dict = None,
-) -> str:
-    resources_performance = []
-
+    max_workers: typing.Optional[int] = None,
+    output: typing.Optional[typing.TextIO] = None,
+    checkpoint_store: typing.Optional[export_checkpoint.CheckpointStore] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    _validate_checkpoint_store(checkpoint_store=checkpoint_store, output=output)
     integration_client = factory.Factory.create(platform=platform, user_access_token=user_access_token, params=params)
 
     logger.warning("Fetched {} {} ad account ids".format(len(account_ids), platform.value))
 
-    for account_id in account_ids:
-        try:
-            resource_performances = integration_client.get_insights(
-                ad_account_id=account_id,
-                resource_type=resource_type,
-                from_datetime=date_from,
-                to_datetime=date_to,
-            )
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+    resources_performance = _export_insights_per_account(
+        integration_client=integration_client,
+        platform=platform,
+        account_ids=account_ids,
+        resource_type=resource_type,
+        date_from=date_from,
+        date_to=date_to,
+        max_workers=max_workers,
+        output=output,
+        checkpoint_store=checkpoint_store,
+        projection=projection,
+    )
 
-        resource_performances = [asdict(resource_performance) for resource_performance in resource_performances]
-        resources_performance.extend(resource_performances)
+    if output is not None:
+        return resources_performance
 
-    return json.dumps(resources_performance, indent=4)
+    return json_codec.dumps(resources_performance, pretty=True)
 
 
 def get_campaign_insights(
@@ -135,28 +284,33 @@ def get_campaign_insights(
     date_from: typing.Optional[datetime.datetime],
     date_to: typing.Optional[datetime.datetime],
     params: typing.Dict = None,
-) -> str:
-    campaigns_performance = []
-
+    max_workers: typing.Optional[int] = None,
+    output: typing.Optional[typing.TextIO] = None,
+    checkpoint_store: typing.Optional[export_checkpoint.CheckpointStore] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    _validate_checkpoint_store(checkpoint_store=checkpoint_store, output=output)
     integration_client = factory.Factory.create(platform=platform, user_access_token=user_access_token, params=params)
 
     logger.warning("Fetched {} {} ad account ids".format(len(account_ids), platform.value))
 
-    for account_id in account_ids:
-        try:
-            campaign_performances = integration_client.get_insights(
-                ad_account_id=account_id,
-                resource_type=enums.ResourceType.CAMPAIGN,
-                from_datetime=date_from,
-                to_datetime=date_to,
-            )
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+    campaigns_performance = _export_insights_per_account(
+        integration_client=integration_client,
+        platform=platform,
+        account_ids=account_ids,
+        resource_type=enums.ResourceType.CAMPAIGN,
+        date_from=date_from,
+        date_to=date_to,
+        max_workers=max_workers,
+        output=output,
+        checkpoint_store=checkpoint_store,
+        projection=projection,
+    )
 
-        campaign_performances = [asdict(campaign_performance) for campaign_performance in campaign_performances]
-        campaigns_performance.extend(campaign_performances)
+    if output is not None:
+        return campaigns_performance
 
-    return json.dumps(campaigns_performance, indent=4)
+    return json_codec.dumps(campaigns_performance, pretty=True)
 
 
 def get_adset_insights(
@@ -166,30 +320,35 @@ def get_adset_insights(
     date_from: typing.Optional[datetime.datetime],
     date_to: typing.Optional[datetime.datetime],
     params: typing.Dict = None,
-) -> str:
-    adsets_performance = []
-
+    max_workers: typing.Optional[int] = None,
+    output: typing.Optional[typing.TextIO] = None,
+    checkpoint_store: typing.Optional[export_checkpoint.CheckpointStore] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    _validate_checkpoint_store(checkpoint_store=checkpoint_store, output=output)
     integration_client = factory.Factory.create(platform=platform, user_access_token=user_access_token, params=params)
 
     logger.warning("Fetched {} {} ad account ids".format(len(account_ids), platform.value))
 
-    for account_id in account_ids:
-        try:
-            adset_performances = integration_client.get_insights(
-                ad_account_id=account_id,
-                resource_type=enums.ResourceType.AD_SET
-                if platform == enums.Platform.FACEBOOK
-                else enums.TiktokResourceType.AD_GROUP,
-                from_datetime=date_from,
-                to_datetime=date_to,
-            )
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+    adsets_performance = _export_insights_per_account(
+        integration_client=integration_client,
+        platform=platform,
+        account_ids=account_ids,
+        resource_type=enums.ResourceType.AD_SET
+        if platform == enums.Platform.FACEBOOK
+        else enums.TiktokResourceType.AD_GROUP,
+        date_from=date_from,
+        date_to=date_to,
+        max_workers=max_workers,
+        output=output,
+        checkpoint_store=checkpoint_store,
+        projection=projection,
+    )
 
-        adset_performances = [asdict(adset_performance) for adset_performance in adset_performances]
-        adsets_performance.extend(adset_performances)
+    if output is not None:
+        return adsets_performance
 
-    return json.dumps(adsets_performance, indent=4)
+    return json_codec.dumps(adsets_performance, pretty=True)
 
 
 def get_ad_insights(
@@ -199,25 +358,301 @@ def get_ad_insights(
     date_from: typing.Optional[datetime.datetime],
     date_to: typing.Optional[datetime.datetime],
     params: typing.Dict = None,
-) -> str:
-    ads_performance = []
-
+    max_workers: typing.Optional[int] = None,
+    output: typing.Optional[typing.TextIO] = None,
+    checkpoint_store: typing.Optional[export_checkpoint.CheckpointStore] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[str, int]:
+    _validate_checkpoint_store(checkpoint_store=checkpoint_store, output=output)
     integration_client = factory.Factory.create(platform=platform, user_access_token=user_access_token, params=params)
 
     logger.warning("Fetched {} {} ad account ids".format(len(account_ids), platform.value))
 
-    for account_id in account_ids:
-        try:
-            ad_performances = integration_client.get_insights(
+    ads_performance = _export_insights_per_account(
+        integration_client=integration_client,
+        platform=platform,
+        account_ids=account_ids,
+        resource_type=enums.ResourceType.AD,
+        date_from=date_from,
+        date_to=date_to,
+        max_workers=max_workers,
+        output=output,
+        checkpoint_store=checkpoint_store,
+        projection=projection,
+    )
+
+    if output is not None:
+        return ads_performance
+
+    return json_codec.dumps(ads_performance, pretty=True)
+
+
+def sync_insights(
+    user_access_token: str,
+    platform: enums.Platform,
+    account_ids: typing.List[str],
+    resource_type: enums.ResourceType,
+    date_from: datetime.datetime,
+    date_to: datetime.datetime,
+    ledger: insights_ledger.InsightsLedger,
+    params: typing.Dict = None,
+    max_workers: typing.Optional[int] = None,
+    restatement_horizon: typing.Optional[datetime.timedelta] = None,
+    refresh_interval: typing.Optional[datetime.timedelta] = None,
+    output: typing.Optional[typing.TextIO] = None,
+) -> typing.Union[str, int]:
+    """
+    Ledger backed variant of `get_insights_by_resource_type`. Only the days of `date_from`-`date_to` missing from
+    `ledger`, or still inside the restatement horizon and not refreshed for `refresh_interval`, are fetched, with
+    one report per run of consecutive days. Windows are recorded in the ledger once their records were handed
+    over: when streaming to `output`, every window as soon as its pages are written, so a failed sync resumes with
+    the windows left; otherwise only once every window of the account was fetched, as the records of a failed
+    account are dropped.
+    """
+    integration_client = factory.Factory.create(platform=platform, user_access_token=user_access_token, params=params)
+
+    def _mark_fetched(account_id: str, window: insights_ledger.InsightsWindow, fetched_at: datetime.datetime) -> None:
+        ledger.mark_fetched(
+            platform=platform.value,
+            account_id=account_id,
+            resource_type=resource_type.value,
+            window=window,
+            fetched_at=fetched_at,
+        )
+
+    def _iter_account_pages(
+        account_id: str,
+        on_window_fetched: typing.Callable[[insights_ledger.InsightsWindow, datetime.datetime], None],
+    ) -> typing.Iterator[typing.List[typing.Any]]:
+        windows = insights_ledger.plan_insights_windows(
+            fetched_at=ledger.get_fetched_at(
+                platform=platform.value,
+                account_id=account_id,
+                resource_type=resource_type.value,
+                date_from=date_from.date(),
+                date_to=date_to.date(),
+            ),
+            date_from=date_from.date(),
+            date_to=date_to.date(),
+            now=datetime.datetime.utcnow(),
+            restatement_horizon=(
+                restatement_horizon if restatement_horizon else unified_constants.INSIGHTS_RESTATEMENT_HORIZON
+            ),
+            refresh_interval=refresh_interval if refresh_interval else unified_constants.INSIGHTS_REFRESH_INTERVAL,
+            max_window_days=unified_constants.INSIGHTS_MAX_WINDOW_DAYS[platform],
+        )
+
+        logger.warning(
+            "Planned {} {} {} insights windows (account_id={}, days={})".format(
+                len(windows), platform.value, resource_type.value, account_id, sum(window.days for window in windows)
+            )
+        )
+
+        for window in windows:
+            fetched_at = datetime.datetime.utcnow()
+            yield from integration_client.iter_insights(
+                ad_account_id=account_id,
+                resource_type=resource_type,
+                from_datetime=datetime.datetime.combine(window.date_from, datetime.time()),
+                to_datetime=datetime.datetime.combine(window.date_to, datetime.time()),
+            )
+            # Resumed only once the last page of the window was handled by the caller
+            on_window_fetched(window, fetched_at)
+
+    def _fetch_account(account_id: str) -> typing.List[typing.Dict]:
+        fetched_windows = []
+        resources_performance = [
+            asdict(resource_performance)
+            for page in _iter_account_pages(
+                account_id=account_id,
+                on_window_fetched=lambda window, fetched_at: fetched_windows.append((window, fetched_at)),
+            )
+            for resource_performance in page
+        ]
+        for window, fetched_at in fetched_windows:
+            _mark_fetched(account_id=account_id, window=window, fetched_at=fetched_at)
+
+        return resources_performance
+
+    if output is not None:
+        return _stream_per_account(
+            platform=platform,
+            account_ids=account_ids,
+            iter_pages=lambda account_id, cursor: _iter_account_pages(
+                account_id=account_id,
+                on_window_fetched=lambda window, fetched_at: _mark_fetched(
+                    account_id=account_id, window=window, fetched_at=fetched_at
+                ),
+            ),
+            output=output,
+            max_workers=max_workers,
+        )
+
+    resources_performance = _export_per_account(
+        platform=platform,
+        account_ids=account_ids,
+        fetch=_fetch_account,
+        max_workers=max_workers,
+    )
+
+    return json_codec.dumps(resources_performance, pretty=True)
+
+
+def _export_insights_per_account(
+    integration_client: typing.Any,
+    platform: enums.Platform,
+    account_ids: typing.List[str],
+    resource_type: typing.Union[enums.ResourceType, enums.TiktokResourceType],
+    date_from: typing.Optional[datetime.datetime],
+    date_to: typing.Optional[datetime.datetime],
+    max_workers: typing.Optional[int],
+    output: typing.Optional[typing.TextIO] = None,
+    checkpoint_store: typing.Optional[export_checkpoint.CheckpointStore] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> typing.Union[typing.List[typing.Dict], int]:
+    if output is not None:
+        return _stream_per_account(
+            platform=platform,
+            account_ids=account_ids,
+            iter_pages=lambda account_id, cursor: integration_client.iter_insights(
+                ad_account_id=account_id,
+                resource_type=resource_type,
+                from_datetime=date_from,
+                to_datetime=date_to,
+                cursor=cursor,
+                projection=projection,
+            ),
+            output=output,
+            max_workers=max_workers,
+            checkpoint_store=checkpoint_store,
+            projection=projection,
+            export_key=export_checkpoint.get_export_key(
+                platform=platform.value,
+                export_name="{}_insights".format(resource_type.value),
+                date_from=date_from,
+                date_to=date_to,
+            ),
+        )
+
+    return _export_per_account(
+        platform=platform,
+        account_ids=account_ids,
+        fetch=lambda account_id: [
+            field_projection.to_record(message=resource_performance, projection=projection)
+            for resource_performance in integration_client.get_insights(
                 ad_account_id=account_id,
-                resource_type=enums.ResourceType.AD,
+                resource_type=resource_type,
                 from_datetime=date_from,
                 to_datetime=date_to,
+                projection=projection,
             )
-        except client_exceptions.ClientError as e:
-            raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+        ],
+        max_workers=max_workers,
+    )
+
+
+def _validate_checkpoint_store(
+    checkpoint_store: typing.Optional[export_checkpoint.CheckpointStore], output: typing.Optional[typing.TextIO]
+) -> None:
+    # Only streamed records survive a failed run, the JSON string of the in-memory export is never returned.
+    if checkpoint_store is not None and output is None:
+        raise exceptions.ImporterException("Checkpointed exports require an `output` to stream the records to")
 
-        ad_performances = [asdict(ad_performance) for ad_performance in ad_performances]
-        ads_performance.extend(ad_performances)
 
-    return json.dumps(ads_performance, indent=4)
+def _export_per_account(
+    platform: enums.Platform,
+    account_ids: typing.List[str],
+    fetch: typing.Callable[[str], typing.List[typing.Dict]],
+    max_workers: typing.Optional[int],
+) -> typing.List[typing.Dict]:
+    account_results = account_runner.run_per_account(
+        fetch=fetch,
+        account_ids=account_ids,
+        max_workers=max_workers if max_workers else unified_constants.EXPORT_MAX_WORKERS[platform],
+    )
+
+    exported_data = [entry for account_result in account_results for entry in account_result.data]
+    failed_accounts = {
+        account_result.account_id: account_result.error for account_result in account_results if account_result.error
+    }
+    if failed_accounts:
+        raise exceptions.PartialExportException(
+            message="Export failed for {} of {} {} accounts (failed_accounts={})".format(
+                len(failed_accounts), len(account_ids), platform.value, failed_accounts
+            ),
+            data=json_codec.dumps(exported_data, pretty=True),
+            failed_accounts=failed_accounts,
+        )
+
+    return exported_data
+
+
+def _stream_per_account(
+    platform: enums.Platform,
+    account_ids: typing.List[str],
+    iter_pages: typing.Callable[[str, pagination.PageCursor], typing.Iterator[typing.List[typing.Any]]],
+    output: typing.TextIO,
+    max_workers: typing.Optional[int],
+    checkpoint_store: typing.Optional[export_checkpoint.CheckpointStore] = None,
+    export_key: typing.Optional[str] = None,
+    projection: typing.Optional[typing.List[str]] = None,
+) -> int:
+    """
+    JSON Lines variant of `_export_per_account`. Every worker writes its pages to `output` as soon as they are
+    parsed, so memory stays bounded by one page per worker. Records of one account keep their order, records of
+    different accounts may interleave.
+
+    With a `checkpoint_store`, accounts finished by a previous run are skipped and unfinished ones continue from
+    the last page written, so `output` is expected to be opened for appending to the output of that run.
+
+    With a `projection`, only the key fields and the projected fields of every record are written.
+    """
+    writer = json_lines.JsonLinesWriter(output=output)
+
+    if checkpoint_store is not None:
+        finished_accounts = checkpoint_store.get_finished_accounts(export_key=export_key)
+        if finished_accounts:
+            logger.warning(
+                "Skipping {} {} accounts finished by a previous run (export_key={})".format(
+                    len(finished_accounts), platform.value, export_key
+                )
+            )
+        account_ids = [account_id for account_id in account_ids if account_id not in finished_accounts]
+
+    def _write_account(account_id: str) -> typing.List[typing.Dict]:
+        cursor = (
+            checkpoint_store.get_cursor(export_key=export_key, account_id=account_id)
+            if checkpoint_store is not None
+            else pagination.PageCursor()
+        )
+        for page in iter_pages(account_id, cursor):
+            writer.write(records=[field_projection.to_record(message=entry, projection=projection) for entry in page])
+            if checkpoint_store is not None:
+                checkpoint_store.save_cursor(export_key=export_key, account_id=account_id, cursor=cursor)
+
+        if checkpoint_store is not None:
+            checkpoint_store.mark_finished(export_key=export_key, account_id=account_id)
+
+        return []
+
+    account_results = account_runner.run_per_account(
+        fetch=_write_account,
+        account_ids=account_ids,
+        max_workers=max_workers if max_workers else unified_constants.EXPORT_MAX_WORKERS[platform],
+    )
+
+    logger.warning("Exported {} {} records".format(writer.records_written, platform.value))
+
+    failed_accounts = {
+        account_result.account_id: account_result.error for account_result in account_results if account_result.error
+    }
+    if failed_accounts:
+        raise exceptions.PartialExportException(
+            message="Export failed for {} of {} {} accounts (failed_accounts={})".format(
+                len(failed_accounts), len(account_ids), platform.value, failed_accounts
+            ),
+            data=None,
+            failed_accounts=failed_accounts,
+        )
+
+    return writer.records_written
@@ -1,8 +1,11 @@
 import datetime
+import os
 import typing
 
-from ads_manager import enums, exceptions, utils
+from ads_manager import columnar, enums, exceptions, utils
+from ads_manager.integrations.clients.s3 import assets as s3_assets
 from ads_manager.integrations.clients.s3 import client as s3_client
+from ads_manager.integrations.clients.s3 import constants as s3_client_constants
 from ads_manager.integrations.clients.s3 import exceptions as s3_client_exceptions
 
 
@@ -21,14 +24,46 @@ def upload_resource_details(
     return uploaded_path
 
 
+def upload_resource_details_records(
+    s3_path: str,
+    records: typing.Iterable[typing.Dict],
+    resource_type: enums.ResourceType,
+    part_size: int = s3_client_constants.MULTIPART_DEFAULT_PART_SIZE,
+    max_concurrency: int = s3_client_constants.MULTIPART_DEFAULT_MAX_CONCURRENCY,
+    endpoint_url: typing.Optional[str] = None,
+) -> str:
+    try:
+        uploaded_path = s3_client.S3Uploader(
+            s3_path=s3_path, endpoint_url=endpoint_url
+        ).upload_resource_details_records(
+            records=records,
+            resource_type=resource_type,
+            date_created=datetime.datetime.utcnow(),
+            part_size=part_size,
+            max_concurrency=max_concurrency,
+        )
+    except s3_client_exceptions.S3UploaderError as e:
+        raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+
+    return uploaded_path
+
+
 def upload_resource_insights(
-    s3_path: str, resources_insights: typing.List[typing.Dict], resource_type: enums.ResourceType
+    s3_path: str,
+    resources_insights: typing.List[typing.Dict],
+    resource_type: enums.ResourceType,
+    batched: bool = False,
+    rows_per_object: typing.Optional[int] = None,
+    max_workers: int = s3_client_constants.UPLOAD_MAX_WORKERS,
 ) -> typing.List[str]:
     try:
         uploaded_path = s3_client.S3Uploader(s3_path=s3_path).upload_resource_performance(
             resource_performance=resources_insights,
             resource_type=resource_type,
             date_created=datetime.datetime.utcnow(),
+            batched=batched,
+            rows_per_object=rows_per_object,
+            max_workers=max_workers,
         )
     except s3_client_exceptions.S3UploaderError as e:
         raise exceptions.ImporterException(utils.get_exception_message(exception=e))
@@ -36,6 +71,47 @@ def upload_resource_insights(
     return uploaded_path
 
 
+def upload_resource_insights_parquet(
+    s3_path: str,
+    resources_insights: typing.Iterable[typing.Dict],
+    resource_type: enums.ResourceType,
+    endpoint_url: typing.Optional[str] = None,
+) -> str:
+    try:
+        uploaded_path = s3_client.S3Uploader(
+            s3_path=s3_path, endpoint_url=endpoint_url
+        ).upload_resource_performance_parquet(
+            resource_performance=resources_insights,
+            resource_type=resource_type,
+            date_created=datetime.datetime.utcnow(),
+        )
+    except s3_client_exceptions.S3UploaderError as e:
+        raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+
+    return uploaded_path
+
+
+def write_resource_insights_parquet(
+    root_path: str,
+    resources_insights: typing.Iterable[typing.Dict],
+    resource_type: enums.ResourceType,
+) -> str:
+    """
+    Local disk counterpart of `upload_resource_insights_parquet`, `root_path` gets the same
+    `{resource}/date_created=` layout as the bucket prefix.
+    """
+    file_path = os.path.join(
+        root_path,
+        s3_client.S3Uploader.get_performance_parquet_path(
+            resource_type=resource_type, date_created=datetime.datetime.utcnow()
+        ),
+    )
+    try:
+        return columnar.write_insights_parquet(records=resources_insights, file_path=file_path)
+    except (exceptions.ColumnarFormatException, OSError) as e:
+        raise exceptions.ImporterException(utils.get_exception_message(exception=e))
+
+
 def upload_facebook_ad_creatives(s3_path: str, ad_creatives: typing.List[typing.Dict]) -> typing.List[str]:
     try:
         uploaded_paths = s3_client.S3Uploader(s3_path=s3_path).upload_resource_assets(
@@ -47,3 +123,20 @@ def upload_facebook_ad_creatives(s3_path: str, ad_creatives: typing.List[typing.
         raise exceptions.ImporterException(utils.get_exception_message(exception=e))
 
     return uploaded_paths
+
+
+def mirror_facebook_ad_creatives(
+    s3_path: str, ad_creatives: typing.List[typing.Dict], max_workers: typing.Optional[int] = None
+) -> s3_assets.AssetsUploadReport:
+    """
+    Like `upload_facebook_ad_creatives`, but failed creatives don't raise, they are reported per creative.
+    """
+    try:
+        return s3_client.S3Uploader(s3_path=s3_path).mirror_resource_assets(
+            asset_list=ad_creatives,
+            resource_type=enums.ResourceType.AD_CREATIVE,
+            date_created=datetime.datetime.utcnow(),
+            **({"max_workers": max_workers} if max_workers else {}),
+        )
+    except s3_client_exceptions.S3UploaderError as e:
+        raise exceptions.ImporterException(utils.get_exception_message(exception=e))
@@ -1,10 +1,9 @@
 import datetime
-import json
 import typing
 
 import marshmallow
 
-from ads_manager import enums
+from ads_manager import enums, json_codec
 
 
 def get_exception_message(exception: Exception) -> str:
@@ -33,10 +32,10 @@ def convert_schema_list_and_dict_fields_to_json_string(
 ) -> typing.Dict:
     for key, value in data.items():
         if isinstance(value, dict):
-            data[key] = json.dumps(value)
+            data[key] = json_codec.dumps(value)
 
         if isinstance(value, list):
-            data[key] = json.dumps(value)
+            data[key] = json_codec.dumps(value)
 
     return data
 
@@ -45,6 +44,50 @@ def format_tiktok_date(date_start: datetime.datetime) -> str:
     return date_start.strftime("%Y-%m-%d")
 
 
+def parse_updated_time(updated_time: str) -> typing.Optional[datetime.datetime]:
+    """
+    Parses Facebook ("2024-01-31T12:00:00+0000") and TikTok ("2024-01-31 12:00:00", UTC) update times into an
+    aware UTC datetime, None when the value is missing or has another format.
+    """
+    for date_format in ["%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d %H:%M:%S"]:
+        try:
+            parsed_time = datetime.datetime.strptime(updated_time, date_format)
+        except (TypeError, ValueError):
+            continue
+
+        if not parsed_time.tzinfo:
+            parsed_time = parsed_time.replace(tzinfo=datetime.timezone.utc)
+
+        return parsed_time.astimezone(datetime.timezone.utc)
+
+    return None
+
+
+def to_utc(date_time: datetime.datetime) -> datetime.datetime:
+    if not date_time.tzinfo:
+        return date_time.replace(tzinfo=datetime.timezone.utc)
+
+    return date_time.astimezone(datetime.timezone.utc)
+
+
+def filter_updated_since(details: typing.List, updated_since: typing.Optional[datetime.datetime]) -> typing.List:
+    """
+    Keeps the resource details (messages with `updated_time`) updated after `updated_since`. Details whose update
+    time can't be parsed are kept, so a format change can't silently drop changes.
+    """
+    if not updated_since:
+        return details
+
+    updated_since = to_utc(updated_since)
+    filtered_details = []
+    for detail in details:
+        updated_time = parse_updated_time(detail.updated_time)
+        if updated_time is None or updated_time > updated_since:
+            filtered_details.append(detail)
+
+    return filtered_details
+
+
 def validate_params(params: typing.Dict) -> None:
     if params is None:
         raise ValueError('Parameters "app_id" and "secret" are required for tiktok platform.')
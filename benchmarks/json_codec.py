@@ -0,0 +1,117 @@
+"""
+Decoding and encoding throughput of the JSON backends on large insights pages.
+
+Usage: python -m benchmarks.json_codec [--rows 1000] [--repeat 20]
+"""
+import argparse
+import json
+import random
+import timeit
+import types
+
+from ads_manager import exceptions, json_codec
+from ads_manager.integrations.gateways import response as gateway_response
+
+
+def get_tiktok_insights_page(rows: int) -> bytes:
+    """
+    Body of one TikTok `report/integrated/get/` page with `rows` daily ad rows, the gateway page size is 1000.
+    """
+    random.seed(0)
+    return json.dumps(
+        {
+            "code": 0,
+            "message": "OK",
+            "request_id": "20231018000000000000000000000000",
+            "data": {
+                "page_info": {"page": 1, "page_size": rows, "total_number": rows * 3, "total_page": 3},
+                "list": [
+                    {
+                        "dimensions": {"ad_id": str(1700000000000000 + index), "stat_time_day": "2023-10-01 00:00:00"},
+                        "metrics": {
+                            "campaign_id": str(1690000000000000 + index // 50),
+                            "campaign_name": "Campaign {}".format(index // 50),
+                            "adgroup_id": str(1695000000000000 + index // 10),
+                            "adgroup_name": "Ad group {}".format(index // 10),
+                            "ad_name": "Ad {}".format(index),
+                            "spend": "{:.2f}".format(random.uniform(0, 500)),
+                            "impressions": str(random.randint(0, 100000)),
+                            "clicks": str(random.randint(0, 5000)),
+                            "conversion": str(random.randint(0, 200)),
+                            "cost_per_conversion": "{:.2f}".format(random.uniform(0, 50)),
+                            "conversion_rate": "{:.2f}".format(random.uniform(0, 10)),
+                            "ctr": "{:.2f}".format(random.uniform(0, 5)),
+                            "cpm": "{:.2f}".format(random.uniform(0, 20)),
+                            "cpc": "{:.2f}".format(random.uniform(0, 3)),
+                            "reach": str(random.randint(0, 80000)),
+                        },
+                    }
+                    for index in range(rows)
+                ],
+            },
+        }
+    ).encode("utf-8")
+
+
+def run(rows: int, repeat: int) -> None:
+    body = get_tiktok_insights_page(rows=rows)
+    records = [{**row["dimensions"], **row["metrics"]} for row in json.loads(body)["data"]["list"]]  # Exported insights
+    print("Insights page: {} rows, {:.0f} KB, best of {} runs\n".format(rows, len(body) / 1024, repeat))
+
+    codecs = [json_codec.JsonCodec(backend=json_codec.JsonBackend.STDLIB)]
+    try:
+        codecs.append(json_codec.JsonCodec(backend=json_codec.JsonBackend.ORJSON))
+    except exceptions.JsonCodecException:
+        print('orjson is not installed, only the stdlib backend is measured ("pip install orjson")\n')
+
+    def parse_twice() -> None:
+        # Before the envelope: `_validate_response` and `_get_content` each decoded the body
+        json.loads(body)["code"]
+        json.loads(body)["data"]
+
+    def parse_once() -> None:
+        envelope = gateway_response.ResponseEnvelope(response=types.SimpleNamespace(content=body))
+        envelope.data["code"]
+        envelope.data["data"]
+
+    results = [("json, parsed twice (before)", _best(func=parse_twice, repeat=repeat))]
+    for codec in codecs:
+        json_codec.configure_codec(backend=codec.backend)
+        results.append(("{}, parse-once envelope".format(codec.backend.value), _best(func=parse_once, repeat=repeat)))
+    _print_results(title="Decode TikTok page", results=results)
+
+    results = []
+    for codec in codecs:
+        results.append(
+            (
+                "{}, compact".format(codec.backend.value),
+                _best(func=lambda: codec.dumps(records), repeat=repeat),
+            )
+        )
+        results.append(
+            (
+                "{}, JSON Lines".format(codec.backend.value),
+                _best(func=lambda: [codec.dumps_bytes(record) for record in records], repeat=repeat),
+            )
+        )
+    _print_results(title="Encode exported insights", results=results)
+
+
+def _best(func: types.FunctionType, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def _print_results(title: str, results: list) -> None:
+    baseline = results[0][1]
+    print(title)
+    for name, seconds in results:
+        print("  {:<34} {:>8.2f} ms  {:>5.1f}x".format(name, seconds * 1000, baseline / seconds))
+    print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(rows=args.rows, repeat=args.repeat)
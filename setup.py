@@ -16,6 +16,12 @@ setuptools.setup(
     version="1.0.0",
     author="ndinevski",
     install_requires=_read_reqs("requirements.txt"),
-    packages=setuptools.find_packages(),
+    extras_require={
+        "http2": ["httpx[http2]"],
+        "async": ["httpx"],
+        "parquet": ["pyarrow"],
+        "json": ["orjson"],
+    },
+    packages=setuptools.find_packages(exclude=["benchmarks"]),
     include_package_data=True,
 )
@@ -0,0 +1,201 @@
+import datetime
+import io
+import typing
+import unittest
+from unittest import mock
+
+from ads_manager import enums, exceptions
+from ads_manager.integrations.clients import exceptions as client_exceptions
+from ads_manager.integrations.clients import factory, messages
+from ads_manager.integrations.clients.facebook import client as facebook_client
+from ads_manager.integrations.clients.tiktok import client as tiktok_client
+from ads_manager.integrations.gateways import pagination
+from ads_manager.services import checkpoint
+from ads_manager.services.facebook import exporter as facebook_exporter
+from ads_manager.services.tiktok import exporter as tiktok_exporter
+from ads_manager.services.unified import exporter as unified_exporter
+
+DATE_FROM = datetime.datetime(2024, 1, 1)
+DATE_TO = datetime.datetime(2024, 3, 15)
+
+
+def get_report(account_id: str, date: datetime.date) -> messages.ResourceInsightsReport:
+    return messages.ResourceInsightsReport(
+        account_id=account_id,
+        account_name=None,
+        resource_type=enums.ResourceType.CAMPAIGN.value,
+        campaign_id="campaign",
+        campaign_name="Campaign",
+        adset_id=None,
+        adset_name=None,
+        ad_id=None,
+        ad_name=None,
+        spend="1",
+        impressions="1",
+        clicks="1",
+        ctr=None,
+        cpm=None,
+        cpc=None,
+        reach="1",
+        actions=None,
+        conversions=[],
+        cost_per_conversion=[],
+        conversion_rate=[],
+        date_start=date.isoformat(),
+        date_stop=date.isoformat(),
+    )
+
+
+def get_window_dates(windows: typing.List[typing.Tuple[datetime.datetime, datetime.datetime]]) -> typing.List:
+    return [(window_from.date(), window_to.date()) for window_from, window_to in windows]
+
+
+class FacebookInsightsSplitTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = facebook_client.FacebookClient(user_access_token="token")
+        self.windows = []
+
+        def _create_insights_report(ad_account_id, resource_type, from_datetime, to_datetime, projection=None):
+            self.windows.append((from_datetime, to_datetime))
+            return "report-{}".format(len(self.windows))
+
+        def _iter_insights_report_results(
+            ad_account_id, report_id, resource_type, from_datetime, to_datetime, cursor=None, projection=None
+        ):
+            if cursor is not None:
+                cursor.done = True
+            yield [get_report(account_id=ad_account_id, date=from_datetime.date())]
+
+        self.client.create_insights_report = _create_insights_report
+        self.client.get_insights_report_status = lambda report_id: {
+            "is_running": False,
+            "async_percent_completion": 100,
+        }
+        self.client.iter_insights_report_results = _iter_insights_report_results
+
+        patcher = mock.patch.object(factory.Factory, "create", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_exporter_iter_insights_splits_range(self) -> None:
+        records = list(
+            facebook_exporter.iter_campaign_insights(
+                user_access_token="token", account_ids=["account"], date_from=DATE_FROM, date_to=DATE_TO
+            )
+        )
+
+        self.assertEqual(
+            get_window_dates(windows=self.windows),
+            [
+                (datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)),
+                (datetime.date(2024, 2, 1), datetime.date(2024, 3, 2)),
+                (datetime.date(2024, 3, 3), datetime.date(2024, 3, 15)),
+            ],
+        )
+        self.assertEqual([record["date_start"] for record in records], ["2024-01-01", "2024-02-01", "2024-03-03"])
+
+    def test_unified_stream_splits_range(self) -> None:
+        output = io.StringIO()
+        records_written = unified_exporter.get_insights_by_resource_type(
+            user_access_token="token",
+            platform=enums.Platform.FACEBOOK,
+            account_ids=["account"],
+            resource_type=enums.ResourceType.CAMPAIGN,
+            date_from=DATE_FROM,
+            date_to=DATE_TO,
+            output=output,
+        )
+
+        self.assertEqual(len(self.windows), 3)
+        self.assertEqual(records_written, 3)
+        self.assertEqual(len(output.getvalue().splitlines()), 3)
+
+
+class TiktokInsightsSplitTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = tiktok_client.TiktokClient(user_access_token="token", params={})
+        self.windows = []
+        self.failing_window = None
+
+        def _iter_window_insights(
+            ad_account_id, resource_type, from_datetime, to_datetime, cursor=None, projection=None
+        ) -> typing.Iterator[typing.List[messages.ResourceInsightsReport]]:
+            self.windows.append((from_datetime, to_datetime))
+            if len(self.windows) == self.failing_window:
+                raise client_exceptions.ClientProviderError("Unable to get insights report")
+
+            if cursor is not None:
+                cursor.page = 1
+                cursor.done = True
+            yield [get_report(account_id=ad_account_id, date=from_datetime.date())]
+
+        self.client._iter_window_insights = _iter_window_insights
+
+        patcher = mock.patch.object(factory.Factory, "create", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_exporter_iter_insights_splits_range(self) -> None:
+        records = list(
+            tiktok_exporter.iter_campaign_insights(
+                user_access_token="token", account_ids=["advertiser"], date_from=DATE_FROM, date_to=DATE_TO, params={}
+            )
+        )
+
+        self.assertEqual(
+            get_window_dates(windows=self.windows),
+            [
+                (datetime.date(2024, 1, 1), datetime.date(2024, 1, 30)),
+                (datetime.date(2024, 1, 31), datetime.date(2024, 2, 29)),
+                (datetime.date(2024, 3, 1), datetime.date(2024, 3, 15)),
+            ],
+        )
+        self.assertEqual([record["date_start"] for record in records], ["2024-01-01", "2024-01-31", "2024-03-01"])
+
+    def test_unified_stream_resumes_from_failed_window(self) -> None:
+        store = checkpoint.CheckpointStore(path=":memory:")
+        self.addCleanup(store.close)
+        export_kwargs = dict(
+            user_access_token="token",
+            platform=enums.Platform.TIKTOK,
+            account_ids=["advertiser"],
+            resource_type=enums.ResourceType.CAMPAIGN,
+            date_from=DATE_FROM,
+            date_to=DATE_TO,
+            params={},
+            checkpoint_store=store,
+        )
+        export_key = checkpoint.get_export_key(
+            platform=enums.Platform.TIKTOK.value,
+            export_name="{}_insights".format(enums.ResourceType.CAMPAIGN.value),
+            date_from=DATE_FROM,
+            date_to=DATE_TO,
+        )
+
+        self.failing_window = 2
+        output = io.StringIO()
+        with self.assertRaises(exceptions.PartialExportException):
+            unified_exporter.get_insights_by_resource_type(output=output, **export_kwargs)
+
+        self.assertEqual(len(output.getvalue().splitlines()), 1)
+        self.assertEqual(
+            store.get_cursor(export_key=export_key, account_id="advertiser"), pagination.PageCursor(window=1)
+        )
+
+        self.windows = []
+        self.failing_window = None
+        unified_exporter.get_insights_by_resource_type(output=output, **export_kwargs)
+
+        self.assertEqual(
+            get_window_dates(windows=self.windows),
+            [
+                (datetime.date(2024, 1, 31), datetime.date(2024, 2, 29)),
+                (datetime.date(2024, 3, 1), datetime.date(2024, 3, 15)),
+            ],
+        )
+        self.assertEqual(len(output.getvalue().splitlines()), 3)
+        self.assertTrue(store.is_finished(export_key=export_key, account_id="advertiser"))
+
+
+if __name__ == "__main__":
+    unittest.main()
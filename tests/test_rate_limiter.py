@@ -0,0 +1,53 @@
+import time
+import unittest
+
+from ads_manager.integrations.gateways import rate_limiter
+
+
+class RateLimiterTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = rate_limiter.RateLimiterConfig(
+            requests_per_second=1000.0, burst=1000, min_requests_per_second=1.0, throttle_pause=0.01
+        )
+        self.rate_limiter = rate_limiter.RateLimiter(config=self.config)
+
+    def _get_rate(self, key: str) -> float:
+        return {stats.key: stats.requests_per_second for stats in self.rate_limiter.get_stats()}[key]
+
+    def test_throttle_pauses_at_min_rate(self) -> None:
+        self.rate_limiter.throttle(key="key", seconds=60.0)
+
+        self.assertEqual(self._get_rate(key="key"), self.config.min_requests_per_second)
+        self.assertGreater(self.rate_limiter.reserve(keys=["key"]), 59.0)
+        self.assertEqual(self._get_rate(key="key"), self.config.min_requests_per_second)
+
+    def test_throttle_recovers_configured_rate_after_pause(self) -> None:
+        self.rate_limiter.throttle(key="key")
+        time.sleep(self.config.throttle_pause * 2)
+
+        for _ in range(5):
+            self.rate_limiter.reserve(keys=["key"])
+        self.assertGreater(self._get_rate(key="key"), self.config.min_requests_per_second)
+
+        for _ in range(10):
+            self.rate_limiter.reserve(keys=["key"])
+        self.assertEqual(self._get_rate(key="key"), self.config.requests_per_second)
+
+    def test_update_usage_rate_is_not_ramped_up(self) -> None:
+        self.rate_limiter.update_usage(key="key", usage=99.0)
+        rate = self._get_rate(key="key")
+
+        for _ in range(10):
+            self.rate_limiter.reserve(keys=["key"])
+        self.assertEqual(self._get_rate(key="key"), rate)
+
+    def test_update_usage_after_throttle_sets_rate(self) -> None:
+        self.rate_limiter.throttle(key="key")
+        time.sleep(self.config.throttle_pause * 2)
+        self.rate_limiter.update_usage(key="key", usage=0.0)
+
+        self.assertEqual(self._get_rate(key="key"), self.config.requests_per_second)
+
+
+if __name__ == "__main__":
+    unittest.main()
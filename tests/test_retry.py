@@ -0,0 +1,36 @@
+import unittest
+from unittest import mock
+
+from ads_manager.integrations.gateways import retry
+
+
+class RetryPolicyTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.retry_policy = retry.RetryPolicy(
+            config=retry.RetryConfig(max_attempts=3, base_delay=0.0, max_delay=0.0, run_budget=2)
+        )
+        self.func = mock.Mock(side_effect=ValueError("Transient error"))
+
+    def _call(self) -> None:
+        with self.assertRaises(ValueError):
+            self.retry_policy.call(func=self.func, is_retryable=lambda error: True, description="GET endpoint")
+
+    def test_run_budget_is_shared_by_requests(self) -> None:
+        self._call()
+        self._call()
+
+        self.assertEqual(self.func.call_count, 4)
+        self.assertEqual(self.retry_policy.get_stats().run_budget_left, 0)
+
+    def test_start_run_restores_run_budget(self) -> None:
+        self._call()
+        self.retry_policy.start_run()
+        self._call()
+
+        self.assertEqual(self.func.call_count, 6)
+        self.assertEqual(self.retry_policy.get_stats().retries, 4)
+        self.assertEqual(self.retry_policy.get_stats().run_budget_left, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()